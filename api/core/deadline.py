@@ -0,0 +1,87 @@
+import asyncio
+import logging
+from typing import Dict, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from shared.concurrency import Deadline, deadline_scope
+
+logger = logging.getLogger(__name__)
+
+
+class DeadlineMiddleware:
+    """
+    요청 단위 Deadline 설정 + 클라이언트 연결 종료 시 진행 중인 작업 취소 (pure ASGI)
+    - 핸들러부터 pipeline_bridge, 파이프라인 각 단계까지 contextvar로 Deadline이 전파됨
+    - 요청 본문을 다 받은 뒤 들어오는 다음 메시지는 http.disconnect 뿐이므로,
+      이를 감시하다가 응답 완료 전에 오면 핸들러 태스크를 취소하고 Deadline에 취소 신호를 보냄
+    - overrides로 경로별 예산 지정 (None = 시간 제한 없음, 취소 신호만 전달)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        timeout: Optional[float],
+        overrides: Optional[Dict[str, Optional[float]]] = None,
+    ):
+        self.app = app
+        self.timeout = timeout
+        self.overrides = dict(overrides or {})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        deadline = Deadline(self.overrides.get(scope["path"], self.timeout))
+        disconnected = asyncio.Event()
+        disconnect_message: Message = {"type": "http.disconnect"}
+        body_complete = False
+        response_complete = False
+        watcher: Optional[asyncio.Task] = None
+
+        async def watch_disconnect() -> None:
+            nonlocal disconnect_message
+            disconnect_message = await receive()
+            disconnected.set()
+            if not response_complete:
+                logger.info(f"🔌 Client disconnected: {scope['path']}")
+                deadline.cancel()
+                app_task.cancel()
+
+        async def wrapped_receive() -> Message:
+            nonlocal body_complete, watcher
+            if body_complete:
+                # 본문 이후의 receive(StreamingResponse 등)는 감시 태스크의 결과를 공유
+                await disconnected.wait()
+                return disconnect_message
+
+            message = await receive()
+            if message["type"] == "http.request" and not message.get("more_body"):
+                body_complete = True
+                watcher = asyncio.ensure_future(watch_disconnect())
+            return message
+
+        async def wrapped_send(message: Message) -> None:
+            nonlocal response_complete
+            if message["type"] == "http.response.body" and not message.get("more_body"):
+                response_complete = True
+            await send(message)
+
+        # 핸들러 태스크는 생성 시점의 컨텍스트(Deadline 포함)를 복사해서 실행됨
+        with deadline_scope(deadline):
+            app_task = asyncio.ensure_future(
+                self.app(scope, wrapped_receive, wrapped_send)
+            )
+
+        try:
+            await app_task
+        except asyncio.CancelledError:
+            # 클라이언트가 떠나서 취소한 경우에는 응답할 대상이 없으므로 조용히 종료
+            if not deadline.cancelled or asyncio.current_task().cancelling():
+                raise
+        finally:
+            if not app_task.done():
+                app_task.cancel()
+            if watcher is not None and not watcher.done():
+                watcher.cancel()
@@ -24,6 +24,12 @@ class ErrorCode(str, Enum):
     NOT_AUTHENTICATED = "NOT_AUTHENTICATED"
     PERMISSION_DENIED = "PERMISSION_DENIED"
 
+    # 429 Too Many Requests 관련
+    TOO_MANY_REQUESTS = "TOO_MANY_REQUESTS"
+
+    # 504 Gateway Timeout 관련
+    DEADLINE_EXCEEDED = "DEADLINE_EXCEEDED"
+
 
 # 커스텀 Exception정의
 # 서버 내부에서 잘못된 응답인경우 raise 커스텀Exception
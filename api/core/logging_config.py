@@ -0,0 +1,104 @@
+import atexit
+import copy
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import IO, List, Optional
+
+from shared.log_context import RequestContextFilter
+
+LOG_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(request_id)s | %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# extra={...} 로 넘기면 메시지 뒤에 key=value 로 덧붙는 구조화 필드
+STRUCTURED_FIELDS = ("method", "path", "status", "stage", "elapsed_ms")
+
+
+class StructuredFormatter(logging.Formatter):
+    """기본 포맷 + 구조화 필드(stage, elapsed_ms 등)를 key=value 로 덧붙임"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        if not hasattr(record, "request_id"):
+            record.request_id = "-"
+        line = super().format(record)
+        fields = [
+            f"{name}={getattr(record, name)}"
+            for name in STRUCTURED_FIELDS
+            if getattr(record, name, None) is not None
+        ]
+        if not fields:
+            return line
+        # traceback이 붙은 경우에도 필드는 첫 줄에 위치하도록
+        first, sep, rest = line.partition("\n")
+        return f"{first} | {' '.join(fields)}{sep}{rest}"
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    이벤트 루프에서는 메시지 문자열만 확정해서 큐에 넣고,
+    시간/예외 traceback 포맷팅과 쓰기는 리스너 스레드에서 수행
+    (기본 QueueHandler.prepare는 호출 스레드에서 전체 포맷팅을 수행함)
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+_listener: Optional[QueueListener] = None
+_previous_handlers: List[logging.Handler] = []
+
+
+def start_logging(level: int = logging.INFO, stream: Optional[IO[str]] = None) -> None:
+    """
+    루트 로거를 QueueHandler 하나로 교체하고, 실제 포맷팅/출력은 백그라운드 스레드에서 처리
+    stdout이 느린 파이프여도 로그 기록이 이벤트 루프를 막지 않음 (FastAPI lifespan)
+    """
+    global _listener, _previous_handlers
+    if _listener is not None:
+        return
+
+    output = logging.StreamHandler(stream if stream is not None else sys.stdout)
+    output.setFormatter(StructuredFormatter(LOG_FORMAT, datefmt=DATE_FORMAT))
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = _DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(RequestContextFilter())
+
+    root = logging.getLogger()
+    _previous_handlers = list(root.handlers)
+    for handler in _previous_handlers:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_logging() -> None:
+    """남은 로그를 모두 출력한 뒤 리스너 종료, 이전 핸들러 복구"""
+    global _listener, _previous_handlers
+    if _listener is None:
+        return
+
+    listener, _listener = _listener, None
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, _DeferredQueueHandler):
+            root.removeHandler(handler)
+    for handler in _previous_handlers:
+        root.addHandler(handler)
+    _previous_handlers = []
+
+    listener.stop()
+    for handler in listener.handlers:
+        handler.flush()
+
+
+# lifespan 종료 없이 프로세스가 끝나도 큐에 남은 로그를 출력
+atexit.register(stop_logging)
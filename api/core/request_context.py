@@ -0,0 +1,64 @@
+import logging
+import re
+import time
+import uuid
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from shared.log_context import request_id_scope
+
+logger = logging.getLogger("api.access")
+
+REQUEST_ID_HEADER = "x-request-id"
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+
+class RequestIdMiddleware:
+    """
+    요청 ID 부여 (pure ASGI)
+    - 게이트웨이가 보낸 X-Request-ID를 그대로 쓰고, 없거나 형식이 이상하면 새로 발급
+    - 요청 처리 중 남는 모든 로그에 request_id가 붙고, 응답 헤더로도 돌려줌
+    - 요청 종료 시 method/path/status/elapsed_ms 구조화 로그 1줄
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = ""
+        for name, value in scope.get("headers", []):
+            if name == REQUEST_ID_HEADER.encode():
+                request_id = value.decode("latin-1")
+                break
+        if not _VALID_REQUEST_ID.match(request_id):
+            request_id = uuid.uuid4().hex[:16]
+
+        status_code = 500
+        started = time.perf_counter()
+
+        async def wrapped_send(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((REQUEST_ID_HEADER.encode(), request_id.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        with request_id_scope(request_id):
+            try:
+                await self.app(scope, receive, wrapped_send)
+            finally:
+                logger.info(
+                    "request completed",
+                    extra={
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "status": status_code,
+                        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                    },
+                )
@@ -0,0 +1,51 @@
+import json
+import logging
+from typing import Any, AsyncIterator, Dict
+
+from api.core.exception import CustomException, ErrorCode
+from shared.concurrency import DeadlineExceeded
+from shared.schema.applicant import EvaluateStreamEvent
+from shared.schema.common_schema import ErrorDetail
+
+logger = logging.getLogger(__name__)
+
+# 프록시(Nginx 등)가 이벤트를 모아서 보내지 않도록 버퍼링 비활성화
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """SSE 프레임 직렬화 (event + data 한 줄 JSON)"""
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+async def to_sse(events: AsyncIterator[EvaluateStreamEvent]) -> AsyncIterator[str]:
+    """
+    이벤트 스트림 -> SSE 프레임 스트림
+    스트림 도중 예외는 HTTP 상태코드로 전달할 수 없으므로 error 이벤트로 내보내고 종료합니다.
+    """
+    try:
+        async for item in events:
+            yield format_sse(item.event, item.data)
+    except CustomException as e:
+        error = ErrorDetail(code=e.code, message=e.message)
+        yield format_sse("error", error.model_dump())
+    except DeadlineExceeded as e:
+        error = ErrorDetail(
+            code=ErrorCode.DEADLINE_EXCEEDED,
+            message="처리 시간이 초과되었습니다.",
+            details=str(e),
+        )
+        yield format_sse("error", error.model_dump())
+    except Exception as e:
+        logger.error(f"🚨 SSE stream aborted: {e}", exc_info=e)
+        error = ErrorDetail(
+            code=ErrorCode.INTERNAL_SERVER_ERROR,
+            message="서버 내부 오류가 발생했습니다.",
+            details=str(e),
+        )
+        yield format_sse("error", error.model_dump())
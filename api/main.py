@@ -1,23 +1,40 @@
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 # Use absolute imports based on the project root 'ai'
+from api.core.deadline import DeadlineMiddleware
 from api.core.exception import CustomException, ErrorCode
+from api.core.logging_config import start_logging, stop_logging
+from api.core.metrics import MetricsMiddleware
+from api.core.request_context import RequestIdMiddleware
 from api.routes import applicant, document, job_posting
+from shared.concurrency import AdmissionRejected, DeadlineExceeded
+from shared.config import settings
+from shared.metrics import PROMETHEUS_CONTENT_TYPE, REGISTRY
+from shared.pipeline_bridge import shutdown_pipelines, startup_pipelines
 from shared.schema.common_schema import ApiResponse, ErrorDetail
 import uvicorn
 
-app = FastAPI(title="AI Service API")
+logger = logging.getLogger(__name__)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 로그 포맷팅/출력은 백그라운드 스레드에서 (느린 stdout이 이벤트 루프를 막지 않도록)
+    start_logging(logging.INFO)
+    # 파이프라인 import + LLM/S3 클라이언트 생성은 백그라운드 prewarm (readiness를 막지 않음)
+    startup_pipelines()
+    yield
+    await shutdown_pipelines()
+    stop_logging()
+
+
+app = FastAPI(title="AI Service API", lifespan=lifespan)
 
 # CORS 설정
 app.add_middleware(
@@ -28,12 +45,31 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 단위 시간 예산 + 클라이언트 연결 종료 시 파이프라인 취소
+app.add_middleware(
+    DeadlineMiddleware,
+    timeout=settings.REQUEST_DEADLINE_SECONDS,
+    overrides={
+        "/ai/api/v1/applicant/evaluate/batch": settings.BATCH_EVALUATION_DEADLINE_SECONDS,
+    },
+)
+
+# 라우트별 처리 시간 히스토그램 (/metrics 로 노출)
+app.add_middleware(MetricsMiddleware)
+
+# 요청 ID 부여 - 가장 바깥에 두어 모든 미들웨어/핸들러/파이프라인 로그에 request_id가 붙도록
+app.add_middleware(RequestIdMiddleware)
+
 
 # 기본 에러처리
 @app.exception_handler(Exception)
 async def default_exception_handler(request: Request, exc: Exception):
     error_msg = str(exc)
-    print(f"🚨 500 Internal Server Error: {error_msg}")
+    logger.error(
+        f"🚨 500 Internal Server Error: {error_msg}",
+        exc_info=exc,
+        extra={"method": request.method, "path": request.url.path},
+    )
 
     error_detail = ErrorDetail(
         code=ErrorCode.INTERNAL_SERVER_ERROR,
@@ -82,9 +118,44 @@ async def custom_exception_handler(request: Request, exc: CustomException):
     )
 
 
+# 파이프라인 대기열이 가득 찬 경우 (Backpressure)
+@app.exception_handler(AdmissionRejected)
+async def admission_rejected_handler(request: Request, exc: AdmissionRejected):
+    error_detail = ErrorDetail(
+        code=ErrorCode.TOO_MANY_REQUESTS,
+        message="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+        details=str(exc),
+    )
+    response: ApiResponse[None] = ApiResponse(success=False, error=error_detail)
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content=response.model_dump(mode="json"),
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+# 요청 시간 예산 안에 파이프라인이 끝나지 않은 경우
+@app.exception_handler(DeadlineExceeded)
+async def deadline_exceeded_handler(request: Request, exc: DeadlineExceeded):
+    error_detail = ErrorDetail(
+        code=ErrorCode.DEADLINE_EXCEEDED,
+        message="처리 시간이 초과되었습니다. 잠시 후 다시 시도해주세요.",
+        details=str(exc),
+    )
+    response: ApiResponse[None] = ApiResponse(success=False, error=error_detail)
+    return JSONResponse(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        content=response.model_dump(mode="json"),
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return PlainTextResponse(REGISTRY.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 @app.get("/")
 async def root():
-    print("hello")
     return {"message": "AI Model Server is running 🚀"}
 
 
@@ -1,12 +1,17 @@
 from fastapi import APIRouter, status
+from fastapi.responses import StreamingResponse
 
 from shared.schema.applicant import (
+    BatchEvaluateRequest,
     CompareRequest,
     CompareResponse,
+    EvaluateJobStatusResponse,
+    EvaluateJobSubmitResponse,
     EvaluateRequest,
     EvaluateResponse,
 )
 from shared.schema.common_schema import ApiResponse
+from api.core.sse import SSE_HEADERS, to_sse
 from api.service.applicant import ApplicantService
 
 router = APIRouter(prefix="/ai/api/v1/applicant", tags=["Applicant"])
@@ -24,6 +29,70 @@ async def evaluate_applicant(request: EvaluateRequest):
     return ApiResponse(success=True, data=result)
 
 
+@router.post(
+    "/evaluate/stream",
+    status_code=status.HTTP_200_OK,
+    summary="지원자 평가 (SSE 스트리밍)",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {"text/event-stream": {}},
+            "description": "competency(역량별) -> feedback(종합 평가) -> result(최종 결과) 순서의 SSE 이벤트",
+        }
+    },
+)
+async def stream_evaluation(request: EvaluateRequest):
+    service = ApplicantService()
+    events = await service.stream_evaluation(request.user_id, request.job_posting_id)
+    return StreamingResponse(
+        to_sse(events), media_type="text/event-stream", headers=SSE_HEADERS
+    )
+
+
+@router.post(
+    "/evaluate/batch",
+    status_code=status.HTTP_200_OK,
+    summary="공고 지원자 일괄 평가 (SSE 스트리밍)",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {"text/event-stream": {}},
+            "description": "applicant(지원자별 결과, 저장 완료 시점) 반복 -> summary(집계) 순서의 SSE 이벤트",
+        }
+    },
+)
+async def stream_batch_evaluation(request: BatchEvaluateRequest):
+    service = ApplicantService()
+    events = await service.stream_batch_evaluation(request.job_posting_id)
+    return StreamingResponse(
+        to_sse(events), media_type="text/event-stream", headers=SSE_HEADERS
+    )
+
+
+@router.post(
+    "/evaluate/async",
+    response_model=ApiResponse[EvaluateJobSubmitResponse],
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="지원자 평가 작업 등록 (비동기)",
+)
+async def submit_evaluation(request: EvaluateRequest):
+    service = ApplicantService()
+    result = await service.submit_evaluation(request.user_id, request.job_posting_id)
+    return ApiResponse(success=True, data=result)
+
+
+@router.get(
+    "/evaluate/{eval_job_id}",
+    response_model=ApiResponse[EvaluateJobStatusResponse],
+    status_code=status.HTTP_200_OK,
+    summary="지원자 평가 작업 상태/결과 조회",
+)
+async def get_evaluation_job(eval_job_id: int):
+    service = ApplicantService()
+    result = await service.get_evaluation_job(eval_job_id)
+    return ApiResponse(success=True, data=result)
+
+
 @router.post(
     "/compare",
     response_model=ApiResponse[CompareResponse],
@@ -1,10 +1,24 @@
+from typing import AsyncIterator
+
+from api.core.exception import CustomException, ErrorCode
 from shared.schema.applicant import (
+    BatchEvaluateRequest,
     CompareRequest,
     CompareResponse,
+    EvaluateJobStatusResponse,
+    EvaluateJobSubmitResponse,
     EvaluateRequest,
     EvaluateResponse,
+    EvaluateStreamEvent,
+)
+from shared.pipeline_bridge import (
+    call_applicant_evaluation,
+    call_applicant_evaluation_batch_stream,
+    call_applicant_evaluation_status,
+    call_applicant_evaluation_stream,
+    call_applicant_evaluation_submit,
+    call_candidate_comparison,
 )
-from shared.pipeline_bridge import call_applicant_evaluation, call_candidate_comparison
 
 
 class ApplicantService:
@@ -18,6 +32,56 @@ class ApplicantService:
             EvaluateRequest(user_id=user_id, job_posting_id=job_posting_id)
         )
 
+    async def stream_evaluation(
+        self, user_id: str, job_posting_id: str
+    ) -> AsyncIterator[EvaluateStreamEvent]:
+        """
+        Evaluate applicant and return a stream of per-competency results as they complete.
+        Raises AdmissionRejected before the stream starts when the pipeline is saturated.
+        """
+        return await call_applicant_evaluation_stream(
+            EvaluateRequest(user_id=user_id, job_posting_id=job_posting_id)
+        )
+
+    async def stream_batch_evaluation(
+        self, job_posting_id: str
+    ) -> AsyncIterator[EvaluateStreamEvent]:
+        """
+        Evaluate every applicant of a job posting, streaming each result as it is saved.
+        Raises AdmissionRejected before the stream starts when the pipeline is saturated.
+        """
+        return await call_applicant_evaluation_batch_stream(
+            BatchEvaluateRequest(job_posting_id=job_posting_id)
+        )
+
+    async def submit_evaluation(
+        self, user_id: str, job_posting_id: str
+    ) -> EvaluateJobSubmitResponse:
+        """
+        Register an asynchronous evaluation job and return its id immediately.
+        """
+        result = await call_applicant_evaluation_submit(
+            EvaluateRequest(user_id=user_id, job_posting_id=job_posting_id)
+        )
+        if result is None:
+            raise CustomException(
+                ErrorCode.ITEM_NOT_FOUND,
+                f"지원 내역을 찾을 수 없습니다. (user_id={user_id}, job_posting_id={job_posting_id})",
+            )
+        return result
+
+    async def get_evaluation_job(self, eval_job_id: int) -> EvaluateJobStatusResponse:
+        """
+        Get status (and result when completed) of an evaluation job.
+        """
+        result = await call_applicant_evaluation_status(eval_job_id)
+        if result is None:
+            raise CustomException(
+                ErrorCode.ITEM_NOT_FOUND,
+                f"평가 작업을 찾을 수 없습니다. (eval_job_id={eval_job_id})",
+            )
+        return result
+
     async def compare_applicants(
         self, user_id: str, job_posting_id: str, competitor: str
     ) -> CompareResponse:
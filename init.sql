@@ -190,6 +190,7 @@ CREATE TABLE job_posts (
     fingerprint_hash CHAR(64) NOT NULL,
     PRIMARY KEY (job_post_id),
     UNIQUE KEY uk_job_posts_source_url (source_url),
+    KEY idx_job_posts_source_url_hash (source_url_hash),
     KEY idx_job_posts_master (job_master_id),
     KEY idx_job_posts_company (company_id),
     KEY idx_job_posts_created_by (created_by),
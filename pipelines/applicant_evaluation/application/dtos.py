@@ -1,5 +1,11 @@
-from shared.schema.applicant import EvaluateResponse, CompetencyScore
-from ..domain.models.report import AnalysisReport
+from shared.schema.applicant import (
+    BatchEvaluateItem,
+    EvaluateResponse,
+    CompetencyScore,
+    EvaluateStreamEvent,
+)
+from ..domain.models.evaluation import CompetencyResult
+from ..domain.models.report import AnalysisReport, ApplicantReport, OverallFeedback
 
 
 class PipelineEvaluateResponse(EvaluateResponse):
@@ -19,3 +25,44 @@ class PipelineEvaluateResponse(EvaluateResponse):
                 for r in report.competency_scores
             ],
         )
+
+
+class PipelineEvaluateStreamEvent(EvaluateStreamEvent):
+    """
+    스트리밍 평가 이벤트(Domain) -> SSE 이벤트 DTO 변환
+    """
+
+    @classmethod
+    def from_domain(
+        cls, item: CompetencyResult | OverallFeedback | AnalysisReport
+    ) -> "EvaluateStreamEvent":
+        if isinstance(item, CompetencyResult):
+            score = CompetencyScore(
+                name=item.name, score=item.score, description=item.description
+            )
+            return cls(event="competency", data=score.model_dump())
+        if isinstance(item, OverallFeedback):
+            return cls(event="feedback", data=item.model_dump())
+        return cls(
+            event="result",
+            data=PipelineEvaluateResponse.from_domain(item).model_dump(),
+        )
+
+
+class PipelineBatchEvaluateItem(BatchEvaluateItem):
+    """
+    일괄 평가 결과(Domain) -> 지원자별 응답 DTO 변환
+    """
+
+    @classmethod
+    def from_domain(cls, item: ApplicantReport) -> "BatchEvaluateItem":
+        return cls(
+            user_id=str(item.user_id),
+            job_application_id=item.job_application_id,
+            result=(
+                PipelineEvaluateResponse.from_domain(item.report)
+                if item.report
+                else None
+            ),
+            error_message=item.error,
+        )
@@ -1,10 +1,11 @@
 import logging
 import asyncio
-from typing import List
+from typing import AsyncIterator, List, Tuple, Union
 from shared.schema.applicant import EvaluateResponse
-from ...domain.models.document import ParsedDoc
+from ...domain.models.document import ApplicantDocuments, JobApplicant, ParsedDoc
 from ...domain.models.evaluation import CompetencyResult
-from ...domain.models.report import AnalysisReport
+from ...domain.models.job import JobInfo
+from ...domain.models.report import AnalysisReport, ApplicantReport, OverallFeedback
 from ...domain.interface.repository_interfaces import JobRepository, DocRepository
 from ...domain.interface.adapter_interfaces import (
     FileStorage,
@@ -14,6 +15,9 @@ from ...domain.interface.adapter_interfaces import (
 
 logger = logging.getLogger(__name__)
 
+# evaluate_stream()이 내보내는 이벤트 타입
+AnalysisEvent = Union[CompetencyResult, OverallFeedback, AnalysisReport]
+
 
 class ApplicationAnalyzer:
     """
@@ -36,40 +40,143 @@ class ApplicationAnalyzer:
         self.agent = agent
 
     async def run(self, user_id: int, job_id: int) -> EvaluateResponse:
+        report = await self.evaluate(user_id, job_id)
+
+        # 응답 반환 (DTO 변환)
+        from ..dtos import PipelineEvaluateResponse
+
+        return PipelineEvaluateResponse.from_domain(report)
+
+    async def evaluate(self, user_id: int, job_id: int) -> AnalysisReport:
+        """평가를 수행하고 도메인 리포트(AnalysisReport)를 반환 (저장/응답 변환은 호출 측 책임)"""
         logger.info(f"🚀 [Evaluation Start] User: {user_id}, Job: {job_id}")
 
-        # 1. 채용 공고 정보 조회
-        job_info = await self.job_repo.get_job_info(job_id)
-        if not job_info:
-            logger.error(f"❌ Job not found: {job_id}")
-            raise ValueError(f"Job not found: {job_id}")
+        job_info, resume_text, portfolio_text = await self._load_inputs(user_id, job_id)
 
-        # 2. 지원자 서류 상태 조회 (Aggregate Root)
-        documents = await self.doc_repo.get_documents(user_id, job_id)
+        report = await self._analyze(job_info, resume_text, portfolio_text)
 
-        # 3. 서류 전처리 (분석 가능한 텍스트가 없으면 추출 수행)
-        if not documents.is_ready_for_analysis():
-            logger.info(f"🔄 Document preparation needed for User: {user_id}")
-            await self._prepare_documents(user_id, job_id, documents)
-            # 상태 갱신
-            documents = await self.doc_repo.get_documents(user_id, job_id)
+        logger.info(f"✨ [Evaluation Complete] User: {user_id}, Job: {job_id}")
+        return report
 
-            if not documents.is_ready_for_analysis():
-                logger.error("❌ Document preparation failed.")
-                raise ValueError("Document preparation failed.")
-            logger.info(f"✅ Document preparation complete for User: {user_id}")
+    async def evaluate_stream(
+        self, user_id: int, job_id: int
+    ) -> AsyncIterator[AnalysisEvent]:
+        """
+        evaluate()의 스트리밍 버전
+        개별 역량 평가가 끝나는 순서대로 CompetencyResult를 내보내고,
+        마지막에 OverallFeedback과 최종 AnalysisReport를 내보냄
+        """
+        logger.info(f"🚀 [Evaluation Stream Start] User: {user_id}, Job: {job_id}")
 
-        if not documents.parsed_resume:
-            raise ValueError("유저의 서류가 존재하지 않습니다.")
-        resume_text = documents.parsed_resume.text
-        portfolio_text = (
-            documents.parsed_portfolio.text if documents.parsed_portfolio else ""
+        job_info, resume_text, portfolio_text = await self._load_inputs(user_id, job_id)
+
+        tasks = [
+            asyncio.ensure_future(
+                self.agent.evaluate_competency(
+                    job_info=job_info,
+                    criteria=criteria,
+                    resume_text=resume_text,
+                    portfolio_text=portfolio_text,
+                )
+            )
+            for criteria in job_info.evaluation_criteria
+        ]
+
+        competency_results: List[CompetencyResult] = []
+        try:
+            for finished in asyncio.as_completed(tasks):
+                result = await finished
+                competency_results.append(result)
+                yield result
+        finally:
+            # 소비자가 중간에 끊으면(클라이언트 disconnect) 남은 LLM 호출 취소
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            # 취소가 끝날 때까지 대기 (pending task 경고/회수되지 않은 예외 방지)
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        # 종합 평가는 기준 순서대로 정렬된 결과를 사용 (완료 순서와 무관하게 동일한 입력)
+        order = {c.name: i for i, c in enumerate(job_info.evaluation_criteria)}
+        competency_results.sort(key=lambda r: order.get(r.name, len(order)))
+
+        overall_feedback = await self.agent.synthesize_report(
+            job_info, competency_results
+        )
+        yield overall_feedback
+
+        report = AnalysisReport.create(
+            job_info=job_info, results=competency_results, feedback=overall_feedback
+        )
+        logger.info(f"✨ [Evaluation Stream Complete] User: {user_id}, Job: {job_id}")
+        yield report
+
+    async def evaluate_batch(
+        self, job_id: int, db_lock: asyncio.Lock, max_in_flight: int = 8
+    ) -> AsyncIterator[ApplicantReport]:
+        """
+        공고의 전체 지원자를 일괄 평가하여, 끝나는 순서대로 ApplicantReport를 내보냄
+        - 공고 정보/평가 기준과 전체 지원자 서류는 한 번만 조회
+        - 동시에 처리하는 지원자 수는 max_in_flight, LLM 호출 수는 agent가 전역으로 제한
+        - 하나의 DB 세션을 공유하므로 저장소 접근은 db_lock으로 직렬화 (호출 측도 같은 락을 사용)
+        - 지원자 1명의 실패는 error로 기록하고 나머지 평가는 계속 진행
+        """
+        async with db_lock:
+            job_info = await self.job_repo.get_job_info(job_id)
+            if not job_info:
+                logger.error(f"❌ Job not found: {job_id}")
+                raise ValueError(f"Job not found: {job_id}")
+            applicants = await self.doc_repo.get_applicants(job_id)
+
+        logger.info(
+            f"🚀 [Batch Evaluation Start] Job: {job_id}, Applicants: {len(applicants)}"
         )
+        slots = asyncio.Semaphore(max(1, max_in_flight))
+
+        async def _evaluate_one(applicant: JobApplicant) -> ApplicantReport:
+            async with slots:
+                try:
+                    resume_text, portfolio_text = await self._prepare_applicant(
+                        job_id, applicant, db_lock
+                    )
+                    report = await self._analyze(job_info, resume_text, portfolio_text)
+                    return ApplicantReport(
+                        job_application_id=applicant.job_application_id,
+                        user_id=applicant.user_id,
+                        report=report,
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"❌ Batch evaluation failed for User: {applicant.user_id} ({e})"
+                    )
+                    return ApplicantReport(
+                        job_application_id=applicant.job_application_id,
+                        user_id=applicant.user_id,
+                        error=str(e),
+                    )
+
+        tasks = [asyncio.ensure_future(_evaluate_one(a)) for a in applicants]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            # 소비자가 중간에 끊으면 남은 평가 취소
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            # 취소된 평가가 db_lock 구간을 빠져나올 때까지 대기 (세션 정리 전)
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        logger.info(f"✨ [Batch Evaluation Complete] Job: {job_id}")
 
+    async def _analyze(
+        self, job_info: JobInfo, resume_text: str, portfolio_text: str
+    ) -> AnalysisReport:
+        """개별 역량 평가(병렬) -> 종합 평가 -> 도메인 리포트 생성"""
         # 4. 개별 역량 평가 (AI 호출 Loop -> Parallel)
         # asyncio.gather를 사용하여 병렬 평가 수행
         logger.info(
-            f"🤖 Starting AI evaluation for {len(job_info.evaluation_criteria)} criteria for User: {user_id}"
+            f"🤖 Starting AI evaluation for {len(job_info.evaluation_criteria)} criteria"
         )
 
         evaluation_tasks = [
@@ -94,15 +201,83 @@ class ApplicationAnalyzer:
             job_info, competency_results
         )
 
-        report = AnalysisReport.create(
+        return AnalysisReport.create(
             job_info=job_info, results=competency_results, feedback=overall_feedback
         )
 
-        # 6. 응답 반환 (DTO 변환)
-        from ..dtos import PipelineEvaluateResponse
+    async def _load_inputs(self, user_id: int, job_id: int) -> Tuple[JobInfo, str, str]:
+        """평가에 필요한 공고 정보와 서류 텍스트를 준비 (필요 시 텍스트 추출 수행)"""
+        # 1. 채용 공고 정보 조회
+        job_info = await self.job_repo.get_job_info(job_id)
+        if not job_info:
+            logger.error(f"❌ Job not found: {job_id}")
+            raise ValueError(f"Job not found: {job_id}")
 
-        logger.info(f"✨ [Evaluation Complete] User: {user_id}, Job: {job_id}")
-        return PipelineEvaluateResponse.from_domain(report)
+        # 2. 지원자 서류 상태 조회 (Aggregate Root)
+        documents = await self.doc_repo.get_documents(user_id, job_id)
+
+        # 3. 서류 전처리 (분석 가능한 텍스트가 없으면 추출 수행)
+        if not documents.is_ready_for_analysis():
+            logger.info(f"🔄 Document preparation needed for User: {user_id}")
+            await self._prepare_documents(user_id, job_id, documents)
+            # 상태 갱신
+            documents = await self.doc_repo.get_documents(user_id, job_id)
+
+            if not documents.is_ready_for_analysis():
+                logger.error("❌ Document preparation failed.")
+                raise ValueError("Document preparation failed.")
+            logger.info(f"✅ Document preparation complete for User: {user_id}")
+
+        resume_text, portfolio_text = self._texts(documents)
+        return job_info, resume_text, portfolio_text
+
+    async def _prepare_applicant(
+        self, job_id: int, applicant: JobApplicant, db_lock: asyncio.Lock
+    ) -> Tuple[str, str]:
+        """
+        일괄 평가용 서류 전처리: 추출한 텍스트를 메모리에 바로 반영 (재조회 없음)
+        다운로드/추출은 병렬로, 저장소 기록만 db_lock으로 직렬화
+        """
+        documents = applicant.documents
+
+        for doc_type in documents.get_missing_parsed_types():
+            file_info = (
+                documents.resume_file
+                if doc_type == "RESUME"
+                else documents.portfolio_file
+            )
+            if not file_info:
+                continue
+
+            file_content = await self.file_storage.download_file(file_info.file_path)
+            text = await self.extractor.extract_text(file_content)
+
+            parsed_doc = ParsedDoc(doc_type=doc_type, text=text)
+            async with db_lock:
+                await self.doc_repo.save_parsed_doc(
+                    applicant.user_id, job_id, parsed_doc
+                )
+
+            if doc_type == "RESUME":
+                documents.parsed_resume = parsed_doc
+            else:
+                documents.parsed_portfolio = parsed_doc
+
+        if not documents.is_ready_for_analysis():
+            raise ValueError("Document preparation failed.")
+
+        return self._texts(documents)
+
+    @staticmethod
+    def _texts(documents: ApplicantDocuments) -> Tuple[str, str]:
+        """분석에 사용할 (이력서, 포트폴리오) 텍스트 반환"""
+        if not documents.parsed_resume:
+            raise ValueError("유저의 서류가 존재하지 않습니다.")
+        resume_text = documents.parsed_resume.text
+        portfolio_text = (
+            documents.parsed_portfolio.text if documents.parsed_portfolio else ""
+        )
+        return resume_text, portfolio_text
 
     async def _prepare_documents(self, user_id: int, job_id: int, documents):
         """텍스트 추출이 필요한 문서들을 처리하여 저장소에 저장하는 헬퍼 메서드 (Async)"""
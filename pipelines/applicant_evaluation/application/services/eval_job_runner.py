@@ -0,0 +1,116 @@
+import asyncio
+import contextvars
+import logging
+from typing import Awaitable, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+EvalJobHandler = Callable[[int], Awaitable[None]]
+# 재시작 시 다시 처리할 작업 ID 목록을 반환 (큐는 프로세스 메모리에만 있으므로)
+EvalJobRecovery = Callable[[], Awaitable[List[int]]]
+
+
+class EvalJobRunner:
+    """
+    비동기 평가 작업(eval_job_id)을 백그라운드에서 처리하는 워커 풀 (Async)
+    - 동시에 실행되는 평가 수는 workers 개수로 제한됨 (나머지는 FIFO 큐에서 대기)
+    - 작업 상태 기록/결과 저장은 handler의 책임이며, Runner는 실행 순서만 제어함
+    - recover가 있으면 워커 기동 시 이전 프로세스에서 끝나지 않은 작업을 다시 등록함
+      (주의) 작업에 소유자/lease 정보가 없어 RUNNING 작업을 모두 중단된 것으로 간주하므로,
+      recover는 평가 작업을 처리하는 프로세스가 1개일 때만 지정해야 함
+      (여러 API 워커/레플리카가 기동하면 다른 프로세스가 처리 중인 작업까지 다시 실행됨)
+    """
+
+    def __init__(
+        self,
+        handler: EvalJobHandler,
+        workers: int = 4,
+        recover: Optional[EvalJobRecovery] = None,
+    ):
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.recover = recover
+
+        self._queue: Optional[asyncio.Queue[int]] = None
+        self._tasks: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def pending(self) -> int:
+        """큐에서 대기 중인 작업 수"""
+        return self._queue.qsize() if self._queue else 0
+
+    def _ensure_started(self) -> asyncio.Queue[int]:
+        """현재 이벤트 루프에 워커가 없으면 기동 (lazy start)"""
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            # 워커는 첫 submit 요청 안에서 생성되므로, 그 요청의 Deadline 등
+            # 요청 단위 컨텍스트를 물려받지 않도록 빈 컨텍스트에서 실행
+            self._tasks = [
+                loop.create_task(self._worker(i), context=contextvars.Context())
+                for i in range(self.workers)
+            ]
+            logger.info(f"🧵 EvalJobRunner started with {self.workers} workers")
+        return self._queue
+
+    async def start(self) -> None:
+        """
+        워커 기동 + 미완료 작업 복구 (이미 기동되어 있으면 아무것도 하지 않음)
+        복구 실패(DB 장애 등)는 기록만 하고 신규 작업 처리는 계속함
+        """
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            return
+        queue = self._ensure_started()
+        if self.recover is None:
+            return
+        try:
+            eval_job_ids = await self.recover()
+        except Exception as e:
+            logger.error(f"❌ Eval job recovery failed: {e}", exc_info=True)
+            return
+        for eval_job_id in eval_job_ids:
+            queue.put_nowait(eval_job_id)
+        if eval_job_ids:
+            logger.info(f"♻️ Eval jobs recovered: {len(eval_job_ids)}")
+
+    async def submit(self, eval_job_id: int) -> None:
+        """평가 작업을 큐에 등록 (즉시 반환)"""
+        await self.start()
+        queue = self._ensure_started()
+        queue.put_nowait(eval_job_id)
+        logger.info(f"📥 Eval job queued: {eval_job_id} (pending: {queue.qsize()})")
+
+    async def join(self) -> None:
+        """큐에 등록된 모든 작업이 끝날 때까지 대기"""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def stop(self) -> None:
+        """
+        워커 종료 (대기 중인 작업은 PENDING 상태로 남아 다음 start()에서 복구됨)
+        실행 중인 작업의 상태 되돌리기는 handler가 취소 시점에 처리함
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+        self._loop = None
+
+    async def _worker(self, index: int) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            eval_job_id = await queue.get()
+            try:
+                await self.handler(eval_job_id)
+            except Exception as e:
+                # handler 내부에서 FAILED 처리를 하므로 여기서는 워커가 죽지 않도록만 보호
+                logger.error(
+                    f"❌ Eval job {eval_job_id} crashed in worker {index}: {e}",
+                    exc_info=True,
+                )
+            finally:
+                queue.task_done()
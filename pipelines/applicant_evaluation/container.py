@@ -0,0 +1,84 @@
+import logging
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.config import settings
+from shared.llm import build_chat_model
+from .application.services.analyzer import ApplicationAnalyzer
+from .domain.interface.adapter_interfaces import (
+    AnalystAgent,
+    FileStorage,
+    TextExtractor,
+)
+from .infrastructure.adapters.llm.ai_agent import LLMAnalyst
+from .infrastructure.adapters.llm.bounded_agent import ConcurrencyLimitedAnalyst
+from .infrastructure.adapters.llm.mock_agent import MockAnalyst
+from .infrastructure.adapters.parser.pdf_extractor import PyPdfExtractor
+from .infrastructure.adapters.storage.s3_storage import S3FileStorage
+from .infrastructure.persistence.doc_repository import SqlAlchemyDocRepository
+from .infrastructure.persistence.job_repository import SqlAlchemyJobRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ApplicantEvaluationContainer:
+    """
+    애플리케이션 수명 동안 유지되는 의존성 묶음 (Composition Root)
+    - LLM 클라이언트, S3 클라이언트, PDF 추출기 등 커넥션 풀/초기화 비용이 있는 객체는 한 번만 생성
+    - DB 세션에 묶인 Repository만 요청마다 생성
+    """
+
+    def __init__(
+        self, agent: AnalystAgent, file_storage: FileStorage, extractor: TextExtractor
+    ):
+        self.agent = agent
+        self.file_storage = file_storage
+        self.extractor = extractor
+
+    @classmethod
+    def build(cls) -> "ApplicantEvaluationContainer":
+        """설정(Mock 여부, LLM 공급자)에 따라 구현체 생성"""
+        agent: AnalystAgent
+        # use_mock 프로퍼티가 있다면 그것을 사용 (dev profile 체크 포함됨)
+        if getattr(settings, "use_mock", False):
+            agent = MockAnalyst()
+        else:
+            agent = LLMAnalyst(llm=build_chat_model())
+
+        # 모든 평가 경로가 같은 LLM 동시성 예산을 공유하도록 감싸서 주입
+        agent = ConcurrencyLimitedAnalyst(agent, settings.LLM_MAX_CONCURRENCY)
+
+        return cls(
+            agent=agent,
+            file_storage=S3FileStorage(),
+            extractor=PyPdfExtractor(),
+        )
+
+    def analyzer(self, db_session: AsyncSession) -> ApplicationAnalyzer:
+        """요청(DB 세션) 단위 Application 서비스 조립 (Wiring)"""
+        return ApplicationAnalyzer(
+            job_repo=SqlAlchemyJobRepository(db_session),
+            doc_repo=SqlAlchemyDocRepository(db_session),
+            file_storage=self.file_storage,
+            extractor=self.extractor,
+            agent=self.agent,
+        )
+
+
+_container: Optional[ApplicantEvaluationContainer] = None
+
+
+def get_container() -> ApplicantEvaluationContainer:
+    """컨테이너 반환 (lifespan에서 초기화되지 않았다면 최초 호출 시 생성)"""
+    global _container
+    if _container is None:
+        _container = ApplicantEvaluationContainer.build()
+        logger.info("📦 ApplicantEvaluationContainer initialized")
+    return _container
+
+
+def reset_container() -> None:
+    """컨테이너 폐기 (애플리케이션 종료 / 테스트 격리용)"""
+    global _container
+    _container = None
@@ -1,6 +1,8 @@
-from typing import Protocol, Optional
+from typing import List, Protocol, Optional
 from ..models.job import JobInfo
-from ..models.document import ApplicantDocuments, ParsedDoc
+from ..models.document import ApplicantDocuments, JobApplicant, ParsedDoc
+from ..models.eval_job import EvalJob, EvalJobStatus
+from ..models.report import AnalysisReport
 
 
 class JobRepository(Protocol):
@@ -24,6 +26,12 @@ class DocRepository(Protocol):
         """
         ...
 
+    async def get_applicants(self, job_id: int) -> List[JobApplicant]:
+        """
+        공고의 전체 지원자와 제출 서류를 한 번에 조회 (일괄 평가용)
+        """
+        ...
+
     async def save_parsed_doc(
         self, user_id: int, job_id: int, parsed_doc: ParsedDoc
     ) -> None:
@@ -31,3 +39,59 @@ class DocRepository(Protocol):
         새로 추출한 텍스트 데이터를 저장
         """
         ...
+
+
+class EvalJobRepository(Protocol):
+    """
+    비동기 평가 작업(ai_eval_jobs) 저장소 인터페이스 (Async)
+    """
+
+    async def create_job(self, user_id: int, job_id: int) -> Optional[EvalJob]:
+        """
+        지원 내역에 대한 평가 작업을 PENDING 상태로 생성 (지원 내역이 없으면 None)
+        """
+        ...
+
+    async def get_job(self, eval_job_id: int) -> Optional[EvalJob]:
+        """eval_job_id로 평가 작업 조회"""
+        ...
+
+    async def update_status(
+        self,
+        eval_job_id: int,
+        status: EvalJobStatus,
+        error_message: Optional[str] = None,
+    ) -> None:
+        """평가 작업 상태 변경"""
+        ...
+
+    async def claim_job(self, eval_job_id: int) -> bool:
+        """
+        PENDING 작업을 RUNNING으로 변경 (조건부 갱신)
+        이미 다른 워커가 가져갔거나 종료된 작업이면 False
+        """
+        ...
+
+    async def recover_unfinished_jobs(self) -> List[int]:
+        """
+        서버 재시작으로 중단된 작업 복구: RUNNING -> PENDING 으로 되돌리고
+        PENDING 작업 ID를 등록 순서대로 반환
+        RUNNING 작업의 소유 프로세스를 구분하지 않으므로 단일 프로세스 배포에서만 호출
+        """
+        ...
+
+
+class EvaluationRepository(Protocol):
+    """
+    지원자 평가 결과(ai_applicant_evaluation) 저장소 인터페이스 (Async)
+    """
+
+    async def save_report(
+        self, job_application_id: int, report: AnalysisReport
+    ) -> None:
+        """평가 리포트 저장 (지원 내역당 1건, Upsert)"""
+        ...
+
+    async def get_report(self, job_application_id: int) -> Optional[AnalysisReport]:
+        """저장된 평가 리포트 조회"""
+        ...
@@ -80,3 +80,11 @@ class ApplicantDocuments(BaseModel):
             missing.append("PORTFOLIO")
 
         return missing
+
+
+class JobApplicant(BaseModel):
+    """공고 일괄 평가 대상 지원자 1명 (지원 내역 + 제출 서류)"""
+
+    job_application_id: int = Field(description="지원 내역 ID")
+    user_id: int = Field(description="지원자(사용자) ID")
+    documents: ApplicantDocuments = Field(description="제출 서류")
@@ -0,0 +1,29 @@
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class EvalJobStatus(str, Enum):
+    """평가 작업 상태 (ai_eval_jobs.status)"""
+
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
+class EvalJob(BaseModel):
+    """비동기 지원자 평가 작업 1건"""
+
+    eval_job_id: int = Field(description="평가 작업 ID")
+    job_application_id: int = Field(description="지원 내역 ID")
+    user_id: int = Field(description="지원자(사용자) ID")
+    job_id: int = Field(description="채용 공고 ID (job_master_id)")
+    status: EvalJobStatus = Field(description="작업 상태")
+    error_message: Optional[str] = Field(default=None, description="실패 사유")
+    created_at: Optional[datetime] = Field(default=None, description="작업 생성 일시")
+
+    def is_finished(self) -> bool:
+        """작업이 종료(성공/실패) 상태인지 확인"""
+        return self.status in (EvalJobStatus.COMPLETED, EvalJobStatus.FAILED)
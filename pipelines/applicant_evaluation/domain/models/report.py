@@ -1,4 +1,4 @@
-from typing import List, Set
+from typing import List, Optional, Set
 from pydantic import BaseModel, Field
 from .evaluation import CompetencyResult
 from .job import JobInfo
@@ -77,3 +77,12 @@ class AnalysisReport(BaseModel):
         average = total / len(self.competency_scores)
 
         return round(average, 1)
+
+
+class ApplicantReport(BaseModel):
+    """공고 일괄 평가에서 지원자 1명의 결과 (성공 시 report, 실패 시 error)"""
+
+    job_application_id: int = Field(description="지원 내역 ID")
+    user_id: int = Field(description="지원자(사용자) ID")
+    report: Optional[AnalysisReport] = Field(default=None, description="평가 리포트")
+    error: Optional[str] = Field(default=None, description="실패 사유")
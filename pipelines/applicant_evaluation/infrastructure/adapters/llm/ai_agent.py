@@ -4,6 +4,10 @@ from typing import List
 from langchain_core.language_models import BaseChatModel
 from langchain_core.output_parsers import PydanticOutputParser
 
+from shared.concurrency import DeadlineExceeded, with_deadline
+from shared.llm.cache import cache_after_parse
+from shared.metrics import time_stage
+
 from ....domain.interface.adapter_interfaces import AnalystAgent
 from ....domain.models.job import JobInfo, EvaluationCriteria
 from ....domain.models.evaluation import CompetencyResult
@@ -22,6 +26,19 @@ class LLMAnalyst(AnalystAgent):
     def __init__(self, llm: BaseChatModel):
         self.llm = llm
 
+        # 프롬프트/파서/체인은 요청과 무관하므로 생성 시 한 번만 구성
+        # 파싱에 성공한 응답만 LLM 캐시에 기록
+        self.competency_chain = cache_after_parse(
+            get_competency_evaluation_prompt()
+            | self.llm
+            | PydanticOutputParser(pydantic_object=CompetencyResult)
+        )
+        self.report_chain = cache_after_parse(
+            get_report_synthesis_prompt()
+            | self.llm
+            | PydanticOutputParser(pydantic_object=OverallFeedback)
+        )
+
     async def evaluate_competency(
         self,
         job_info: JobInfo,
@@ -32,25 +49,24 @@ class LLMAnalyst(AnalystAgent):
         """
         단일 평가 기준에 대해 점수와 이유를 생성
         """
-        parser = PydanticOutputParser(pydantic_object=CompetencyResult)
-
-        prompt = get_competency_evaluation_prompt()
-
-        chain = prompt | self.llm | parser
-
         try:
-            result = await chain.ainvoke(
-                {
-                    "company_name": job_info.company_name,
-                    "main_tasks": ", ".join(job_info.main_tasks),
-                    "tech_stacks": ", ".join(job_info.tech_stacks),
-                    "criteria_name": criteria.name,
-                    "criteria_desc": criteria.description,
-                    "resume_text": resume_text[:10000],
-                    "portfolio_text": portfolio_text[:10000],
-                    # "format_instructions": parser.get_format_instructions(), # Removed
-                }
-            )
+            # 남은 예산 안에 응답이 없으면 요청을 끊어 토큰 과금을 멈춤
+            with time_stage("applicant_evaluation", "evaluate_competency"):
+                result = await with_deadline(
+                    self.competency_chain.ainvoke(
+                        {
+                            "company_name": job_info.company_name,
+                            "main_tasks": ", ".join(job_info.main_tasks),
+                            "tech_stacks": ", ".join(job_info.tech_stacks),
+                            "criteria_name": criteria.name,
+                            "criteria_desc": criteria.description,
+                            "resume_text": resume_text[:10000],
+                            "portfolio_text": portfolio_text[:10000],
+                            # "format_instructions": parser.get_format_instructions(), # Removed
+                        }
+                    ),
+                    stage="evaluate_competency",
+                )
 
             logger.info(
                 f"✅ Evaluated criteria: {criteria.name} (Score: {result.score})"
@@ -60,6 +76,9 @@ class LLMAnalyst(AnalystAgent):
                 name=criteria.name, score=result.score, description=result.description
             )
 
+        except DeadlineExceeded:
+            # 시간 초과는 0점 처리하지 않고 요청 전체를 중단
+            raise
         except Exception as e:
             logger.error(f"❌ Evaluation failed for {criteria.name}: {e}")
             # 실패 시 기본값 반환 혹은 재시도 로직 (여기선 0점 처리)
@@ -73,32 +92,32 @@ class LLMAnalyst(AnalystAgent):
         """
         개별 평가 결과를 종합하여 최종 리포트 생성
         """
-        parser = PydanticOutputParser(pydantic_object=OverallFeedback)
-
         # 평가 결과 요약 텍스트 생성
         results_summary = "\n".join(
             [f"- {r.name}: {r.score}점. {r.description}" for r in competency_results]
         )
 
-        prompt = get_report_synthesis_prompt()
-
-        chain = prompt | self.llm | parser
-
         try:
-            result = await chain.ainvoke(
-                {
-                    "company_name": job_info.company_name,
-                    "job_summary": job_info.summary[:500],
-                    "results_summary": results_summary,
-                    # "format_instructions": parser.get_format_instructions(), # Removed
-                }
-            )
+            with time_stage("applicant_evaluation", "synthesize_report"):
+                result = await with_deadline(
+                    self.report_chain.ainvoke(
+                        {
+                            "company_name": job_info.company_name,
+                            "job_summary": job_info.summary[:500],
+                            "results_summary": results_summary,
+                            # "format_instructions": parser.get_format_instructions(), # Removed
+                        }
+                    ),
+                    stage="synthesize_report",
+                )
 
             return OverallFeedback(
                 one_line_review=result.one_line_review,
                 feedback_detail=result.feedback_detail,
             )
 
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"❌ Report synthesis failed: {e}")
             return OverallFeedback(
@@ -0,0 +1,50 @@
+import asyncio
+from typing import List, Optional
+
+from ....domain.interface.adapter_interfaces import AnalystAgent
+from ....domain.models.job import JobInfo, EvaluationCriteria
+from ....domain.models.evaluation import CompetencyResult
+from ....domain.models.report import OverallFeedback
+
+
+class ConcurrencyLimitedAnalyst(AnalystAgent):
+    """
+    AnalystAgent 데코레이터: 프로세스 전체의 동시 LLM 호출 수를 제한
+    단건/스트리밍/일괄 평가가 같은 인스턴스를 공유하므로 LLM 동시성 예산도 공유됨
+    """
+
+    def __init__(self, agent: AnalystAgent, max_concurrency: int):
+        self.agent = agent
+        self.max_concurrency = max(1, max_concurrency)
+
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # 세마포어는 생성된 이벤트 루프에 묶이므로 루프가 바뀌면 새로 생성
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def evaluate_competency(
+        self,
+        job_info: JobInfo,
+        criteria: EvaluationCriteria,
+        resume_text: str,
+        portfolio_text: str,
+    ) -> CompetencyResult:
+        async with self._get_semaphore():
+            return await self.agent.evaluate_competency(
+                job_info=job_info,
+                criteria=criteria,
+                resume_text=resume_text,
+                portfolio_text=portfolio_text,
+            )
+
+    async def synthesize_report(
+        self, job_info: JobInfo, competency_results: List[CompetencyResult]
+    ) -> OverallFeedback:
+        async with self._get_semaphore():
+            return await self.agent.synthesize_report(job_info, competency_results)
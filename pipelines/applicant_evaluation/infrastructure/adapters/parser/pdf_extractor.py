@@ -1,8 +1,14 @@
 import io
 import asyncio
+import logging
+import time
 import pdfplumber
+from shared.concurrency import with_deadline
+from shared.metrics import time_stage
 from ....domain.interface.adapter_interfaces import TextExtractor
 
+logger = logging.getLogger(__name__)
+
 
 class PyPdfExtractor(TextExtractor):
     """
@@ -16,6 +22,7 @@ class PyPdfExtractor(TextExtractor):
         """
 
         def _extract_sync():
+            started = time.perf_counter()
             try:
                 # BytesIO를 사용하여 메모리 스트림 생성
                 pdf_stream = io.BytesIO(pdf_content)
@@ -31,8 +38,17 @@ class PyPdfExtractor(TextExtractor):
                 return "\n\n".join(full_text).strip()
 
             except Exception as e:
-                # 로그를 남기는 것이 좋지만, 여기서는 간단히 빈 문자열 반환하거나 에러 출력
-                print(f"PDF extraction failed with pdfplumber: {e}")
+                # 추출 실패는 빈 문자열로 처리 (호출 측에서 서류 준비 실패로 판단)
+                logger.error(
+                    f"❌ PDF extraction failed with pdfplumber: {e}",
+                    extra={
+                        "stage": "pdf_extraction",
+                        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                    },
+                )
                 return ""
 
-        return await asyncio.to_thread(_extract_sync)
+        with time_stage("applicant_evaluation", "pdf_extraction"):
+            return await with_deadline(
+                asyncio.to_thread(_extract_sync), stage="pdf_extraction"
+            )
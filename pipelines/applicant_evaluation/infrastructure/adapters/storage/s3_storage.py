@@ -1,9 +1,15 @@
 import asyncio
+import logging
+import time
 import boto3
 from botocore.exceptions import ClientError
+from shared.concurrency import with_deadline
 from shared.config import settings
+from shared.metrics import time_stage
 from ....domain.interface.adapter_interfaces import FileStorage
 
+logger = logging.getLogger(__name__)
+
 
 class S3FileStorage(FileStorage):
     """
@@ -30,11 +36,20 @@ class S3FileStorage(FileStorage):
             response = self.s3_client.get_object(Bucket=self.bucket, Key=file_path)
             return response["Body"].read()
 
+        started = time.perf_counter()
         try:
-            return await asyncio.to_thread(_download_sync)
+            with time_stage("applicant_evaluation", "s3_download"):
+                return await with_deadline(
+                    asyncio.to_thread(_download_sync), stage="s3_download"
+                )
         except ClientError as e:
-            # TODO: 로깅 (e.g. logger.error)
-            print(f"S3 Download Error: {e}")
+            logger.error(
+                f"❌ S3 download failed: {file_path} ({e})",
+                extra={
+                    "stage": "s3_download",
+                    "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                },
+            )
             raise FileNotFoundError(f"Failed to download file from S3: {file_path}")
 
     async def upload_file(
@@ -55,9 +70,16 @@ class S3FileStorage(FileStorage):
                 ContentType=content_type,
             )
 
+        started = time.perf_counter()
         try:
             await asyncio.to_thread(_upload_sync)
             return destination_path
         except ClientError as e:
-            print(f"S3 Upload Error: {e}")
+            logger.error(
+                f"❌ S3 upload failed: {destination_path} ({e})",
+                extra={
+                    "stage": "s3_upload",
+                    "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                },
+            )
             raise RuntimeError(f"Failed to upload file to S3: {e}")
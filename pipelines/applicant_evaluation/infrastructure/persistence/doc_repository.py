@@ -1,3 +1,5 @@
+from collections import defaultdict
+from typing import List, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import joinedload
@@ -5,13 +7,19 @@ from sqlalchemy.exc import NoResultFound
 import datetime
 
 
+from shared.metrics import timed_query
 from shared.db.model.models import (
     JobApplication,
     ApplicationDocument,
     ApplicationDocumentParsed,
 )
 from ...domain.interface.repository_interfaces import DocRepository
-from ...domain.models.document import ApplicantDocuments, ParsedDoc, FileInfo
+from ...domain.models.document import (
+    ApplicantDocuments,
+    FileInfo,
+    JobApplicant,
+    ParsedDoc,
+)
 
 
 class SqlAlchemyDocRepository(DocRepository):
@@ -22,6 +30,7 @@ class SqlAlchemyDocRepository(DocRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    @timed_query
     async def get_documents(self, user_id: int, job_id: int) -> ApplicantDocuments:
         # 1. 지원 내역(JobApplication) 조회
         stmt = select(JobApplication).where(
@@ -49,7 +58,56 @@ class SqlAlchemyDocRepository(DocRepository):
         doc_result = await self.session.execute(doc_stmt)
         docs = doc_result.scalars().unique().all()  # unique() 권장 (joinedload 사용시)
 
-        # 3. 도메인 객체 조립 (Aggregating)
+        return self._to_documents(docs)
+
+    @timed_query
+    async def get_applicants(self, job_id: int) -> List[JobApplicant]:
+        # 1. 공고의 전체 지원 내역 조회 (삭제된 지원 제외)
+        stmt = (
+            select(JobApplication)
+            .where(
+                JobApplication.job_master_id == job_id,
+                JobApplication.deleted_at.is_(None),
+            )
+            .order_by(JobApplication.job_application_id)
+        )
+        result = await self.session.execute(stmt)
+        applications = result.scalars().all()
+
+        if not applications:
+            return []
+
+        # 2. 전체 지원자의 문서를 한 번의 쿼리로 조회 (N+1 방지)
+        application_ids = [a.job_application_id for a in applications]
+        doc_stmt = (
+            select(ApplicationDocument)
+            .options(
+                joinedload(ApplicationDocument.file),
+                joinedload(ApplicationDocument.parsed),  # type: ignore
+            )
+            .where(ApplicationDocument.job_application_id.in_(application_ids))
+        )
+        doc_result = await self.session.execute(doc_stmt)
+
+        docs_by_application = defaultdict(list)
+        for doc in doc_result.scalars().unique().all():
+            docs_by_application[doc.job_application_id].append(doc)
+
+        # 3. 지원자별 도메인 객체 조립
+        return [
+            JobApplicant(
+                job_application_id=int(a.job_application_id),  # type: ignore
+                user_id=int(a.user_id),  # type: ignore
+                documents=self._to_documents(
+                    docs_by_application.get(a.job_application_id, [])
+                ),
+            )
+            for a in applications
+        ]
+
+    @staticmethod
+    def _to_documents(docs: Sequence[ApplicationDocument]) -> ApplicantDocuments:
+        """문서 행 목록 -> 도메인 객체 조립 (Aggregating)"""
         agg = ApplicantDocuments()
 
         for doc in docs:
@@ -84,6 +142,7 @@ class SqlAlchemyDocRepository(DocRepository):
 
         return agg
 
+    @timed_query
     async def save_parsed_doc(
         self, user_id: int, job_id: int, parsed_doc: ParsedDoc
     ) -> None:
@@ -0,0 +1,127 @@
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
+from sqlalchemy.orm import joinedload
+import datetime
+
+from shared.metrics import timed_query
+from shared.db.model.models import AiEvalJob, JobApplication
+from ...domain.interface.repository_interfaces import EvalJobRepository
+from ...domain.models.eval_job import EvalJob, EvalJobStatus
+
+EVAL_TYPE = "APPLICANT_EVALUATION"
+
+
+class SqlAlchemyEvalJobRepository(EvalJobRepository):
+    """
+    ai_eval_jobs 테이블 기반 평가 작업 Repository 구현체 (Async)
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @timed_query
+    async def create_job(self, user_id: int, job_id: int) -> Optional[EvalJob]:
+        # 1. 지원 내역(JobApplication) 조회
+        stmt = select(JobApplication).where(
+            JobApplication.user_id == user_id, JobApplication.job_master_id == job_id
+        )
+        result = await self.session.execute(stmt)
+        application = result.scalars().first()
+
+        if not application:
+            return None
+
+        # 2. 작업 행 생성 (PENDING)
+        now = datetime.datetime.now()
+        record = AiEvalJob(
+            job_application_id=application.job_application_id,
+            requested_by=user_id,
+            eval_type=EVAL_TYPE,
+            status=EvalJobStatus.PENDING.value,
+            created_at=now,
+        )
+        self.session.add(record)
+        await self.session.flush()  # eval_job_id 채번
+
+        return EvalJob(
+            eval_job_id=int(record.eval_job_id),  # type: ignore
+            job_application_id=int(application.job_application_id),  # type: ignore
+            user_id=user_id,
+            job_id=job_id,
+            status=EvalJobStatus.PENDING,
+            created_at=now,
+        )
+
+    @timed_query
+    async def get_job(self, eval_job_id: int) -> Optional[EvalJob]:
+        stmt = (
+            select(AiEvalJob)
+            .options(joinedload(AiEvalJob.application))
+            .where(AiEvalJob.eval_job_id == eval_job_id)
+        )
+        result = await self.session.execute(stmt)
+        record = result.scalars().first()
+
+        if not record or not record.application:
+            return None
+
+        return EvalJob(
+            eval_job_id=int(record.eval_job_id),  # type: ignore
+            job_application_id=int(record.job_application_id),  # type: ignore
+            user_id=int(record.application.user_id),  # type: ignore
+            job_id=int(record.application.job_master_id),  # type: ignore
+            status=EvalJobStatus(str(record.status)),
+            error_message=record.error_message,  # type: ignore
+            created_at=record.created_at,  # type: ignore
+        )
+
+    @timed_query
+    async def update_status(
+        self,
+        eval_job_id: int,
+        status: EvalJobStatus,
+        error_message: Optional[str] = None,
+    ) -> None:
+        record = await self.session.get(AiEvalJob, eval_job_id)
+        if not record:
+            return
+
+        record.status = status.value  # type: ignore
+        record.error_message = error_message  # type: ignore
+        await self.session.flush()
+
+    @timed_query
+    async def claim_job(self, eval_job_id: int) -> bool:
+        # 조건부 UPDATE로 같은 작업이 두 번 실행되지 않도록 함 (복구 + 신규 등록 중복 등)
+        stmt = (
+            update(AiEvalJob)
+            .where(
+                AiEvalJob.eval_job_id == eval_job_id,
+                AiEvalJob.status == EvalJobStatus.PENDING.value,
+            )
+            .values(status=EvalJobStatus.RUNNING.value, error_message=None)
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount == 1
+
+    @timed_query
+    async def recover_unfinished_jobs(self) -> List[int]:
+        await self.session.execute(
+            update(AiEvalJob)
+            .where(
+                AiEvalJob.eval_type == EVAL_TYPE,
+                AiEvalJob.status == EvalJobStatus.RUNNING.value,
+            )
+            .values(status=EvalJobStatus.PENDING.value)
+        )
+        stmt = (
+            select(AiEvalJob.eval_job_id)
+            .where(
+                AiEvalJob.eval_type == EVAL_TYPE,
+                AiEvalJob.status == EvalJobStatus.PENDING.value,
+            )
+            .order_by(AiEvalJob.eval_job_id)
+        )
+        result = await self.session.execute(stmt)
+        return [int(eval_job_id) for eval_job_id in result.scalars().all()]
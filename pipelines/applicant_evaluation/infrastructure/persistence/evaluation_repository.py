@@ -0,0 +1,76 @@
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+import datetime
+
+from shared.metrics import timed_query
+from shared.db.model.models import AiApplicantEvaluation
+from ...domain.interface.repository_interfaces import EvaluationRepository
+from ...domain.models.evaluation import CompetencyResult
+from ...domain.models.report import AnalysisReport
+
+
+class SqlAlchemyEvaluationRepository(EvaluationRepository):
+    """
+    ai_applicant_evaluation 테이블 기반 평가 결과 Repository 구현체 (Async)
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @timed_query
+    async def save_report(
+        self, job_application_id: int, report: AnalysisReport
+    ) -> None:
+        stmt = select(AiApplicantEvaluation).where(
+            AiApplicantEvaluation.job_application_id == job_application_id
+        )
+        result = await self.session.execute(stmt)
+        existing = result.scalars().first()
+
+        now = datetime.datetime.now()
+        scores = [r.model_dump() for r in report.competency_scores]
+
+        if existing:
+            # Update
+            existing.overall_score = round(report.overall_score)  # type: ignore
+            existing.one_line_review = report.one_line_review  # type: ignore
+            existing.feedback_detail = report.feedback_detail  # type: ignore
+            existing.comparison_scores = scores  # type: ignore
+            existing.updated_at = now  # type: ignore
+            existing.deleted_at = None  # type: ignore
+        else:
+            # Insert
+            self.session.add(
+                AiApplicantEvaluation(
+                    job_application_id=job_application_id,
+                    overall_score=round(report.overall_score),
+                    one_line_review=report.one_line_review,
+                    feedback_detail=report.feedback_detail,
+                    comparison_scores=scores,
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+
+        await self.session.flush()
+
+    @timed_query
+    async def get_report(self, job_application_id: int) -> Optional[AnalysisReport]:
+        stmt = select(AiApplicantEvaluation).where(
+            AiApplicantEvaluation.job_application_id == job_application_id,
+            AiApplicantEvaluation.deleted_at.is_(None),
+        )
+        result = await self.session.execute(stmt)
+        record = result.scalars().first()
+
+        if not record:
+            return None
+
+        # overall_score 컬럼은 정수이므로, 응답 점수는 역량별 점수에서 다시 계산 (도메인 로직)
+        scores = record.comparison_scores if record.comparison_scores else []
+        return AnalysisReport(
+            competency_scores=[CompetencyResult(**item) for item in scores],
+            one_line_review=str(record.one_line_review),
+            feedback_detail=str(record.feedback_detail),
+        )
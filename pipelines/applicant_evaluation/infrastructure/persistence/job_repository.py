@@ -2,6 +2,7 @@ from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import joinedload
+from shared.metrics import timed_query
 from shared.db.model.models import JobMaster, JobMasterSkill, Skill
 from ...domain.interface.repository_interfaces import JobRepository
 from ...domain.models.job import JobInfo, EvaluationCriteria
@@ -15,6 +16,7 @@ class SqlAlchemyJobRepository(JobRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    @timed_query
     async def get_job_info(self, job_id: int) -> Optional[JobInfo]:
         # 1. JobMaster + Company 조회
         stmt = (
@@ -1,20 +1,55 @@
+import asyncio
 import logging
+from typing import AsyncIterator, List, Optional
 from shared.db.connection import get_db
-from .infrastructure.persistence.job_repository import SqlAlchemyJobRepository
-from .infrastructure.persistence.doc_repository import SqlAlchemyDocRepository
+from sqlalchemy.ext.asyncio import AsyncSession
+from .infrastructure.persistence.eval_job_repository import SqlAlchemyEvalJobRepository
+from .infrastructure.persistence.evaluation_repository import (
+    SqlAlchemyEvaluationRepository,
+)
 from shared.config import settings
-from .infrastructure.adapters.llm.ai_agent import LLMAnalyst
-from .infrastructure.adapters.llm.mock_agent import MockAnalyst
-from .domain.interface.adapter_interfaces import AnalystAgent
-from .infrastructure.adapters.storage.s3_storage import S3FileStorage
-from .infrastructure.adapters.parser.pdf_extractor import PyPdfExtractor
+from .domain.models.eval_job import EvalJobStatus
 from .application.services.analyzer import ApplicationAnalyzer
-from shared.schema.applicant import EvaluateRequest, EvaluateResponse
-from langchain_core.language_models import BaseChatModel
+from .container import get_container, reset_container
+from .application.services.eval_job_runner import EvalJobRunner
+from .application.dtos import (
+    PipelineBatchEvaluateItem,
+    PipelineEvaluateResponse,
+    PipelineEvaluateStreamEvent,
+)
+from shared.schema.applicant import (
+    BatchEvaluateRequest,
+    BatchEvaluateSummary,
+    EvaluateRequest,
+    EvaluateResponse,
+    EvaluateJobStatusResponse,
+    EvaluateJobSubmitResponse,
+    EvaluateStreamEvent,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _build_analyzer(db_session: AsyncSession) -> ApplicationAnalyzer:
+    """수명 긴 의존성(컨테이너) + 요청 단위 DB 세션으로 Application 서비스 조립"""
+    return get_container().analyzer(db_session)
+
+
+async def startup() -> None:
+    """
+    애플리케이션 시작 시 장수명 클라이언트 초기화 (FastAPI lifespan)
+    평가 워커를 기동하고 이전 프로세스에서 끝나지 않은 평가 작업을 다시 등록
+    """
+    await asyncio.to_thread(get_container)
+    await eval_job_runner.start()
+
+
+async def shutdown() -> None:
+    """애플리케이션 종료 시 워커 정리 및 컨테이너 폐기"""
+    await eval_job_runner.stop()
+    reset_container()
+
+
 async def run_pipeline(request: EvaluateRequest) -> EvaluateResponse:
     """
     지원자 평가 파이프라인의 메인 진입점 (Async Entrypoint)
@@ -22,67 +57,227 @@ async def run_pipeline(request: EvaluateRequest) -> EvaluateResponse:
     """
     # DB 세션 라이프사이클 관리 (Async Generator)
     async for db_session in get_db():
-        # 1. Infrastructure Layer의 구현체 생성 (Dependencies)
-        job_repo = SqlAlchemyJobRepository(db_session)
-        doc_repo = SqlAlchemyDocRepository(db_session)
-
-        file_storage = S3FileStorage()
-        extractor = PyPdfExtractor()
-
-        # External Clients (DI) & Mock Selection
-        # use_mock 프로퍼티가 있다면 그것을 사용 (dev profile 체크 포함됨)
-        # 또는 settings.USE_MOCK을 직접 사용해도 됨
-        agent: AnalystAgent
-        if getattr(settings, "use_mock", False):
-            agent = MockAnalyst()
-        else:
-            llm_model: BaseChatModel
-            if getattr(settings, "LLM_PROVIDER", "openai") == "gemini":
-                from langchain_google_genai import ChatGoogleGenerativeAI
-
-                model = getattr(settings, "GOOGLE_MODEL", "gemini-3-flash-preview")
-                logger.info(f"🤖 Initializing LLMJobExtractor with gemini ({model})")
-
-                llm_model = ChatGoogleGenerativeAI(
-                    model=model,
-                    google_api_key=settings.GOOGLE_API_KEY,
-                    temperature=0,
-                )
-            else:
-                from langchain_openai import ChatOpenAI
-                from pydantic import SecretStr
-
-                model = getattr(settings, "OPENAI_MODEL", "gpt-4o-mini")
-                logger.info(f"🤖 Initializing LLMJobExtractor with OpenAI ({model})")
-
-                llm_model = ChatOpenAI(
-                    model=model,
-                    temperature=0,
-                    api_key=(
-                        SecretStr(settings.OPENAI_API_KEY)
-                        if settings.OPENAI_API_KEY
-                        else None
-                    ),
-                    model_kwargs={"response_format": {"type": "json_object"}},
-                )
-            agent = LLMAnalyst(llm=llm_model)
-
-        # 2. Application Layer 서비스에 의존성 주입 (Wiring)
-        analyzer = ApplicationAnalyzer(
-            job_repo=job_repo,
-            doc_repo=doc_repo,
-            file_storage=file_storage,
-            extractor=extractor,
-            agent=agent,
-        )
+        analyzer = _build_analyzer(db_session)
 
-        # 3. 비즈니스 로직 실행 (Async)
-        # 서비스 계층의 run 메서드도 async여야 함
+        # 비즈니스 로직 실행 (Async)
         result = await analyzer.run(int(request.user_id), int(request.job_posting_id))
 
-        # 4. 트랜잭션 커밋 (저장소 변경사항 반영)
+        # 트랜잭션 커밋 (저장소 변경사항 반영)
         await db_session.commit()
 
         return result
 
     raise RuntimeError("Failed to obtain database session")
+
+
+async def stream_pipeline(
+    request: EvaluateRequest,
+) -> AsyncIterator[EvaluateStreamEvent]:
+    """
+    지원자 평가 파이프라인 (Streaming Entrypoint)
+    역량별 평가 결과가 끝나는 대로 이벤트를 내보내고, 마지막에 종합 평가/최종 결과를 내보냅니다.
+    """
+    async for db_session in get_db():
+        analyzer = _build_analyzer(db_session)
+
+        async for item in analyzer.evaluate_stream(
+            int(request.user_id), int(request.job_posting_id)
+        ):
+            yield PipelineEvaluateStreamEvent.from_domain(item)
+
+        # 서류 전처리 결과 반영
+        await db_session.commit()
+        return
+
+    raise RuntimeError("Failed to obtain database session")
+
+
+async def batch_stream_pipeline(
+    request: BatchEvaluateRequest,
+) -> AsyncIterator[EvaluateStreamEvent]:
+    """
+    공고 단위 일괄 평가 파이프라인 (Streaming Entrypoint)
+    지원자별 평가가 끝나는 대로 결과를 저장(커밋)하고 applicant 이벤트로 내보낸 뒤,
+    마지막에 summary 이벤트를 내보냅니다.
+    """
+    async for db_session in get_db():
+        analyzer = _build_analyzer(db_session)
+        evaluation_repo = SqlAlchemyEvaluationRepository(db_session)
+        # 하나의 세션을 여러 평가 태스크가 공유하므로 DB 접근 직렬화
+        db_lock = asyncio.Lock()
+
+        total = succeeded = 0
+        async for item in analyzer.evaluate_batch(
+            int(request.job_posting_id),
+            db_lock,
+            max_in_flight=settings.LLM_MAX_CONCURRENCY,
+        ):
+            total += 1
+            if item.report:
+                saved = False
+                try:
+                    async with db_lock:
+                        # 지원자별 SAVEPOINT: 저장 실패 시 이 지원자의 결과만 되돌림
+                        # (세션을 공유하는 다른 지원자의 서류 전처리 결과는 유지)
+                        async with db_session.begin_nested():
+                            await evaluation_repo.save_report(
+                                item.job_application_id, item.report
+                            )
+                        saved = True
+                        await db_session.commit()
+                    succeeded += 1
+                except Exception as e:
+                    logger.error(
+                        f"❌ Failed to save evaluation: {item.job_application_id} ({e})"
+                    )
+                    if saved:
+                        # 커밋 실패는 세션 전체를 되돌려야 세션을 다시 사용할 수 있음
+                        async with db_lock:
+                            await db_session.rollback()
+                    item = item.model_copy(update={"error": str(e)})
+
+            yield EvaluateStreamEvent(
+                event="applicant",
+                data=PipelineBatchEvaluateItem.from_domain(item).model_dump(),
+            )
+
+        # 저장에 실패한 지원자의 서류 전처리 결과 등 남은 변경사항 반영
+        async with db_lock:
+            await db_session.commit()
+
+        summary = BatchEvaluateSummary(
+            total=total, succeeded=succeeded, failed=total - succeeded
+        )
+        yield EvaluateStreamEvent(event="summary", data=summary.model_dump())
+        return
+
+    raise RuntimeError("Failed to obtain database session")
+
+
+async def _process_eval_job(eval_job_id: int) -> None:
+    """
+    백그라운드 워커에서 실행되는 평가 작업 처리기
+    PENDING -> RUNNING -> (평가 수행 + 결과 저장) -> COMPLETED / FAILED
+    서버 종료로 취소되면 PENDING으로 되돌려 재기동 시 다시 처리
+    """
+    async for db_session in get_db():
+        job_repo = SqlAlchemyEvalJobRepository(db_session)
+        eval_job = await job_repo.get_job(eval_job_id)
+        if not eval_job:
+            logger.error(f"❌ Eval job not found: {eval_job_id}")
+            return
+
+        # 복구 등록과 신규 등록이 겹치거나 이미 처리된 작업은 건너뜀
+        if not await job_repo.claim_job(eval_job_id):
+            await db_session.rollback()
+            logger.info(f"⏭️ Eval job already taken: {eval_job_id}")
+            return
+        await db_session.commit()
+
+        try:
+            analyzer = _build_analyzer(db_session)
+            report = await analyzer.evaluate(eval_job.user_id, eval_job.job_id)
+
+            await SqlAlchemyEvaluationRepository(db_session).save_report(
+                eval_job.job_application_id, report
+            )
+            await job_repo.update_status(eval_job_id, EvalJobStatus.COMPLETED)
+            await db_session.commit()
+            logger.info(f"✅ Eval job completed: {eval_job_id}")
+
+        except asyncio.CancelledError:
+            logger.warning(f"⚠️ Eval job interrupted, back to PENDING: {eval_job_id}")
+            try:
+                await db_session.rollback()
+                await job_repo.update_status(eval_job_id, EvalJobStatus.PENDING)
+                await db_session.commit()
+            except Exception as e:
+                # 되돌리지 못한 RUNNING 작업은 재기동 시 recover에서 복구
+                logger.error(f"❌ Failed to release eval job {eval_job_id}: {e}")
+            raise
+
+        except Exception as e:
+            logger.error(f"❌ Eval job failed: {eval_job_id} ({e})", exc_info=True)
+            await db_session.rollback()
+            await job_repo.update_status(
+                eval_job_id, EvalJobStatus.FAILED, error_message=str(e)
+            )
+            await db_session.commit()
+        return
+
+
+async def _recover_eval_jobs() -> List[int]:
+    """
+    큐는 프로세스 메모리에만 있으므로, 기동 시 DB에 남은 미완료 작업을 다시 등록
+    (단일 API 프로세스 전제: 모든 RUNNING 작업을 중단된 것으로 보고 PENDING으로 되돌리므로
+    uvicorn --workers 2 이상이나 레플리카 여러 개로 띄우면 처리 중인 작업이 중복 실행됨)
+    """
+    async for db_session in get_db():
+        eval_job_ids = await SqlAlchemyEvalJobRepository(
+            db_session
+        ).recover_unfinished_jobs()
+        await db_session.commit()
+        return eval_job_ids
+
+    raise RuntimeError("Failed to obtain database session")
+
+
+# 프로세스 단위 워커 풀 (startup 또는 첫 submit 시점에 현재 이벤트 루프에서 기동)
+eval_job_runner = EvalJobRunner(
+    handler=_process_eval_job,
+    workers=settings.EVAL_JOB_WORKERS,
+    recover=_recover_eval_jobs,
+)
+
+
+async def submit_pipeline(
+    request: EvaluateRequest,
+) -> Optional[EvaluateJobSubmitResponse]:
+    """
+    지원자 평가 작업 등록 (Submit)
+    ai_eval_jobs 행을 생성하고 즉시 반환하며, 실제 평가는 백그라운드 워커가 수행합니다.
+    지원 내역이 없으면 None 반환
+    """
+    async for db_session in get_db():
+        job_repo = SqlAlchemyEvalJobRepository(db_session)
+        eval_job = await job_repo.create_job(
+            int(request.user_id), int(request.job_posting_id)
+        )
+        if not eval_job:
+            return None
+        await db_session.commit()
+
+        await eval_job_runner.submit(eval_job.eval_job_id)
+        return EvaluateJobSubmitResponse(
+            eval_job_id=eval_job.eval_job_id, status=eval_job.status.value
+        )
+
+    raise RuntimeError("Failed to obtain database session")
+
+
+async def get_job_pipeline(eval_job_id: int) -> Optional[EvaluateJobStatusResponse]:
+    """
+    지원자 평가 작업 상태/결과 조회 (Poll)
+    작업이 없으면 None 반환
+    """
+    async for db_session in get_db():
+        eval_job = await SqlAlchemyEvalJobRepository(db_session).get_job(eval_job_id)
+        if not eval_job:
+            return None
+
+        result = None
+        if eval_job.status == EvalJobStatus.COMPLETED:
+            report = await SqlAlchemyEvaluationRepository(db_session).get_report(
+                eval_job.job_application_id
+            )
+            if report:
+                result = PipelineEvaluateResponse.from_domain(report)
+
+        return EvaluateJobStatusResponse(
+            eval_job_id=eval_job.eval_job_id,
+            status=eval_job.status.value,
+            result=result,
+            error_message=eval_job.error_message,
+        )
+
+    raise RuntimeError("Failed to obtain database session")
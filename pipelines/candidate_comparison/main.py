@@ -1,12 +1,16 @@
+import logging
+
 from shared.schema.applicant import CompareRequest, CompareResponse, ComparisonMetric
 
+logger = logging.getLogger(__name__)
+
 
 async def run_pipeline(request: CompareRequest) -> CompareResponse:
     """
     Execute the Candidate Comparison Pipeline.
     Currently returns dummy data directly.
     """
-    print(
+    logger.info(
         f"Running Candidate Comparison Pipeline for user {request.user_id} vs {request.competitor}"
     )
 
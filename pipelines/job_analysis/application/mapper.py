@@ -1,4 +1,4 @@
-from ..domain.models.job_data import ExtractedJobData
+from ..domain.models.job_data import ExtractedJobData, StoredJobPost
 from datetime import datetime
 from shared.schema.job_posting import (
     JobPostingAnalyzeResponse,
@@ -14,7 +14,22 @@ class JobDataMapper:
     """
 
     @staticmethod
-    def to_analyze_response(data: ExtractedJobData) -> JobPostingAnalyzeResponse:
+    def to_existing_response(post: StoredJobPost) -> JobPostingAnalyzeResponse:
+        """이미 등록된 공고 -> 저장된 분석 결과 그대로 응답 (크롤링/LLM 생략)"""
+        return JobDataMapper.to_analyze_response(
+            post.data,
+            job_posting_id=post.job_post_id,
+            is_existing=True,
+            recruitment_status=post.recruitment_status,
+        )
+
+    @staticmethod
+    def to_analyze_response(
+        data: ExtractedJobData,
+        job_posting_id: int = 0,
+        is_existing: bool = False,
+        recruitment_status: str = "OPEN",
+    ) -> JobPostingAnalyzeResponse:
         recruitment_period = None
         if data.start_date or data.end_date:
             start_d = (
@@ -30,13 +45,13 @@ class JobDataMapper:
             recruitment_period = RecruitmentPeriod(start_date=start_d, end_date=end_d)
 
         return JobPostingAnalyzeResponse(
-            job_posting_id=0,
-            is_existing=False,
+            job_posting_id=job_posting_id,
+            is_existing=is_existing,
             company_name=data.company_name,
             job_title=data.job_title,
             main_responsibilities=data.main_tasks,
             required_skills=data.tech_stacks,
-            recruitment_status="OPEN",
+            recruitment_status=recruitment_status,
             recruitment_period=recruitment_period,
             ai_summary=data.ai_summary or "",
             evaluation_criteria=[
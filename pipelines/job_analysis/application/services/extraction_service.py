@@ -1,12 +1,32 @@
 import logging
 import asyncio
+import inspect
+from typing import Optional, Tuple, Union
+from shared.concurrency import with_deadline
+from shared.metrics import REGISTRY
 from shared.schema.job_posting import JobPostingAnalyzeResponse
-from ...domain.interface.crawler import WebCrawler
+from ...domain.interface.crawler import AsyncWebCrawler, PostingCrawler, WebCrawler
 from ...domain.interface.extractor import JobDataExtractor
+from ...domain.interface.repository import JobPostRepository
+from ...domain.models.job_data import PostingFields
+from ...domain.services.section_pruner import SectionPruner
+from ...domain.services.url_canonicalizer import canonicalize_job_url, hash_job_url
 from ..mapper import JobDataMapper
 
 logger = logging.getLogger(__name__)
 
+INPUT_TOKENS = REGISTRY.histogram(
+    "job_analysis_input_tokens",
+    "LLM 추출 입력 토큰 수 (raw=크롤링 원문, pruned=섹션 정리 후)",
+    ["stage"],
+    buckets=(250, 500, 1000, 2000, 3000, 4000, 6000, 8000, 12000),
+)
+JOB_POST_LOOKUPS = REGISTRY.counter(
+    "job_post_lookup_total",
+    "기존 공고 조회 결과 (hash=source_url_hash 일치, source_url=해시 불일치·원본 URL로만 일치, miss=없음)",
+    ["result"],
+)
+
 
 class JobExtractionService:
     """
@@ -14,11 +34,47 @@ class JobExtractionService:
     (Infrastructure에 대한 의존성을 주입받거나 Factory를 통해 해결)
     """
 
-    def __init__(self, crawler: WebCrawler, extractor: JobDataExtractor):
+    def __init__(
+        self,
+        crawler: Union[WebCrawler, AsyncWebCrawler, PostingCrawler],
+        extractor: JobDataExtractor,
+        pruner: Optional[SectionPruner] = None,
+    ):
         # DIP: 구체 클래스 대신 인터페이스 사용
         # 외부에서(Main 등) 반드시 구현체를 주입해줘야 함
         self.crawler = crawler
         self.extractor = extractor
+        # 추출 전 섹션 정리 (없으면 크롤링 원문 그대로 추출)
+        self.pruner = pruner
+
+    async def find_existing(
+        self, url: str, job_posts: JobPostRepository
+    ) -> Optional[JobPostingAnalyzeResponse]:
+        """
+        이미 등록된 공고(표준화 URL 해시 일치)면 저장된 분석 결과 반환, 없으면 None
+        해시로 찾지 못했지만 source_url(원본/표준화 URL)로 찾으면 저장 쪽 해시 규칙이
+        url_canonicalizer의 계약과 다른 것이므로 경고를 남기고 그 공고를 사용
+        """
+        url_hash = hash_job_url(url)
+        stored = await job_posts.find_by_url_hash(url_hash)
+        if stored is None:
+            source_urls = list(dict.fromkeys([url, canonicalize_job_url(url)]))
+            stored = await job_posts.find_by_source_url(source_urls)
+            if stored is None:
+                JOB_POST_LOOKUPS.inc(result="miss")
+                return None
+            JOB_POST_LOOKUPS.inc(result="source_url")
+            logger.warning(
+                f"⚠️ source_url_hash mismatch: job post {stored.job_post_id} matched by "
+                f"source_url but not by hash {url_hash} (see url_canonicalizer contract)"
+            )
+        else:
+            JOB_POST_LOOKUPS.inc(result="hash")
+
+        logger.info(
+            f"♻️ Existing job post {stored.job_post_id} found. Skipping crawl/extraction."
+        )
+        return JobDataMapper.to_existing_response(stored)
 
     async def extract_job_data(self, url: str) -> JobPostingAnalyzeResponse:
         """
@@ -33,9 +89,10 @@ class JobExtractionService:
 
         try:
             # 1. 크롤링 (Crawling)
-            # Playwright는 Blocking I/O이므로 별도 스레드에서 실행
+            # async 크롤러는 이벤트 루프에서 바로 await, sync 크롤러(Blocking I/O)는 별도 스레드에서 실행
+            # (스레드에도 Deadline이 전파되어 브라우저 단계별 타임아웃이 남은 예산으로 잡힘)
             logger.info(f"🌐 Crawling URL: {url}")
-            raw_text = await asyncio.to_thread(self.crawler.fetch, url)
+            raw_text, fields = await with_deadline(self._crawl(url), stage="crawl")
 
             if not raw_text or len(raw_text) < 50:
                 logger.warning("⚠️ Crawled content is too short.")
@@ -45,20 +102,52 @@ class JobExtractionService:
                 f"✅ Crawling complete ({len(raw_text)} chars). Starting extraction..."
             )
 
-            # 2. 추출 (Extraction)
-            extracted_data = await self.extractor.extract(raw_text)
+            # 2. 섹션 정리 (지원 방법/복지/근무지, 같은 회사 공고의 반복 소개 문구 제거)
+            text = self._prune(url, raw_text)
+
+            # 3. 추출 (Extraction) - 마크업에서 확인한 필드는 LLM이 다시 추출하지 않음
+            if fields is not None:
+                extracted_data = await self.extractor.extract(text, known=fields)
+            else:
+                extracted_data = await self.extractor.extract(text)
             if not extracted_data:
                 logger.error("❌ LLM Extraction returned empty result")
                 raise RuntimeError("LLM Extraction returned empty result")
+            if self.pruner is not None:
+                # 다음 공고의 반복 문구 판별용 (회사명은 추출 결과로만 알 수 있음)
+                self.pruner.remember(url, raw_text, extracted_data.company_name)
 
             logger.info(
                 f"✅ Extraction complete for '{extracted_data.company_name}' - '{extracted_data.job_title}'"
             )
 
-            # 3. Response 매핑 (Domain Model -> Presentation Schema)
+            # 4. Response 매핑 (Domain Model -> Presentation Schema)
             return JobDataMapper.to_analyze_response(extracted_data)
 
         except Exception as e:
             logger.error(f"❌ Job extraction failed: {e}", exc_info=True)
             # Presentation Layer에서 처리하도록 예외 전파
             raise
+
+    async def _crawl(self, url: str) -> Tuple[str, Optional[PostingFields]]:
+        """크롤링 텍스트 + (크롤러가 지원하면) 규칙 기반으로 읽은 필드"""
+        fetch_posting = getattr(self.crawler, "fetch_posting", None)
+        if fetch_posting is not None:
+            posting = await fetch_posting(url)
+            return posting.text, posting.fields
+        if inspect.iscoroutinefunction(self.crawler.fetch):
+            return await self.crawler.fetch(url), None
+        return await asyncio.to_thread(self.crawler.fetch, url), None
+
+    def _prune(self, url: str, raw_text: str) -> str:
+        if self.pruner is None:
+            return raw_text
+        result = self.pruner.prune(raw_text, url)
+        INPUT_TOKENS.observe(result.tokens_before, stage="raw")
+        INPUT_TOKENS.observe(result.tokens_after, stage="pruned")
+        logger.info(
+            f"✂️ Pruned posting text: ~{result.tokens_before} -> ~{result.tokens_after} tokens "
+            f"(-{result.reduction:.0%}, dropped sections: {result.dropped or '-'}, "
+            f"boilerplate lines: {result.boilerplate_lines})"
+        )
+        return result.text
@@ -0,0 +1,208 @@
+import logging
+import os
+from typing import Optional, Union
+
+from shared.config import settings
+from shared.llm import TokenCounter, build_chat_model, build_token_counter
+from .application.services.extraction_service import JobExtractionService
+from .domain.interface.extractor import JobDataExtractor
+from .domain.services.section_pruner import SectionPruner
+from .infrastructure.adapters.crawling.async_crawler import AsyncPlaywrightCrawler
+from .infrastructure.adapters.crawling.browser_pool import BrowserPool
+from .infrastructure.adapters.crawling.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerCrawler,
+)
+from .infrastructure.adapters.crawling.executor import CrawlExecutor, ExecutorCrawler
+from .infrastructure.adapters.crawling.http_fast_path import (
+    HttpFastPath,
+    HttpFirstCrawler,
+)
+from .infrastructure.adapters.crawling.posting_fields import PostingFieldsCrawler
+from .infrastructure.adapters.crawling.router import DynamicRoutingCrawler
+from .infrastructure.adapters.crawling.snapshotting import SnapshottingCrawler
+from .infrastructure.adapters.llm.job_extractor import LLMJobExtractor
+from .infrastructure.adapters.llm.mock_extractor import MockJobExtractor
+from .infrastructure.persistence.snapshot_store import (
+    BlobSnapshotStore,
+    LocalBlobBackend,
+    S3BlobBackend,
+)
+
+logger = logging.getLogger(__name__)
+
+Crawler = Union[
+    ExecutorCrawler,
+    AsyncPlaywrightCrawler,
+    HttpFirstCrawler,
+    SnapshottingCrawler,
+    CircuitBreakerCrawler,
+    PostingFieldsCrawler,
+]
+
+
+class JobAnalysisContainer:
+    """
+    애플리케이션 수명 동안 유지되는 의존성 묶음 (Composition Root)
+    - LLM 클라이언트(커넥션 풀)와 프롬프트/파서 체인, 크롤러 라우터(브라우저 풀)를 한 번만 생성
+    """
+
+    def __init__(
+        self,
+        service: JobExtractionService,
+        crawler: Crawler,
+    ):
+        self.service = service
+        self.crawler = crawler
+
+    def close(self) -> None:
+        """브라우저 풀 종료 (Blocking) - async 자원은 이벤트 루프에서 aclose()로 종료"""
+        if isinstance(
+            self.crawler,
+            (
+                ExecutorCrawler,
+                HttpFirstCrawler,
+                SnapshottingCrawler,
+                CircuitBreakerCrawler,
+                PostingFieldsCrawler,
+            ),
+        ):
+            self.crawler.close()
+
+    async def aclose(self) -> None:
+        """크롤러 종료 (sync 풀은 이벤트 루프 밖에서)"""
+        await self.crawler.aclose()
+
+    @classmethod
+    def build(cls) -> "JobAnalysisContainer":
+        """설정에 따라 Extractor / 크롤러 엔진 주입 결정"""
+        # 섹션 정리 보고와 추출 조각 분할이 같은 토크나이저를 사용
+        count_tokens = build_token_counter()
+        extractor = build_extractor(count_tokens)
+        crawler = _build_crawler()
+        # 반복 문구 비교 기록은 프로세스 수명 동안 유지
+        pruner = (
+            SectionPruner(count_tokens=count_tokens)
+            if settings.JOB_TEXT_PRUNING
+            else None
+        )
+        return cls(
+            service=JobExtractionService(
+                crawler=crawler, extractor=extractor, pruner=pruner
+            ),
+            crawler=crawler,
+        )
+
+
+def build_extractor(count_tokens: Optional[TokenCounter] = None) -> JobDataExtractor:
+    if settings.use_mock:
+        return MockJobExtractor()
+    return LLMJobExtractor(
+        llm=build_chat_model(),
+        count_tokens=count_tokens or build_token_counter(),
+        chunk_tokens=settings.JOB_EXTRACTION_CHUNK_TOKENS,
+        chunk_overlap_tokens=settings.JOB_EXTRACTION_CHUNK_OVERLAP_TOKENS,
+    )
+
+
+def build_snapshot_store() -> Optional[BlobSnapshotStore]:
+    """CRAWL_SNAPSHOT_BACKEND 설정에 따른 스냅샷 저장소 (미지정 시 None)"""
+    backend = settings.CRAWL_SNAPSHOT_BACKEND
+    if not backend:
+        return None
+    index_path = os.path.join(settings.CRAWL_SNAPSHOT_DIR, "index.sqlite3")
+    if backend == "local":
+        return BlobSnapshotStore(
+            blobs=LocalBlobBackend(settings.CRAWL_SNAPSHOT_DIR), index_path=index_path
+        )
+    if backend == "s3":
+        # 지원서 파일용 S3 어댑터(같은 버킷/인증 설정)를 재사용
+        from applicant_evaluation.infrastructure.adapters.storage.s3_storage import (
+            S3FileStorage,
+        )
+
+        return BlobSnapshotStore(
+            blobs=S3BlobBackend(
+                S3FileStorage(), prefix=settings.CRAWL_SNAPSHOT_S3_PREFIX
+            ),
+            index_path=index_path,
+        )
+    raise ValueError(f"Unknown CRAWL_SNAPSHOT_BACKEND: {backend}")
+
+
+def _build_browser_crawler() -> Union[ExecutorCrawler, AsyncPlaywrightCrawler]:
+    if settings.CRAWLER_ENGINE == "async":
+        return AsyncPlaywrightCrawler(
+            max_concurrent_pages=settings.CRAWLER_ASYNC_MAX_PAGES,
+            max_pages_per_context=settings.BROWSER_MAX_PAGES_PER_CONTEXT,
+        )
+    if settings.CRAWLER_ENGINE != "pool":
+        raise ValueError(f"Unknown CRAWLER_ENGINE: {settings.CRAWLER_ENGINE}")
+    # sync 크롤링은 기본 asyncio 스레드 풀 대신 전용 실행기에서 (PDF 파싱/S3 I/O와 분리)
+    return ExecutorCrawler(
+        DynamicRoutingCrawler(
+            pool=BrowserPool(
+                size=settings.BROWSER_POOL_SIZE,
+                max_pages_per_context=settings.BROWSER_MAX_PAGES_PER_CONTEXT,
+                max_pages_per_browser=settings.BROWSER_MAX_PAGES_PER_BROWSER,
+                max_rss_mb=settings.BROWSER_MAX_RSS_MB,
+            )
+        ),
+        CrawlExecutor(
+            max_workers=settings.CRAWLER_EXECUTOR_WORKERS,
+            per_domain_limit=settings.CRAWLER_PER_DOMAIN_CONCURRENCY,
+        ),
+    )
+
+
+def _build_crawler() -> Crawler:
+    crawler: Crawler = _build_browser_crawler()
+    if settings.CRAWLER_HTTP_FAST_PATH:
+        crawler = HttpFirstCrawler(
+            fast_path=HttpFastPath(timeout=settings.CRAWLER_HTTP_TIMEOUT_SECONDS),
+            fallback=crawler,
+        )
+    store = build_snapshot_store()
+    if store is not None:
+        crawler = SnapshottingCrawler(crawler, store)
+    # circuit이 열려 있으면 fast path/브라우저 모두 건너뛰고, 스냅샷 응답은 다시 저장하지 않음
+    crawler = CircuitBreakerCrawler(
+        crawler,
+        CircuitBreaker(
+            failure_threshold=settings.CRAWLER_BREAKER_FAILURES,
+            cooldown_seconds=settings.CRAWLER_BREAKER_COOLDOWN_SECONDS,
+        ),
+        store=store,
+    )
+    if settings.JOB_RULE_BASED_FIELDS:
+        # 가장 바깥: 원본 HTML(스냅샷 응답이면 스냅샷 원본)에서 구조화 필드를 읽음
+        crawler = PostingFieldsCrawler(crawler)
+    return crawler
+
+
+_container: Optional[JobAnalysisContainer] = None
+
+
+def get_container() -> JobAnalysisContainer:
+    """컨테이너 반환 (lifespan에서 초기화되지 않았다면 최초 호출 시 생성)"""
+    global _container
+    if _container is None:
+        _container = JobAnalysisContainer.build()
+        logger.info("📦 JobAnalysisContainer initialized")
+    return _container
+
+
+def reset_container() -> None:
+    """컨테이너 폐기 (애플리케이션 종료 / 테스트 격리용) - 실행 중인 브라우저도 종료 (Blocking)"""
+    global _container
+    container, _container = _container, None
+    if container is not None:
+        container.close()
+
+
+async def shutdown_container() -> None:
+    """애플리케이션 종료 시 컨테이너 폐기 + 브라우저 종료 (FastAPI lifespan)"""
+    global _container
+    container, _container = _container, None
+    if container is not None:
+        await container.aclose()
@@ -1,4 +1,5 @@
 from typing import Protocol
+from ..models.job_data import CrawledPosting
 
 
 class WebCrawler(Protocol):
@@ -7,3 +8,19 @@ class WebCrawler(Protocol):
     def fetch(self, url: str) -> str:
         """URL의 콘텐츠를 가져옵니다. (Synchronous or Blocking I/O)"""
         ...
+
+
+class AsyncWebCrawler(Protocol):
+    """비동기 웹 크롤러 인터페이스 (이벤트 루프에서 직접 await)"""
+
+    async def fetch(self, url: str) -> str:
+        """URL의 콘텐츠를 가져옵니다. (Non-blocking I/O)"""
+        ...
+
+
+class PostingCrawler(Protocol):
+    """텍스트와 함께 구조화된 필드(회사명/공고명/날짜/기술 스택)를 반환하는 크롤러"""
+
+    async def fetch_posting(self, url: str) -> CrawledPosting:
+        """URL의 콘텐츠와 규칙 기반으로 읽은 필드를 가져옵니다. (Non-blocking I/O)"""
+        ...
@@ -1,10 +1,15 @@
 from typing import Protocol, Optional
-from ..models.job_data import ExtractedJobData
+from ..models.job_data import ExtractedJobData, PostingFields
 
 
 class JobDataExtractor(Protocol):
     """데이터 추출기 인터페이스 (LLM)"""
 
-    async def extract(self, raw_text: str) -> Optional[ExtractedJobData]:
-        """텍스트에서 구조화된 채용 공고 데이터를 추출합니다."""
+    async def extract(
+        self, raw_text: str, known: Optional[PostingFields] = None
+    ) -> Optional[ExtractedJobData]:
+        """
+        텍스트에서 구조화된 채용 공고 데이터를 추출합니다.
+        known: 공고 페이지 마크업에서 이미 확인한 필드 (추출 결과에 그대로 사용)
+        """
         ...
@@ -0,0 +1,19 @@
+from typing import Optional, Protocol, Sequence
+from ..models.job_data import StoredJobPost
+
+
+class JobPostRepository(Protocol):
+    """등록된 채용 공고 저장소 인터페이스 (Async)"""
+
+    async def find_by_url_hash(self, url_hash: str) -> Optional[StoredJobPost]:
+        """source_url_hash로 등록된 공고와 저장된 분석 결과를 조회"""
+        ...
+
+    async def find_by_source_url(
+        self, source_urls: Sequence[str]
+    ) -> Optional[StoredJobPost]:
+        """
+        source_url(원본 URL) 중 하나와 일치하는 공고 조회
+        source_url_hash 계약 불일치(저장 쪽 해시 규칙이 다름)를 감지하기 위한 보조 조회
+        """
+        ...
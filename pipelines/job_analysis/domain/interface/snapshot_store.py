@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import List, Optional, Protocol
+from ..models.snapshot import CrawlSnapshot, SnapshotRecord
+
+
+class SnapshotStore(Protocol):
+    """크롤링 스냅샷 저장소 인터페이스 (Async)"""
+
+    async def save(self, snapshot: CrawlSnapshot) -> SnapshotRecord:
+        """스냅샷 저장 (같은 내용은 한 번만 저장) 후 인덱스 항목 반환"""
+        ...
+
+    async def load(self, content_hash: str) -> CrawlSnapshot:
+        """content_hash로 스냅샷 본문 로드"""
+        ...
+
+    async def find(
+        self,
+        url: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        latest_only: bool = False,
+    ) -> List[SnapshotRecord]:
+        """URL(표준화)/수집 시각으로 인덱스 조회 (최신순)"""
+        ...
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel
 
 
@@ -18,3 +18,35 @@ class ExtractedJobData(BaseModel):
     end_date: Optional[str] = None
     ai_summary: Optional[str] = None
     evaluation_criteria: List[EvaluationCriteriaItem] = []
+
+
+class PostingFields(BaseModel):
+    """
+    공고 페이지의 구조화된 마크업/JSON에서 규칙으로 읽은 필드 (LLM 추출 대상에서 제외)
+    값을 확인한 필드만 설정됨 (model_fields_set) - 상시채용처럼 확인 결과가 None인 날짜도 포함
+    """
+
+    company_name: Optional[str] = None
+    job_title: Optional[str] = None
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    tech_stacks: Optional[List[str]] = None
+
+    def known(self) -> Dict[str, Any]:
+        """확인된 필드만 (필드명 -> 값)"""
+        return self.model_dump(include=self.model_fields_set)
+
+
+class CrawledPosting(BaseModel):
+    """크롤링 결과 텍스트 + 규칙 기반으로 읽은 필드 (읽지 못했으면 None)"""
+
+    text: str
+    fields: Optional[PostingFields] = None
+
+
+class StoredJobPost(BaseModel):
+    """이미 등록된 공고 (job_posts + job_masters에 저장된 분석 결과)"""
+
+    job_post_id: int
+    recruitment_status: str
+    data: ExtractedJobData
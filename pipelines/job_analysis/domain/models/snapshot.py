@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+
+
+class CrawlSnapshot(BaseModel):
+    """크롤링 1회의 원본 HTML과 정제 텍스트 (재추출용 보관 단위)"""
+
+    url: str
+    captured_at: datetime
+    source: str  # browser / http
+    raw_html: Optional[str] = None
+    text: str
+
+
+class SnapshotRecord(BaseModel):
+    """스냅샷 인덱스 항목 (URL/시간으로 조회, 본문은 content_hash로 저장소에서 로드)"""
+
+    content_hash: str
+    url: str
+    canonical_url: str
+    captured_at: datetime
+    source: str
+    text_chars: int
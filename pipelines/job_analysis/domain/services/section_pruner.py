@@ -0,0 +1,321 @@
+import hashlib
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set
+
+from shared.llm.tokens import TokenCounter, estimate_tokens
+from .url_canonicalizer import hash_job_url
+
+# 섹션 제목(공백/기호 제거) -> 분류
+# - core: 추출 프롬프트가 직접 쓰는 필드 (주요업무/기술스택/평가 기준의 근거)
+# - schedule: 접수 기간 - 시작일/마감일 줄만 남김
+# - drop: 프롬프트가 쓰지 않는 섹션 (지원 방법/복지/근무지 주소 등)
+# - intro: 회사/포지션 소개 - 같은 회사의 이전 공고와 겹치는 문단은 제거
+_HEADINGS: Dict[str, str] = {
+    **dict.fromkeys(
+        [
+            "핵심정보",
+            "모집요강",
+            "모집부문",
+            "주요업무",
+            "담당업무",
+            "업무내용",
+            "자격요건",
+            "지원자격",
+            "필수요건",
+            "필수사항",
+            "우대사항",
+            "우대조건",
+            "기술스택",
+            "기술스택툴",
+            "사용기술",
+            "개발환경",
+            "이런일을해요",
+            "이런분을찾아요",
+            "이런분이면더좋아요",
+            "이런경험이있으면좋아요",
+        ],
+        "core",
+    ),
+    **dict.fromkeys(
+        ["접수기간및방법", "접수기간", "모집기간", "채용기간", "시작일", "마감일"],
+        "schedule",
+    ),
+    **dict.fromkeys(
+        [
+            "지원방법",
+            "접수방법",
+            "제출서류",
+            "유의사항",
+            "기타사항",
+            "채용절차",
+            "전형절차",
+            "채용문의",
+            "문의처",
+            "복리후생",
+            "복지",
+            "혜택및복지",
+            "복지및혜택",
+            "근무지역",
+            "근무지",
+            "근무위치",
+            "회사위치",
+            "오시는길",
+        ],
+        "drop",
+    ),
+    **dict.fromkeys(["포지션상세", "회사소개", "기업소개", "팀소개"], "intro"),
+}
+
+# 분류별 점수 (min_score 미만 섹션은 제거)
+SECTION_SCORES: Dict[str, float] = {
+    "header": 1.0,
+    "core": 1.0,
+    "schedule": 0.8,
+    "intro": 0.6,
+    "body": 0.6,
+    "drop": 0.0,
+}
+
+_HEADING_NOISE = re.compile(r"[\s•·\-■□▶▪◆◇○●※:：\[\]()【】<>]")
+_DATE = re.compile(r"\d{4}[.\-/년]\s*\d{1,2}|상시|채용\s*시|마감")
+_BLANK_LINES = re.compile(r"\n\s*\n")
+_COMPANY_NOISE = re.compile(r"\(주\)|㈜|주식회사|\(유\)|\s")
+
+
+def normalize_company(name: str) -> str:
+    return _COMPANY_NOISE.sub("", name).lower()
+
+
+def _heading_category(line: str) -> Optional[str]:
+    if len(line) > 20:
+        return None
+    return _HEADINGS.get(_HEADING_NOISE.sub("", line).lower())
+
+
+def _fingerprint(line: str) -> str:
+    normalized = " ".join(line.split()).lower()
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class Section:
+    category: str
+    heading: Optional[str]
+    lines: List[str] = field(default_factory=list)
+
+    @property
+    def name(self) -> str:
+        return self.heading or self.category
+
+
+def split_sections(text: str) -> List[Section]:
+    """
+    크롤링 텍스트 -> 섹션 목록
+    빈 줄로 나뉜 블록마다 새 섹션을 시작하고, 블록 안에서는 알려진 제목 줄에서 섹션을 나눔
+    첫 블록(회사명/공고명)은 header
+    """
+    sections: List[Section] = []
+    for index, block in enumerate(_BLANK_LINES.split(text.strip())):
+        current = Section("header" if index == 0 else "body", None)
+        sections.append(current)
+        for line in block.splitlines():
+            category = _heading_category(line.strip()) if index else None
+            if category is not None:
+                current = Section(category, line.strip())
+                sections.append(current)
+            current.lines.append(line)
+    return [s for s in sections if any(line.strip() for line in s.lines)]
+
+
+@dataclass
+class PruneResult:
+    text: str
+    tokens_before: int
+    tokens_after: int
+    dropped: List[str] = field(default_factory=list)
+    boilerplate_lines: int = 0
+
+    @property
+    def reduction(self) -> float:
+        """줄어든 토큰 비율 (0~1)"""
+        if not self.tokens_before:
+            return 0.0
+        return 1 - self.tokens_after / self.tokens_before
+
+
+class CompanyBoilerplate:
+    """
+    회사별 최근 공고의 소개 문단 지문 (같은 회사 공고마다 반복되는 회사 소개/홍보 문구 판별)
+    회사명은 추출 결과로만 알 수 있으므로 추출 후 remember로 기록하고,
+    다음 공고는 헤더 줄에서 기록된 회사명(별칭 포함)을 찾아 비교
+    """
+
+    def __init__(self, max_companies: int = 1000, max_postings: int = 20):
+        self.max_companies = max_companies
+        self.max_postings = max_postings
+        # 회사 -> 공고(URL 해시) -> 문단 지문
+        self._postings: "OrderedDict[str, OrderedDict[str, Set[str]]]" = OrderedDict()
+        self._aliases: Dict[str, str] = {}
+
+    def find_company(self, header_lines: Iterable[str]) -> Optional[str]:
+        for line in header_lines:
+            company = self._aliases.get(normalize_company(line))
+            if company is not None:
+                return company
+        return None
+
+    def is_repeated(self, company: str, fingerprint: str, posting: str) -> bool:
+        """같은 회사의 다른 공고에 같은 문단이 있었는지"""
+        postings = self._postings.get(company, {})
+        return any(
+            fingerprint in fingerprints
+            for key, fingerprints in postings.items()
+            if key != posting
+        )
+
+    def remember(
+        self,
+        company_name: str,
+        posting: str,
+        header_lines: Iterable[str],
+        fingerprints: Set[str],
+    ) -> None:
+        company = normalize_company(company_name)
+        if not company:
+            return
+        # 헤더의 회사명 표기가 추출된 회사명과 다를 수 있으므로 포함 관계인 헤더 줄도 별칭으로 등록
+        self._aliases[company] = company
+        for line in header_lines:
+            alias = normalize_company(line)
+            if len(alias) >= 2 and (alias in company or company in alias):
+                self._aliases[alias] = company
+
+        postings = self._postings.setdefault(company, OrderedDict())
+        self._postings.move_to_end(company)
+        postings[posting] = fingerprints
+        postings.move_to_end(posting)
+        while len(postings) > self.max_postings:
+            postings.popitem(last=False)
+        while len(self._postings) > self.max_companies:
+            evicted, _ = self._postings.popitem(last=False)
+            self._aliases = {
+                alias: owner
+                for alias, owner in self._aliases.items()
+                if owner != evicted
+            }
+
+
+class SectionPruner:
+    """
+    LLM 추출 전 크롤링 텍스트 정리 (입력 토큰 = 추출 지연/비용 절감)
+    - 섹션 점수가 min_score 미만인 섹션 제거 (지원 방법, 복지, 근무지 주소 등)
+    - 접수 기간 섹션은 시작일/마감일 줄만 유지
+    - 소개/분류 없는 섹션에서 같은 회사의 이전 공고와 겹치는 문단(min_line_chars 이상) 제거
+      (같은 공고를 다시 분석하는 경우는 URL 해시로 구분해서 비교하지 않음)
+    """
+
+    def __init__(
+        self,
+        boilerplate: Optional[CompanyBoilerplate] = None,
+        min_score: float = 0.5,
+        min_line_chars: int = 20,
+        min_output_chars: int = 50,
+        count_tokens: TokenCounter = estimate_tokens,
+    ):
+        self.boilerplate = boilerplate or CompanyBoilerplate()
+        self.min_score = min_score
+        self.min_line_chars = min_line_chars
+        # 정리 결과가 이보다 짧으면 원문 사용 (알 수 없는 레이아웃 보호)
+        self.min_output_chars = min_output_chars
+        self.count_tokens = count_tokens
+
+    def prune(self, text: str, url: str) -> PruneResult:
+        sections = split_sections(text)
+        posting = hash_job_url(url)
+        company = self.boilerplate.find_company(self._header_lines(sections))
+        # 주요업무/자격요건 같은 섹션을 못 찾은 레이아웃이면 본문이 반복 문구로 보일 수 있으므로 비교하지 않음
+        if not any(section.category == "core" for section in sections):
+            company = None
+
+        kept: List[str] = []
+        dropped: List[str] = []
+        boilerplate_lines = 0
+        for section in sections:
+            if SECTION_SCORES[section.category] < self.min_score:
+                dropped.append(section.name)
+                continue
+            lines = section.lines
+            if section.category == "schedule":
+                lines = self._schedule_lines(lines)
+            elif section.category in ("intro", "body") and company is not None:
+                before = len(lines)
+                lines = [
+                    line
+                    for line in lines
+                    if not self._is_boilerplate(company, line, posting)
+                ]
+                boilerplate_lines += before - len(lines)
+            # 제목만 남은 섹션은 제거
+            body = (
+                lines[1:]
+                if section.heading and lines[0].strip() == section.heading
+                else lines
+            )
+            if not any(line.strip() for line in body):
+                dropped.append(section.name)
+                continue
+            kept.append("\n".join(lines))
+
+        pruned = "\n\n".join(kept)
+        if len(pruned) < self.min_output_chars:
+            pruned, dropped, boilerplate_lines = text, [], 0
+        return PruneResult(
+            text=pruned,
+            tokens_before=self.count_tokens(text),
+            tokens_after=self.count_tokens(pruned),
+            dropped=dropped,
+            boilerplate_lines=boilerplate_lines,
+        )
+
+    def remember(self, url: str, text: str, company_name: str) -> None:
+        """추출이 끝난 공고의 소개 문단을 회사별로 기록 (다음 공고의 반복 문구 판별용)"""
+        if normalize_company(company_name) in ("", "unknown"):
+            return
+        sections = split_sections(text)
+        fingerprints = {
+            _fingerprint(line)
+            for section in sections
+            if section.category in ("intro", "body")
+            for line in section.lines
+            if len(line.strip()) >= self.min_line_chars
+        }
+        self.boilerplate.remember(
+            company_name, hash_job_url(url), self._header_lines(sections), fingerprints
+        )
+
+    def _is_boilerplate(self, company: str, line: str, posting: str) -> bool:
+        if len(line.strip()) < self.min_line_chars:
+            return False
+        return self.boilerplate.is_repeated(company, _fingerprint(line), posting)
+
+    @staticmethod
+    def _header_lines(sections: List[Section]) -> List[str]:
+        # 사람인 본문 첫 줄에도 회사명이 있으므로 헤더와 그 다음 섹션 앞부분까지 후보
+        lines: List[str] = []
+        for section in sections[:2]:
+            lines.extend(line.strip() for line in section.lines[:3])
+        return [line for line in lines if line]
+
+    @staticmethod
+    def _schedule_lines(lines: List[str]) -> List[str]:
+        """제목 + 날짜 줄(과 바로 앞의 라벨 줄)만 유지"""
+        kept = [lines[0]] if _heading_category(lines[0].strip()) else []
+        for i, line in enumerate(lines):
+            if i and _DATE.search(line):
+                label = lines[i - 1]
+                if label not in kept and len(label.strip()) <= 20:
+                    kept.append(label)
+                kept.append(line)
+        return kept
@@ -0,0 +1,90 @@
+"""
+공고 URL 표준화 + job_posts.source_url_hash 계약
+
+source_url_hash = sha256(canonicalize_job_url(source_url).encode("utf-8")).hexdigest()
+(소문자 hex 64자). job_posts 행을 저장하는 쪽(백엔드)도 같은 규칙으로 채워야
+이 파이프라인의 기존 공고 조회가 일치함. 규칙을 바꾸면 기존 행의 해시도 다시 계산해야 함.
+
+표준화 규칙 (canonicalize_job_url)
+1. 앞뒤 공백 제거, host 소문자화, "m." 모바일 host는 "www."로 변환
+2. 사람인(saramin.co.kr 또는 *.saramin.co.kr host, evilsaramin.co.kr 같은 유사 도메인 제외) + rec_idx 있음 -> https://www.saramin.co.kr/zf_user/jobs/view?rec_idx={rec_idx}
+3. 원티드(wanted.co.kr 또는 *.wanted.co.kr host) + /wd/{id} 경로 -> https://www.wanted.co.kr/wd/{id}
+4. 그 외: scheme 소문자(없으면 https), 기본값이 아닌 port 유지, 경로 끝 "/" 제거(빈 경로는 "/"),
+   fragment 제거, 추적 파라미터(utm_*, fbclid, gclid, ref, referer, src, source) 제거,
+   나머지 쿼리는 (key, value) 순으로 정렬 후 urlencode
+
+예) https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=52069064&view_type=list
+    -> https://www.saramin.co.kr/zf_user/jobs/view?rec_idx=52069064
+    -> source_url_hash = 1d9e6d93bfb845785b599f825834b9ad3c27fab3c2b121c08a14609c390b1945
+"""
+
+import hashlib
+import re
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 공고 식별과 무관한 추적/유입 파라미터
+_TRACKING_PARAMS = {"fbclid", "gclid", "ref", "referer", "src", "source"}
+_TRACKING_PREFIXES = ("utm_",)
+
+_WANTED_JOB_PATH = re.compile(r"^/wd/(\d+)")
+
+# 지원 사이트 -> 등록 도메인
+JOB_SITE_DOMAINS = {"saramin": "saramin.co.kr", "wanted": "wanted.co.kr"}
+
+
+def is_site_host(host: str, domain: str) -> bool:
+    """host가 domain 자체이거나 그 하위 도메인인지 (evilsaramin.co.kr 같은 유사 도메인은 False)"""
+    host = host.lower().rstrip(".")
+    return host == domain or host.endswith("." + domain)
+
+
+def job_site_of(url: str) -> Optional[str]:
+    """URL의 host로 지원 사이트 판별 ("saramin" / "wanted"), 경로/쿼리 문자열은 보지 않음"""
+    host = urlsplit(url.strip()).hostname or ""
+    for site, domain in JOB_SITE_DOMAINS.items():
+        if is_site_host(host, domain):
+            return site
+    return None
+
+
+def canonicalize_job_url(url: str) -> str:
+    """
+    같은 공고를 가리키는 URL을 하나의 표준 형태로 변환 (요청 합치기/조회 키 용도)
+    - 사람인: rec_idx만 남김 (relay/view, view, view-detail 등 경로 무관)
+    - 원티드: /wd/{공고ID} 로 축약
+    - 그 외: scheme/host 소문자화, fragment 및 추적 파라미터 제거, 쿼리 정렬
+    """
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    if host.startswith("m."):
+        host = "www." + host[2:]
+
+    query = parse_qsl(parts.query, keep_blank_values=True)
+
+    if is_site_host(host, JOB_SITE_DOMAINS["saramin"]):
+        rec_idx = next((v for k, v in query if k == "rec_idx" and v), None)
+        if rec_idx:
+            return f"https://www.saramin.co.kr/zf_user/jobs/view?rec_idx={rec_idx}"
+
+    if is_site_host(host, JOB_SITE_DOMAINS["wanted"]):
+        match = _WANTED_JOB_PATH.match(parts.path)
+        if match:
+            return f"https://www.wanted.co.kr/wd/{match.group(1)}"
+
+    filtered = sorted(
+        (k, v)
+        for k, v in query
+        if k.lower() not in _TRACKING_PARAMS
+        and not k.lower().startswith(_TRACKING_PREFIXES)
+    )
+    netloc = host if parts.port is None else f"{host}:{parts.port}"
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(
+        ((parts.scheme or "https").lower(), netloc, path, urlencode(filtered), "")
+    )
+
+
+def hash_job_url(url: str) -> str:
+    """job_posts.source_url_hash 값: 표준화 URL(UTF-8)의 SHA-256 (소문자 hex 64자, 모듈 docstring의 계약)"""
+    return hashlib.sha256(canonicalize_job_url(url).encode("utf-8")).hexdigest()
@@ -0,0 +1,239 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+from playwright.async_api import Browser, BrowserContext, Page, Playwright
+from playwright.async_api import async_playwright
+
+from shared.concurrency import check_deadline
+from shared.metrics import observe_stage
+from ....domain.interface.crawler import AsyncWebCrawler
+from .base import translate_crawl_error
+from .browser_pool import (
+    BROWSER_LAUNCHES,
+    CONTEXT_OPTIONS,
+    LAUNCH_ARGS,
+    STEALTH_SCRIPT,
+    WEBDRIVER_SCRIPT,
+    recover_launch_failure,
+    start_virtual_display,
+)
+from .router import StrategyRouter
+from .strategies.default import DefaultCrawler
+from .strategies.saramin import SaraminCrawler
+from .strategies.wanted import WantedCrawler
+
+logger = logging.getLogger(__name__)
+
+AsyncPlaywrightFactory = Callable[[], Awaitable[Playwright]]
+
+
+async def _default_playwright() -> Playwright:
+    return await async_playwright().start()
+
+
+class _ContextSlot:
+    """컨텍스트 1개와 그 안에서 열린 페이지 수 (교체 후에도 열려 있는 페이지가 모두 닫히면 종료)"""
+
+    def __init__(self, context: BrowserContext):
+        self.context = context
+        self.opened = 0
+        self.active = 0
+        self.retired = False
+
+
+class AsyncPlaywrightCrawler(StrategyRouter, AsyncWebCrawler):
+    """
+    async 엔진: 이벤트 루프 1개 + Chromium 1개로 여러 공고 페이지를 동시에 크롤링
+    - 스레드를 쓰지 않으므로 동시 페이지 수(max_concurrent_pages)가 스레드 풀 크기에 묶이지 않음
+    - 컨텍스트는 max_pages_per_context 페이지마다 교체, 브라우저가 죽으면 다음 fetch에서 다시 실행
+    - 사이트별 파싱은 sync 엔진과 같은 Strategy의 async 훅(_parse_page)을 그대로 사용
+    - Playwright 객체는 이벤트 루프에 묶이므로 생성한 루프에서만 사용 (루프가 바뀌면 새로 실행)
+    """
+
+    def __init__(
+        self,
+        max_concurrent_pages: int = 8,
+        max_pages_per_context: int = 20,
+        headless: bool = False,
+        playwright_factory: Optional[AsyncPlaywrightFactory] = None,
+        use_virtual_display: bool = True,
+    ):
+        # 훅 전용 인스턴스 (sync 브라우저 풀은 사용하지 않으므로 생성되지 않음)
+        self.saramin = SaraminCrawler()
+        self.wanted = WantedCrawler()
+        self.default = DefaultCrawler()
+
+        self.max_concurrent_pages = max(1, max_concurrent_pages)
+        self.max_pages_per_context = max(1, max_pages_per_context)
+        # 봇 탐지 회피를 위해 기본은 Headful (Linux 서버는 Xvfb 가상 디스플레이 사용)
+        self.headless = headless
+        self.use_virtual_display = use_virtual_display and not headless
+        self._playwright_factory = playwright_factory or _default_playwright
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pages: Optional[asyncio.Semaphore] = None
+        self._launch_lock: Optional[asyncio.Lock] = None
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._slot: Optional[_ContextSlot] = None
+        self._display: Any = None
+        self._display_checked = False
+
+    async def fetch(self, url: str) -> str:
+        """
+        공유 브라우저에서 새 페이지 -> 페이지 이동 -> (Strategy 훅) -> 텍스트 반환
+        Deadline은 contextvar로 그대로 보이므로 단계별 타임아웃이 남은 예산으로 잡히고,
+        요청이 취소되면 대기 중인 Playwright 호출도 함께 취소됨
+        """
+        strategy = self._strategy_for(url)
+        self._bind_loop()
+        assert self._pages is not None
+
+        check_deadline("browser_pool")
+        try:
+            async with self._pages:
+                page, slot = await self._new_page()
+                failed = True
+                try:
+                    text = await strategy._visit(page, url)
+                    failed = False
+                    return text
+                finally:
+                    await self._release(page, slot, failed)
+        except Exception as e:
+            error = translate_crawl_error(e)
+            if error is e:
+                raise
+            raise error from e
+
+    async def aclose(self) -> None:
+        """브라우저 종료 (브라우저를 실행한 이벤트 루프에서 호출)"""
+        if self._slot is not None:
+            await self._close_context(self._slot)
+            self._slot = None
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+        if self._display is not None:
+            await asyncio.to_thread(self._display.stop)
+            self._display = None
+        logger.info("🧹 Async crawler closed")
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        if self._loop is not None:
+            # 다른 루프의 Playwright 객체는 쓸 수 없으므로 버리고 새로 실행
+            logger.warning(
+                "⚠️ Event loop changed. Relaunching browser for async crawler."
+            )
+        self._loop = loop
+        self._pages = asyncio.Semaphore(self.max_concurrent_pages)
+        self._launch_lock = asyncio.Lock()
+        self._playwright = None
+        self._browser = None
+        self._slot = None
+
+    async def _new_page(self) -> Tuple[Page, _ContextSlot]:
+        assert self._launch_lock is not None
+        async with self._launch_lock:
+            if self._browser is None or not self._browser.is_connected():
+                await self._start_browser()
+            if self._slot is None or self._slot.retired:
+                self._slot = _ContextSlot(await self._new_context())
+            slot = self._slot
+            slot.opened += 1
+            slot.active += 1
+            if slot.opened >= self.max_pages_per_context:
+                # 이후 페이지는 새 컨텍스트에서 열고, 이 컨텍스트는 마지막 페이지가 닫힐 때 종료
+                slot.retired = True
+
+        try:
+            return await slot.context.new_page(), slot
+        except BaseException:
+            await self._release(None, slot, failed=True)
+            raise
+
+    async def _release(
+        self, page: Optional[Page], slot: _ContextSlot, failed: bool
+    ) -> None:
+        if page is not None:
+            try:
+                await page.close()
+            except Exception:
+                pass
+        slot.active -= 1
+        if failed:
+            # 페이지 작업이 실패하면 컨텍스트 상태를 신뢰할 수 없으므로 새로 시작
+            slot.retired = True
+        if slot.retired and slot.active == 0:
+            await self._close_context(slot)
+
+    async def _close_context(self, slot: _ContextSlot) -> None:
+        try:
+            await slot.context.close()
+        except Exception:
+            pass
+
+    async def _start_browser(self) -> None:
+        await self._discard_browser()
+        started = time.perf_counter()
+        if self.use_virtual_display and not self._display_checked:
+            self._display_checked = True
+            self._display = await asyncio.to_thread(start_virtual_display)
+
+        if self._playwright is None:
+            self._playwright = await self._playwright_factory()
+        try:
+            browser = await self._playwright.chromium.launch(
+                headless=self.headless, args=LAUNCH_ARGS
+            )
+        except Exception as e:
+            await asyncio.to_thread(recover_launch_failure, e)
+            browser = await self._playwright.chromium.launch(
+                headless=True, args=LAUNCH_ARGS
+            )
+
+        self._browser = browser
+        BROWSER_LAUNCHES.inc()
+        elapsed = time.perf_counter() - started
+        observe_stage("job_analysis", "browser_launch", elapsed)
+        logger.info(f"🧭 Async crawler: browser launched ({elapsed * 1000:.0f} ms)")
+
+    async def _discard_browser(self) -> None:
+        """
+        연결이 끊긴 브라우저와 현재 컨텍스트를 정리 (재실행 전, best-effort)
+        - 진행 중인 페이지가 남은 컨텍스트는 retired로 표시해 마지막 페이지의 _release에서 닫힘
+        """
+        slot, browser = self._slot, self._browser
+        self._slot = None
+        self._browser = None
+        if slot is not None:
+            slot.retired = True
+            if slot.active == 0:
+                await self._close_context(slot)
+        if browser is not None:
+            try:
+                await browser.close()
+            except Exception:
+                pass
+
+    async def _new_context(self) -> BrowserContext:
+        """탐지 방지 스크립트가 적용된 컨텍스트 (sync 풀과 같은 설정)"""
+        assert self._browser is not None
+        context = await self._browser.new_context(**CONTEXT_OPTIONS)
+        await context.add_init_script(WEBDRIVER_SCRIPT)
+        await context.add_init_script(STEALTH_SCRIPT)
+        return context
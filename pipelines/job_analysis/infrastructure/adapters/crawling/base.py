@@ -1,235 +1,110 @@
 from abc import ABC, abstractmethod
 import logging
-import subprocess
-from playwright.sync_api import sync_playwright, Page, Error as PlaywrightError
-from bs4 import BeautifulSoup
+import time
+from typing import Dict, FrozenSet, Optional, Tuple
+from playwright.async_api import Page, Error as PlaywrightError
 from fastapi import HTTPException
+from shared.concurrency import DeadlineExceeded, check_deadline, stage_timeout_ms
+from shared.metrics import observe_stage, time_stage
+from .block_detection import CrawlBlocked, detect_block_page
+from .browser_pool import BrowserPool
+from .capture import capture_requested, record_raw_html
+from .html_cleaner import clean_html
+from .page_adapter import awaitable_page, run_hook
+from .readiness import READINESS, domain_of, wait_until_ready
+from .request_blocking import install_request_blocking
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
 
-class BasePlaywrightCrawler(ABC):
+class SiteStrategy(ABC):
     """
-    모든 Playwright 기반 크롤러의 부모 클래스.
-    공통적인 브라우저 실행 및 종료 로직을 담당합니다.
+    사이트별 페이지 이동/파싱 훅 (sync 브라우저 풀 엔진과 async 엔진이 공유)
+    훅은 playwright.async_api.Page를 받는 코루틴으로 작성합니다.
+    sync 엔진에서는 같은 모양의 어댑터(AwaitableProxy)가 전달되므로, 훅 안에서는 페이지 조작만 await 해야 합니다.
     """
 
-    def __init__(self):
-        self.user_agent = (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
+    # 이 사이트에서 차단하지 않을 요청 분류 (request_blocking.BLOCKED_URL_PATTERNS의 키)
+    _ALLOWED_REQUESTS: FrozenSet[str] = frozenset()
+    # 본문 준비 신호: 이 셀렉터 중 하나에 텍스트가 생기면 준비 완료
+    # (없으면 본문 텍스트가 _STABLE_MS 동안 바뀌지 않을 때 준비 완료)
+    _READY_SELECTORS: Tuple[str, ...] = ()
+    _STABLE_MS = 1000
+    # 파싱 결과가 이보다 짧으면 차단/빈 페이지로 판정 (임의 페이지를 방문하는 기본 크롤러는 검사 안 함)
+    _MIN_CONTENT_CHARS = 0
+
+    async def _visit(self, page: Page, url: str) -> str:
+        """페이지 이동 후 사이트별 파싱"""
+        # 공통 페이지 이동 로직 (Timeout 방지 및 속도 개선)
+        check_deadline("navigation")
+        navigation_started = time.perf_counter()
+        # 불필요한 리소스는 브라우저 안에서 차단 (요청마다 Python을 거치지 않음)
+        await install_request_blocking(page, self._ALLOWED_REQUESTS)
+        domain = domain_of(url)
+
+        # 1. commit(응답 헤더 수신)까지만 기다림
+        # 타임아웃은 이 도메인의 최근 commit 시간 분위수로 계산 (기록이 적으면 15초), 남은 예산이 더 짧으면 예산만큼
+        goto_timeout = stage_timeout_ms(
+            "navigation", READINESS.timeout_ms(domain, "navigation")
         )
-
-    def fetch(self, url: str) -> str:
-        """
-        공통 템플릿 메서드: 브라우저 실행 -> 페이지 이동 -> (자식 클래스 로직) -> 텍스트 반환
-        """
-        # 봇 탐지 회피를 위해 무조건 Headful 모드 사용 (User Request)
-        is_headless = False
-        display = None
-
         try:
-            # Linux 서버 등에서 가상 디스플레이(Xvfb) 시도
-            from pyvirtualdisplay import Display
-
-            display = Display(visible=False, size=(1920, 1080))
-            display.start()
-            logger.info("🖥️  Virtual Display(Xvfb) started.")
-        except Exception as e:
-            # Xvfb가 없으면(로컬 Mac 등) 실제 모니터 사용
-            logger.warning(
-                f"⚠️  Virtual Display not available (Error: {e}). Using physical display."
+            await page.goto(url, timeout=goto_timeout, wait_until="commit")
+            READINESS.record(
+                domain, "navigation", time.perf_counter() - navigation_started
             )
-
-        try:
-            with sync_playwright() as p:
-                try:
-                    # 무조건 headless=False로 실행
-                    browser = p.chromium.launch(
-                        headless=is_headless,
-                        args=[
-                            "--disable-blink-features=AutomationControlled",
-                            "--no-sandbox",
-                            "--disable-setuid-sandbox",
-                            "--disable-dev-shm-usage",  # 메모리 부족 충돌 방지 (Linux/Docker 필수)
-                            "--disable-gpu",  # 가상 환경 렌더링 충돌 방지
-                        ],
-                    )
-                except Exception as e:
-                    # 브라우저 실행 실패 시 예외 처리
-                    error_msg = str(e)
-                    logger.error(f"❌ Browser Launch Failed: {error_msg}")
-
-                    # 1. 브라우저 실행 파일이 없는 경우 (가장 근본적인 원인)
-                    if "Executable doesn't exist" in error_msg:
-                        logger.info("� Browser missing. Installing chromium...")
-                        subprocess.run(
-                            ["playwright", "install", "chromium"], check=True
-                        )
-                        logger.info("✅ Browser installed. Retrying launch...")
-                        browser = p.chromium.launch(
-                            headless=True,  # 설치 직후 안전하게 Headless로 시작
-                            args=[
-                                "--disable-blink-features=AutomationControlled",
-                                "--no-sandbox",
-                                "--disable-setuid-sandbox",
-                                "--disable-dev-shm-usage",
-                                "--disable-gpu",
-                            ],
-                        )
-
-                    # 2. 시스템 의존성 라이브러리가 없는 경우 (Linux/Ubuntu 등)
-                    elif "error while loading shared libraries" in error_msg:
-                        logger.info(
-                            "🔧 System dependencies missing. Running 'npx playwright install-deps'..."
-                        )
-                        try:
-                            subprocess.run(
-                                ["npx", "playwright", "install-deps", "chromium"],
-                                check=True,
-                            )
-                            logger.info("✅ Dependencies installed. Retrying launch...")
-                            # 의존성 설치 후 재시도 (Headless + Stealth)
-                            browser = p.chromium.launch(
-                                headless=True,
-                                args=[
-                                    "--disable-blink-features=AutomationControlled",
-                                    "--no-sandbox",
-                                    "--disable-setuid-sandbox",
-                                    "--disable-dev-shm-usage",
-                                    "--disable-gpu",
-                                ],
-                            )
-                        except Exception as dep_err:
-                            logger.error(
-                                f"❌ Failed to install dependencies: {dep_err}"
-                            )
-                            raise e
-
-                    # 3. Xvfb(XServer)가 없어서 Headful 모드가 실패한 경우 (환경 설정 문제)
-                    elif (
-                        "No XServer running" in error_msg
-                        or "headless: true" in error_msg
-                    ):
-                        logger.warning(
-                            "🚨 Xvfb not found! Falling back to 'headless=True' with Stealth options to prevent crash."
-                        )
-                        browser = p.chromium.launch(
-                            headless=True,  # 자동 폴백
-                            args=[
-                                "--disable-blink-features=AutomationControlled",
-                                "--no-sandbox",
-                                "--disable-setuid-sandbox",
-                                "--disable-dev-shm-usage",
-                                "--disable-gpu",
-                            ],
-                        )
-
-                    else:
-                        # 그 외 알 수 없는 에러는 그대로 발생
-                        raise e
-
-                context = browser.new_context(
-                    user_agent=self.user_agent,
-                    viewport={"width": 1920, "height": 1080},
-                    locale="ko-KR",
-                    ignore_https_errors=True,  # HTTPS 에러 무시
-                )
-
-                # navigator.webdriver 값 제거 (가장 중요한 탐지 방지 스크립트)
-                context.add_init_script(
-                    "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
-                )
-
-                # 실제 사용자처럼 보이게 하기 위한 추가 스크립트 주입 (Stealth)
-                context.add_init_script("""
-                    // 1. Plugins/MimeTypes 모킹 (Headless는 보통 비어있음)
-                    Object.defineProperty(navigator, 'plugins', {
-                        get: () => [1, 2, 3, 4, 5] 
-                    });
-                    
-                    // 2. window.chrome 속성 유지
-                    window.chrome = { runtime: {} };
-
-                    // 3. 권한 요청 자동 통과 (Notification 등)
-                    const originalQuery = window.navigator.permissions.query;
-                    window.navigator.permissions.query = (parameters) => (
-                        parameters.name === 'notifications' ?
-                        Promise.resolve({ state: 'granted' }) :
-                        originalQuery(parameters)
-                    );
-
-                    // 4. WebGL 벤더 정보 조작
-                    const getParameter = WebGLRenderingContext.prototype.getParameter;
-                    WebGLRenderingContext.prototype.getParameter = function(parameter) {
-                        if (parameter === 37445) return 'Intel Inc.';
-                        if (parameter === 37446) return 'Intel Iris OpenGL Engine';
-                        return getParameter(parameter);
-                    };
-                """)
-
-                page = context.new_page()
-
-                # 속도 최적화: 불필요한 리소스(이미지, 폰트 등) 로딩 차단
-                def block_resources(route):
-                    if route.request.resource_type in [
-                        "image",
-                        "media",
-                        "font",
-                        "stylesheet",
-                        "other",  # 광고 스크립트 등 기타 리소스
-                    ]:
-                        route.abort()
-                    else:
-                        route.continue_()
-
-                # 모든 요청에 대해 인터셉터 등록
-                page.route("**/*", block_resources)
-
-                # 공통 페이지 이동 로직 (Timeout 방지 및 속도 개선)
-                # 1. commit(응답 헤더 수신)까지만 기다림
-                try:
-                    # 타임아웃 15초로 단축 (Fail Fast)
-                    page.goto(url, timeout=15000, wait_until="commit")
-                except PlaywrightError as e:
-                    logger.warning(f"⚠️ Initial navigation warning: {e}")
-
-                # 2. DOM 로드 대기 (최대 10초)
-                try:
-                    page.wait_for_load_state("domcontentloaded", timeout=10000)
-                except Exception:
-                    logger.warning(
-                        "⚠️ DOM load timeout. Proceeding with partial content."
-                    )
-
-                # 3. 최소한의 콘텐츠(body)가 렌더링될 때까지 짧게 대기 (1초)
-                try:
-                    page.wait_for_selector("body", timeout=1000)
-                except Exception:
-                    pass
-
-                # 자식 클래스별 구체적인 파싱 로직 실행 (Hook)
-                result_text = self._parse_page(page)
-
-                browser.close()
-                return result_text
-
         except PlaywrightError as e:
-            logger.error(f"❌ Playwright error: {e}")
-            raise HTTPException(status_code=400, detail=f"Crawling failed: {str(e)}")
-        except Exception as e:
-            logger.error(f"❌ Unexpected error: {e}")
-            raise HTTPException(
-                status_code=500, detail=f"Internal crawler error: {str(e)}"
+            READINESS.record_miss(domain, "navigation")
+            logger.warning(f"⚠️ Initial navigation warning: {e}")
+
+        # 2. 본문 셀렉터가 나타나거나 본문이 더 이상 바뀌지 않으면 바로 파싱 (고정 대기 없음)
+        ready = await wait_until_ready(
+            page,
+            self._READY_SELECTORS,
+            timeout_ms=READINESS.timeout_ms(domain, "content"),
+            stable_ms=self._STABLE_MS,
+        )
+        if ready == "blocked":
+            # 봇 확인 페이지: 파싱/LLM 추출 없이 바로 실패 (도메인 circuit breaker가 집계)
+            title = await page.title()
+            raise CrawlBlocked(url, "marker", title)
+        if ready == "selector" or (ready == "stable" and not self._READY_SELECTORS):
+            READINESS.record(
+                domain, "content", time.perf_counter() - navigation_started
             )
-        finally:
-            if display:
-                display.stop()
+        else:
+            READINESS.record_miss(domain, "content")
+            await self._on_not_ready(page)
+
+        observe_stage(
+            "job_analysis", "navigation", time.perf_counter() - navigation_started
+        )
+
+        # 자식 클래스별 구체적인 파싱 로직 실행 (Hook)
+        check_deadline("parse_page")
+        with time_stage("job_analysis", "parse_page"):
+            text = await self._parse_page(page)
+        # 준비 신호 없이 파싱한 결과도 차단 문구/빈 본문이면 LLM으로 넘기지 않음
+        blocked = detect_block_page(text, min_chars=self._MIN_CONTENT_CHARS)
+        if blocked is not None:
+            raise CrawlBlocked(url, *blocked)
+
+        # 스냅샷 저장이 켜져 있으면 파싱에 쓴 페이지의 원본 HTML도 기록 (재추출용)
+        if capture_requested():
+            try:
+                record_raw_html(await page.content(), source="browser")
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to capture raw HTML: {e}")
+        return text
+
+    async def _on_not_ready(self, page: Page) -> None:
+        """본문 준비 신호 없이 파싱으로 넘어갈 때 (차단 페이지 진단 등)"""
+        logger.warning(
+            f"⚠️ Content not ready on {page.url}. Proceeding with partial content."
+        )
 
     @abstractmethod
-    def _parse_page(self, page: Page) -> str:
+    async def _parse_page(self, page: Page) -> str:
         """
         각 사이트별 크롤러가 구체적으로 구현해야 하는 파싱 로직.
         Page 객체를 받아서 최종 텍스트를 반환해야 합니다.
@@ -237,24 +112,68 @@ class BasePlaywrightCrawler(ABC):
         pass
 
     def _clean_html(self, html_content: str) -> str:
-        """HTML 정제 헬퍼 메서드 (BeautifulSoup 활용)"""
-        soup = BeautifulSoup(html_content, "html.parser")
+        """HTML 정제 헬퍼 메서드 (lxml 엔진, html_cleaner.clean_html)"""
+        return clean_html(html_content)
+
+    def _clean_sections(self, sections: Dict[str, Optional[str]]) -> Dict[str, str]:
+        """추출 스크립트가 반환한 섹션별 HTML -> 정제 텍스트 (없는 섹션은 빈 문자열, 순서 유지)"""
+        cleaned = {}
+        for name, html in sections.items():
+            if html is None:
+                logger.warning(f"⚠️ Section not found: {name}")
+                cleaned[name] = ""
+            else:
+                cleaned[name] = self._clean_html(html)
+        return cleaned
+
+
+def translate_crawl_error(error: Exception) -> Exception:
+    """크롤링 예외 -> 호출자에게 던질 예외 (두 엔진 공통)"""
+    if isinstance(error, DeadlineExceeded):
+        logger.warning(f"⏱️ Crawling aborted: {error}")
+        return error
+    if isinstance(error, CrawlBlocked):
+        logger.error(f"🚨 {error}")
+        return error
+    if isinstance(error, PlaywrightError):
+        logger.error(f"❌ Playwright error: {error}")
+        return HTTPException(status_code=400, detail=f"Crawling failed: {str(error)}")
+    logger.error(f"❌ Unexpected error: {error}")
+    return HTTPException(
+        status_code=500, detail=f"Internal crawler error: {str(error)}"
+    )
+
+
+class BasePlaywrightCrawler(SiteStrategy):
+    """
+    sync 엔진: 모든 Playwright 기반 크롤러의 부모 클래스.
+    브라우저 실행/종료는 공유 BrowserPool이 담당하고, 크롤러는 페이지 이동과 파싱 훅만 제공합니다.
+    """
 
-        unwanted_tags = [
-            "script",
-            "style",
-            "noscript",
-            "header",
-            "footer",
-            "nav",
-            "aside",
-            "form",
-        ]
-        for tag in soup(unwanted_tags):
-            tag.decompose()
+    def __init__(self, pool: Optional[BrowserPool] = None):
+        # 풀을 주입하지 않으면 최초 fetch 시 단독 풀 생성 (개발용 스크립트 / async 엔진의 훅 전용 인스턴스)
+        self._pool = pool
 
-        text = soup.get_text(separator="\n", strip=True)
-        import re
+    @property
+    def pool(self) -> BrowserPool:
+        if self._pool is None:
+            self._pool = BrowserPool(size=1)
+        return self._pool
 
-        text = re.sub(r"\n\s*\n", "\n\n", text)
-        return text.strip()
+    def fetch(self, url: str) -> str:
+        """
+        공통 템플릿 메서드: 풀의 브라우저에서 새 페이지 -> 페이지 이동 -> (자식 클래스 로직) -> 텍스트 반환
+        각 대기 단계의 타임아웃은 요청의 남은 시간 예산(Deadline)을 넘지 않으며,
+        예산이 소진되거나 요청이 취소되면 다음 단계로 넘어가기 전에 DeadlineExceeded로 중단
+        """
+        check_deadline("browser_pool")
+        try:
+            # 풀 워커 스레드에서 async 훅을 이벤트 루프 없이 실행
+            return self.pool.run(
+                lambda page: run_hook(self._visit(awaitable_page(page), url))
+            )
+        except Exception as e:
+            error = translate_crawl_error(e)
+            if error is e:
+                raise
+            raise error from e
@@ -0,0 +1,55 @@
+from typing import Optional, Tuple
+
+# 봇 차단/보안 확인 페이지 문구 (소문자 비교)
+BLOCK_MARKERS: Tuple[str, ...] = (
+    "비정상적인 접근",
+    "자동입력 방지",
+    "보안 확인",
+    "보안문자",
+    "captcha",
+    "access denied",
+    "just a moment",
+    "attention required",
+    "unusual traffic",
+    "are you a robot",
+)
+# 이보다 긴 페이지는 문구가 있어도 공고 본문으로 봄 (보안 직무 공고의 "보안 확인" 등 오탐 방지)
+BLOCK_PAGE_MAX_CHARS = 1500
+# 이보다 짧은 파싱 결과는 공고가 아님 (차단/빈 페이지)
+MIN_CONTENT_CHARS = 100
+
+
+class CrawlBlocked(Exception):
+    """차단/보안 확인 페이지를 받음 (LLM으로 넘기지 않고 도메인 circuit breaker에 실패로 기록)"""
+
+    def __init__(self, url: str, reason: str, detail: str = ""):
+        self.url = url
+        # 지표 라벨로 쓰는 분류: marker(차단 문구) / short_content(본문 없음)
+        self.reason = reason
+        super().__init__(
+            f"Blocked page from {url} ({reason}{': ' + detail if detail else ''})"
+        )
+
+
+def find_block_marker(text: str) -> Optional[str]:
+    """짧은 페이지에서 차단 문구를 찾으면 반환"""
+    if len(text) > BLOCK_PAGE_MAX_CHARS:
+        return None
+    lowered = text.lower()
+    return next((marker for marker in BLOCK_MARKERS if marker in lowered), None)
+
+
+def detect_block_page(
+    text: str, title: str = "", min_chars: int = MIN_CONTENT_CHARS
+) -> Optional[Tuple[str, str]]:
+    """
+    파싱 결과(+ 페이지 제목)가 차단 페이지로 보이면 (분류, 근거) 반환, 정상이면 None
+    - marker: 제목 또는 짧은 본문에 차단 문구
+    - short_content: 본문이 min_chars 미만
+    """
+    marker = find_block_marker(title) or find_block_marker(text)
+    if marker is not None:
+        return "marker", marker
+    if len(text.strip()) < min_chars:
+        return "short_content", f"{len(text.strip())} chars"
+    return None
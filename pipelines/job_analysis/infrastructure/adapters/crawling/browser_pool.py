@@ -0,0 +1,440 @@
+import contextvars
+import logging
+import os
+import queue
+import subprocess
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar
+
+from playwright.sync_api import Browser, BrowserContext, Page, Playwright
+from playwright.sync_api import sync_playwright
+
+from shared.concurrency import check_deadline
+from shared.metrics import REGISTRY, observe_stage
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+LAUNCH_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",  # 메모리 부족 충돌 방지 (Linux/Docker 필수)
+    "--disable-gpu",  # 가상 환경 렌더링 충돌 방지
+]
+
+CONTEXT_OPTIONS: Dict[str, Any] = {
+    "user_agent": USER_AGENT,
+    "viewport": {"width": 1920, "height": 1080},
+    "locale": "ko-KR",
+    "ignore_https_errors": True,  # HTTPS 에러 무시
+}
+
+WEBDRIVER_SCRIPT = (
+    "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+)
+
+# 실제 사용자처럼 보이게 하기 위한 추가 스크립트 (Stealth)
+STEALTH_SCRIPT = """
+    // 1. Plugins/MimeTypes 모킹 (Headless는 보통 비어있음)
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5]
+    });
+
+    // 2. window.chrome 속성 유지
+    window.chrome = { runtime: {} };
+
+    // 3. 권한 요청 자동 통과 (Notification 등)
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+        Promise.resolve({ state: 'granted' }) :
+        originalQuery(parameters)
+    );
+
+    // 4. WebGL 벤더 정보 조작
+    const getParameter = WebGLRenderingContext.prototype.getParameter;
+    WebGLRenderingContext.prototype.getParameter = function(parameter) {
+        if (parameter === 37445) return 'Intel Inc.';
+        if (parameter === 37446) return 'Intel Iris OpenGL Engine';
+        return getParameter(parameter);
+    };
+"""
+
+# 메트릭은 sync 풀과 async 엔진이 공유
+BROWSER_LAUNCHES = REGISTRY.counter(
+    "browser_pool_launches_total", "브라우저 풀에서 Chromium을 띄운 횟수"
+)
+BROWSER_RECYCLES = REGISTRY.counter(
+    "browser_pool_recycles_total", "브라우저 교체 횟수", ["reason"]
+)
+BROWSER_QUEUE_DEPTH = REGISTRY.gauge(
+    "browser_pool_queue_depth", "브라우저를 기다리는 페이지 작업 수"
+)
+
+PageJob = Callable[[Page], T]
+PlaywrightFactory = Callable[[], Playwright]
+
+
+def recover_launch_failure(error: Exception) -> None:
+    """
+    Chromium 실행 실패 원인 복구 (실행 파일/시스템 의존성 설치, Xvfb 누락) - Blocking
+    복구할 수 없으면 error를 다시 발생시키고, 복구했으면 호출자는 headless로 재시도
+    """
+    error_msg = str(error)
+    logger.error(f"❌ Browser Launch Failed: {error_msg}")
+
+    # 1. 브라우저 실행 파일이 없는 경우 (가장 근본적인 원인)
+    if "Executable doesn't exist" in error_msg:
+        logger.info("🔧 Browser missing. Installing chromium...")
+        subprocess.run(["playwright", "install", "chromium"], check=True)
+        # 설치 직후 안전하게 Headless로 시작
+        logger.info("✅ Browser installed. Retrying launch...")
+        return
+
+    # 2. 시스템 의존성 라이브러리가 없는 경우 (Linux/Ubuntu 등)
+    if "error while loading shared libraries" in error_msg:
+        logger.info(
+            "🔧 System dependencies missing. Running 'npx playwright install-deps'..."
+        )
+        try:
+            subprocess.run(
+                ["npx", "playwright", "install-deps", "chromium"], check=True
+            )
+        except Exception as dep_err:
+            logger.error(f"❌ Failed to install dependencies: {dep_err}")
+            raise error
+        logger.info("✅ Dependencies installed. Retrying launch...")
+        return
+
+    # 3. Xvfb(XServer)가 없어서 Headful 모드가 실패한 경우 (환경 설정 문제)
+    if "No XServer running" in error_msg or "headless: true" in error_msg:
+        logger.warning(
+            "🚨 Xvfb not found! Falling back to 'headless=True' with Stealth options to prevent crash."
+        )
+        return
+
+    # 그 외 알 수 없는 에러는 그대로 발생
+    raise error
+
+
+def _launch_browser(playwright: Playwright, headless: bool) -> Browser:
+    """Chromium 실행 (실행 파일/시스템 의존성/Xvfb 누락 시 복구 후 재시도)"""
+    try:
+        return playwright.chromium.launch(headless=headless, args=LAUNCH_ARGS)
+    except Exception as e:
+        recover_launch_failure(e)
+        return playwright.chromium.launch(headless=True, args=LAUNCH_ARGS)
+
+
+def start_virtual_display() -> Any:
+    """가상 디스플레이(Xvfb) 시작, 사용할 수 없으면 None (실제 모니터 사용)"""
+    try:
+        from pyvirtualdisplay import Display
+
+        display = Display(visible=False, size=(1920, 1080))
+        display.start()
+        logger.info("🖥️  Virtual Display(Xvfb) started.")
+        return display
+    except Exception as e:
+        # Xvfb가 없으면(로컬 Mac 등) 실제 모니터 사용
+        logger.warning(
+            f"⚠️  Virtual Display not available (Error: {e}). Using physical display."
+        )
+        return None
+
+
+def _new_context(browser: Browser) -> BrowserContext:
+    """탐지 방지 스크립트가 적용된 컨텍스트 (여러 페이지가 재사용, 리소스 차단은 페이지별 CDP 설정)"""
+    context = browser.new_context(**CONTEXT_OPTIONS)
+    # navigator.webdriver 값 제거 (가장 중요한 탐지 방지 스크립트)
+    context.add_init_script(WEBDRIVER_SCRIPT)
+    context.add_init_script(STEALTH_SCRIPT)
+    return context
+
+
+def _process_tree_rss_mb(root_pids: Set[int]) -> Optional[float]:
+    """root_pids와 모든 하위 프로세스의 RSS 합계(MB), /proc이 없으면(macOS 등) None"""
+    if not root_pids or not os.path.isdir("/proc"):
+        return None
+
+    children: Dict[int, List[int]] = {}
+    rss_pages: Dict[int, int] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                stat = f.read()
+            with open(f"/proc/{entry}/statm") as f:
+                statm = f.read()
+        except OSError:
+            continue
+        # comm(2번째 필드)에 공백/괄호가 있을 수 있으므로 마지막 ')' 이후를 파싱
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry))
+        rss_pages[int(entry)] = int(statm.split()[1])
+
+    total, stack = 0, list(root_pids)
+    while stack:
+        pid = stack.pop()
+        total += rss_pages.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def _child_pids() -> Set[int]:
+    if not os.path.isdir("/proc"):
+        return set()
+    me, pids = str(os.getpid()), set()
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                if f.read().rsplit(")", 1)[1].split()[1] == me:
+                    pids.add(int(entry))
+        except (OSError, IndexError):
+            continue
+    return pids
+
+
+class _BrowserWorker(threading.Thread):
+    """
+    Chromium 1개를 소유하는 전용 스레드
+    sync Playwright 객체는 생성한 스레드에서만 사용할 수 있으므로, 페이지 작업을 이 스레드로 보내서 실행함
+    """
+
+    def __init__(self, pool: "BrowserPool", index: int):
+        super().__init__(name=f"browser-pool-{index}", daemon=True)
+        self.pool = pool
+
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._context: Optional[BrowserContext] = None
+        self._driver_pids: Set[int] = set()
+        self._pages_in_browser = 0
+        self._pages_in_context = 0
+
+    def run(self) -> None:
+        try:
+            while True:
+                job = self.pool._jobs.get()
+                if job is None:
+                    return
+                BROWSER_QUEUE_DEPTH.set(self.pool._jobs.qsize())
+                self._serve(*job)
+        finally:
+            self._close_browser()
+
+    def _serve(
+        self, fn: PageJob, ctx: contextvars.Context, future: "Future[Any]"
+    ) -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+
+        try:
+            # 요청 컨텍스트(Deadline, request_id)에서 실행 - 대기 중 예산이 소진됐으면 브라우저를 쓰지 않음
+            ctx.run(check_deadline, "browser_pool")
+        except BaseException as e:
+            future.set_exception(e)
+            return
+
+        try:
+            page = self._new_page()
+            try:
+                future.set_result(ctx.run(fn, page))
+            finally:
+                try:
+                    page.close()
+                except Exception:
+                    pass
+        except BaseException as e:
+            future.set_exception(e)
+            # 페이지 작업이 실패하면 컨텍스트 상태를 신뢰할 수 없으므로 새로 시작
+            self._close_context()
+            if self._browser is not None and not self._browser.is_connected():
+                self._recycle("disconnected")
+        finally:
+            self._after_page()
+
+    def _new_page(self) -> Page:
+        if self._browser is None:
+            self._start_browser()
+        assert self._browser is not None
+        if self._context is None:
+            self._context = _new_context(self._browser)
+            self._pages_in_context = 0
+        return self._context.new_page()
+
+    def _start_browser(self) -> None:
+        started = time.perf_counter()
+        self.pool._ensure_display()
+
+        # 이 워커의 Playwright 드라이버 프로세스를 식별 (RSS 측정용)
+        with self.pool._launch_lock:
+            before = _child_pids()
+            self._playwright = self.pool._playwright_factory()
+            self._driver_pids = _child_pids() - before
+
+        try:
+            self._browser = _launch_browser(self._playwright, self.pool.headless)
+        except BaseException:
+            self._close_browser()
+            raise
+        self._pages_in_browser = 0
+        BROWSER_LAUNCHES.inc()
+        elapsed = time.perf_counter() - started
+        observe_stage("job_analysis", "browser_launch", elapsed)
+        logger.info(f"🧭 {self.name}: browser launched ({elapsed * 1000:.0f} ms)")
+
+    def _after_page(self) -> None:
+        self._pages_in_browser += 1
+        self._pages_in_context += 1
+        pool = self.pool
+
+        if self._browser is None:
+            return
+        if self._pages_in_browser >= pool.max_pages_per_browser:
+            self._recycle("max_pages")
+            return
+        if pool.max_rss_mb is not None:
+            rss = _process_tree_rss_mb(self._driver_pids)
+            if rss is not None and rss > pool.max_rss_mb:
+                logger.info(f"♻️ {self.name}: RSS {rss:.0f} MB > {pool.max_rss_mb} MB")
+                self._recycle("rss")
+                return
+        if self._pages_in_context >= pool.max_pages_per_context:
+            self._close_context()
+
+    def _recycle(self, reason: str) -> None:
+        BROWSER_RECYCLES.inc(reason=reason)
+        logger.info(
+            f"♻️ {self.name}: recycling browser ({reason}, {self._pages_in_browser} pages)"
+        )
+        self._close_browser()
+
+    def _close_context(self) -> None:
+        if self._context is not None:
+            try:
+                self._context.close()
+            except Exception:
+                pass
+            self._context = None
+
+    def _close_browser(self) -> None:
+        self._close_context()
+        if self._browser is not None:
+            try:
+                self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            try:
+                self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+        self._driver_pids = set()
+
+
+class BrowserPool:
+    """
+    장수명 Chromium 풀 (Saramin/Wanted/Default 크롤러가 공유)
+    - 브라우저마다 전용 스레드 1개, 최초 사용 시 실행 (lazy)
+    - 컨텍스트(탐지 방지 스크립트/리소스 차단 포함)는 max_pages_per_context 페이지마다 새로 생성
+    - 브라우저는 max_pages_per_browser 페이지 또는 프로세스 트리 RSS가 max_rss_mb를 넘으면 교체
+    - fetch마다 하는 일은 새 페이지 열기 -> 작업 -> 페이지 닫기 뿐
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_pages_per_context: int = 20,
+        max_pages_per_browser: int = 200,
+        max_rss_mb: Optional[float] = None,
+        headless: bool = False,
+        playwright_factory: Optional[PlaywrightFactory] = None,
+        use_virtual_display: bool = True,
+    ):
+        self.size = max(1, size)
+        self.max_pages_per_context = max(1, max_pages_per_context)
+        self.max_pages_per_browser = max(1, max_pages_per_browser)
+        self.max_rss_mb = max_rss_mb
+        # 봇 탐지 회피를 위해 기본은 Headful (Linux 서버는 Xvfb 가상 디스플레이 사용)
+        self.headless = headless
+        self.use_virtual_display = use_virtual_display and not headless
+
+        self._playwright_factory: PlaywrightFactory = playwright_factory or (
+            lambda: sync_playwright().start()
+        )
+        self._jobs: (
+            "queue.Queue[Optional[Tuple[PageJob, contextvars.Context, Future]]]"
+        ) = queue.Queue()
+        self._workers: List[_BrowserWorker] = []
+        self._lock = threading.Lock()
+        self._launch_lock = threading.Lock()
+        self._display: Any = None
+        self._display_checked = False
+        self._closed = False
+
+    def run(self, fn: PageJob[T], timeout: Optional[float] = None) -> T:
+        """
+        풀의 브라우저에서 새 페이지를 열어 fn(page)를 실행하고 결과 반환 (Blocking)
+        fn은 호출한 쪽의 contextvars(Deadline, request_id)를 그대로 보고 실행됨
+        """
+        self._ensure_workers()
+        future: "Future[T]" = Future()
+        self._jobs.put((fn, contextvars.copy_context(), future))
+        BROWSER_QUEUE_DEPTH.set(self._jobs.qsize())
+        return future.result(timeout)
+
+    def close(self, timeout: float = 10.0) -> None:
+        """모든 브라우저 종료 (대기 중인 작업은 처리 후 종료)"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            workers, self._workers = self._workers, []
+
+        for _ in workers:
+            self._jobs.put(None)
+        for worker in workers:
+            worker.join(timeout)
+
+        if self._display is not None:
+            try:
+                self._display.stop()
+            except Exception:
+                pass
+            self._display = None
+        logger.info("🧹 Browser pool closed")
+
+    def _ensure_workers(self) -> None:
+        if len(self._workers) >= self.size:
+            return
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Browser pool is closed")
+            while len(self._workers) < self.size:
+                worker = _BrowserWorker(self, len(self._workers))
+                worker.start()
+                self._workers.append(worker)
+
+    def _ensure_display(self) -> None:
+        """Linux 서버 등에서 가상 디스플레이(Xvfb)를 프로세스당 한 번만 시작"""
+        with self._launch_lock:
+            if self._display_checked or not self.use_virtual_display:
+                return
+            self._display_checked = True
+            self._display = start_virtual_display()
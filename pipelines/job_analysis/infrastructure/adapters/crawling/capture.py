@@ -0,0 +1,49 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+
+@dataclass
+class CrawlCapture:
+    """fetch 1회 동안 크롤러가 받은 원본 HTML (스냅샷 저장용)"""
+
+    raw_html: Optional[str] = None
+    source: Optional[str] = None  # browser / http / snapshot
+
+
+# contextvar라서 asyncio 태스크, asyncio.to_thread, 브라우저 풀 워커 스레드(copy_context)까지 전달됨
+# (캡처 객체 자체는 공유되므로 워커 스레드에서 기록한 값을 호출자가 그대로 읽음)
+_current_capture: ContextVar[Optional[CrawlCapture]] = ContextVar(
+    "crawl_capture", default=None
+)
+
+
+@contextmanager
+def capture_scope() -> Iterator[CrawlCapture]:
+    """
+    with 블록 안의 fetch가 받은 원본 HTML을 기록
+    바깥 데코레이터가 이미 연 범위가 있으면 같은 캡처 객체를 공유 (스냅샷 저장 + 구조화 필드 파싱)
+    """
+    outer = _current_capture.get()
+    if outer is not None:
+        yield outer
+        return
+    capture = CrawlCapture()
+    token = _current_capture.set(capture)
+    try:
+        yield capture
+    finally:
+        _current_capture.reset(token)
+
+
+def capture_requested() -> bool:
+    """원본 HTML 기록이 필요한지 (스냅샷 미사용 시 page.content() 추가 호출을 건너뜀)"""
+    return _current_capture.get() is not None
+
+
+def record_raw_html(raw_html: Optional[str], source: str) -> None:
+    capture = _current_capture.get()
+    if capture is not None:
+        capture.raw_html = raw_html
+        capture.source = source
@@ -0,0 +1,224 @@
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, Optional, Union
+
+from fastapi import HTTPException
+
+from shared.metrics import REGISTRY
+from ....domain.interface.crawler import AsyncWebCrawler, WebCrawler
+from ....domain.interface.snapshot_store import SnapshotStore
+from .block_detection import CrawlBlocked
+from .capture import record_raw_html
+from .readiness import domain_of, metric_site
+
+logger = logging.getLogger(__name__)
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+CIRCUIT_STATE = REGISTRY.gauge(
+    "crawler_circuit_state",
+    "도메인 circuit breaker 상태 (0=closed, 1=half_open, 2=open)",
+    ["site"],
+)
+CIRCUIT_TRANSITIONS = REGISTRY.counter(
+    "crawler_circuit_transitions_total",
+    "circuit breaker 상태 전환 수",
+    ["site", "state"],
+)
+BLOCKED_PAGES = REGISTRY.counter(
+    "crawler_blocked_pages_total",
+    "차단/보안 확인 페이지로 판정된 크롤링 수",
+    ["site", "reason"],
+)
+CIRCUIT_FALLBACKS = REGISTRY.counter(
+    "crawler_circuit_fallback_total",
+    "크롤링 대신 응답한 결과 (snapshot=저장된 스냅샷, unavailable=503)",
+    ["site", "result"],
+)
+
+
+@dataclass
+class _Circuit:
+    state: str = CLOSED
+    failures: int = 0
+    opened_at: float = 0.0
+    probing: bool = False
+
+
+class CircuitBreaker:
+    """
+    도메인별 circuit breaker (차단 페이지 연속 failure_threshold번 -> open)
+    - open: cooldown_seconds 동안 크롤링하지 않고 바로 실패
+    - half_open: cooldown이 지나면 요청 1개만 시험 크롤링(probe), 성공하면 closed / 차단이면 다시 open
+    실패가 없는 도메인은 상태를 보관하지 않음 (기본 크롤러가 방문하는 임의 도메인 대비)
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 120.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def state(self, domain: str) -> str:
+        with self._lock:
+            circuit = self._circuits.get(domain)
+            return circuit.state if circuit else CLOSED
+
+    def acquire(self, domain: str) -> bool:
+        """크롤링해도 되면 True (half_open이면 이 호출이 probe를 맡음)"""
+        with self._lock:
+            circuit = self._circuits.get(domain)
+            if circuit is None or circuit.state == CLOSED:
+                return True
+            if circuit.state == OPEN:
+                if self._clock() - circuit.opened_at < self.cooldown_seconds:
+                    return False
+                self._transition(domain, circuit, HALF_OPEN)
+            if circuit.probing:
+                return False
+            circuit.probing = True
+            return True
+
+    def record_success(self, domain: str) -> None:
+        with self._lock:
+            circuit = self._circuits.pop(domain, None)
+            if circuit is not None and circuit.state != CLOSED:
+                self._transition(domain, circuit, CLOSED)
+
+    def record_failure(self, domain: str) -> None:
+        """차단 페이지 1건 (half_open probe 실패 시 바로 다시 open)"""
+        with self._lock:
+            circuit = self._circuits.setdefault(domain, _Circuit())
+            circuit.failures += 1
+            circuit.probing = False
+            if circuit.state == HALF_OPEN or (
+                circuit.state == CLOSED and circuit.failures >= self.failure_threshold
+            ):
+                circuit.opened_at = self._clock()
+                self._transition(domain, circuit, OPEN)
+
+    def release(self, domain: str) -> None:
+        """차단과 무관한 실패(타임아웃/취소 등) - 상태는 그대로 두고 probe 자리만 반환"""
+        with self._lock:
+            circuit = self._circuits.get(domain)
+            if circuit is not None:
+                circuit.probing = False
+
+    def retry_after(self, domain: str) -> float:
+        """다음 probe까지 남은 시간(초)"""
+        with self._lock:
+            circuit = self._circuits.get(domain)
+            if circuit is None or circuit.state != OPEN:
+                return 0.0
+            elapsed = self._clock() - circuit.opened_at
+            return max(0.0, self.cooldown_seconds - elapsed)
+
+    def _transition(self, domain: str, circuit: _Circuit, state: str) -> None:
+        circuit.state = state
+        if state == CLOSED:
+            circuit.failures = 0
+        site = metric_site(domain)
+        CIRCUIT_STATE.set(_STATE_VALUES[state], site=site)
+        CIRCUIT_TRANSITIONS.inc(site=site, state=state)
+        icon = "🟢" if state == CLOSED else "🟡" if state == HALF_OPEN else "🔴"
+        logger.warning(f"{icon} Crawl circuit for {domain} -> {state}")
+
+
+class CircuitBreakerCrawler(AsyncWebCrawler):
+    """
+    크롤러 데코레이터: 차단 페이지가 이어지는 도메인은 cooldown 동안 크롤링하지 않고 바로 응답
+    - 차단됐거나 circuit이 열려 있으면 스냅샷 저장소의 가장 최근 크롤링 결과로 응답 (저장소가 있을 때)
+    - 스냅샷도 없으면 503 + Retry-After (차단 페이지 텍스트는 LLM으로 넘기지 않음)
+    """
+
+    def __init__(
+        self,
+        crawler: Union[WebCrawler, AsyncWebCrawler],
+        breaker: CircuitBreaker,
+        store: Optional[SnapshotStore] = None,
+    ):
+        self.crawler = crawler
+        self.breaker = breaker
+        self.store = store
+
+    async def fetch(self, url: str) -> str:
+        domain = domain_of(url)
+        if not self.breaker.acquire(domain):
+            logger.warning(f"⛔ Crawl circuit open for {domain}. Skipping crawl.")
+            return await self._fallback(url, domain)
+
+        try:
+            if inspect.iscoroutinefunction(self.crawler.fetch):
+                text = await self.crawler.fetch(url)
+            else:
+                text = await asyncio.to_thread(self.crawler.fetch, url)
+        except CrawlBlocked as e:
+            BLOCKED_PAGES.inc(site=metric_site(domain), reason=e.reason)
+            self.breaker.record_failure(domain)
+            return await self._fallback(url, domain)
+        except BaseException:
+            self.breaker.release(domain)
+            raise
+        self.breaker.record_success(domain)
+        return text
+
+    async def _fallback(self, url: str, domain: str) -> str:
+        site = metric_site(domain)
+        text = await self._latest_snapshot_text(url)
+        if text is not None:
+            CIRCUIT_FALLBACKS.inc(site=site, result="snapshot")
+            return text
+
+        CIRCUIT_FALLBACKS.inc(site=site, result="unavailable")
+        retry_after = max(1, round(self.breaker.retry_after(domain)))
+        raise HTTPException(
+            status_code=503,
+            detail=f"Crawling temporarily unavailable for {domain} (bot check detected)",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+    async def _latest_snapshot_text(self, url: str) -> Optional[str]:
+        if self.store is None:
+            return None
+        try:
+            records = await self.store.find(url=url, limit=1, latest_only=True)
+            if not records:
+                return None
+            record = records[0]
+            snapshot = await self.store.load(record.content_hash)
+        except Exception as e:
+            logger.warning(f"⚠️ Snapshot fallback failed: {e}")
+            return None
+
+        # 구조화 필드 파싱(PostingFieldsCrawler)은 차단 페이지 대신 스냅샷 원본을 사용
+        record_raw_html(snapshot.raw_html, source="snapshot")
+        age = datetime.now(timezone.utc) - record.captured_at
+        logger.info(
+            f"🗄️ Serving crawl snapshot ({record.content_hash[:12]}, age {age}) for {url}"
+        )
+        return snapshot.text
+
+    def close(self) -> None:
+        """내부 크롤러 종료 (Blocking)"""
+        close = getattr(self.crawler, "close", None)
+        if close is not None:
+            close()
+
+    async def aclose(self) -> None:
+        aclose = getattr(self.crawler, "aclose", None)
+        if aclose is not None:
+            await aclose()
+        else:
+            await asyncio.to_thread(self.close)
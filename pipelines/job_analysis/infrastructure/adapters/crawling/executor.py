@@ -0,0 +1,164 @@
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, TypeVar
+
+from shared.metrics import REGISTRY
+from ....domain.interface.crawler import AsyncWebCrawler, WebCrawler
+from .readiness import domain_of, metric_site
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CRAWL_QUEUE_SECONDS = REGISTRY.histogram(
+    "crawler_executor_queue_seconds",
+    "크롤링 작업이 전용 실행기 대기열에서 기다린 시간",
+    ["site"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 20),
+)
+CRAWL_QUEUE_DEPTH = REGISTRY.gauge(
+    "crawler_executor_queue_depth", "전용 실행기에서 대기 중인 크롤링 작업 수"
+)
+CRAWL_ACTIVE = REGISTRY.gauge(
+    "crawler_executor_active", "전용 실행기에서 실행 중인 크롤링 작업 수", ["site"]
+)
+
+
+@dataclass
+class _CrawlJob:
+    domain: str
+    fn: Callable[..., Any]
+    args: tuple
+    ctx: contextvars.Context
+    future: "Future[Any]"
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class CrawlExecutor:
+    """
+    sync 크롤링 전용 실행기 (고정 크기 스레드 + 자체 FIFO 대기열)
+    - 기본 asyncio 스레드 풀(asyncio.to_thread)을 쓰지 않으므로 크롤링이 몰려도 PDF 파싱/S3 I/O가 밀리지 않음
+    - 도메인별 동시 실행 상한: 상한에 걸린 작업은 순서를 유지한 채 대기하고, 다른 도메인 작업이 먼저 실행됨
+    - 대기열에서 취소된 작업(요청 취소/Deadline)은 실행하지 않고 버림
+    """
+
+    def __init__(self, max_workers: int = 4, per_domain_limit: int = 2):
+        self.max_workers = max(1, max_workers)
+        self.per_domain_limit = max(1, per_domain_limit)
+        self._queue: Deque[_CrawlJob] = deque()
+        self._active: Dict[str, int] = {}
+        self._cond = threading.Condition()
+        self._workers: List[threading.Thread] = []
+        self._closed = False
+
+    def submit(self, domain: str, fn: Callable[..., T], *args: Any) -> "Future[T]":
+        """fn(*args)를 대기열에 넣고 Future 반환 (호출한 쪽의 contextvars에서 실행)"""
+        future: "Future[T]" = Future()
+        job = _CrawlJob(domain, fn, args, contextvars.copy_context(), future)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Crawl executor is closed")
+            self._ensure_workers()
+            self._queue.append(job)
+            CRAWL_QUEUE_DEPTH.set(len(self._queue))
+            self._cond.notify_all()
+        return future
+
+    async def run(self, domain: str, fn: Callable[..., T], *args: Any) -> T:
+        """submit 후 결과 대기 (await 중인 코루틴이 취소되면 대기열의 작업도 취소)"""
+        return await asyncio.wrap_future(self.submit(domain, fn, *args))
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """대기 중인 작업은 취소하고, 실행 중인 작업이 끝나면 스레드 종료"""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            pending, self._queue = list(self._queue), deque()
+            CRAWL_QUEUE_DEPTH.set(0)
+            self._cond.notify_all()
+            workers, self._workers = self._workers, []
+        for job in pending:
+            job.future.cancel()
+        for worker in workers:
+            worker.join(timeout)
+
+    def _ensure_workers(self) -> None:
+        while len(self._workers) < self.max_workers:
+            worker = threading.Thread(
+                target=self._work,
+                name=f"crawl-executor-{len(self._workers)}",
+                daemon=True,
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def _next_job(self) -> Optional[_CrawlJob]:
+        """상한에 걸리지 않은 가장 오래된 작업 (취소된 작업은 정리) - lock 안에서 호출"""
+        for job in list(self._queue):
+            if job.future.cancelled():
+                self._queue.remove(job)
+                continue
+            if self._active.get(job.domain, 0) < self.per_domain_limit:
+                self._queue.remove(job)
+                return job
+        return None
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                job = self._next_job()
+                while job is None:
+                    if self._closed:
+                        return
+                    self._cond.wait()
+                    job = self._next_job()
+                self._active[job.domain] = self._active.get(job.domain, 0) + 1
+                CRAWL_QUEUE_DEPTH.set(len(self._queue))
+
+            site = metric_site(job.domain)
+            CRAWL_QUEUE_SECONDS.observe(
+                time.perf_counter() - job.enqueued_at, site=site
+            )
+            CRAWL_ACTIVE.inc(site=site)
+            try:
+                if job.future.set_running_or_notify_cancel():
+                    try:
+                        job.future.set_result(job.ctx.run(job.fn, *job.args))
+                    except BaseException as e:
+                        job.future.set_exception(e)
+            finally:
+                CRAWL_ACTIVE.dec(site=site)
+                with self._cond:
+                    self._active[job.domain] -= 1
+                    if not self._active[job.domain]:
+                        del self._active[job.domain]
+                    # 같은 도메인 상한에 걸려 있던 작업을 깨움
+                    self._cond.notify_all()
+
+
+class ExecutorCrawler(AsyncWebCrawler):
+    """sync 크롤러(브라우저 풀)를 전용 실행기에서 실행하는 async 어댑터"""
+
+    def __init__(self, crawler: WebCrawler, executor: CrawlExecutor):
+        self.crawler = crawler
+        self.executor = executor
+
+    async def fetch(self, url: str) -> str:
+        return await self.executor.run(domain_of(url), self.crawler.fetch, url)
+
+    def close(self) -> None:
+        """대기 중인 크롤링 취소 후 브라우저 종료 (Blocking)"""
+        self.executor.shutdown()
+        close = getattr(self.crawler, "close", None)
+        if close is not None:
+            close()
+
+    async def aclose(self) -> None:
+        await asyncio.to_thread(self.close)
@@ -0,0 +1,67 @@
+import logging
+import re
+
+import lxml.html
+from bs4 import BeautifulSoup
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+# 본문이 아닌 태그 (하위 텍스트까지 제거, 뒤따르는 텍스트는 유지)
+UNWANTED_TAGS = (
+    "script",
+    "style",
+    "noscript",
+    "header",
+    "footer",
+    "nav",
+    "aside",
+    "form",
+)
+
+_BLANK_LINES = re.compile(r"\n\s*\n")
+_UTF8_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+
+def _collapse(chunks) -> str:
+    """텍스트 조각 -> 조각별 strip 후 줄바꿈으로 연결, 빈 줄은 1줄로 (두 엔진 공통 출력 규칙)"""
+    text = "\n".join(chunk for chunk in (c.strip() for c in chunks) if chunk)
+    return _BLANK_LINES.sub("\n\n", text).strip()
+
+
+def clean_html_soup(html_content: str) -> str:
+    """BeautifulSoup(html.parser) 엔진 - lxml 엔진의 출력 기준 (비교/벤치마크용)"""
+    soup = BeautifulSoup(html_content, "html.parser")
+    for tag in soup(UNWANTED_TAGS):
+        tag.decompose()
+    # get_text(strip=True)는 문자열 노드마다 strip (주석/doctype 제외)
+    return _collapse(soup.strings)
+
+
+def clean_html_lxml(html_content: str) -> str:
+    """
+    lxml(libxml2) 엔진: 파싱과 텍스트 순회가 C에서 실행됨
+    제외 태그는 제거 대신 내용만 비워서(tail 유지) 앞뒤 텍스트가 html.parser 엔진과 같은 조각으로 남음
+    """
+    try:
+        try:
+            root = lxml.html.document_fromstring(html_content)
+        except ValueError:
+            # 인코딩 선언이 있는 XML/XHTML 문서는 str로 받지 않으므로 UTF-8 bytes로 파싱
+            # (html.parser로 넘기면 XMLParsedAsHTMLWarning이 발생)
+            root = lxml.html.document_fromstring(
+                html_content.encode("utf-8"), parser=_UTF8_PARSER
+            )
+    except etree.ParserError:
+        # 빈 문서/공백만 있는 문서
+        return ""
+
+    for element in list(root.iter(*UNWANTED_TAGS)):
+        element.clear(keep_tail=True)
+    # itertext는 주석/처리 명령 텍스트를 건너뛰고 text/tail을 각각 별도 조각으로 반환
+    return _collapse(root.itertext())
+
+
+def clean_html(html_content: str) -> str:
+    """HTML -> 본문 텍스트 (브라우저 크롤러와 HTTP fast path 공통)"""
+    return clean_html_lxml(html_content)
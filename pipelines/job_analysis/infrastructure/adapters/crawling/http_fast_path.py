@@ -0,0 +1,299 @@
+import asyncio
+import inspect
+import json
+import logging
+import re
+from typing import Any, Dict, List, Optional, Union
+from urllib.parse import parse_qsl, urlsplit
+
+import httpx
+from bs4 import BeautifulSoup
+
+from shared.concurrency import stage_timeout
+from shared.metrics import REGISTRY, time_stage
+from ....domain.interface.crawler import AsyncWebCrawler, WebCrawler
+from ....domain.services.url_canonicalizer import job_site_of
+from .html_cleaner import clean_html
+from .browser_pool import USER_AGENT
+from .capture import record_raw_html
+from .strategies.saramin import SaraminCrawler
+
+logger = logging.getLogger(__name__)
+
+FAST_PATH_RESULTS = REGISTRY.counter(
+    "crawler_fast_path_total",
+    "HTTP fast path 결과 (hit=브라우저 없이 완료, miss=브라우저로 폴백)",
+    ["site", "result"],
+)
+
+SARAMIN_DETAIL_URL = "https://www.saramin.co.kr/zf_user/jobs/relay/view-detail?rec_idx={rec_idx}&rec_seq=0"
+WANTED_API_URL = "https://www.wanted.co.kr/api/v4/jobs/{job_id}"
+
+_WANTED_JOB_PATH = re.compile(r"/wd/(\d+)")
+_NEXT_DATA = re.compile(
+    r'<script[^>]*id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL
+)
+
+# 원티드 공고 상세 필드 -> 섹션 제목 (브라우저 크롤링 결과와 같은 제목)
+_WANTED_SECTIONS = [
+    ("intro", "포지션 상세"),
+    ("main_tasks", "주요업무"),
+    ("requirements", "자격요건"),
+    ("preferred_points", "우대사항"),
+    ("benefits", "혜택 및 복지"),
+]
+
+
+class FastPathMiss(Exception):
+    """HTTP fast path로 공고를 가져오지 못했거나 검증에 실패함 (브라우저 크롤러로 폴백)"""
+
+
+# ── 사람인 ─────────────────────────────────────────────
+
+
+def parse_saramin_page(html: str) -> Dict[str, str]:
+    """공고 페이지 HTML -> 헤더/요약/접수 방법 섹션 (브라우저 크롤러와 같은 셀렉터)"""
+    soup = BeautifulSoup(html, "html.parser")
+    root = SaraminCrawler._ROOT
+    sections = {}
+    for name, selector in (
+        ("header", f"{root} .wrap_jv_header"),
+        ("summary", f"{root} .jv_cont.jv_summary"),
+        ("howto", f"{root} .jv_cont.jv_howto"),
+    ):
+        node = soup.select_one(selector)
+        sections[name] = clean_html(node.decode_contents()) if node else ""
+    return sections
+
+
+def parse_saramin_detail(html: str) -> str:
+    """공고 본문 iframe 문서 -> 텍스트 (.user_content 우선, fallback은 body)"""
+    soup = BeautifulSoup(html, "html.parser")
+    node = soup.select_one(".user_content") or soup.body or soup
+    return clean_html(node.decode_contents())
+
+
+# ── 원티드 ─────────────────────────────────────────────
+
+
+def parse_wanted_next_data(html: str) -> Optional[Any]:
+    """공고 페이지에 포함된 __NEXT_DATA__ JSON"""
+    match = _NEXT_DATA.search(html)
+    if not match:
+        return None
+    try:
+        return json.loads(match.group(1))
+    except json.JSONDecodeError:
+        return None
+
+
+def find_wanted_job(payload: Any) -> Optional[Dict[str, Any]]:
+    """API 응답/__NEXT_DATA__ 어디에 있든 공고 객체(position + detail)를 찾음"""
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            detail = node.get("detail")
+            if isinstance(node.get("position"), str) and isinstance(detail, dict):
+                if any(detail.get(key) for key, _ in _WANTED_SECTIONS):
+                    return node
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return None
+
+
+def format_wanted_job(job: Dict[str, Any]) -> str:
+    """원티드 공고 객체 -> 브라우저 크롤링 결과와 같은 모양의 텍스트"""
+    company = job.get("company") or {}
+    company_name = company.get("name") if isinstance(company, dict) else None
+    address = job.get("address") or {}
+    location = address.get("full_location") if isinstance(address, dict) else None
+
+    header = [company_name or job.get("company_name") or "", job["position"]]
+    lines: List[str] = ["\n".join(line for line in header if line)]
+
+    detail = job["detail"]
+    for key, title in _WANTED_SECTIONS:
+        if detail.get(key):
+            lines.append(f"{title}\n{str(detail[key]).strip()}")
+
+    skills = [
+        tag.get("title") or tag.get("text")
+        for tag in job.get("skill_tags") or []
+        if isinstance(tag, dict)
+    ]
+    if any(skills):
+        lines.append("기술스택 • 툴\n" + "\n".join(s for s in skills if s))
+
+    lines.append(f"마감일\n{job.get('due_time') or '상시채용'}")
+    if location:
+        lines.append(f"근무지역\n{location}")
+    return "\n\n".join(lines)
+
+
+class HttpFastPath:
+    """
+    브라우저 없이 HTTP 요청만으로 공고 본문을 가져오는 fetcher (커넥션 풀 공유)
+    - 사람인: 공고 페이지 + 본문 iframe 문서(view-detail)를 동시에 요청해서 파싱
+    - 원티드: 공고 API(JSON) -> 실패 시 페이지의 __NEXT_DATA__ 파싱
+    결과가 검증(min_chars 등)을 통과하지 못하면 FastPathMiss
+    """
+
+    def __init__(
+        self,
+        timeout: float = 5.0,
+        min_chars: int = 200,
+        max_connections: int = 20,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.timeout = timeout
+        self.min_chars = min_chars
+        self.max_connections = max_connections
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @staticmethod
+    def site_of(url: str) -> Optional[str]:
+        """host 기준 사이트 판별 (경로/쿼리에 도메인 문자열이 있어도 fast path로 보내지 않음)"""
+        return job_site_of(url)
+
+    async def fetch(self, url: str) -> str:
+        site = self.site_of(url)
+        if site is None:
+            raise FastPathMiss("unsupported site")
+        try:
+            if site == "saramin":
+                return await self._fetch_saramin(url)
+            return await self._fetch_wanted(url)
+        except httpx.HTTPError as e:
+            raise FastPathMiss(f"{type(e).__name__}: {e}") from e
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # 커넥션은 이벤트 루프에 묶이므로 루프가 바뀌면 새 클라이언트 생성
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._loop = loop
+            self._client = httpx.AsyncClient(
+                headers={
+                    "User-Agent": USER_AGENT,
+                    "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+                },
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                transport=self._transport,
+            )
+        return self._client
+
+    async def _get(self, url: str) -> httpx.Response:
+        # 남은 요청 예산보다 길게 기다리지 않음 (예산 소진 시 DeadlineExceeded)
+        timeout = stage_timeout("http_fetch", self.timeout)
+        response = await self._get_client().get(url, timeout=timeout)
+        response.raise_for_status()
+        return response
+
+    def _validate(self, body: str, what: str) -> None:
+        if len(body) < self.min_chars:
+            raise FastPathMiss(f"{what} too short ({len(body)} chars)")
+
+    async def _fetch_saramin(self, url: str) -> str:
+        query = dict(parse_qsl(urlsplit(url).query))
+        rec_idx = query.get("rec_idx")
+        if not rec_idx:
+            raise FastPathMiss("rec_idx missing")
+
+        page, detail = await asyncio.gather(
+            self._get(url), self._get(SARAMIN_DETAIL_URL.format(rec_idx=rec_idx))
+        )
+        sections = parse_saramin_page(page.text)
+        body = parse_saramin_detail(detail.text)
+        self._validate(body, "detail")
+        if not sections["header"]:
+            # 헤더(회사명/공고명)가 없으면 차단 페이지 등일 가능성이 높음
+            raise FastPathMiss("header not found")
+
+        # 본문은 iframe 문서에 있으므로 두 문서를 함께 기록
+        record_raw_html(page.text + "\n" + detail.text, source="http")
+        parts = [sections["header"], sections["summary"], body, sections["howto"]]
+        return "\n\n".join(p for p in parts if p)
+
+    async def _fetch_wanted(self, url: str) -> str:
+        match = _WANTED_JOB_PATH.search(urlsplit(url).path)
+        if not match:
+            raise FastPathMiss("job id missing")
+
+        job = None
+        try:
+            response = await self._get(WANTED_API_URL.format(job_id=match.group(1)))
+            job = find_wanted_job(response.json())
+            raw = response.text
+        except (httpx.HTTPError, ValueError) as e:
+            logger.info(f"ℹ️ Wanted API unavailable ({e}), trying __NEXT_DATA__")
+
+        if job is None:
+            page = await self._get(url)
+            job = find_wanted_job(parse_wanted_next_data(page.text))
+            raw = page.text
+        if job is None:
+            raise FastPathMiss("job payload not found")
+
+        text = format_wanted_job(job)
+        self._validate(text, "posting")
+        # API 응답(JSON) 또는 __NEXT_DATA__가 포함된 페이지 HTML
+        record_raw_html(raw, source="http")
+        return text
+
+
+class HttpFirstCrawler(AsyncWebCrawler):
+    """
+    HTTP fast path를 먼저 시도하고, 실패/검증 실패 시에만 Playwright 크롤러로 폴백
+    (폴백은 sync 브라우저 풀 / async 엔진 모두 가능)
+    """
+
+    def __init__(
+        self, fast_path: HttpFastPath, fallback: Union[WebCrawler, AsyncWebCrawler]
+    ):
+        self.fast_path = fast_path
+        self.fallback = fallback
+
+    async def fetch(self, url: str) -> str:
+        site = self.fast_path.site_of(url)
+        if site is not None:
+            try:
+                with time_stage("job_analysis", "http_fetch"):
+                    text = await self.fast_path.fetch(url)
+                FAST_PATH_RESULTS.inc(site=site, result="hit")
+                logger.info(f"⚡ Fast path hit ({site}, {len(text)} chars)")
+                return text
+            except FastPathMiss as e:
+                FAST_PATH_RESULTS.inc(site=site, result="miss")
+                logger.warning(
+                    f"⚠️ Fast path miss ({site}: {e}). Falling back to browser."
+                )
+
+        if inspect.iscoroutinefunction(self.fallback.fetch):
+            return await self.fallback.fetch(url)
+        return await asyncio.to_thread(self.fallback.fetch, url)
+
+    def close(self) -> None:
+        """폴백 브라우저 종료 (Blocking) - HTTP 커넥션은 이벤트 루프와 함께 정리"""
+        close = getattr(self.fallback, "close", None)
+        if close is not None:
+            close()
+
+    async def aclose(self) -> None:
+        await self.fast_path.aclose()
+        aclose = getattr(self.fallback, "aclose", None)
+        if aclose is not None:
+            await aclose()
+        else:
+            await asyncio.to_thread(self.close)
@@ -0,0 +1,84 @@
+import inspect
+from typing import Any, Coroutine, List, Tuple, TypeVar
+
+from playwright import async_api
+
+T = TypeVar("T")
+
+# async API와 같은 이름의 클래스를 가진 sync API 객체만 감싸서 반환
+_WRAPPED_TYPES = {
+    "Page",
+    "Frame",
+    "Locator",
+    "FrameLocator",
+    "ElementHandle",
+    "BrowserContext",
+    "CDPSession",
+    "JSHandle",
+}
+
+
+class AwaitableProxy:
+    """
+    sync Playwright 객체를 async API 모양으로 노출하는 어댑터
+    - async API에서 코루틴인 메서드(count, inner_html, click 등)는 awaitable을 반환하지만,
+      내부에서는 sync 메서드를 바로 호출하므로 실제로 대기하지 않음
+    - async API에서도 동기인 메서드/프로퍼티(locator, first, url 등)는 그대로 반환
+    사이트별 파싱 훅(async _parse_page)을 sync 엔진(브라우저 풀 스레드)에서도 그대로 실행하기 위해 사용
+    """
+
+    def __init__(self, target: Any):
+        self._target = target
+        self._twin = getattr(async_api, type(target).__name__)
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._target, name)
+        if not callable(value):
+            return _wrap(value)
+
+        if inspect.iscoroutinefunction(getattr(self._twin, name, None)):
+
+            async def call(*args: Any, **kwargs: Any) -> Any:
+                return _wrap(value(*_unwrap(args), **kwargs))
+
+            return call
+
+        def call_sync(*args: Any, **kwargs: Any) -> Any:
+            return _wrap(value(*_unwrap(args), **kwargs))
+
+        return call_sync
+
+    def __repr__(self) -> str:
+        return f"AwaitableProxy({self._target!r})"
+
+
+def _wrap(value: Any) -> Any:
+    if type(value).__name__ in _WRAPPED_TYPES:
+        return AwaitableProxy(value)
+    return value
+
+
+def _unwrap(args: Tuple[Any, ...]) -> List[Any]:
+    # 래핑된 객체를 인자로 넘길 때는 원래 sync 객체로 (예: context.new_cdp_session(page))
+    return [a._target if isinstance(a, AwaitableProxy) else a for a in args]
+
+
+def awaitable_page(page: Any) -> Any:
+    """sync Page -> async Page 모양의 어댑터"""
+    return AwaitableProxy(page)
+
+
+def run_hook(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    AwaitableProxy만 await 하는 훅 코루틴을 이벤트 루프 없이 끝까지 실행
+    (모든 await가 즉시 완료되므로 send 한 번에 끝나야 함)
+    """
+    try:
+        coro.send(None)
+    except StopIteration as done:
+        return done.value
+    coro.close()
+    raise RuntimeError(
+        "Page hook suspended on a non-Playwright awaitable; "
+        "hooks shared by the sync engine may only await page operations"
+    )
@@ -0,0 +1,261 @@
+import asyncio
+import inspect
+import json
+import logging
+import re
+from typing import Any, Dict, List, Optional, Union
+
+import lxml.html
+from lxml import etree
+
+from shared.metrics import REGISTRY
+from ....domain.interface.crawler import AsyncWebCrawler, WebCrawler
+from ....domain.models.job_data import CrawledPosting, PostingFields
+from .capture import capture_scope
+from .http_fast_path import HttpFastPath, find_wanted_job, parse_wanted_next_data
+from .readiness import domain_of, metric_site
+
+logger = logging.getLogger(__name__)
+
+POSTING_FIELD_RESULTS = REGISTRY.counter(
+    "job_posting_fields_total",
+    "규칙 기반 필드 추출 결과 (full=5개 필드 모두, partial=일부, none=없음)",
+    ["site", "result"],
+)
+
+_DATE = re.compile(r"(\d{4})\s*[.\-/년]\s*(\d{1,2})\s*[.\-/월]\s*(\d{1,2})")
+# 마감일이 없는 공고 (날짜 확인 결과가 None)
+_NO_DEADLINE = re.compile(r"상시|채용\s*시")
+_SKILL_LABELS = {"스킬", "기술스택", "사용기술", "필요기술"}
+_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+
+def _has_class(name: str) -> str:
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+# 사람인: SaraminCrawler._ROOT와 같은 위치 (#content .wrap_jview > section:first-of-type .wrap_jv_cont)
+_SARAMIN_ROOT = (
+    f'//*[@id="content"]//*[{_has_class("wrap_jview")}]'
+    f'/section[1]//*[{_has_class("wrap_jv_cont")}]'
+)
+# 원티드: CSS 모듈 클래스의 해시 접미사는 배포마다 바뀔 수 있으므로 접두사로 찾음
+_WANTED_HEADER = '//*[contains(@class, "JobHeader_JobHeader__")]'
+_WANTED_DUE_TIME = '//*[contains(@class, "JobDueTime_JobDueTime__")]'
+
+
+def _document(html: str) -> Optional[etree._Element]:
+    try:
+        # bytes로 파싱 (인코딩 선언이 있는 문서도 str 제약 없이 파싱)
+        return lxml.html.document_fromstring(html.encode("utf-8"), parser=_HTML_PARSER)
+    except etree.ParserError:
+        return None
+
+
+def _text(node: Optional[etree._Element]) -> str:
+    return " ".join(node.text_content().split()) if node is not None else ""
+
+
+def _first(root: etree._Element, xpath: str) -> Optional[etree._Element]:
+    nodes = root.xpath(xpath)
+    return nodes[0] if nodes else None
+
+
+def parse_posting_date(text: str) -> Dict[str, Optional[str]]:
+    """
+    날짜 문자열 -> {"value": YYYY-MM-DD} / 상시채용이면 {"value": None}
+    날짜로 읽을 수 없으면 빈 dict (확인하지 못한 필드는 LLM이 추출)
+    """
+    match = _DATE.search(text)
+    if match:
+        year, month, day = (int(g) for g in match.groups())
+        return {"value": f"{year:04d}-{month:02d}-{day:02d}"}
+    if _NO_DEADLINE.search(text):
+        return {"value": None}
+    return {}
+
+
+def _split_skills(text: str) -> List[str]:
+    return [s.strip() for s in re.split(r"[,，·•|/]", text) if s.strip()]
+
+
+# ── 사람인 ─────────────────────────────────────────────
+
+
+def parse_saramin_fields(html: str) -> PostingFields:
+    """
+    공고 페이지 HTML -> 회사명/공고명(.wrap_jv_header), 시작일/마감일(.jv_howto .info_period),
+    스킬(.jv_summary의 스킬 항목이 있는 공고만)
+    """
+    root = _document(html)
+    found: Dict[str, Any] = {}
+    if root is None:
+        return PostingFields()
+
+    header = _first(root, f'{_SARAMIN_ROOT}//*[{_has_class("wrap_jv_header")}]')
+    if header is not None:
+        company = _text(_first(header, f'.//*[{_has_class("company")}]'))
+        title = _text(_first(header, f'.//*[{_has_class("tit_job")}]'))
+        if company:
+            found["company_name"] = company
+        if title:
+            found["job_title"] = title
+
+    period = _first(
+        root,
+        f'{_SARAMIN_ROOT}//*[{_has_class("jv_howto")}]//dl[{_has_class("info_period")}]',
+    )
+    if period is not None:
+        for dt in period.xpath("./dt"):
+            dd = _first(dt, "following-sibling::dd[1]")
+            field = {"시작일": "start_date", "마감일": "end_date"}.get(_text(dt))
+            date = parse_posting_date(_text(dd)) if field else {}
+            if date:
+                found[field] = date["value"]
+
+    summary = _first(root, f'{_SARAMIN_ROOT}//*[{_has_class("jv_summary")}]')
+    if summary is not None:
+        for dt in summary.xpath(".//dt"):
+            if _text(dt).replace(" ", "") in _SKILL_LABELS:
+                skills = _split_skills(_text(_first(dt, "following-sibling::dd[1]")))
+                if skills:
+                    found["tech_stacks"] = skills
+                break
+    return PostingFields(**found)
+
+
+# ── 원티드 ─────────────────────────────────────────────
+
+
+def wanted_fields_from_job(job: Dict[str, Any]) -> PostingFields:
+    """원티드 공고 객체(API 응답 / __NEXT_DATA__) -> 회사명/공고명/마감일/기술 스택"""
+    found: Dict[str, Any] = {"job_title": job["position"]}
+    company = job.get("company") or {}
+    company_name = company.get("name") if isinstance(company, dict) else None
+    if company_name or job.get("company_name"):
+        found["company_name"] = company_name or job["company_name"]
+
+    # due_time이 없으면 상시채용
+    due_time = job.get("due_time")
+    date = parse_posting_date(str(due_time)) if due_time else {"value": None}
+    if date:
+        found["end_date"] = date["value"]
+
+    skills = [
+        tag.get("title") or tag.get("text")
+        for tag in job.get("skill_tags") or []
+        if isinstance(tag, dict)
+    ]
+    if any(skills):
+        found["tech_stacks"] = [s for s in skills if s]
+    return PostingFields(**found)
+
+
+def _wanted_dom_fields(html: str) -> PostingFields:
+    """렌더링된 페이지의 JobHeader / JobDueTime 마크업 (__NEXT_DATA__가 없을 때)"""
+    root = _document(html)
+    found: Dict[str, Any] = {}
+    if root is None:
+        return PostingFields()
+
+    header = _first(root, _WANTED_HEADER)
+    if header is not None:
+        title = _text(_first(header, ".//h1"))
+        company = _first(header, './/a[contains(@href, "/company/")]')
+        company_name = (
+            company.get("data-company-name") or _text(company)
+            if company is not None
+            else ""
+        )
+        if title:
+            found["job_title"] = title
+        if company_name:
+            found["company_name"] = company_name
+
+    due_time = _first(root, _WANTED_DUE_TIME)
+    if due_time is not None:
+        date = parse_posting_date(_text(due_time))
+        if date:
+            found["end_date"] = date["value"]
+    return PostingFields(**found)
+
+
+def parse_wanted_fields(raw: str) -> PostingFields:
+    """공고 API 응답(JSON) 또는 공고 페이지 HTML(__NEXT_DATA__ 우선, 없으면 마크업)"""
+    if raw.lstrip().startswith("{"):
+        try:
+            payload = json.loads(raw)
+        except ValueError:
+            payload = None
+    else:
+        payload = parse_wanted_next_data(raw)
+    job = find_wanted_job(payload)
+    if job is not None:
+        return wanted_fields_from_job(job)
+    return _wanted_dom_fields(raw)
+
+
+def parse_posting_fields(url: str, raw_html: Optional[str]) -> Optional[PostingFields]:
+    """
+    크롤러가 받은 원본(HTML/JSON) -> 규칙 기반 필드 (지원하지 않는 사이트/읽은 필드가 없으면 None)
+    규칙 파싱 실패는 크롤링/추출을 실패시키지 않음 (LLM이 모든 필드를 추출)
+    """
+    site = HttpFastPath.site_of(url)
+    if site is None or not raw_html:
+        return None
+    try:
+        if site == "saramin":
+            fields = parse_saramin_fields(raw_html)
+        else:
+            fields = parse_wanted_fields(raw_html)
+    except Exception as e:
+        logger.warning(f"⚠️ Rule-based field parsing failed for {url}: {e}")
+        return None
+    return fields if fields.model_fields_set else None
+
+
+class PostingFieldsCrawler(AsyncWebCrawler):
+    """
+    크롤러 데코레이터: fetch가 받은 원본 HTML/JSON에서 사이트별 규칙으로
+    회사명/공고명/시작일/마감일/기술 스택을 읽어 텍스트와 함께 반환 (fetch_posting)
+    원본은 스냅샷 저장과 같은 캡처 범위로 전달받음 (브라우저 엔진은 page.content() 1회 추가)
+    """
+
+    def __init__(self, crawler: Union[WebCrawler, AsyncWebCrawler]):
+        self.crawler = crawler
+
+    async def fetch_posting(self, url: str) -> CrawledPosting:
+        with capture_scope() as capture:
+            if inspect.iscoroutinefunction(self.crawler.fetch):
+                text = await self.crawler.fetch(url)
+            else:
+                text = await asyncio.to_thread(self.crawler.fetch, url)
+
+        # lxml 파싱은 페이지 크기에 비례하므로 이벤트 루프 밖에서
+        fields = await asyncio.to_thread(parse_posting_fields, url, capture.raw_html)
+        known = fields.known() if fields is not None else {}
+        result = (
+            "none"
+            if not known
+            else "full" if len(known) == len(PostingFields.model_fields) else "partial"
+        )
+        POSTING_FIELD_RESULTS.inc(site=metric_site(domain_of(url)), result=result)
+        if known:
+            logger.info(f"📐 Rule-based fields ({result}): {sorted(known)}")
+        return CrawledPosting(text=text, fields=fields)
+
+    async def fetch(self, url: str) -> str:
+        return (await self.fetch_posting(url)).text
+
+    def close(self) -> None:
+        """내부 크롤러 종료 (Blocking)"""
+        close = getattr(self.crawler, "close", None)
+        if close is not None:
+            close()
+
+    async def aclose(self) -> None:
+        aclose = getattr(self.crawler, "aclose", None)
+        if aclose is not None:
+            await aclose()
+        else:
+            await asyncio.to_thread(self.close)
@@ -0,0 +1,188 @@
+import logging
+import math
+import threading
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from playwright.async_api import Page
+
+from shared.concurrency import stage_timeout_ms
+from shared.metrics import REGISTRY
+from .block_detection import BLOCK_MARKERS, BLOCK_PAGE_MAX_CHARS
+
+logger = logging.getLogger(__name__)
+
+READINESS_SECONDS = REGISTRY.histogram(
+    "crawler_readiness_seconds",
+    "페이지 이동 시작부터 단계 완료까지 걸린 시간 (navigation=응답 commit, content=본문 준비)",
+    ["site", "stage"],
+    buckets=(0.1, 0.25, 0.5, 1, 2, 3, 5, 8, 12, 15, 20),
+)
+READINESS_QUANTILE = REGISTRY.gauge(
+    "crawler_readiness_quantile_seconds",
+    "도메인별 최근 준비 시간 분위수 (타임아웃 계산 기준)",
+    ["site", "stage", "quantile"],
+)
+READINESS_TIMEOUT = REGISTRY.gauge(
+    "crawler_readiness_timeout_seconds",
+    "분위수로 계산한 현재 단계 타임아웃",
+    ["site", "stage"],
+)
+READINESS_MISSES = REGISTRY.counter(
+    "crawler_readiness_misses_total",
+    "타임아웃까지 준비 신호가 오지 않은 페이지 수",
+    ["site", "stage"],
+)
+
+# 단계별 (기본 타임아웃 = 상한, 하한) ms - 기록이 min_samples보다 적으면 기본값 사용
+STAGE_LIMITS_MS: Dict[str, Tuple[float, float]] = {
+    "navigation": (15000, 3000),
+    "content": (15000, 2000),
+}
+
+# 지표 라벨로 쓰는 도메인 (그 외 도메인은 "other"로 묶어서 라벨 수 제한)
+_LABELED_DOMAINS = {"saramin.co.kr": "saramin", "wanted.co.kr": "wanted"}
+
+# 준비 판정 스크립트 (wait_for_function이 polling 간격마다 실행, truthy 반환 시 종료)
+# - 본문 셀렉터 중 하나에 텍스트가 생기면 "selector"
+# - 짧은 페이지의 제목/본문에 차단 문구가 있으면 "blocked" (봇 확인 페이지에서 대기 예산을 쓰지 않음)
+# - 본문 텍스트 길이가 stableMs 동안 변하지 않으면 "stable" (셀렉터가 없는 사이트)
+READY_SCRIPT = """
+({ selectors, stableMs, blockMarkers, blockMaxChars }) => {
+  for (const selector of selectors) {
+    const node = document.querySelector(selector);
+    if (node && node.textContent.trim()) return "selector";
+  }
+  const body = document.body;
+  if (!body || document.readyState === "loading") return false;
+  const text = body.innerText || body.textContent;
+  if (text.length <= blockMaxChars) {
+    const haystack = (document.title + "\\n" + text).toLowerCase();
+    if (blockMarkers.some((marker) => haystack.includes(marker))) return "blocked";
+  }
+  const size = body.textContent.length;
+  const now = performance.now();
+  const state = window.__crawlerReadiness || (window.__crawlerReadiness = { size: -1, since: now });
+  if (size !== state.size) {
+    state.size = size;
+    state.since = now;
+    return false;
+  }
+  return size > 0 && now - state.since >= stableMs ? "stable" : false;
+}
+"""
+
+
+def domain_of(url: str) -> str:
+    host = (urlsplit(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def metric_site(domain: str) -> str:
+    for suffix, label in _LABELED_DOMAINS.items():
+        if domain == suffix or domain.endswith("." + suffix):
+            return label
+    return "other"
+
+
+def _quantile(samples: Sequence[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+
+class ReadinessTracker:
+    """
+    도메인별 단계 준비 시간 기록 -> 분위수 기반 타임아웃
+    타임아웃 = clamp(최근 window개 중 percentile 분위수 x multiplier, 하한, 기본값)
+    (sync 브라우저 풀 스레드와 async 엔진이 공유하므로 lock으로 보호)
+    """
+
+    def __init__(
+        self,
+        window: int = 200,
+        min_samples: int = 20,
+        percentile: float = 0.95,
+        multiplier: float = 1.5,
+        max_domains: int = 256,
+    ):
+        self.window = window
+        self.min_samples = min_samples
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.max_domains = max_domains
+        self._samples: "OrderedDict[Tuple[str, str], Deque[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, domain: str, stage: str, seconds: float) -> None:
+        site = metric_site(domain)
+        READINESS_SECONDS.observe(seconds, site=site, stage=stage)
+        with self._lock:
+            samples = self._window(domain, stage)
+            samples.append(seconds)
+            snapshot = list(samples)
+
+        if len(snapshot) >= self.min_samples:
+            for q in (0.5, self.percentile):
+                READINESS_QUANTILE.set(
+                    _quantile(snapshot, q), site=site, stage=stage, quantile=str(q)
+                )
+            READINESS_TIMEOUT.set(
+                self.timeout_ms(domain, stage) / 1000, site=site, stage=stage
+            )
+
+    def record_miss(self, domain: str, stage: str) -> None:
+        READINESS_MISSES.inc(site=metric_site(domain), stage=stage)
+
+    def timeout_ms(self, domain: str, stage: str) -> float:
+        """기록된 분위수로 계산한 단계 타임아웃(ms) - 남은 요청 예산은 반영하지 않음"""
+        default_ms, floor_ms = STAGE_LIMITS_MS[stage]
+        with self._lock:
+            samples = list(self._samples.get((domain, stage), ()))
+        if len(samples) < self.min_samples:
+            return default_ms
+        derived = _quantile(samples, self.percentile) * self.multiplier * 1000
+        return min(default_ms, max(floor_ms, derived))
+
+    def _window(self, domain: str, stage: str) -> Deque[float]:
+        key = (domain, stage)
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+            # 기본 크롤러는 임의 도메인을 방문하므로 오래 안 쓴 도메인부터 정리
+            while len(self._samples) > self.max_domains * len(STAGE_LIMITS_MS):
+                self._samples.popitem(last=False)
+        else:
+            self._samples.move_to_end(key)
+        return samples
+
+
+# 프로세스 기본 tracker (두 엔진, 모든 Strategy가 공유)
+READINESS = ReadinessTracker()
+
+
+async def wait_until_ready(
+    page: Page, selectors: Sequence[str], timeout_ms: float, stable_ms: float
+) -> Optional[str]:
+    """
+    본문 셀렉터가 나타나거나 본문이 stable_ms 동안 변하지 않으면 즉시 반환 ("selector" / "stable")
+    차단 페이지로 보이면 "blocked", timeout_ms 안에 준비되지 않으면 None
+    """
+    # 예산 소진(DeadlineExceeded)은 타임아웃으로 삼키지 않고 그대로 전파
+    timeout = stage_timeout_ms("content_ready", timeout_ms)
+    try:
+        handle = await page.wait_for_function(
+            READY_SCRIPT,
+            arg={
+                "selectors": list(selectors),
+                "stableMs": stable_ms,
+                "blockMarkers": list(BLOCK_MARKERS),
+                "blockMaxChars": BLOCK_PAGE_MAX_CHARS,
+            },
+            timeout=timeout,
+            polling=100,
+        )
+    except Exception as e:
+        logger.warning(f"⚠️ Content readiness timeout ({e.__class__.__name__})")
+        return None
+    return await handle.json_value()
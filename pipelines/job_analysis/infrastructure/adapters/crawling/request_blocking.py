@@ -0,0 +1,69 @@
+import logging
+from typing import AbstractSet, Dict, List, Tuple
+
+from playwright.async_api import Page
+
+logger = logging.getLogger(__name__)
+
+# 속도 최적화: 불필요한 리소스(이미지, 폰트 등) 로딩 차단
+# CDP Network.setBlockedURLs 패턴 ('*'는 임의 문자열, '?'는 임의 문자 1개)
+# 브라우저 안에서 바로 차단되므로 요청이 Python route 핸들러를 거치지 않음 (허용된 요청도 멈추지 않음)
+BLOCKED_URL_PATTERNS: Dict[str, Tuple[str, ...]] = {
+    "image": tuple(
+        pattern
+        for ext in ("png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico")
+        for pattern in (f"*.{ext}", f"*.{ext}?*")
+    ),
+    "font": tuple(
+        pattern
+        for ext in ("woff", "woff2", "ttf", "otf", "eot")
+        for pattern in (f"*.{ext}", f"*.{ext}?*")
+    ),
+    "stylesheet": ("*.css", "*.css?*"),
+    "media": tuple(
+        pattern
+        for ext in ("mp4", "webm", "mp3", "m3u8")
+        for pattern in (f"*.{ext}", f"*.{ext}?*")
+    ),
+    # 분석/광고 스크립트와 비콘
+    "tracker": (
+        "*://*.google-analytics.com/*",
+        "*://*.googletagmanager.com/*",
+        "*://*.doubleclick.net/*",
+        "*://connect.facebook.net/*",
+        "*://*.facebook.com/tr*",
+        "*://static.hotjar.com/*",
+        "*://*.clarity.ms/*",
+    ),
+}
+
+
+def blocked_url_patterns(allowed: AbstractSet[str] = frozenset()) -> List[str]:
+    """차단할 URL 패턴 (사이트별 허용 목록의 분류는 제외)"""
+    unknown = set(allowed) - BLOCKED_URL_PATTERNS.keys()
+    if unknown:
+        raise ValueError(f"Unknown request categories: {sorted(unknown)}")
+    return [
+        pattern
+        for category, patterns in BLOCKED_URL_PATTERNS.items()
+        if category not in allowed
+        for pattern in patterns
+    ]
+
+
+async def install_request_blocking(
+    page: Page, allowed: AbstractSet[str] = frozenset()
+) -> bool:
+    """
+    페이지 이동 전에 CDP로 URL 차단 목록 설정 (페이지당 왕복 3번, 이후 요청마다 추가 비용 없음)
+    CDP를 쓸 수 없으면(Chromium 외 브라우저 등) 차단 없이 진행하고 False 반환
+    """
+    patterns = blocked_url_patterns(allowed)
+    try:
+        session = await page.context.new_cdp_session(page)
+        await session.send("Network.enable")
+        await session.send("Network.setBlockedURLs", {"urls": patterns})
+        return True
+    except Exception as e:
+        logger.warning(f"⚠️ Request blocking unavailable ({e}). Loading all resources.")
+        return False
@@ -1,24 +1,46 @@
+from typing import Optional, cast
+
 from ....domain.interface.crawler import WebCrawler
+from .base import BasePlaywrightCrawler, SiteStrategy
+from .browser_pool import BrowserPool
 from .strategies.default import DefaultCrawler
 from .strategies.saramin import SaraminCrawler
 from .strategies.wanted import WantedCrawler
 
 
-class DynamicRoutingCrawler(WebCrawler):
+class StrategyRouter:
+    """URL 패턴 -> 사이트별 Strategy 선택 정책 (sync/async 엔진 공통)"""
+
+    saramin: SiteStrategy
+    wanted: SiteStrategy
+    default: SiteStrategy
+
+    def _strategy_for(self, url: str) -> SiteStrategy:
+        if "saramin.co.kr" in url:
+            return self.saramin
+        if "wanted.co.kr" in url:
+            return self.wanted
+        return self.default
+
+
+class DynamicRoutingCrawler(StrategyRouter, WebCrawler):
     """
     URL을 분석하여 적절한 실제 크롤러(Strategy)로 라우팅해주는 스마트 크롤러.
     Application Layer는 이 클래스 인스턴스 하나만 주입받으면 됨.
     """
 
-    def fetch(self, url: str) -> str:
-        # 정책 구현: URL 패턴에 따라 Strategy 선택
-        strategy: WebCrawler
-        if "saramin.co.kr" in url:
-            strategy = SaraminCrawler()
-        elif "wanted.co.kr" in url:
-            strategy = WantedCrawler()
-        else:
-            strategy = DefaultCrawler()
+    def __init__(self, pool: Optional[BrowserPool] = None):
+        # Strategy는 상태가 없으므로 한 번만 생성하여 재사용, 브라우저 풀은 모든 Strategy가 공유
+        self.pool = pool or BrowserPool()
+        self.saramin = SaraminCrawler(self.pool)
+        self.wanted = WantedCrawler(self.pool)
+        self.default = DefaultCrawler(self.pool)
 
-        # 선택된 전략 실행 (위임)
+    def close(self) -> None:
+        """풀의 브라우저 종료 (애플리케이션 종료 시)"""
+        self.pool.close()
+
+    def fetch(self, url: str) -> str:
+        # 정책 구현: URL 패턴에 따라 Strategy 선택 후 실행 (위임)
+        strategy = cast(BasePlaywrightCrawler, self._strategy_for(url))
         return strategy.fetch(url)
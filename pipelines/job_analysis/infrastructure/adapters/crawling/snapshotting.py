@@ -0,0 +1,91 @@
+import asyncio
+import inspect
+import logging
+from datetime import datetime, timezone
+from typing import Set, Union
+
+from shared.concurrency import deadline_scope
+from shared.metrics import REGISTRY
+from ....domain.interface.crawler import AsyncWebCrawler, WebCrawler
+from ....domain.interface.snapshot_store import SnapshotStore
+from ....domain.models.snapshot import CrawlSnapshot
+from .capture import capture_scope
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_RESULTS = REGISTRY.counter(
+    "crawl_snapshots_total",
+    "크롤링 스냅샷 저장 결과",
+    ["result"],
+)
+
+
+class SnapshottingCrawler(AsyncWebCrawler):
+    """
+    크롤러 데코레이터: fetch 결과(정제 텍스트)와 크롤러가 받은 원본 HTML을 스냅샷 저장소에 기록
+    저장은 백그라운드 태스크로 실행하므로 응답 지연에 포함되지 않고, 실패해도 크롤링 결과에는 영향 없음
+    """
+
+    def __init__(
+        self, crawler: Union[WebCrawler, AsyncWebCrawler], store: SnapshotStore
+    ):
+        self.crawler = crawler
+        self.store = store
+        self._pending: Set[asyncio.Task] = set()
+
+    async def fetch(self, url: str) -> str:
+        with capture_scope() as capture:
+            if inspect.iscoroutinefunction(self.crawler.fetch):
+                text = await self.crawler.fetch(url)
+            else:
+                text = await asyncio.to_thread(self.crawler.fetch, url)
+
+        snapshot = CrawlSnapshot(
+            url=url,
+            captured_at=datetime.now(timezone.utc),
+            source=capture.source or "unknown",
+            raw_html=capture.raw_html,
+            text=text,
+        )
+        task = asyncio.create_task(self._save(snapshot))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+        return text
+
+    async def _save(self, snapshot: CrawlSnapshot) -> None:
+        # 요청의 Deadline과 무관하게 저장 (응답이 끝난 뒤에도 진행)
+        with deadline_scope(None):
+            try:
+                record = await self.store.save(snapshot)
+                SNAPSHOT_RESULTS.inc(result="saved")
+                logger.info(
+                    f"🗄️ Crawl snapshot stored ({record.content_hash[:12]}, {record.source})"
+                )
+            except Exception as e:
+                SNAPSHOT_RESULTS.inc(result="error")
+                logger.warning(f"⚠️ Failed to store crawl snapshot: {e}")
+
+    async def flush(self) -> None:
+        """진행 중인 스냅샷 저장이 끝날 때까지 대기"""
+        if self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+
+    def close(self) -> None:
+        """내부 크롤러 종료 (Blocking)"""
+        close = getattr(self.crawler, "close", None)
+        if close is not None:
+            close()
+        store_close = getattr(self.store, "close", None)
+        if store_close is not None:
+            store_close()
+
+    async def aclose(self) -> None:
+        await self.flush()
+        aclose = getattr(self.crawler, "aclose", None)
+        if aclose is not None:
+            await aclose()
+        else:
+            await asyncio.to_thread(self.crawler.close)
+        store_close = getattr(self.store, "close", None)
+        if store_close is not None:
+            await asyncio.to_thread(store_close)
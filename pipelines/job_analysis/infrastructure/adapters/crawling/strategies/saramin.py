@@ -1,9 +1,66 @@
-from playwright.sync_api import Page
+from playwright.async_api import Page
+from shared.concurrency import stage_timeout_ms
 from ..base import BasePlaywrightCrawler
+from ..block_detection import MIN_CONTENT_CHARS, CrawlBlocked, find_block_marker
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 섹션 HTML을 한 번에 반환하는 추출 스크립트 (섹션이 없으면 null)
+# 본문은 .jv_detail .cont 안의 iframe(같은 origin) 문서를 DOMContentLoaded까지 기다렸다가 읽음
+_EXTRACT_SCRIPT = """
+async ({ root, frameTimeout }) => {
+  const html = (selector) => {
+    const node = document.querySelector(selector);
+    return node ? node.innerHTML : null;
+  };
+  const readyDocument = async (iframe) => {
+    const src = new URL(iframe.getAttribute("src") || "about:blank", location.href);
+    if (src.protocol.startsWith("http") && src.origin !== location.origin) return null;
+    // src가 있으면 초기 about:blank 문서가 아닌 실제 문서가 로드될 때까지 대기
+    const navigates = src.href !== "about:blank";
+    const deadline = Date.now() + frameTimeout;
+    while (true) {
+      const doc = iframe.contentDocument;
+      const loaded = doc && doc.body && doc.readyState !== "loading"
+        && (!navigates || doc.location.href !== "about:blank");
+      if (loaded) return doc;
+      if (Date.now() >= deadline) return null;
+      await new Promise((resolve) => setTimeout(resolve, 50));
+    }
+  };
+
+  let detail = null;
+  let detailSource = null;
+  const cont = document.querySelector(`${root} .jv_cont.jv_detail .cont`);
+  if (cont) {
+    const iframe = cont.querySelector("iframe");
+    if (!iframe) {
+      detail = cont.innerHTML;
+      detailSource = "cont";
+    } else {
+      const doc = await readyDocument(iframe);
+      if (doc) {
+        detail = (doc.querySelector(".user_content") || doc.body).innerHTML;
+        detailSource = "iframe";
+      } else {
+        detailSource = "iframe_unreadable";
+      }
+    }
+  }
+
+  return {
+    sections: {
+      header: html(`${root} .wrap_jv_header`),
+      summary: html(`${root} .jv_cont.jv_summary`),
+      detail,
+      howto: html(`${root} .jv_cont.jv_howto`),
+    },
+    detailSource,
+  };
+}
+"""
+
 
 class SaraminCrawler(BasePlaywrightCrawler):
     """
@@ -20,93 +77,70 @@ class SaraminCrawler(BasePlaywrightCrawler):
     # 공통 루트: #content > .wrap_jview의 첫 번째 section 안의 .wrap_jv_cont
     _ROOT = "#content .wrap_jview > section:first-of-type .wrap_jv_cont"
 
-    def _parse_page(self, page: Page) -> str:
-        # 루트 컨테이너가 렌더링될 때까지 대기 (최초 진입점)
-        try:
-            page.wait_for_selector(self._ROOT, timeout=5000)
-        except Exception:
-            logger.warning(
-                f"⚠️ Failed to load page content from {page.url} (Title: {page.title()})"
-            )
-            if "사람인" not in page.title() and "지원" not in page.title():
-                logger.error(f"🚨 Suspicious Page Content (Bot Block?): {page.title()}")
-
-        # 각 섹션을 순서대로 추출하여 리스트에 모음
-        sections = [
-            self._extract_header(page),
-            self._extract_summary(page),
-            self._extract_detail(page),
-            self._extract_howto(page),
-        ]
-
-        # 빈 섹션 제거 후 합침
-        return "\n\n".join(s for s in sections if s)
-
-    # ── 섹션별 추출 메서드 ─────────────────────────────────
-
-    def _extract_header(self, page: Page) -> str:
-        """공고 헤더"""
-        return self._extract_section(page, f"{self._ROOT} .wrap_jv_header")
-
-    def _extract_summary(self, page: Page) -> str:
-        """요약 정보"""
-        return self._extract_section(page, f"{self._ROOT} .jv_cont.jv_summary")
-
-    def _extract_howto(self, page: Page) -> str:
-        """접수 방법"""
-        return self._extract_section(page, f"{self._ROOT} .jv_cont.jv_howto")
-
-    def _extract_detail(self, page: Page) -> str:
-        """공고 본문 — .jv_cont.jv_detail > .cont 내 첫 번째 iframe 우선, fallback은 .cont 직접 추출"""
-        cont_selector = f"{self._ROOT} .jv_cont.jv_detail .cont"
-
-        if page.locator(cont_selector).count() == 0:
+    # 루트 컨테이너가 렌더링되면 준비 완료 (차단 페이지 등은 2초간 변화가 없으면 바로 파싱)
+    _READY_SELECTORS = (_ROOT,)
+    _STABLE_MS = 2000
+    _MIN_CONTENT_CHARS = MIN_CONTENT_CHARS
+
+    async def _on_not_ready(self, page: Page) -> None:
+        title = await page.title()
+        logger.warning(
+            f"⚠️ Failed to load page content from {page.url} (Title: {title})"
+        )
+        if find_block_marker(title) is not None:
+            # 보안 확인 페이지는 파싱하지 않고 바로 실패
+            raise CrawlBlocked(page.url, "marker", title)
+        if "사람인" not in title and "지원" not in title:
+            logger.error(f"🚨 Suspicious Page Content (Bot Block?): {title}")
+
+    async def _parse_page(self, page: Page) -> str:
+        # 모든 섹션(본문 iframe 포함)을 page.evaluate 1번으로 가져옴
+        payload = await page.evaluate(
+            _EXTRACT_SCRIPT,
+            {
+                "root": self._ROOT,
+                "frameTimeout": stage_timeout_ms("parse_page", 5000),
+            },
+        )
+        sections = self._clean_sections(payload["sections"])
+
+        if payload["detailSource"] == "iframe_unreadable":
+            # 다른 origin이거나 로드되지 않은 iframe은 Playwright frame으로 직접 추출
+            iframe_locator = page.locator(
+                f"{self._ROOT} .jv_cont.jv_detail .cont iframe"
+            ).first
+            sections["detail"] = await self._extract_iframe_content(iframe_locator)
+        elif payload["detailSource"] is None:
             logger.warning("⚠️ .jv_cont.jv_detail .cont not found")
-            return ""
-
-        # iframe이 있으면 그 안에서 추출
-        iframe_locator = page.locator(f"{cont_selector} iframe").first
-        if iframe_locator.count() > 0:
-            return self._extract_iframe_content(iframe_locator)
-
-        # iframe 없으면 .cont 본체를 직접 추출
-        logger.info("No iframe in .jv_detail .cont, extracting directly.")
-        return self._clean_html(page.locator(cont_selector).inner_html())
-
-    # ── 공통 헬퍼 ──────────────────────────────────────────
 
-    def _extract_section(self, page: Page, selector: str) -> str:
-        """단일 셀렉터에서 텍스트를 추출하는 공통 헬퍼"""
-        if page.locator(selector).count() > 0:
-            text = self._clean_html(page.locator(selector).inner_html())
-            logger.info(f"✅ Extracted: {selector}")
-            return text
+        # 헤더 -> 요약 -> 본문 -> 접수 방법 순서, 빈 섹션 제거 후 합침
+        return "\n\n".join(s for s in sections.values() if s)
 
-        logger.warning(f"⚠️ Section not found: {selector}")
-        return ""
+    # ── iframe fallback ────────────────────────────────────
 
-    def _extract_iframe_content(self, iframe_locator) -> str:
+    async def _extract_iframe_content(self, iframe_locator) -> str:
         """iframe 내부 콘텐츠를 추출 (.user_content 우선, fallback은 body)"""
-        handle = iframe_locator.element_handle()
+        handle = await iframe_locator.element_handle()
         if not handle:
             logger.warning("⚠️ Failed to get iframe element handle")
             return ""
 
         # iframe 내부 로드 완료 대기
-        frame = handle.content_frame()
+        frame = await handle.content_frame()
         if not frame:
             logger.warning("⚠️ iframe content_frame() returned None")
             return ""
 
+        frame_timeout = stage_timeout_ms("parse_page", 5000)
         try:
-            frame.wait_for_load_state("domcontentloaded", timeout=5000)
+            await frame.wait_for_load_state("domcontentloaded", timeout=frame_timeout)
         except Exception:
             logger.warning("⚠️ iframe domcontentloaded timeout, proceeding anyway.")
 
-        if frame.locator(".user_content").count() > 0:
-            raw_html = frame.locator(".user_content").inner_html()
+        if await frame.locator(".user_content").count() > 0:
+            raw_html = await frame.locator(".user_content").inner_html()
         else:
-            raw_html = frame.locator("body").inner_html()
+            raw_html = await frame.locator("body").inner_html()
 
         logger.info("✅ Extracted iframe content")
         return self._clean_html(raw_html)
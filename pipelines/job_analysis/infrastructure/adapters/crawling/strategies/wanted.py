@@ -1,9 +1,44 @@
-from playwright.sync_api import Page
+from playwright.async_api import Page
+from shared.concurrency import stage_timeout_ms
 from ..base import BasePlaywrightCrawler
+from ..block_detection import MIN_CONTENT_CHARS, CrawlBlocked, find_block_marker
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 본문 "더보기" 버튼이 있으면 클릭 후 버튼이 사라질 때까지(확장 완료) 기다린 뒤
+# 섹션 HTML을 한 번에 반환하는 추출 스크립트 (섹션이 없으면 null)
+_EXTRACT_SCRIPT = """
+async ({ header, description, expandButton, dueTime, workplace, expandTimeout }) => {
+  const html = (selector) => {
+    const node = document.querySelector(selector);
+    return node ? node.innerHTML : null;
+  };
+  const hidden = (node) => !node.isConnected || node.getClientRects().length === 0;
+
+  let expand = "none";
+  const button = document.querySelector(expandButton);
+  if (button) {
+    button.click();
+    const deadline = Date.now() + expandTimeout;
+    while (!hidden(button) && Date.now() < deadline) {
+      await new Promise((resolve) => setTimeout(resolve, 50));
+    }
+    expand = hidden(button) ? "expanded" : "timeout";
+  }
+
+  return {
+    sections: {
+      header: html(header),
+      description: html(description),
+      dueTime: html(dueTime),
+      workplace: html(workplace),
+    },
+    expand,
+  };
+}
+"""
+
 
 class WantedCrawler(BasePlaywrightCrawler):
     """
@@ -22,77 +57,48 @@ class WantedCrawler(BasePlaywrightCrawler):
 
     _ROOT = ".JobContent_JobContent__Qb6DR"
     _WRAPPER = f"{_ROOT} .JobContent_descriptionWrapper__RMlfm"
-
-    def _parse_page(self, page: Page) -> str:
-        # 원티드는 SPA — 루트 컨테이너가 렌더링될 때까지 대기
-        try:
-            page.wait_for_selector(self._ROOT, timeout=10000)
-        except Exception:
-            logger.warning(
-                f"⚠️ Failed to load page content from {page.url} (Title: {page.title()})"
-            )
-            if "wanted" not in page.url:
-                logger.error(f"🚨 Suspicious Page Content (Bot Block?): {page.title()}")
-
-        sections = [
-            self._extract_header(page),
-            self._extract_description(page),
-            self._extract_due_time(page),
-            self._extract_workplace(page),
-        ]
-
-        return "\n\n".join(s for s in sections if s)
-
-    # ── 섹션별 추출 메서드 ─────────────────────────────────
-
-    def _extract_header(self, page: Page) -> str:
-        """공고 헤더"""
-        return self._extract_section(page, f"{self._ROOT} .JobHeader_JobHeader__TZkW3")
-
-    def _extract_description(self, page: Page) -> str:
-        """공고 본문 — "상세정보 더보기" 버튼이 있으면 클릭 후 전체 본문 추출"""
-        description_selector = f"{self._WRAPPER} .JobDescription_JobDescription__s2Keo"
-        wrapper_selector = (
-            f"{description_selector}"
-            " .JobDescription_JobDescription__paragraph__wrapper__WPrKC"
-        )
-
-        # wrapper 내부 버튼(더보기)이 있으면 클릭하여 전체 본문 확장
-        button_locator = page.locator(f"{wrapper_selector} button")
-        if button_locator.count() > 0:
-            button_locator.first.click()
-            # 클릭 후 버튼이 제거될 때까지 대기 (확장 완료 시점)
-            try:
-                button_locator.first.wait_for(state="hidden", timeout=3000)
-            except Exception:
-                logger.warning("⚠️ '더보기' 버튼 숨김 대기 타임아웃, 현재 상태로 진행.")
-            logger.info("✅ Clicked '더보기' button in JobDescription")
-
-        return self._extract_section(page, description_selector)
-
-    def _extract_due_time(self, page: Page) -> str:
-        """접수 기간"""
-        return self._extract_section(
-            page, f"{self._WRAPPER} .JobDueTime_JobDueTime__yvhtg"
+    # SPA라 외부 스크립트(태그 매니저 등) 로딩이 막히면 초기화가 늦어지거나 본문이 렌더링되지 않을 수 있음
+    _ALLOWED_REQUESTS = frozenset({"tracker"})
+
+    # 원티드는 SPA — 루트 컨테이너가 렌더링되면 준비 완료
+    # (로딩 화면이 잠시 멈춰 있을 수 있으므로 변화 없음 판정은 길게)
+    _READY_SELECTORS = (_ROOT,)
+    _STABLE_MS = 3000
+    _MIN_CONTENT_CHARS = MIN_CONTENT_CHARS
+
+    async def _on_not_ready(self, page: Page) -> None:
+        title = await page.title()
+        logger.warning(
+            f"⚠️ Failed to load page content from {page.url} (Title: {title})"
         )
-
-    def _extract_workplace(self, page: Page) -> str:
-        """근무지"""
-        return self._extract_section(
-            page,
-            f"{self._WRAPPER} .JobWorkPlace_JobWorkPlace__xPlGe"
-            " .JobWorkPlace_JobWorkPlace__map__24PDM"
-            " .JobWorkPlace_JobWorkPlace__map__location__6pp2d",
+        if find_block_marker(title) is not None:
+            # 보안 확인 페이지는 파싱하지 않고 바로 실패
+            raise CrawlBlocked(page.url, "marker", title)
+        if "wanted" not in page.url:
+            logger.error(f"🚨 Suspicious Page Content (Bot Block?): {title}")
+
+    async def _parse_page(self, page: Page) -> str:
+        # "더보기" 확장과 모든 섹션 추출을 page.evaluate 1번으로 처리
+        description = f"{self._WRAPPER} .JobDescription_JobDescription__s2Keo"
+        payload = await page.evaluate(
+            _EXTRACT_SCRIPT,
+            {
+                "header": f"{self._ROOT} .JobHeader_JobHeader__TZkW3",
+                "description": description,
+                "expandButton": f"{description}"
+                " .JobDescription_JobDescription__paragraph__wrapper__WPrKC button",
+                "dueTime": f"{self._WRAPPER} .JobDueTime_JobDueTime__yvhtg",
+                "workplace": f"{self._WRAPPER} .JobWorkPlace_JobWorkPlace__xPlGe"
+                " .JobWorkPlace_JobWorkPlace__map__24PDM"
+                " .JobWorkPlace_JobWorkPlace__map__location__6pp2d",
+                "expandTimeout": stage_timeout_ms("parse_page", 3000),
+            },
         )
+        if payload["expand"] == "timeout":
+            logger.warning("⚠️ '더보기' 버튼 숨김 대기 타임아웃, 현재 상태로 진행.")
+        elif payload["expand"] == "expanded":
+            logger.info("✅ Clicked '더보기' button in JobDescription")
 
-    # ── 공통 헬퍼 ──────────────────────────────────────────
-
-    def _extract_section(self, page: Page, selector: str) -> str:
-        """단일 셀렉터에서 텍스트를 추출하는 공통 헬퍼"""
-        if page.locator(selector).count() > 0:
-            text = self._clean_html(page.locator(selector).inner_html())
-            logger.info(f"✅ Extracted: {selector}")
-            return text
-
-        logger.warning(f"⚠️ Section not found: {selector}")
-        return ""
+        # 헤더 -> 본문 -> 접수 기간 -> 근무지 순서, 빈 섹션 제거 후 합침
+        sections = self._clean_sections(payload["sections"])
+        return "\n\n".join(s for s in sections.values() if s)
@@ -0,0 +1,86 @@
+import re
+from typing import Callable, Iterable, List, Optional
+
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+from pydantic import BaseModel
+
+from shared.llm.tokens import TokenCounter
+from ....domain.models.job_data import EvaluationCriteriaItem
+
+# 조각 경계는 섹션(빈 줄) -> 줄 -> 단어 순으로 찾음
+_SEPARATORS = ["\n\n", "\n", " ", ""]
+
+_KEY_NOISE = re.compile(r"[\s\W_]+")
+
+
+class ChunkExtraction(BaseModel):
+    """공고 조각 1개의 추출 결과 (조각에 없는 필드는 비워 둠)"""
+
+    company_name: Optional[str] = None
+    job_title: Optional[str] = None
+    main_tasks: List[str] = []
+    tech_stacks: List[str] = []
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    key_points: List[str] = []
+
+
+class SummaryFields(BaseModel):
+    """합쳐진 추출 결과로 마지막에 작성하는 필드"""
+
+    ai_summary: Optional[str] = None
+    evaluation_criteria: List[EvaluationCriteriaItem] = []
+
+
+def build_splitter(
+    count_tokens: TokenCounter, chunk_tokens: int, overlap_tokens: int
+) -> RecursiveCharacterTextSplitter:
+    """토큰 수 기준 분할기 (문자 수 기준이면 한글/영문 공고의 토큰 예산이 달라짐)"""
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_tokens,
+        chunk_overlap=overlap_tokens,
+        length_function=count_tokens,
+        separators=_SEPARATORS,
+    )
+
+
+def _dedupe(items: Iterable[str], key: Callable[[str], str]) -> List[str]:
+    """처음 나온 순서/표기를 유지하며 중복 제거 (조각이 겹치는 구간의 중복 포함)"""
+    seen = set()
+    merged: List[str] = []
+    for item in items:
+        item = item.strip()
+        k = key(item)
+        if not k or k in seen:
+            continue
+        seen.add(k)
+        merged.append(item)
+    return merged
+
+
+def _text_key(text: str) -> str:
+    return _KEY_NOISE.sub("", text).lower()
+
+
+def _first(values: Iterable[Optional[str]], skip=("unknown",)) -> Optional[str]:
+    for value in values:
+        if value and value.strip() and value.strip().lower() not in skip:
+            return value.strip()
+    return None
+
+
+def merge_chunk_results(parts: List[ChunkExtraction]) -> ChunkExtraction:
+    """
+    조각별 결과 -> 하나의 결과 (LLM 호출 없이 결정적으로 병합)
+    - 회사명/공고명/날짜: 조각 순서상 처음 나온 값 (공고 앞부분 우선)
+    - 주요 업무/기술 스택/핵심 내용: 조각 순서대로 이어 붙이고 공백/기호/대소문자를 무시한 중복 제거
+    """
+    return ChunkExtraction(
+        company_name=_first(p.company_name for p in parts),
+        job_title=_first(p.job_title for p in parts),
+        main_tasks=_dedupe((t for p in parts for t in p.main_tasks), _text_key),
+        tech_stacks=_dedupe((t for p in parts for t in p.tech_stacks), _text_key),
+        start_date=_first(p.start_date for p in parts),
+        end_date=_first(p.end_date for p in parts),
+        key_points=_dedupe((t for p in parts for t in p.key_points), _text_key),
+    )
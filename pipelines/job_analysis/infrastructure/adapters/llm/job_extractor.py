@@ -1,46 +1,131 @@
+import asyncio
+import json
 import logging
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from langchain_core.language_models import BaseChatModel
 from langchain_core.output_parsers import PydanticOutputParser
+from pydantic import BaseModel
+from shared.concurrency import DeadlineExceeded, with_deadline
+from shared.llm.cache import cache_after_parse
+from shared.llm.tokens import TokenCounter, estimate_tokens
+from shared.metrics import REGISTRY, time_stage
 from ....domain.interface.extractor import JobDataExtractor
-from ....domain.models.job_data import ExtractedJobData
-from .prompts import get_job_extraction_prompt
+from ....domain.models.job_data import (
+    EvaluationCriteriaItem,
+    ExtractedJobData,
+    PostingFields,
+)
+from .chunked_extraction import (
+    ChunkExtraction,
+    SummaryFields,
+    build_splitter,
+    merge_chunk_results,
+)
+from .prompts import (
+    JOB_FIELD_INSTRUCTIONS,
+    format_field_request,
+    get_job_chunk_extraction_prompt,
+    get_job_completion_prompt,
+    get_job_extraction_prompt,
+    get_job_summary_prompt,
+)
 
 logger = logging.getLogger(__name__)
 
+EXTRACTION_CHUNKS = REGISTRY.histogram(
+    "job_extraction_chunks",
+    "공고 1건의 LLM 추출 조각 수 (1 = 단일 호출)",
+    buckets=(1, 2, 3, 4, 6, 8),
+)
+
+
+class JobDataCompletion(BaseModel):
+    """확인된 필드를 제외하고 추출한 결과 (요청하지 않은 필드는 비어 있음)"""
+
+    company_name: Optional[str] = None
+    job_title: Optional[str] = None
+    main_tasks: List[str] = []
+    tech_stacks: List[str] = []
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    ai_summary: Optional[str] = None
+    evaluation_criteria: List[EvaluationCriteriaItem] = []
+
 
 class LLMJobExtractor(JobDataExtractor):
     """
     LLM(LangChain)을 사용하여 텍스트에서 채용 공고 데이터를 추출하는 어댑터.
     특정 LLM 구현체에 의존하지 않고 BaseChatModel을 주입받아 사용합니다.
+
+    chunk_tokens를 넘는 긴 공고는 잘라내지 않고 토큰 수 기준 조각으로 나눠서
+    조각별 추출(병렬) -> 주요 업무/기술 스택 결정적 병합 -> 요약/평가 기준만 작은 LLM 호출 1번
+    (지연 시간 = 조각 1개 왕복 + 요약 호출, 조각 수와 무관)
+
+    공고 페이지 마크업에서 확인한 필드(known)가 있으면 LLM은 나머지 필드만 출력하고,
+    확인된 값이 LLM 결과보다 우선함
     """
 
-    def __init__(self, llm: BaseChatModel):
+    def __init__(
+        self,
+        llm: BaseChatModel,
+        count_tokens: TokenCounter = estimate_tokens,
+        chunk_tokens: int = 4000,
+        chunk_overlap_tokens: int = 200,
+    ):
         self.llm = llm
+        self.count_tokens = count_tokens
+        self.chunk_tokens = chunk_tokens
 
         # Pydantic 모델을 사용하여 파서 설정
         self.parser = PydanticOutputParser(pydantic_object=ExtractedJobData)
 
-    async def extract(self, raw_text: str) -> Optional[ExtractedJobData]:
+        # 프롬프트 -> LLM -> 파서 체인 (요청마다 재구성하지 않음)
+        # 파싱에 성공한 응답만 LLM 캐시에 기록 (깨진 JSON이 재요청마다 재사용되지 않도록)
+        self.chain = cache_after_parse(
+            get_job_extraction_prompt() | self.llm | self.parser
+        )
+        self.completion_chain = cache_after_parse(
+            get_job_completion_prompt()
+            | self.llm
+            | PydanticOutputParser(pydantic_object=JobDataCompletion)
+        )
+        self.chunk_chain = cache_after_parse(
+            get_job_chunk_extraction_prompt()
+            | self.llm
+            | PydanticOutputParser(pydantic_object=ChunkExtraction)
+        )
+        self.summary_chain = cache_after_parse(
+            get_job_summary_prompt()
+            | self.llm
+            | PydanticOutputParser(pydantic_object=SummaryFields)
+        )
+        self.splitter = build_splitter(count_tokens, chunk_tokens, chunk_overlap_tokens)
+
+    async def extract(
+        self, raw_text: str, known: Optional[PostingFields] = None
+    ) -> Optional[ExtractedJobData]:
         """
         raw_text에서 구조화된 데이터를 추출하여 ExtractedJobData 반환
         """
-        logger.info(f"🧠 Extracting job data from text ({len(raw_text)} chars)...")
+        known_fields = known.known() if known is not None else {}
+        tokens = self.count_tokens(raw_text)
+        logger.info(
+            f"🧠 Extracting job data from text ({len(raw_text)} chars, {tokens} tokens)..."
+        )
 
         try:
-            # 프롬프트 정의
-            prompt = get_job_extraction_prompt()
-
-            # 체인 연결
-            chain = prompt | self.llm | self.parser
-
             # 실행
-            result = await chain.ainvoke(
-                {
-                    "raw_text": raw_text[:15000],  # 토큰 제한 고려하여 절삭
-                    # "format_instructions": self.parser.get_format_instructions(), # Removed
-                }
-            )
+            with time_stage("job_analysis", "llm_extraction"):
+                if tokens <= self.chunk_tokens:
+                    EXTRACTION_CHUNKS.observe(1)
+                    extraction = (
+                        self._complete(raw_text, known_fields)
+                        if known_fields
+                        else self.chain.ainvoke({"raw_text": raw_text})
+                    )
+                else:
+                    extraction = self._extract_chunked(raw_text, known_fields)
+                result = await with_deadline(extraction, stage="llm_extraction")
 
             # PydanticOutputParser는 이미 Pydantic 객체를 반환하므로 바로 리턴
             logger.info(
@@ -48,6 +133,86 @@ class LLMJobExtractor(JobDataExtractor):
             )
             return result
 
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"❌ Extraction failed: {e}", exc_info=True)
             return None
+
+    async def _complete(
+        self, raw_text: str, known_fields: Dict[str, Any]
+    ) -> ExtractedJobData:
+        """확인되지 않은 필드만 LLM으로 추출한 뒤 확인된 필드와 합침"""
+        requested = [f for f in JOB_FIELD_INSTRUCTIONS if f not in known_fields]
+        instructions, example = format_field_request(requested)
+        logger.info(
+            f"📐 Using rule-based fields {sorted(known_fields)}; LLM extracts {requested}"
+        )
+        completion = await self.completion_chain.ainvoke(
+            {
+                "known_fields": json.dumps(known_fields, ensure_ascii=False),
+                "field_instructions": instructions,
+                "output_example": example,
+                "raw_text": raw_text,
+            }
+        )
+        data = completion.model_dump(include=set(requested))
+        data.update(known_fields)
+        return ExtractedJobData(
+            **{
+                **data,
+                "company_name": data.get("company_name") or "Unknown",
+                "job_title": data.get("job_title") or "",
+            }
+        )
+
+    async def _extract_chunked(
+        self, raw_text: str, known_fields: Dict[str, Any]
+    ) -> ExtractedJobData:
+        chunks = self.splitter.split_text(raw_text)
+        EXTRACTION_CHUNKS.observe(len(chunks))
+        logger.info(
+            f"🧩 Long posting split into {len(chunks)} chunks (<= {self.chunk_tokens} tokens each)"
+        )
+
+        # Map: 조각별 추출을 동시에 (실패한 조각은 건너뛰고 나머지로 병합)
+        results = await asyncio.gather(
+            *(
+                self.chunk_chain.ainvoke(
+                    {
+                        "chunk_index": index,
+                        "chunk_count": len(chunks),
+                        "raw_text": chunk,
+                    }
+                )
+                for index, chunk in enumerate(chunks, start=1)
+            ),
+            return_exceptions=True,
+        )
+        parts: List[ChunkExtraction] = []
+        for index, result in enumerate(results, start=1):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    f"⚠️ Chunk {index}/{len(chunks)} extraction failed: {result}"
+                )
+                continue
+            parts.append(result)
+        if not parts:
+            raise RuntimeError(f"All {len(chunks)} chunk extractions failed")
+
+        # Reduce: 목록 필드는 코드로 병합, 요약/평가 기준만 병합 결과로 LLM 호출
+        # 마크업에서 확인한 필드가 조각별 추출 결과보다 우선
+        merged = merge_chunk_results(parts).model_copy(update=known_fields)
+        summary = await self.summary_chain.ainvoke(
+            {"merged_data": merged.model_dump_json(exclude_none=True)}
+        )
+        return ExtractedJobData(
+            company_name=merged.company_name or "Unknown",
+            job_title=merged.job_title or "",
+            main_tasks=merged.main_tasks,
+            tech_stacks=merged.tech_stacks,
+            start_date=merged.start_date,
+            end_date=merged.end_date,
+            ai_summary=summary.ai_summary,
+            evaluation_criteria=summary.evaluation_criteria,
+        )
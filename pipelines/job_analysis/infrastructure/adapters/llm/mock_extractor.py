@@ -1,6 +1,10 @@
 from typing import Optional
 from ....domain.interface.extractor import JobDataExtractor
-from ....domain.models.job_data import ExtractedJobData, EvaluationCriteriaItem
+from ....domain.models.job_data import (
+    EvaluationCriteriaItem,
+    ExtractedJobData,
+    PostingFields,
+)
 
 
 class MockJobExtractor(JobDataExtractor):
@@ -9,7 +13,9 @@ class MockJobExtractor(JobDataExtractor):
     OpenAI 호출 없이 고정된 더미 데이터를 반환합니다.
     """
 
-    async def extract(self, raw_text: str) -> Optional[ExtractedJobData]:
+    async def extract(
+        self, raw_text: str, known: Optional[PostingFields] = None
+    ) -> Optional[ExtractedJobData]:
         return ExtractedJobData(
             company_name="(주)모의기업",
             job_title="백엔드 개발자 (Python/FastAPI)",
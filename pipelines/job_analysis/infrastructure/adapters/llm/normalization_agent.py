@@ -5,6 +5,7 @@ from typing import Optional
 from langchain_openai import ChatOpenAI
 from pydantic import SecretStr
 from shared.config import settings
+from shared.llm import get_llm_cache
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +23,7 @@ class AIAgent:
                     if settings.OPENAI_API_KEY
                     else None
                 ),
+                cache=get_llm_cache(),
             )
 
     async def is_same_company(self, raw_name: str, normalized_name: str) -> bool:
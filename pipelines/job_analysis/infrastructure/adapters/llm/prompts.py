@@ -1,5 +1,49 @@
+import json
+from typing import Any, Dict, Iterable, Tuple
+
 from langchain_core.prompts import ChatPromptTemplate
 
+# 추출 필드 -> (설명, 출력 예시) - 확인된 필드를 제외하고 추출할 때 사용
+JOB_FIELD_INSTRUCTIONS: Dict[str, Tuple[str, Any]] = {
+    "company_name": ("회사명 (텍스트에 없으면 'Unknown')", "회사명"),
+    "job_title": ("공고 제목 또는 직무명", "직무명"),
+    "main_tasks": ("주요 업무 (리스트)", ["업무1", "업무2"]),
+    "tech_stacks": ("기술 스택 (리스트, 예: Python, AWS, React)", ["기술1", "기술2"]),
+    "start_date": ("공고 시작일 (YYYY-MM-DD, 없으면 null)", "2024-01-01"),
+    "end_date": ("공고 마감일 (YYYY-MM-DD, 상시채용은 null)", None),
+    "ai_summary": (
+        "공고 전체 내용과 우선시되는 핵심 역량을 포함하여 3~5줄로 요약",
+        "요약 내용...",
+    ),
+    "evaluation_criteria": (
+        "다음 4가지 기준에 맞추어 평가 기준 추출 (리스트)\n"
+        "       - 직무 적합성\n"
+        "       - 문화 적합성\n"
+        "       - 성장 가능성\n"
+        "       - 문제 해결 능력\n"
+        '       각 항목은 {"name": "기준명", "description": "상세 설명"} 형태여야 함.',
+        [
+            {"name": "직무 적합성", "description": "..."},
+            {"name": "문화 적합성", "description": "..."},
+        ],
+    ),
+}
+
+
+def format_field_request(fields: Iterable[str]) -> Tuple[str, str]:
+    """추출할 필드 -> (번호 붙은 설명, JSON 출력 예시) - get_job_completion_prompt 변수용"""
+    fields = list(fields)
+    instructions = "\n    ".join(
+        f"{i}. {name}: {JOB_FIELD_INSTRUCTIONS[name][0]}"
+        for i, name in enumerate(fields, start=1)
+    )
+    example = json.dumps(
+        {name: JOB_FIELD_INSTRUCTIONS[name][1] for name in fields},
+        ensure_ascii=False,
+        indent=4,
+    )
+    return instructions, example
+
 
 def get_job_extraction_prompt() -> ChatPromptTemplate:
     """
@@ -47,3 +91,110 @@ def get_job_extraction_prompt() -> ChatPromptTemplate:
     return ChatPromptTemplate.from_messages(
         [("system", system_prompt), ("user", user_prompt)]
     )
+
+
+def get_job_chunk_extraction_prompt() -> ChatPromptTemplate:
+    """
+    긴 채용 공고를 나눈 조각 1개에서 사실 정보만 추출하는 프롬프트 (요약/평가 기준은 추출하지 않음)
+
+    Required Variables:
+    - chunk_index / chunk_count: 조각 순서 (1부터)
+    - raw_text: 공고 텍스트 조각
+    """
+    system_prompt = """
+    당신은 채용 공고 분석 전문가입니다. 주어진 텍스트는 긴 채용 공고를 여러 조각으로 나눈 것 중 하나입니다.
+    이 조각에 실제로 적혀 있는 정보만 추출하여 JSON 형식으로 출력하세요. 조각에 없는 정보는 추측하지 말고 null 또는 빈 리스트로 두세요.
+
+    추출해야 할 정보:
+    1. company_name: 회사명 (없으면 null)
+    2. job_title: 공고 제목 또는 직무명 (없으면 null)
+    3. main_tasks: 주요 업무 (리스트)
+    4. tech_stacks: 기술 스택 (리스트, 예: Python, AWS, React)
+    5. start_date: 공고 시작일 (YYYY-MM-DD, 없으면 null)
+    6. end_date: 공고 마감일 (YYYY-MM-DD, 없으면 null)
+    7. key_points: 자격요건/우대사항/팀과 조직 문화 등 요약과 평가 기준 작성에 필요한 핵심 내용 (최대 5개, 각 한 문장)
+
+    반드시 아래와 같은 JSON 형식으로만 응답해주세요 (MarkDown Code Block 없이, 스키마 정의 없이, 순수 JSON 데이터만):
+    {{
+        "company_name": "회사명",
+        "job_title": null,
+        "main_tasks": ["업무1", "업무2"],
+        "tech_stacks": ["기술1", "기술2"],
+        "start_date": null,
+        "end_date": "2024-01-31",
+        "key_points": ["핵심 내용1", "핵심 내용2"]
+    }}
+    """
+
+    user_prompt = "[조각 {chunk_index}/{chunk_count}]\n{raw_text}"
+
+    return ChatPromptTemplate.from_messages(
+        [("system", system_prompt), ("user", user_prompt)]
+    )
+
+
+def get_job_summary_prompt() -> ChatPromptTemplate:
+    """
+    조각별 추출 결과를 합친 정보로 요약/평가 기준만 작성하는 프롬프트
+
+    Required Variables:
+    - merged_data: 합쳐진 추출 결과 (JSON 문자열)
+    """
+    system_prompt = """
+    당신은 채용 공고 분석 전문가입니다. 주어진 JSON은 하나의 채용 공고에서 추출한 정보입니다.
+    이 정보만을 근거로 아래 항목을 작성하여 JSON 형식으로 출력하세요.
+
+    1. ai_summary: 공고 전체 내용과 우선시되는 핵심 역량을 포함하여 3~5줄로 요약
+    2. evaluation_criteria: 다음 4가지 기준에 맞추어 평가 기준 추출 (리스트)
+       - 직무 적합성
+       - 문화 적합성
+       - 성장 가능성
+       - 문제 해결 능력
+       각 항목은 {{"name": "기준명", "description": "상세 설명"}} 형태여야 함.
+
+    반드시 아래와 같은 JSON 형식으로만 응답해주세요 (MarkDown Code Block 없이, 스키마 정의 없이, 순수 JSON 데이터만):
+    {{
+        "ai_summary": "요약 내용...",
+        "evaluation_criteria": [
+            {{"name": "직무 적합성", "description": "..."}},
+            {{"name": "문화 적합성", "description": "..."}}
+        ]
+    }}
+    """
+
+    user_prompt = "{merged_data}"
+
+    return ChatPromptTemplate.from_messages(
+        [("system", system_prompt), ("user", user_prompt)]
+    )
+
+
+def get_job_completion_prompt() -> ChatPromptTemplate:
+    """
+    공고 페이지 마크업에서 이미 확인한 필드를 제외한 나머지만 추출하는 프롬프트
+    (확인된 필드는 출력하지 않으므로 출력 토큰이 줄어듦)
+
+    Required Variables:
+    - known_fields: 확인된 필드 (JSON 문자열, 참고용)
+    - field_instructions: 추출할 필드 설명 (번호 목록)
+    - output_example: 추출할 필드만 담은 JSON 예시
+    - raw_text: 채용 공고 원본 텍스트
+    """
+    system_prompt = """
+    당신은 채용 공고 분석 전문가입니다. 주어진 채용 공고 텍스트에서 핵심 정보를 추출하여 JSON 형식으로 출력하세요.
+
+    다음 정보는 공고 페이지에서 이미 확인되었으므로 다시 출력하지 말고, 요약과 평가 기준 작성 시 참고만 하세요:
+    {known_fields}
+
+    추출해야 할 정보:
+    {field_instructions}
+
+    반드시 아래와 같은 JSON 형식으로만 응답해주세요 (MarkDown Code Block 없이, 스키마 정의 없이, 순수 JSON 데이터만):
+    {output_example}
+    """
+
+    user_prompt = "{raw_text}"
+
+    return ChatPromptTemplate.from_messages(
+        [("system", system_prompt), ("user", user_prompt)]
+    )
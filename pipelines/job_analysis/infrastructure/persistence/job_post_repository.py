@@ -0,0 +1,95 @@
+from typing import Any, Optional, Sequence
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+from shared.metrics import timed_query
+from shared.db.model.models import JobMasterSkill, JobPost, Skill
+from ...domain.interface.repository import JobPostRepository
+from ...domain.models.job_data import (
+    EvaluationCriteriaItem,
+    ExtractedJobData,
+    StoredJobPost,
+)
+
+
+class SqlAlchemyJobPostRepository(JobPostRepository):
+    """
+    JobPostRepository의 SQLAlchemy (Async) 구현체
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @timed_query
+    async def find_by_url_hash(self, url_hash: str) -> Optional[StoredJobPost]:
+        # idx_job_posts_source_url_hash
+        return await self._find(JobPost.source_url_hash == url_hash)
+
+    @timed_query
+    async def find_by_source_url(
+        self, source_urls: Sequence[str]
+    ) -> Optional[StoredJobPost]:
+        # source_url UNIQUE 인덱스
+        return await self._find(JobPost.source_url.in_(list(source_urls)))
+
+    async def _find(self, condition: Any) -> Optional[StoredJobPost]:
+        # 1. JobPost + JobMaster + Company 조회
+        stmt = (
+            select(JobPost)
+            .options(joinedload(JobPost.job_master), joinedload(JobPost.company))
+            .where(condition, JobPost.deleted_at.is_(None))
+            .order_by(JobPost.job_post_id.desc())
+            .limit(1)
+        )
+        result = await self.session.execute(stmt)
+        job_post = result.scalars().first()
+
+        if not job_post or not job_post.job_master:
+            return None
+        job_master = job_post.job_master
+
+        # 2. Tech Stacks (Skills) 조회
+        skill_stmt = (
+            select(Skill.skill_name)
+            .join(JobMasterSkill, Skill.skill_id == JobMasterSkill.skill_id)
+            .where(
+                JobMasterSkill.job_master_id == job_master.job_master_id,
+                JobMasterSkill.deleted_at.is_(None),
+            )
+        )
+        skill_result = await self.session.execute(skill_stmt)
+        tech_stacks = list(skill_result.scalars().all())
+
+        # 3. Evaluation Criteria 변환 (JSON -> Domain Models)
+        criteria: list[EvaluationCriteriaItem] = []
+        if isinstance(job_master.evaluation_criteria, list):
+            criteria = [
+                EvaluationCriteriaItem(
+                    name=item.get("name", "Unknown"),
+                    description=item.get("description", ""),
+                )
+                for item in job_master.evaluation_criteria
+            ]
+
+        # 4. 도메인 객체 생성 (공고별 값이 있으면 우선, 없으면 마스터 값)
+        start_date = job_post.start_date or job_master.start_date
+        end_date = job_post.end_date or job_master.end_date
+        main_tasks = job_master.main_tasks or job_post.main_tasks
+        return StoredJobPost(
+            job_post_id=job_post.job_post_id,
+            recruitment_status=job_post.recruitment_status,
+            data=ExtractedJobData(
+                company_name=(
+                    job_post.company.name
+                    if job_post.company
+                    else job_post.raw_company_name or "Unknown"
+                ),
+                job_title=job_master.job_title,
+                main_tasks=main_tasks if isinstance(main_tasks, list) else [],
+                tech_stacks=tech_stacks,
+                start_date=start_date.isoformat() if start_date else None,
+                end_date=end_date.isoformat() if end_date else None,
+                ai_summary=job_master.ai_summary,
+                evaluation_criteria=criteria,
+            ),
+        )
@@ -0,0 +1,256 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, List, Optional, Protocol, Tuple
+
+from ...domain.interface.snapshot_store import SnapshotStore
+from ...domain.models.snapshot import CrawlSnapshot, SnapshotRecord
+from ...domain.services.url_canonicalizer import canonicalize_job_url
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS crawl_snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    content_hash TEXT NOT NULL,
+    url TEXT NOT NULL,
+    canonical_url TEXT NOT NULL,
+    captured_at TEXT NOT NULL,
+    source TEXT NOT NULL,
+    text_chars INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_crawl_snapshots_url_time
+    ON crawl_snapshots (canonical_url, captured_at);
+CREATE INDEX IF NOT EXISTS idx_crawl_snapshots_time ON crawl_snapshots (captured_at);
+CREATE INDEX IF NOT EXISTS idx_crawl_snapshots_hash ON crawl_snapshots (content_hash);
+"""
+
+_COLUMNS = "content_hash, url, canonical_url, captured_at, source, text_chars"
+
+
+class BlobBackend(Protocol):
+    """압축된 스냅샷 본문을 key로 저장/조회하는 저장소"""
+
+    async def put(self, key: str, data: bytes) -> None: ...
+
+    async def get(self, key: str) -> bytes: ...
+
+
+class LocalBlobBackend(BlobBackend):
+    """로컬 디스크 blob 저장소 (임시 파일에 쓴 뒤 rename - 읽는 쪽은 완성된 파일만 봄)"""
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    async def put(self, key: str, data: bytes) -> None:
+        await asyncio.to_thread(self._put_sync, key, data)
+
+    async def get(self, key: str) -> bytes:
+        return await asyncio.to_thread((self.root / key).read_bytes)
+
+    def _put_sync(self, key: str, data: bytes) -> None:
+        path = self.root / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+class S3BlobBackend(BlobBackend):
+    """
+    S3 blob 저장소 - 기존 S3FileStorage(upload_file/download_file)를 그대로 사용
+    (버킷/인증 정보는 S3FileStorage 설정을 따름)
+    """
+
+    def __init__(self, storage: Any, prefix: str = "crawl-snapshots"):
+        self.storage = storage
+        self.prefix = prefix.strip("/")
+
+    async def put(self, key: str, data: bytes) -> None:
+        await self.storage.upload_file(
+            data, f"{self.prefix}/{key}", content_type="application/gzip"
+        )
+
+    async def get(self, key: str) -> bytes:
+        return await self.storage.download_file(f"{self.prefix}/{key}")
+
+
+def _utc_iso(value: datetime) -> str:
+    # 문자열 비교로 시간 범위를 조회하므로 UTC + 고정 자릿수로 저장 (naive는 로컬 시간으로 간주)
+    return value.astimezone(timezone.utc).isoformat(timespec="microseconds")
+
+
+def encode_snapshot(snapshot: CrawlSnapshot) -> Tuple[str, bytes]:
+    """스냅샷 본문(원본 HTML + 정제 텍스트) -> (content_hash, gzip blob)"""
+    payload = json.dumps(
+        {"raw_html": snapshot.raw_html, "text": snapshot.text},
+        ensure_ascii=False,
+        sort_keys=True,
+    ).encode("utf-8")
+    # mtime=0: 같은 내용이면 blob 바이트도 같음
+    return hashlib.sha256(payload).hexdigest(), gzip.compress(payload, mtime=0)
+
+
+class BlobSnapshotStore(SnapshotStore):
+    """
+    내용 주소(content-addressed) 스냅샷 저장소
+    - 본문은 원본 HTML + 정제 텍스트의 SHA-256을 key로 gzip 압축해서 blob 저장소(로컬/S3)에 1번만 저장
+    - URL(표준화)/수집 시각 인덱스는 로컬 SQLite (같은 내용을 다시 수집하면 인덱스 행만 추가)
+    """
+
+    def __init__(self, blobs: BlobBackend, index_path: str):
+        self.blobs = blobs
+        self.index_path = index_path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def blob_key(content_hash: str) -> str:
+        return f"objects/{content_hash[:2]}/{content_hash}.json.gz"
+
+    async def save(self, snapshot: CrawlSnapshot) -> SnapshotRecord:
+        content_hash, blob = await asyncio.to_thread(encode_snapshot, snapshot)
+        record = SnapshotRecord(
+            content_hash=content_hash,
+            url=snapshot.url,
+            canonical_url=canonicalize_job_url(snapshot.url),
+            captured_at=snapshot.captured_at,
+            source=snapshot.source,
+            text_chars=len(snapshot.text),
+        )
+        # blob을 먼저 저장해야 인덱스가 없는 blob을 가리키지 않음
+        if not await asyncio.to_thread(self._has_content, content_hash):
+            await self.blobs.put(self.blob_key(content_hash), blob)
+        else:
+            logger.info(f"♻️ Snapshot content already stored ({content_hash[:12]})")
+        await asyncio.to_thread(self._insert, record)
+        return record
+
+    async def load(self, content_hash: str) -> CrawlSnapshot:
+        rows = await asyncio.to_thread(
+            self._query,
+            f"SELECT {_COLUMNS} FROM crawl_snapshots WHERE content_hash = ? "
+            "ORDER BY captured_at DESC LIMIT 1",
+            (content_hash,),
+        )
+        if not rows:
+            raise KeyError(f"Snapshot not found: {content_hash}")
+        record = rows[0]
+        blob = await self.blobs.get(self.blob_key(content_hash))
+        payload = json.loads(await asyncio.to_thread(gzip.decompress, blob))
+        return CrawlSnapshot(
+            url=record.url,
+            captured_at=record.captured_at,
+            source=record.source,
+            raw_html=payload["raw_html"],
+            text=payload["text"],
+        )
+
+    async def find(
+        self,
+        url: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        latest_only: bool = False,
+    ) -> List[SnapshotRecord]:
+        conditions, params = [], []
+        if url is not None:
+            conditions.append("canonical_url = ?")
+            params.append(canonicalize_job_url(url))
+        if since is not None:
+            conditions.append("captured_at >= ?")
+            params.append(_utc_iso(since))
+        if until is not None:
+            conditions.append("captured_at < ?")
+            params.append(_utc_iso(until))
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        if latest_only:
+            # URL별 가장 최근 스냅샷 1개 (SQLite는 MAX()와 함께 조회한 컬럼을 해당 행 값으로 채움)
+            sql = (
+                f"SELECT {_COLUMNS}, MAX(captured_at) FROM crawl_snapshots {where} "
+                "GROUP BY canonical_url ORDER BY captured_at DESC"
+            )
+        else:
+            sql = f"SELECT {_COLUMNS} FROM crawl_snapshots {where} ORDER BY captured_at DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return await asyncio.to_thread(self._query, sql, tuple(params))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ── SQLite 인덱스 (Blocking, to_thread에서 호출) ─────────────
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.index_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.index_path, timeout=5.0, check_same_thread=False
+            )
+            # 여러 uvicorn worker가 같은 인덱스에 기록해도 읽기가 막히지 않도록 WAL
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _has_content(self, content_hash: str) -> bool:
+        with self._lock:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT 1 FROM crawl_snapshots WHERE content_hash = ? LIMIT 1",
+                    (content_hash,),
+                )
+                .fetchone()
+            )
+        return row is not None
+
+    def _insert(self, record: SnapshotRecord) -> None:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    f"INSERT INTO crawl_snapshots ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        record.content_hash,
+                        record.url,
+                        record.canonical_url,
+                        _utc_iso(record.captured_at),
+                        record.source,
+                        record.text_chars,
+                    ),
+                )
+
+    def _query(self, sql: str, params: tuple) -> List[SnapshotRecord]:
+        with self._lock:
+            rows = self._connection().execute(sql, params).fetchall()
+        return [
+            SnapshotRecord(
+                content_hash=row[0],
+                url=row[1],
+                canonical_url=row[2],
+                captured_at=datetime.fromisoformat(row[3]),
+                source=row[4],
+                text_chars=row[5],
+            )
+            for row in rows
+        ]
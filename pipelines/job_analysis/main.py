@@ -1,69 +1,112 @@
 import logging
+from typing import Optional
 
 from shared.schema.job_posting import (
     JobPostingAnalyzeRequest,
     JobPostingAnalyzeResponse,
     JobPostingDeleteResponse,
 )
+from shared.concurrency import (
+    DeadlineExceeded,
+    FileLockSingleFlight,
+    SingleFlight,
+    current_deadline,
+    deadline_scope,
+    with_deadline,
+)
+from shared.db.connection import get_db
 from .application.services.extraction_service import JobExtractionService
-from .infrastructure.adapters.crawling.router import DynamicRoutingCrawler
-from .infrastructure.adapters.llm.job_extractor import LLMJobExtractor
+from .container import get_container, shutdown_container
+from .infrastructure.persistence.job_post_repository import (
+    SqlAlchemyJobPostRepository,
+)
+from .domain.services.url_canonicalizer import canonicalize_job_url
 
 from shared.config import settings
-from .infrastructure.adapters.llm.mock_extractor import MockJobExtractor
-
-from langchain_core.language_models import BaseChatModel
-from .domain.interface.extractor import JobDataExtractor
 
 logger = logging.getLogger(__name__)
 
+# 등록 여부 조회는 최적화이므로 오래 걸리면 포기하고 분석 진행
+_LOOKUP_TIMEOUT_SECONDS = 2.0
+
+
+def _build_single_flight() -> SingleFlight[JobPostingAnalyzeResponse]:
+    """설정에 따라 In-Process / Cross-Process 요청 합치기 구현 선택"""
+    if settings.SINGLE_FLIGHT_LOCK_DIR:
+        logger.info(
+            f"🔒 Cross-process single-flight enabled ({settings.SINGLE_FLIGHT_LOCK_DIR})"
+        )
+        return FileLockSingleFlight(
+            lock_dir=settings.SINGLE_FLIGHT_LOCK_DIR,
+            serialize=lambda response: response.model_dump_json(),
+            deserialize=JobPostingAnalyzeResponse.model_validate_json,
+        )
+    return SingleFlight()
+
+
+# 같은 공고(표준화 URL)에 대한 동시 분석 요청은 크롤링/LLM 추출을 1회만 수행
+job_analysis_flight = _build_single_flight()
+
+
+def startup() -> None:
+    """애플리케이션 시작 시 장수명 클라이언트 초기화 (FastAPI lifespan)"""
+    get_container()
+
+
+async def shutdown() -> None:
+    """애플리케이션 종료 시 컨테이너 폐기 (브라우저 종료 포함)"""
+    await shutdown_container()
+
 
 # TODO: 공고분석 파이프라인 구현, 벡터db에만 공고 저장
 async def run_pipeline(request: JobPostingAnalyzeRequest) -> JobPostingAnalyzeResponse:
     """
     크롤링 및 추출 파이프라인
     """
-    # 설정에 따라 Extractor 주입 결정
-    extractor_impl: JobDataExtractor
-    if settings.use_mock:
-        extractor_impl = MockJobExtractor()
-    else:
-        llm_model: BaseChatModel
-        if getattr(settings, "LLM_PROVIDER", "openai") == "gemini":
-            from langchain_google_genai import ChatGoogleGenerativeAI
-
-            model = getattr(settings, "GOOGLE_MODEL", "gemini-3-flash-preview")
-            logger.info(f"🤖 Initializing LLMJobExtractor with gemini ({model})")
-
-            llm_model = ChatGoogleGenerativeAI(
-                model=model,
-                google_api_key=settings.GOOGLE_API_KEY,
-                temperature=0,
-            )
-        else:
-            from langchain_openai import ChatOpenAI
-            from pydantic import SecretStr
-
-            model = getattr(settings, "OPENAI_MODEL", "gpt-4o-mini")
-            logger.info(f"🤖 Initializing LLMJobExtractor with OpenAI ({model})")
-
-            llm_model = ChatOpenAI(
-                model=model,
-                temperature=0,
-                api_key=(
-                    SecretStr(settings.OPENAI_API_KEY)
-                    if settings.OPENAI_API_KEY
-                    else None
-                ),
-                model_kwargs={"response_format": {"type": "json_object"}},
-            )
 
-        extractor_impl = LLMJobExtractor(llm=llm_model)
+    service = get_container().service
+    key = canonicalize_job_url(request.url)
+
+    # 이미 등록된 공고는 저장된 분석 결과를 바로 반환 (크롤링/LLM 생략)
+    # 원본 URL 전달 (해시는 표준화 URL로 계산, 해시 불일치 감지용 source_url 조회에 원본도 사용)
+    existing = await _find_existing(service, request.url)
+    if existing is not None:
+        return existing
 
-    service = JobExtractionService(
-        crawler=DynamicRoutingCrawler(), extractor=extractor_impl
+    # 합쳐진 작업은 여러 요청이 함께 기다리므로 첫 요청의 연결 종료로 취소되지 않도록
+    # 취소 신호만 분리 (만료 시각은 유지), 각 요청은 자기 예산만큼만 기다림
+    deadline = current_deadline()
+    shared_deadline = deadline.detached() if deadline else None
+
+    async def extract() -> JobPostingAnalyzeResponse:
+        with deadline_scope(shared_deadline):
+            # 같은 key로 합쳐진 요청은 모두 이 결과를 받으므로 key(표준화 URL)를 크롤링
+            # (첫 요청의 원본 URL을 크롤링하면 다른 요청이 그 페이지 결과를 받게 됨)
+            return await service.extract_job_data(key)
+
+    return await with_deadline(
+        job_analysis_flight.do(key, extract), stage="job_analysis"
     )
-    return await service.extract_job_data(request.url)
+
+
+async def _find_existing(
+    service: JobExtractionService, url: str
+) -> Optional[JobPostingAnalyzeResponse]:
+    """job_posts.source_url_hash 조회 - DB 장애 시에는 조회 없이 분석 진행"""
+    try:
+        async for db_session in get_db():
+            return await with_deadline(
+                service.find_existing(url, SqlAlchemyJobPostRepository(db_session)),
+                stage="job_post_lookup",
+                cap=_LOOKUP_TIMEOUT_SECONDS,
+            )
+    except DeadlineExceeded as e:
+        if e.cancelled:
+            raise
+        logger.warning(f"⚠️ Job post lookup timed out ({e}). Analyzing anyway.")
+    except Exception as e:
+        logger.warning(f"⚠️ Job post lookup failed ({e}). Analyzing anyway.")
+    return None
 
 
 # TODO: 삭제 파이프라인 구현, 벡터db에 저장된 내용만 삭제
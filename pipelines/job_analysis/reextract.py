@@ -0,0 +1,166 @@
+"""
+저장된 크롤링 스냅샷으로 공고 데이터 일괄 재추출 (크롤링 없이 LLM 추출만 다시 실행)
+
+    PYTHONPATH=.:pipelines python -m job_analysis.reextract --since 2026-01-01 --latest-only -o out.jsonl
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from contextlib import nullcontext
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Sequence
+
+from pydantic import BaseModel
+
+from shared.llm import bypass_llm_cache
+from .container import build_extractor, build_snapshot_store
+from .domain.interface.extractor import JobDataExtractor
+from .domain.interface.snapshot_store import SnapshotStore
+from .domain.models.job_data import ExtractedJobData
+from .domain.models.snapshot import SnapshotRecord
+from .infrastructure.adapters.crawling.posting_fields import parse_posting_fields
+
+logger = logging.getLogger(__name__)
+
+
+class ReextractionResult(BaseModel):
+    """스냅샷 1개의 재추출 결과 (실패 시 data=None, error에 사유)"""
+
+    record: SnapshotRecord
+    data: Optional[ExtractedJobData] = None
+    error: Optional[str] = None
+
+
+async def reextract_snapshots(
+    store: SnapshotStore,
+    extractor: JobDataExtractor,
+    records: Sequence[SnapshotRecord],
+    concurrency: int = 4,
+) -> AsyncIterator[ReextractionResult]:
+    """
+    스냅샷 목록을 동시에 최대 concurrency개씩 재추출 (완료 순서대로 반환)
+    한 스냅샷의 실패는 결과의 error로 기록하고 나머지는 계속 진행
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    for record in records:
+        queue.put_nowait(record)
+    results: asyncio.Queue = asyncio.Queue()
+
+    async def worker() -> None:
+        while True:
+            try:
+                record = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            results.put_nowait(await _reextract_one(store, extractor, record))
+
+    workers = [
+        asyncio.create_task(worker())
+        for _ in range(max(1, min(concurrency, len(records))))
+    ]
+    try:
+        for _ in range(len(records)):
+            yield await results.get()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+async def _reextract_one(
+    store: SnapshotStore, extractor: JobDataExtractor, record: SnapshotRecord
+) -> ReextractionResult:
+    try:
+        snapshot = await store.load(record.content_hash)
+        # 저장된 원본 HTML이 있으면 크롤링 때와 같이 규칙 기반 필드를 사용
+        fields = parse_posting_fields(snapshot.url, snapshot.raw_html)
+        if fields is not None:
+            data = await extractor.extract(snapshot.text, known=fields)
+        else:
+            data = await extractor.extract(snapshot.text)
+    except Exception as e:
+        logger.warning(f"⚠️ Re-extraction failed for {record.url}: {e}")
+        return ReextractionResult(record=record, error=f"{type(e).__name__}: {e}")
+    if data is None:
+        return ReextractionResult(
+            record=record, error="extraction returned empty result"
+        )
+    return ReextractionResult(record=record, data=data)
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="저장된 크롤링 스냅샷으로 공고 데이터 재추출 (네트워크 크롤링 없음)"
+    )
+    parser.add_argument("--url", help="이 공고(표준화 URL 기준)의 스냅샷만")
+    parser.add_argument(
+        "--since", type=datetime.fromisoformat, help="수집 시각 하한 (ISO)"
+    )
+    parser.add_argument(
+        "--until", type=datetime.fromisoformat, help="수집 시각 상한 (ISO, 미포함)"
+    )
+    parser.add_argument("--limit", type=int)
+    parser.add_argument(
+        "--latest-only", action="store_true", help="URL별 최신 스냅샷만"
+    )
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="LLM 응답 캐시를 조회하지 않고 다시 호출 (새 응답으로 캐시 갱신)",
+    )
+    parser.add_argument("-o", "--output", help="결과 JSONL 경로 (기본: stdout)")
+    return parser.parse_args(argv)
+
+
+async def _run(args: argparse.Namespace) -> int:
+    store = build_snapshot_store()
+    if store is None:
+        logger.error("❌ CRAWL_SNAPSHOT_BACKEND is not configured")
+        return 2
+
+    try:
+        records = await store.find(
+            url=args.url,
+            since=args.since,
+            until=args.until,
+            limit=args.limit,
+            latest_only=args.latest_only,
+        )
+        logger.info(f"🔁 Re-extracting {len(records)} snapshots...")
+
+        out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+        failed = 0
+        try:
+            async for result in reextract_snapshots(
+                store, build_extractor(), records, concurrency=args.concurrency
+            ):
+                failed += result.error is not None
+                out.write(
+                    json.dumps(result.model_dump(mode="json"), ensure_ascii=False)
+                    + "\n"
+                )
+        finally:
+            if out is not sys.stdout:
+                out.close()
+    finally:
+        store.close()
+
+    logger.info(
+        f"✅ Re-extraction complete ({len(records) - failed} ok, {failed} failed)"
+    )
+    return 1 if failed else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    logging.basicConfig(level=logging.INFO)
+    args = _parse_args(argv)
+    with bypass_llm_cache() if args.no_cache else nullcontext():
+        return asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
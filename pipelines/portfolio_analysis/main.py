@@ -1,12 +1,16 @@
+import logging
+
 from shared.schema.document import PortfolioAnalyzeRequest, PortfolioAnalyzeResponse
 
+logger = logging.getLogger(__name__)
+
 
 async def run_pipeline(request: PortfolioAnalyzeRequest) -> PortfolioAnalyzeResponse:
     """
     Execute the Portfolio Analysis Pipeline.
     Currently returns dummy data directly.
     """
-    print(f"Running Portfolio Analysis Pipeline for user {request.user_id}")
+    logger.info(f"Running Portfolio Analysis Pipeline for user {request.user_id}")
 
     return PortfolioAnalyzeResponse(
         ai_analysis_report="Portfolio shows strong skills (Pipeline Analysis).",
@@ -1,12 +1,16 @@
+import logging
+
 from shared.schema.document import ResumeAnalyzeRequest, ResumeAnalyzeResponse
 
+logger = logging.getLogger(__name__)
+
 
 async def run_pipeline(request: ResumeAnalyzeRequest) -> ResumeAnalyzeResponse:
     """
     Execute the Resume Analysis Pipeline.
     Currently returns dummy data directly.
     """
-    print(f"Running Resume Analysis Pipeline for user {request.user_id}")
+    logger.info(f"Running Resume Analysis Pipeline for user {request.user_id}")
 
     return ResumeAnalyzeResponse(
         ai_analysis_report=f"Resume analysis for user {request.user_id} completed.",
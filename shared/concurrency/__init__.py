@@ -0,0 +1,36 @@
+"""Concurrency Utilities"""
+
+from .admission import (
+    AdmissionController,
+    AdmissionRejected,
+    AdmissionTicket,
+    AdmittedStream,
+)
+from .deadline import (
+    Deadline,
+    DeadlineExceeded,
+    check_deadline,
+    current_deadline,
+    deadline_scope,
+    stage_timeout,
+    stage_timeout_ms,
+    with_deadline,
+)
+from .single_flight import FileLockSingleFlight, SingleFlight
+
+__all__ = [
+    "AdmissionController",
+    "AdmissionRejected",
+    "AdmissionTicket",
+    "AdmittedStream",
+    "Deadline",
+    "DeadlineExceeded",
+    "check_deadline",
+    "current_deadline",
+    "deadline_scope",
+    "stage_timeout",
+    "stage_timeout_ms",
+    "with_deadline",
+    "SingleFlight",
+    "FileLockSingleFlight",
+]
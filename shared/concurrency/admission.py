@@ -0,0 +1,179 @@
+import asyncio
+import logging
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Generic, Optional, TypeVar
+
+from shared.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+QUEUE_DEPTH = REGISTRY.gauge(
+    "admission_queue_depth", "실행 슬롯을 기다리는 요청 수", ["pipeline"]
+)
+IN_FLIGHT = REGISTRY.gauge("admission_in_flight", "실행 중인 요청 수", ["pipeline"])
+WAIT_SECONDS = REGISTRY.histogram(
+    "admission_wait_seconds", "실행 슬롯을 얻기까지 대기한 시간(초)", ["pipeline"]
+)
+REJECTED = REGISTRY.counter(
+    "admission_rejected_total", "대기열이 가득 차 거절된 요청 수", ["pipeline"]
+)
+
+
+class AdmissionRejected(Exception):
+    """대기열이 가득 차서 요청을 받을 수 없음 (API 계층에서 429 + Retry-After로 변환)"""
+
+    def __init__(self, name: str, retry_after: int):
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(
+            f"Too many concurrent '{name}' requests. Retry after {retry_after}s."
+        )
+
+
+class AdmissionTicket:
+    """획득한 실행 슬롯 1개 (release는 여러 번 호출해도 한 번만 반영)"""
+
+    def __init__(self, controller: "AdmissionController", semaphore: asyncio.Semaphore):
+        self._controller = controller
+        self._semaphore = semaphore
+        self._started = time.perf_counter()
+        self._released = False
+
+    def release(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        self._controller._release(self._semaphore, time.perf_counter() - self._started)
+
+
+class AdmissionController:
+    """
+    파이프라인별 동시 실행 수 제한 + 길이가 제한된 대기열 (Backpressure)
+    - 실행 중인 요청이 max_concurrency 미만이면 즉시 실행
+    - 가득 찼으면 max_queue 까지 대기, 대기열도 가득 찼으면 AdmissionRejected
+    - Retry-After는 최근 처리 시간(EWMA)과 대기열 길이로 추정
+    """
+
+    def __init__(self, name: str, max_concurrency: int, max_queue: int):
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+
+        self._in_flight = 0
+        self._waiting = 0
+        self._avg_service_seconds: Optional[float] = None
+
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        return self._waiting
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # 세마포어는 생성된 이벤트 루프에 묶이므로 루프가 바뀌면 상태를 새로 시작
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._in_flight = 0
+            self._waiting = 0
+        return self._semaphore
+
+    def retry_after(self) -> int:
+        """대기열이 한 바퀴 비워질 때까지의 예상 시간(초, 최소 1초)"""
+        if self._avg_service_seconds is None:
+            return 1
+        rounds = (self._waiting + 1) / self.max_concurrency
+        return max(1, math.ceil(self._avg_service_seconds * rounds))
+
+    async def acquire(self) -> AdmissionTicket:
+        """실행 슬롯 획득 (대기열이 가득 찼으면 즉시 AdmissionRejected)"""
+        semaphore = self._get_semaphore()
+
+        if semaphore.locked() and self._waiting >= self.max_queue:
+            REJECTED.inc(pipeline=self.name)
+            retry_after = self.retry_after()
+            logger.warning(
+                f"🚦 Admission rejected: {self.name} "
+                f"(in_flight={self._in_flight}, waiting={self._waiting}, retry_after={retry_after}s)"
+            )
+            raise AdmissionRejected(self.name, retry_after)
+
+        self._waiting += 1
+        QUEUE_DEPTH.set(self._waiting, pipeline=self.name)
+        started = time.perf_counter()
+        try:
+            await semaphore.acquire()
+        finally:
+            self._waiting -= 1
+            QUEUE_DEPTH.set(self._waiting, pipeline=self.name)
+            WAIT_SECONDS.observe(time.perf_counter() - started, pipeline=self.name)
+
+        self._in_flight += 1
+        IN_FLIGHT.set(self._in_flight, pipeline=self.name)
+        return AdmissionTicket(self, semaphore)
+
+    def _release(self, semaphore: asyncio.Semaphore, service_seconds: float) -> None:
+        semaphore.release()
+        # 이전 이벤트 루프에서 발급된 슬롯이면 현재 카운터에는 반영하지 않음
+        if semaphore is not self._semaphore:
+            return
+
+        self._in_flight -= 1
+        IN_FLIGHT.set(self._in_flight, pipeline=self.name)
+        # 최근 처리 시간 가중 평균 (Retry-After 추정용)
+        if self._avg_service_seconds is None:
+            self._avg_service_seconds = service_seconds
+        else:
+            self._avg_service_seconds = (
+                0.8 * self._avg_service_seconds + 0.2 * service_seconds
+            )
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """with 블록 동안 실행 슬롯 점유"""
+        ticket = await self.acquire()
+        try:
+            yield
+        finally:
+            ticket.release()
+
+
+class AdmittedStream(Generic[T]):
+    """
+    실행 슬롯을 스트림 수명에 묶는 async iterator
+    스트림이 끝나거나, 실패/취소되거나, 소비되지 않고 버려져도 슬롯을 반환함
+    """
+
+    def __init__(self, iterator: AsyncIterator[T], ticket: AdmissionTicket):
+        self._iterator = iterator
+        self._ticket = ticket
+
+    def __aiter__(self) -> "AdmittedStream[T]":
+        return self
+
+    async def __anext__(self) -> T:
+        try:
+            return await self._iterator.__anext__()
+        except BaseException:
+            # StopAsyncIteration(정상 종료) / 예외 / 취소 모두 슬롯 반환
+            self._ticket.release()
+            raise
+
+    async def aclose(self) -> None:
+        self._ticket.release()
+        aclose = getattr(self._iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    def __del__(self) -> None:
+        self._ticket.release()
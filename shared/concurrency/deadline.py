@@ -0,0 +1,132 @@
+import asyncio
+import inspect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class DeadlineExceeded(TimeoutError):
+    """요청 시간 예산이 소진되었거나 클라이언트가 떠나서 단계를 중단함 (API 계층에서 504로 변환)"""
+
+    def __init__(self, stage: str, cancelled: bool = False):
+        self.stage = stage
+        self.cancelled = cancelled
+        reason = "request cancelled" if cancelled else "deadline exceeded"
+        super().__init__(f"{reason} at stage '{stage}'")
+
+
+class Deadline:
+    """
+    요청 단위 시간 예산
+    - 각 단계는 고정 타임아웃 대신 남은 시간(remaining)으로 타임아웃을 잡음
+    - cancel()은 스레드에서 실행 중인 블로킹 작업(Playwright 등)이 다음 확인 지점에서 멈추도록 알림
+    - timeout=None이면 시간 제한 없이 취소 신호만 전달
+    """
+
+    def __init__(self, timeout: Optional[float]):
+        self.expires_at = (
+            math.inf if timeout is None else time.monotonic() + max(0.0, timeout)
+        )
+        self._cancelled = threading.Event()
+
+    @classmethod
+    def at(cls, expires_at: float) -> "Deadline":
+        deadline = cls(None)
+        deadline.expires_at = expires_at
+        return deadline
+
+    def remaining(self) -> float:
+        """남은 시간(초), 제한이 없으면 inf"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def expired(self) -> bool:
+        return self.cancelled or self.remaining() <= 0
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def check(self, stage: str) -> None:
+        """예산이 남아 있지 않으면 DeadlineExceeded"""
+        if self.cancelled:
+            raise DeadlineExceeded(stage, cancelled=True)
+        if self.remaining() <= 0:
+            raise DeadlineExceeded(stage)
+
+    def timeout(self, stage: str, cap: Optional[float] = None) -> Optional[float]:
+        """단계 타임아웃(초) = min(cap, 남은 시간), 둘 다 없으면 None"""
+        self.check(stage)
+        timeout = self.remaining() if cap is None else min(cap, self.remaining())
+        return None if math.isinf(timeout) else timeout
+
+    def detached(self) -> "Deadline":
+        """같은 만료 시각, 별도 취소 신호 (여러 요청이 공유하는 작업용)"""
+        return Deadline.at(self.expires_at)
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar("deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """현재 컨텍스트의 Deadline (asyncio 태스크/asyncio.to_thread에도 전파됨)"""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """with 블록 동안 현재 Deadline 지정 (None이면 해제)"""
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def stage_timeout(stage: str, cap: Optional[float] = None) -> Optional[float]:
+    """현재 Deadline 기준 단계 타임아웃(초), Deadline이 없으면 cap 그대로"""
+    deadline = current_deadline()
+    if deadline is None:
+        return cap
+    return deadline.timeout(stage, cap)
+
+
+def stage_timeout_ms(stage: str, cap_ms: float) -> float:
+    """Playwright용 단계 타임아웃(ms) - 최소 1ms (0은 Playwright에서 '무제한')"""
+    timeout = stage_timeout(stage, cap_ms / 1000)
+    assert timeout is not None
+    return max(1.0, timeout * 1000)
+
+
+def check_deadline(stage: str) -> None:
+    """블로킹 작업의 단계 사이 확인 지점"""
+    deadline = current_deadline()
+    if deadline is not None:
+        deadline.check(stage)
+
+
+async def with_deadline(
+    awaitable: Awaitable[T], stage: str, cap: Optional[float] = None
+) -> T:
+    """남은 예산(과 cap) 안에 끝나지 않으면 작업을 취소하고 DeadlineExceeded"""
+    try:
+        timeout = stage_timeout(stage, cap)
+    except DeadlineExceeded:
+        if inspect.iscoroutine(awaitable):
+            awaitable.close()
+        raise
+
+    if timeout is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, timeout)
+    except asyncio.TimeoutError:
+        raise DeadlineExceeded(stage) from None
@@ -0,0 +1,131 @@
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from typing import Awaitable, Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    동일 키에 대한 동시 호출을 하나의 실행으로 합치는 레지스트리 (In-Process)
+    - 첫 호출자(leader)만 fn을 실행하고, 실행 중에 들어온 호출자(follower)는 같은 결과/예외를 공유
+    - 실행이 끝나면 키가 제거되므로 결과를 캐시하지 않음 (진행 중인 요청만 합침)
+    - 한 호출자가 취소되어도 공유 작업은 취소되지 않음 (asyncio.shield)
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    @property
+    def inflight(self) -> int:
+        """현재 진행 중인 키 개수"""
+        return len(self._inflight)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+
+        # 다른 이벤트 루프에서 만들어진 작업은 공유할 수 없음
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = loop.create_task(self._run(key, fn))
+            self._inflight[key] = task
+        else:
+            logger.info(f"🔗 Joining in-flight request: {key}")
+
+        return await asyncio.shield(task)
+
+    async def _run(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        try:
+            return await fn()
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+
+
+class FileLockSingleFlight(SingleFlight[T]):
+    """
+    프로세스 간(uvicorn worker 간) 요청 합치기 (같은 호스트의 파일시스템 공유 필요, POSIX 전용)
+    - 프로세스 내부는 SingleFlight로 먼저 합치고, 프로세스 대표 1건만 키별 파일 락(fcntl)을 경쟁
+    - 락을 잡은 프로세스가 fn을 실행하고 결과를 직렬화해 파일로 남김
+    - 락을 기다리던 프로세스는 대기 시작 이후에 기록된 결과가 있으면 재실행 없이 그 결과를 사용
+    - 실패(예외)는 공유하지 않으므로, 다음 락 보유자가 직접 다시 실행함
+    """
+
+    def __init__(
+        self,
+        lock_dir: str,
+        serialize: Callable[[T], str],
+        deserialize: Callable[[str], T],
+        poll_interval: float = 0.05,
+    ) -> None:
+        super().__init__()
+        self.lock_dir = lock_dir
+        self.serialize = serialize
+        self.deserialize = deserialize
+        self.poll_interval = poll_interval
+        os.makedirs(lock_dir, exist_ok=True)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        return await super().do(key, lambda: self._do_locked(key, fn))
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        base = os.path.join(self.lock_dir, digest)
+        return f"{base}.lock", f"{base}.result"
+
+    async def _do_locked(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        import fcntl
+
+        lock_path, result_path = self._paths(key)
+        started_at = time.time()
+
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            # 블로킹 flock은 취소할 수 없으므로 non-blocking 폴링으로 대기
+            waited = False
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    waited = True
+                    await asyncio.sleep(self.poll_interval)
+
+            try:
+                if waited:
+                    shared = self._read_result(result_path, since=started_at)
+                    if shared is not None:
+                        logger.info(f"🔗 Reused result from another worker: {key}")
+                        return shared
+
+                result = await fn()
+                self._write_result(result_path, result)
+                return result
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def _read_result(self, path: str, since: float) -> Optional[T]:
+        try:
+            if os.path.getmtime(path) < since:
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                return self.deserialize(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to read shared result ({path}): {e}")
+            return None
+
+    def _write_result(self, path: str, result: T) -> None:
+        # 원자적 교체로 부분 기록된 파일을 읽지 않도록 함
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.serialize(result))
+        os.replace(tmp_path, path)
@@ -54,6 +54,73 @@ class Settings(BaseSettings):
     GOOGLE_API_KEY: str | None = None
     GOOGLE_MODEL: str = "gemini-3-flash-preview"
 
+    # 요청 단위 시간 예산(초) - 게이트웨이 타임아웃(30초)보다 짧게 두어 그 전에 작업을 정리하고 504 응답
+    # 각 단계(크롤링/S3/PDF/LLM)의 타임아웃은 남은 예산에서 계산됨
+    REQUEST_DEADLINE_SECONDS: float = 28.0
+    # 공고 지원자 일괄 평가(SSE)는 지원자 수에 비례하므로 별도 예산 (미지정 시 시간 제한 없음, 연결 종료 시에만 취소)
+    BATCH_EVALUATION_DEADLINE_SECONDS: float | None = None
+
+    # 파이프라인별 동시 실행 수 / 대기열 길이 (대기열이 가득 차면 429 + Retry-After)
+    # 공고 분석은 Chromium 페이지를 쓰므로 브라우저 풀 크기에 맞춰 낮게 유지
+    JOB_ANALYSIS_MAX_CONCURRENCY: int = 2
+    JOB_ANALYSIS_MAX_QUEUE: int = 10
+    APPLICANT_EVALUATION_MAX_CONCURRENCY: int = 8
+    APPLICANT_EVALUATION_MAX_QUEUE: int = 50
+
+    # 크롤러 엔진: pool(sync Playwright + 브라우저별 전용 스레드) / async(이벤트 루프 1개 + Chromium 1개)
+    CRAWLER_ENGINE: str = "pool"
+    # async 엔진의 동시 페이지 수
+    CRAWLER_ASYNC_MAX_PAGES: int = 8
+    # 사람인/원티드는 브라우저 없이 HTTP로 먼저 시도 (검증 실패 시에만 브라우저로 폴백)
+    CRAWLER_HTTP_FAST_PATH: bool = True
+    CRAWLER_HTTP_TIMEOUT_SECONDS: float = 5.0
+    # 크롤링 원본 HTML/정제 텍스트 스냅샷 저장 (재추출용): 미지정 시 저장 안 함 / local / s3
+    CRAWL_SNAPSHOT_BACKEND: str | None = None
+    # 로컬 blob 디렉토리 겸 URL/시각 인덱스(SQLite) 위치 - s3 백엔드도 인덱스는 여기에 저장
+    CRAWL_SNAPSHOT_DIR: str = "data/crawl_snapshots"
+    CRAWL_SNAPSHOT_S3_PREFIX: str = "crawl-snapshots"
+
+    # pool 엔진의 크롤링 전용 실행기 (기본 asyncio 스레드 풀과 분리): 동시 크롤링 수 / 도메인별 동시 크롤링 수
+    CRAWLER_EXECUTOR_WORKERS: int = 4
+    CRAWLER_PER_DOMAIN_CONCURRENCY: int = 2
+    # 도메인별 circuit breaker: 차단 페이지가 연속 N번이면 cooldown 동안 크롤링하지 않음 (스냅샷이 있으면 스냅샷으로 응답)
+    CRAWLER_BREAKER_FAILURES: int = 3
+    CRAWLER_BREAKER_COOLDOWN_SECONDS: float = 120.0
+    # LLM 추출 전 크롤링 텍스트 섹션 정리 (지원 방법/복지/근무지 주소, 같은 회사 공고의 반복 소개 문구 제거)
+    JOB_TEXT_PRUNING: bool = True
+    # 사람인/원티드 공고 마크업(JSON)에서 회사명/공고명/날짜/기술 스택을 규칙으로 읽고 LLM은 나머지 필드만 추출
+    JOB_RULE_BASED_FIELDS: bool = True
+    # LLM 추출 입력 한도(토큰): 넘는 공고는 조각으로 나눠 병렬 추출 후 병합 / 조각 간 겹치는 토큰 수
+    JOB_EXTRACTION_CHUNK_TOKENS: int = 4000
+    JOB_EXTRACTION_CHUNK_OVERLAP_TOKENS: int = 200
+
+    # 크롤링용 장수명 Chromium 풀 (pool 엔진, 브라우저마다 전용 스레드 1개)
+    BROWSER_POOL_SIZE: int = 2
+    # 컨텍스트(쿠키/스토리지)는 N 페이지마다, 브라우저는 N 페이지 또는 RSS(MB) 초과 시 교체
+    BROWSER_MAX_PAGES_PER_CONTEXT: int = 20
+    BROWSER_MAX_PAGES_PER_BROWSER: int = 200
+    BROWSER_MAX_RSS_MB: float | None = 1024
+
+    # 서버 기동 후 파이프라인 모듈/클라이언트를 백그라운드에서 미리 로딩 (false면 최초 요청 시 로딩)
+    PIPELINE_PREWARM: bool = True
+
+    # 프로세스 전체의 동시 LLM 평가 호출 수 (단건/스트리밍/일괄 평가가 공유하는 예산)
+    LLM_MAX_CONCURRENCY: int = 16
+
+    # LLM 응답 캐시 (공급자/모델/파라미터 + 렌더링된 프롬프트 기준, 모든 LangChain 호출 지점 공유)
+    # false면 캐시를 조회/기록하지 않음 / PATH 미지정 시 메모리 계층만
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_PATH: str | None = "data/llm_cache.sqlite3"
+    LLM_CACHE_MEMORY_ENTRIES: int = 512
+    LLM_CACHE_TTL_SECONDS: float | None = 7 * 24 * 3600
+    LLM_CACHE_MAX_MB: float = 256
+
+    # 비동기 평가 작업(ai_eval_jobs) 워커 수 = 동시에 실행되는 평가 파이프라인 수
+    EVAL_JOB_WORKERS: int = 4
+
+    # 공고 분석 요청 합치기(single-flight) - 지정 시 같은 호스트의 uvicorn worker 간에도 합침 (파일 락 디렉토리)
+    SINGLE_FLIGHT_LOCK_DIR: str | None = None
+
     # AWS S3
     AWS_ACCESS_KEY_ID: str
     AWS_SECRET_ACCESS_KEY: str
@@ -7,7 +7,6 @@ from sqlalchemy import (
     Date,
     ForeignKey,
     Text,
-    DECIMAL,
     JSON,
     TIMESTAMP,
 )
@@ -62,6 +61,37 @@ class JobMaster(Base):
     company = relationship("Company")
 
 
+class JobPost(Base):
+    __tablename__ = "job_posts"
+
+    job_post_id = Column(BigInteger, primary_key=True, autoincrement=True)
+    job_master_id = Column(
+        BigInteger, ForeignKey("job_masters.job_master_id"), nullable=False
+    )
+    ai_job_id = Column(BigInteger, nullable=False)
+    company_id = Column(BigInteger, ForeignKey("companies.company_id"), nullable=False)
+    created_by = Column(BigInteger, ForeignKey("users.user_id"))
+    source_type = Column(String(20), nullable=False)
+    source_url = Column(String(500), nullable=False, unique=True)
+    source_url_hash = Column(String(64), nullable=False, index=True)
+    raw_company_name = Column(String(100))
+    raw_job_title = Column(String(150))
+    main_tasks = Column(JSON)
+    recruitment_status = Column(String(20), nullable=False)
+    registration_status = Column(String(20), nullable=False)
+    start_date = Column(Date)
+    end_date = Column(Date)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    updated_at = Column(
+        DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
+    )
+    deleted_at = Column(DateTime)
+    fingerprint_hash = Column(String(64), nullable=False)
+
+    job_master = relationship("JobMaster")
+    company = relationship("Company")
+
+
 class Skill(Base):
     __tablename__ = "skills"
 
@@ -167,6 +197,22 @@ class ApplicationDocumentParsed(Base):
     application_document = relationship("ApplicationDocument", back_populates="parsed")
 
 
+class AiEvalJob(Base):
+    __tablename__ = "ai_eval_jobs"
+
+    eval_job_id = Column(BigInteger, primary_key=True, autoincrement=True)
+    job_application_id = Column(
+        BigInteger, ForeignKey("job_applications.job_application_id"), nullable=False
+    )
+    requested_by = Column(BigInteger, ForeignKey("users.user_id"), nullable=False)
+    eval_type = Column(String(30), nullable=False)
+    status = Column(String(20), nullable=False)
+    error_message = Column(Text)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+
+    application = relationship("JobApplication")
+
+
 class AiApplicantEvaluation(Base):
     __tablename__ = "ai_applicant_evaluation"
 
@@ -177,14 +223,14 @@ class AiApplicantEvaluation(Base):
         nullable=False,
         unique=True,
     )
-    eval_job_id = Column(
-        BigInteger
-    )  # FK constraint to ai_eval_jobs omitted for brevity or needs Model
-    final_score = Column(Integer, nullable=False)
-    rank_percentile = Column(DECIMAL(5, 2))  # type: ignore
-    overall_strengths = Column(JSON)
-    overall_weaknesses = Column(JSON)
-    improvement_suggestions = Column(JSON)
+    overall_score = Column(Integer, nullable=False)
+    one_line_review = Column(Text, nullable=False)
+    feedback_detail = Column(Text, nullable=False)
+    comparison_scores = Column(JSON, nullable=False)  # 역량별 점수 리스트
     created_at = Column(DateTime, nullable=False, server_default=func.now())
+    updated_at = Column(
+        DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
+    )
+    deleted_at = Column(DateTime)
 
     application = relationship("JobApplication")
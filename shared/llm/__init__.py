@@ -0,0 +1,16 @@
+"""LLM Client Utilities"""
+
+from .cache import TieredLLMCache, bypass_llm_cache, cache_after_parse, get_llm_cache
+from .factory import build_chat_model
+from .tokens import TokenCounter, build_token_counter, estimate_tokens
+
+__all__ = [
+    "build_chat_model",
+    "bypass_llm_cache",
+    "cache_after_parse",
+    "get_llm_cache",
+    "TieredLLMCache",
+    "build_token_counter",
+    "estimate_tokens",
+    "TokenCounter",
+]
@@ -0,0 +1,401 @@
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
+
+from shared.config import settings
+from shared.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+CACHE_LOOKUPS = REGISTRY.counter(
+    "llm_cache_lookups_total",
+    "LLM 응답 캐시 조회 결과 (memory/disk=해당 계층 hit, miss, bypass=조회 생략)",
+    ["result"],
+)
+CACHE_EVICTIONS = REGISTRY.counter(
+    "llm_cache_evictions_total",
+    "LLM 응답 캐시 제거 항목 수 (lru=메모리 계층 초과, ttl=만료, size=디스크 용량 초과)",
+    ["reason"],
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache (accessed_at);
+"""
+
+# 요청 단위 캐시 우회 (응답은 새로 받아서 캐시를 갱신)
+_bypass: ContextVar[bool] = ContextVar("llm_cache_bypass", default=False)
+# cache_after_parse 체인 안의 기록 대기열 (파서 검증을 통과해야 캐시에 기록)
+_pending: ContextVar[Optional[List[Tuple["TieredLLMCache", str, RETURN_VAL_TYPE]]]] = (
+    ContextVar("llm_cache_pending", default=None)
+)
+
+
+@contextmanager
+def bypass_llm_cache() -> Iterator[None]:
+    """with 블록 안의 LLM 호출은 캐시를 조회하지 않음 (새 응답으로 캐시 갱신)"""
+    token = _bypass.set(True)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+@contextmanager
+def _deferred_writes() -> Iterator[List[Tuple["TieredLLMCache", str, RETURN_VAL_TYPE]]]:
+    pending: List[Tuple[TieredLLMCache, str, RETURN_VAL_TYPE]] = []
+    token = _pending.set(pending)
+    try:
+        yield pending
+    finally:
+        _pending.reset(token)
+
+
+def cache_after_parse(chain: Runnable) -> Runnable:
+    """
+    prompt | llm | parser 체인을 감싸, 파서까지 성공한 응답만 LLM 캐시에 기록
+    잘린/깨진 JSON 응답이 캐시되면 같은 입력이 TTL 동안 계속 실패하므로,
+    체인이 예외로 끝나면 이번 호출의 응답은 기록하지 않음 (다음 호출은 LLM을 다시 호출)
+    """
+
+    def invoke(input: Any, config: RunnableConfig) -> Any:
+        with _deferred_writes() as pending:
+            result = chain.invoke(input, config)
+        for cache, key, value in pending:
+            cache._store(key, value)
+        return result
+
+    async def ainvoke(input: Any, config: RunnableConfig) -> Any:
+        with _deferred_writes() as pending:
+            result = await chain.ainvoke(input, config)
+        for cache, key, value in pending:
+            await cache._astore(key, value)
+        return result
+
+    return RunnableLambda(invoke, afunc=ainvoke, name="cache_after_parse")
+
+
+def cache_key(prompt: str, llm_string: str) -> str:
+    """
+    프롬프트(렌더링된 메시지) + llm_string -> 캐시 key
+    llm_string에는 모델 클래스(공급자), 모델명, temperature, response_format/바인딩된 도구(스키마) 등
+    호출 파라미터가 모두 포함됨 (LangChain이 생성)
+    """
+    return hashlib.sha256(f"{llm_string}\0{prompt}".encode("utf-8")).hexdigest()
+
+
+def encode_generations(generations: Sequence[Generation]) -> str:
+    items = []
+    for generation in generations:
+        if isinstance(generation, ChatGeneration):
+            items.append(
+                {
+                    "message": message_to_dict(generation.message),
+                    "generation_info": generation.generation_info,
+                }
+            )
+        else:
+            items.append(
+                {"text": generation.text, "generation_info": generation.generation_info}
+            )
+    return json.dumps(items, ensure_ascii=False)
+
+
+def decode_generations(value: str) -> List[Generation]:
+    generations: List[Generation] = []
+    for item in json.loads(value):
+        if "message" in item:
+            [message] = messages_from_dict([item["message"]])
+            generations.append(
+                ChatGeneration(message=message, generation_info=item["generation_info"])
+            )
+        else:
+            generations.append(
+                Generation(text=item["text"], generation_info=item["generation_info"])
+            )
+    return generations
+
+
+class TieredLLMCache(BaseCache):
+    """
+    LangChain LLM 응답 캐시 (모든 chat model 호출 지점이 공유)
+    - 메모리 계층: 최근 사용 순 LRU (max_memory_entries)
+    - 디스크 계층: SQLite (path가 없으면 사용 안 함) - 만료(ttl_seconds)와
+      용량(max_disk_bytes, 오래 사용하지 않은 항목부터 제거) 기준으로 정리, 프로세스 재시작/uvicorn worker 간 공유
+    temperature=0 호출만 캐시한다는 가정 (같은 key면 같은 응답으로 간주)
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_memory_entries: int = 512,
+        ttl_seconds: Optional[float] = 7 * 24 * 3600,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+        prune_every: int = 100,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.max_memory_entries = max_memory_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_disk_bytes = max_disk_bytes
+        # 디스크 정리(만료/용량)는 기록 prune_every번마다 1번
+        self.prune_every = prune_every
+        self.clock = clock
+        # key -> (생성 시각, 응답)
+        self._memory: "OrderedDict[str, Tuple[float, RETURN_VAL_TYPE]]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writes = 0
+
+    # ── BaseCache ──────────────────────────────────────────
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        if _bypass.get():
+            CACHE_LOOKUPS.inc(result="bypass")
+            return None
+        key = cache_key(prompt, llm_string)
+        hit = self._lookup_memory(key)
+        return hit if hit is not None else self._lookup_disk(key)
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        key = cache_key(prompt, llm_string)
+        if not self._defer(key, return_val):
+            self._store(key, return_val)
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._memory_lock:
+            self._memory.clear()
+        if self.path is not None:
+            with self._disk_lock:
+                conn = self._connection()
+                with conn:
+                    conn.execute("DELETE FROM llm_cache")
+
+    async def alookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        if _bypass.get():
+            CACHE_LOOKUPS.inc(result="bypass")
+            return None
+        key = cache_key(prompt, llm_string)
+        # 메모리 계층은 이벤트 루프에서, SQLite는 스레드에서
+        hit = self._lookup_memory(key)
+        if hit is not None or self.path is None:
+            return hit if hit is not None else self._miss()
+        return await asyncio.to_thread(self._lookup_disk, key)
+
+    async def aupdate(
+        self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE
+    ) -> None:
+        key = cache_key(prompt, llm_string)
+        if not self._defer(key, return_val):
+            await self._astore(key, return_val)
+
+    async def aclear(self, **kwargs: Any) -> None:
+        await asyncio.to_thread(self.clear)
+
+    def close(self) -> None:
+        with self._disk_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ── 기록 ───────────────────────────────────────────────
+
+    def _defer(self, key: str, value: RETURN_VAL_TYPE) -> bool:
+        """cache_after_parse 체인 안이면 기록을 미룸 (파서 성공 후 기록)"""
+        pending = _pending.get()
+        if pending is None:
+            return False
+        pending.append((self, key, value))
+        return True
+
+    def _store(self, key: str, value: RETURN_VAL_TYPE) -> None:
+        self._update_memory(key, value)
+        self._update_disk(key, value)
+
+    async def _astore(self, key: str, value: RETURN_VAL_TYPE) -> None:
+        self._update_memory(key, value)
+        if self.path is not None:
+            await asyncio.to_thread(self._update_disk, key, value)
+
+    # ── 메모리 계층 ────────────────────────────────────────
+
+    def _expired(self, created_at: float) -> bool:
+        return (
+            self.ttl_seconds is not None
+            and self.clock() - created_at > self.ttl_seconds
+        )
+
+    def _lookup_memory(self, key: str) -> Optional[RETURN_VAL_TYPE]:
+        with self._memory_lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            created_at, value = entry
+            if self._expired(created_at):
+                del self._memory[key]
+                CACHE_EVICTIONS.inc(reason="ttl")
+                return None
+            self._memory.move_to_end(key)
+        CACHE_LOOKUPS.inc(result="memory")
+        return value
+
+    def _update_memory(
+        self, key: str, value: RETURN_VAL_TYPE, created_at: Optional[float] = None
+    ) -> None:
+        with self._memory_lock:
+            self._memory[key] = (
+                created_at if created_at is not None else self.clock(),
+                value,
+            )
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+                CACHE_EVICTIONS.inc(reason="lru")
+
+    def _miss(self) -> None:
+        CACHE_LOOKUPS.inc(result="miss")
+        return None
+
+    # ── 디스크 계층 (Blocking) ─────────────────────────────
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+            # 여러 uvicorn worker가 같은 캐시 파일을 공유
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _lookup_disk(self, key: str) -> Optional[RETURN_VAL_TYPE]:
+        if self.path is None:
+            return self._miss()
+        try:
+            with self._disk_lock:
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and self._expired(row[1]):
+                    with conn:
+                        conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    CACHE_EVICTIONS.inc(reason="ttl")
+                    row = None
+                elif row is not None:
+                    with conn:
+                        conn.execute(
+                            "UPDATE llm_cache SET accessed_at = ? WHERE key = ?",
+                            (self.clock(), key),
+                        )
+            if row is None:
+                return self._miss()
+            value = decode_generations(row[0])
+        except (sqlite3.Error, ValueError, KeyError) as e:
+            # 캐시 장애는 LLM 호출로 대체 (응답 실패로 만들지 않음)
+            logger.warning(f"⚠️ LLM cache lookup failed: {e}")
+            return self._miss()
+
+        CACHE_LOOKUPS.inc(result="disk")
+        # 다음 조회는 메모리 계층에서 (만료 시각은 디스크 항목 기준 유지)
+        self._update_memory(key, value, created_at=row[1])
+        return value
+
+    def _update_disk(self, key: str, value: RETURN_VAL_TYPE) -> None:
+        if self.path is None:
+            return
+        try:
+            encoded = encode_generations(value)
+            now = self.clock()
+            with self._disk_lock:
+                conn = self._connection()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO llm_cache "
+                        "(key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                        (key, encoded, len(encoded.encode("utf-8")), now, now),
+                    )
+                self._writes += 1
+                if self._writes % self.prune_every == 0:
+                    self._prune(conn)
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"⚠️ LLM cache update failed: {e}")
+
+    def _prune(self, conn: sqlite3.Connection) -> Dict[str, int]:
+        """만료 항목 삭제 후, 전체 크기가 max_disk_bytes 이하가 될 때까지 오래 사용하지 않은 항목부터 삭제"""
+        removed = {"ttl": 0, "size": 0}
+        with conn:
+            if self.ttl_seconds is not None:
+                removed["ttl"] = conn.execute(
+                    "DELETE FROM llm_cache WHERE created_at < ?",
+                    (self.clock() - self.ttl_seconds,),
+                ).rowcount
+            total = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM llm_cache"
+            ).fetchone()[0]
+            if total > self.max_disk_bytes:
+                excess = total - self.max_disk_bytes
+                freed = 0
+                victims = []
+                for key, size in conn.execute(
+                    "SELECT key, size FROM llm_cache ORDER BY accessed_at"
+                ):
+                    if freed >= excess:
+                        break
+                    victims.append((key,))
+                    freed += size
+                conn.executemany("DELETE FROM llm_cache WHERE key = ?", victims)
+                removed["size"] = len(victims)
+        for reason, count in removed.items():
+            if count:
+                CACHE_EVICTIONS.inc(count, reason=reason)
+        if any(removed.values()):
+            logger.info(f"🧹 LLM cache pruned ({removed})")
+        return removed
+
+
+_cache: Optional[TieredLLMCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[TieredLLMCache]:
+    """
+    프로세스 전체가 공유하는 LLM 응답 캐시 (LLM_CACHE_ENABLED=false면 None)
+    chat model 생성 시 cache=로 전달
+    """
+    global _cache
+    if not getattr(settings, "LLM_CACHE_ENABLED", True):
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = TieredLLMCache(
+                path=settings.LLM_CACHE_PATH,
+                max_memory_entries=settings.LLM_CACHE_MEMORY_ENTRIES,
+                ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+                max_disk_bytes=int(settings.LLM_CACHE_MAX_MB * 1024 * 1024),
+            )
+            logger.info(
+                f"🗃️ LLM response cache initialized ({settings.LLM_CACHE_PATH or 'memory only'})"
+            )
+    return _cache
@@ -0,0 +1,44 @@
+import logging
+
+from langchain_core.language_models import BaseChatModel
+
+from shared.config import settings
+from .cache import get_llm_cache
+
+logger = logging.getLogger(__name__)
+
+
+def build_chat_model() -> BaseChatModel:
+    """
+    설정(LLM_PROVIDER)에 따라 Chat 모델 클라이언트 생성
+    내부에 HTTP 커넥션 풀을 가지므로 요청마다 만들지 말고 애플리케이션 수명 동안 재사용해야 함
+    응답은 프로세스 공유 LLM 캐시(get_llm_cache)에 기록되어 같은 프롬프트는 다시 호출하지 않음
+    """
+    if getattr(settings, "LLM_PROVIDER", "openai") == "gemini":
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        model = getattr(settings, "GOOGLE_MODEL", "gemini-3-flash-preview")
+        logger.info(f"🤖 Initializing chat model with gemini ({model})")
+
+        return ChatGoogleGenerativeAI(
+            model=model,
+            google_api_key=settings.GOOGLE_API_KEY,
+            temperature=0,
+            cache=get_llm_cache(),
+        )
+
+    from langchain_openai import ChatOpenAI
+    from pydantic import SecretStr
+
+    model = getattr(settings, "OPENAI_MODEL", "gpt-4o-mini")
+    logger.info(f"🤖 Initializing chat model with OpenAI ({model})")
+
+    return ChatOpenAI(
+        model=model,
+        temperature=0,
+        api_key=(
+            SecretStr(settings.OPENAI_API_KEY) if settings.OPENAI_API_KEY else None
+        ),
+        model_kwargs={"response_format": {"type": "json_object"}},
+        cache=get_llm_cache(),
+    )
@@ -0,0 +1,57 @@
+import logging
+import re
+from typing import Callable, Optional
+
+from shared.config import settings
+
+logger = logging.getLogger(__name__)
+
+TokenCounter = Callable[[str], int]
+
+# 모델 이름으로 인코딩을 찾지 못할 때 (Gemini 등) 사용하는 인코딩 - 근사치
+DEFAULT_ENCODING = "o200k_base"
+
+_HANGUL = re.compile(r"[가-힣ㄱ-ㅎㅏ-ㅣ]")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    LLM 입력 토큰 수 근사치 (토크나이저 없이)
+    한글은 음절당 약 1토큰, 그 외 문자는 약 4자당 1토큰으로 계산
+    """
+    hangul = len(_HANGUL.findall(text))
+    return hangul + (len(text) - hangul + 3) // 4
+
+
+def build_token_counter(model: Optional[str] = None) -> TokenCounter:
+    """
+    설정된 LLM 모델의 tiktoken 인코딩으로 토큰 수를 세는 함수 생성
+    인코딩 파일은 최초 1회 내려받으므로(TIKTOKEN_CACHE_DIR로 캐시 위치 지정 가능)
+    애플리케이션 수명 동안 재사용해야 하며, 불러오지 못하면 estimate_tokens로 대체
+    """
+    if model is None and getattr(settings, "LLM_PROVIDER", "openai") == "openai":
+        model = getattr(settings, "OPENAI_MODEL", None)
+
+    try:
+        import tiktoken
+
+        try:
+            encoding = (
+                tiktoken.encoding_for_model(model)
+                if model
+                else tiktoken.get_encoding(DEFAULT_ENCODING)
+            )
+        except KeyError:
+            encoding = tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception as e:
+        logger.warning(
+            f"⚠️ tiktoken encoding unavailable ({e}). Using approximate token counts."
+        )
+        return estimate_tokens
+
+    logger.info(f"🔢 Token counter initialized with {encoding.name}")
+
+    def count_tokens(text: str) -> int:
+        return len(encoding.encode(text, disallowed_special=()))
+
+    return count_tokens
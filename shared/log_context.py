@@ -0,0 +1,34 @@
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+# 요청 단위 식별자 (asyncio 태스크/asyncio.to_thread에도 전파되어 크롤러 스레드 로그에도 남음)
+_request_id: ContextVar[str] = ContextVar("request_id", default="-")
+
+
+def current_request_id() -> str:
+    return _request_id.get()
+
+
+@contextmanager
+def request_id_scope(request_id: str) -> Iterator[str]:
+    """with 블록 동안 현재 요청 ID 지정"""
+    token = _request_id.set(request_id)
+    try:
+        yield request_id
+    finally:
+        _request_id.reset(token)
+
+
+class RequestContextFilter(logging.Filter):
+    """
+    LogRecord에 request_id 부여
+    로그를 남긴 쪽(이벤트 루프/워커 스레드)의 컨텍스트에서 실행되어야 하므로
+    QueueHandler 처럼 기록 시점에 동작하는 핸들러에 붙여야 함
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "request_id"):
+            record.request_id = _request_id.get()
+        return True
@@ -0,0 +1,34 @@
+"""In-Process Metrics (Prometheus Text Exposition)"""
+
+from .registry import (
+    DEFAULT_BUCKETS,
+    REGISTRY,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+)
+from .stages import (
+    DB_QUERY_SECONDS,
+    STAGE_SECONDS,
+    observe_stage,
+    time_stage,
+    timed_query,
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "REGISTRY",
+    "PROMETHEUS_CONTENT_TYPE",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "DB_QUERY_SECONDS",
+    "STAGE_SECONDS",
+    "observe_stage",
+    "time_stage",
+    "timed_query",
+]
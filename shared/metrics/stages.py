@@ -0,0 +1,61 @@
+import functools
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Iterator, TypeVar
+
+from .registry import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "pipeline_stage_seconds",
+    "파이프라인 단계별 소요 시간(초)",
+    ["pipeline", "stage"],
+)
+DB_QUERY_SECONDS = REGISTRY.histogram(
+    "db_query_seconds",
+    "저장소 메서드별 DB 조회/저장 소요 시간(초)",
+    ["repository", "method"],
+)
+
+
+@contextmanager
+def time_stage(pipeline: str, stage: str) -> Iterator[None]:
+    """with 블록을 파이프라인 단계 시간으로 기록 (스레드/이벤트 루프 어디서든 사용 가능, 예외가 나도 기록)"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(pipeline, stage, time.perf_counter() - started)
+
+
+def observe_stage(pipeline: str, stage: str, seconds: float) -> None:
+    """
+    이미 측정한 단계 시간을 기록 (with 블록으로 감싸기 어려운 구간용)
+    DEBUG 레벨이면 request_id와 함께 구조화 로그로도 남김
+    """
+    STAGE_SECONDS.observe(seconds, pipeline=pipeline, stage=stage)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "stage finished",
+            extra={
+                "stage": f"{pipeline}.{stage}",
+                "elapsed_ms": round(seconds * 1000, 1),
+            },
+        )
+
+
+def timed_query(method: F) -> F:
+    """저장소(async) 메서드 데코레이터 - 라벨은 클래스명/메서드명"""
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        with DB_QUERY_SECONDS.time(
+            repository=type(self).__name__, method=method.__name__
+        ):
+            return await method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
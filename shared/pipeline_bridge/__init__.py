@@ -1,17 +1,29 @@
 from .interface import (
     call_applicant_evaluation,
+    call_applicant_evaluation_batch_stream,
+    call_applicant_evaluation_status,
+    call_applicant_evaluation_stream,
+    call_applicant_evaluation_submit,
     call_candidate_comparison,
     call_job_analysis,
     call_job_deletion,
     call_portfolio_analysis,
     call_resume_analysis,
+    shutdown_pipelines,
+    startup_pipelines,
 )
 
 __all__ = [
     "call_job_analysis",
     "call_resume_analysis",
     "call_applicant_evaluation",
+    "call_applicant_evaluation_stream",
+    "call_applicant_evaluation_batch_stream",
+    "call_applicant_evaluation_submit",
+    "call_applicant_evaluation_status",
     "call_candidate_comparison",
     "call_portfolio_analysis",
     "call_job_deletion",
+    "startup_pipelines",
+    "shutdown_pipelines",
 ]
@@ -1,8 +1,17 @@
+import asyncio
+from typing import AsyncIterator, Dict, Optional
+
+from shared.concurrency import AdmissionController, AdmittedStream
+
 from shared.schema.applicant import (
+    BatchEvaluateRequest,
     CompareRequest,
     CompareResponse,
+    EvaluateJobStatusResponse,
+    EvaluateJobSubmitResponse,
     EvaluateRequest,
     EvaluateResponse,
+    EvaluateStreamEvent,
 )
 from shared.schema.document import (
     PortfolioAnalyzeRequest,
@@ -15,39 +24,146 @@ from shared.schema.job_posting import (
     JobPostingAnalyzeResponse,
     JobPostingDeleteResponse,
 )
-from applicant_evaluation.main import run_pipeline as run_applicant_evaluation
-from candidate_comparison.main import run_pipeline as run_candidate_comparison
-from job_analysis.main import (
-    run_pipeline as run_job_analysis,
-    delete_pipeline as delete_job_analysis,
+from .registry import PipelineRegistry
+
+# 파이프라인 모듈은 최초 호출(또는 prewarm) 시점에 import (API cold start 단축)
+registry = PipelineRegistry(
+    {
+        "job_analysis": "job_analysis.main",
+        "applicant_evaluation": "applicant_evaluation.main",
+        "candidate_comparison": "candidate_comparison.main",
+        "portfolio_analysis": "portfolio_analysis.main",
+        "resume_analysis": "resume_analysis.main",
+    }
 )
-from portfolio_analysis.main import run_pipeline as run_portfolio_analysis
-from resume_analysis.main import run_pipeline as run_resume_analysis
+
+_prewarm_task: Optional[asyncio.Task] = None
+
+# 파이프라인별 실행 슬롯 + 대기열 (대기열 초과 시 AdmissionRejected -> 429)
+_admissions: Dict[str, AdmissionController] = {}
+
+
+def _admission_for(name: str) -> AdmissionController:
+    controller = _admissions.get(name)
+    if controller is None:
+        from shared.config import settings
+
+        prefix = name.upper()
+        controller = AdmissionController(
+            name,
+            max_concurrency=getattr(settings, f"{prefix}_MAX_CONCURRENCY"),
+            max_queue=getattr(settings, f"{prefix}_MAX_QUEUE"),
+        )
+        _admissions[name] = controller
+    return controller
+
+
+def startup_pipelines() -> None:
+    """
+    파이프라인 모듈 import + 장수명 의존성 초기화를 백그라운드에서 시작 (FastAPI lifespan)
+    기동(readiness)을 막지 않으며, prewarm 전에 들어온 요청은 해당 파이프라인만 즉시 로딩
+    """
+    global _prewarm_task
+    from shared.config import settings
+
+    if settings.PIPELINE_PREWARM:
+        _prewarm_task = asyncio.get_running_loop().create_task(registry.prewarm())
+
+
+async def shutdown_pipelines() -> None:
+    """진행 중인 prewarm 취소 후, 로딩된 파이프라인의 워커/의존성 정리"""
+    global _prewarm_task
+    if _prewarm_task is not None:
+        _prewarm_task.cancel()
+        await asyncio.gather(_prewarm_task, return_exceptions=True)
+        _prewarm_task = None
+    await registry.shutdown()
 
 
 async def call_job_analysis(
     request: JobPostingAnalyzeRequest,
 ) -> JobPostingAnalyzeResponse:
-    return await run_job_analysis(request)
+    async with _admission_for("job_analysis").admit():
+        run_pipeline = await registry.aentrypoint("job_analysis", "run_pipeline")
+        return await run_pipeline(request)
 
 
 async def call_job_deletion(job_posting_id: int) -> JobPostingDeleteResponse:
-    return await delete_job_analysis(job_posting_id)
+    delete_pipeline = await registry.aentrypoint("job_analysis", "delete_pipeline")
+    return await delete_pipeline(job_posting_id)
 
 
 async def call_resume_analysis(request: ResumeAnalyzeRequest) -> ResumeAnalyzeResponse:
-    return await run_resume_analysis(request)
+    run_pipeline = await registry.aentrypoint("resume_analysis", "run_pipeline")
+    return await run_pipeline(request)
 
 
 async def call_applicant_evaluation(request: EvaluateRequest) -> EvaluateResponse:
-    return await run_applicant_evaluation(request)
+    async with _admission_for("applicant_evaluation").admit():
+        run_pipeline = await registry.aentrypoint(
+            "applicant_evaluation", "run_pipeline"
+        )
+        return await run_pipeline(request)
+
+
+async def call_applicant_evaluation_stream(
+    request: EvaluateRequest,
+) -> AsyncIterator[EvaluateStreamEvent]:
+    """
+    실행 슬롯을 먼저 확보한 뒤 스트림 반환 (응답 시작 전에 429 판단)
+    슬롯은 스트림이 끝나거나 끊길 때 반환됨
+    """
+    ticket = await _admission_for("applicant_evaluation").acquire()
+    try:
+        stream_pipeline = await registry.aentrypoint(
+            "applicant_evaluation", "stream_pipeline"
+        )
+    except BaseException:
+        ticket.release()
+        raise
+    return AdmittedStream(stream_pipeline(request), ticket)
+
+
+async def call_applicant_evaluation_batch_stream(
+    request: BatchEvaluateRequest,
+) -> AsyncIterator[EvaluateStreamEvent]:
+    """배치 평가 1건 = 실행 슬롯 1개 (내부 LLM 동시성은 LLM_MAX_CONCURRENCY로 별도 제한)"""
+    ticket = await _admission_for("applicant_evaluation").acquire()
+    try:
+        batch_stream_pipeline = await registry.aentrypoint(
+            "applicant_evaluation", "batch_stream_pipeline"
+        )
+    except BaseException:
+        ticket.release()
+        raise
+    return AdmittedStream(batch_stream_pipeline(request), ticket)
+
+
+async def call_applicant_evaluation_submit(
+    request: EvaluateRequest,
+) -> Optional[EvaluateJobSubmitResponse]:
+    submit_pipeline = await registry.aentrypoint(
+        "applicant_evaluation", "submit_pipeline"
+    )
+    return await submit_pipeline(request)
+
+
+async def call_applicant_evaluation_status(
+    eval_job_id: int,
+) -> Optional[EvaluateJobStatusResponse]:
+    get_job_pipeline = await registry.aentrypoint(
+        "applicant_evaluation", "get_job_pipeline"
+    )
+    return await get_job_pipeline(eval_job_id)
 
 
 async def call_candidate_comparison(request: CompareRequest) -> CompareResponse:
-    return await run_candidate_comparison(request)
+    run_pipeline = await registry.aentrypoint("candidate_comparison", "run_pipeline")
+    return await run_pipeline(request)
 
 
 async def call_portfolio_analysis(
     request: PortfolioAnalyzeRequest,
 ) -> PortfolioAnalyzeResponse:
-    return await run_portfolio_analysis(request)
+    run_pipeline = await registry.aentrypoint("portfolio_analysis", "run_pipeline")
+    return await run_pipeline(request)
@@ -0,0 +1,103 @@
+import asyncio
+import importlib
+import inspect
+import logging
+import threading
+import time
+from types import ModuleType
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PipelineRegistry:
+    """
+    파이프라인 진입점(main 모듈) 지연 로딩 레지스트리
+    - API 프로세스 import 시점에는 파이프라인 스택(Playwright, LangChain, boto3 등)을 불러오지 않음
+    - 최초 호출 시점에 모듈을 import 하고 캐시함
+    - prewarm()으로 서버 기동 후 백그라운드에서 미리 로딩 가능 (readiness를 막지 않음)
+    - 이벤트 루프에서는 aresolve()/aentrypoint() 사용 (import 대기를 스레드에서 처리)
+    """
+
+    def __init__(self, modules: Dict[str, str]):
+        # 파이프라인 이름 -> 모듈 경로 (예: "job_analysis" -> "job_analysis.main")
+        self.modules = dict(modules)
+        self._loaded: Dict[str, ModuleType] = {}
+        # 파이프라인별 import 락 (서로 다른 파이프라인의 로딩은 직렬화하지 않음)
+        self._locks: Dict[str, threading.Lock] = {
+            name: threading.Lock() for name in self.modules
+        }
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.modules)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._loaded
+
+    def resolve(self, name: str) -> ModuleType:
+        """
+        파이프라인 모듈 반환 (처음이면 import, Blocking)
+        다른 스레드(prewarm)가 같은 파이프라인을 import 중이면 끝날 때까지 대기
+        """
+        module = self._loaded.get(name)
+        if module is not None:
+            return module
+
+        if name not in self.modules:
+            raise KeyError(f"Unknown pipeline: {name}")
+
+        # 요청 스레드와 prewarm 스레드가 동시에 import 하지 않도록 직렬화
+        with self._locks[name]:
+            module = self._loaded.get(name)
+            if module is None:
+                started = time.perf_counter()
+                module = importlib.import_module(self.modules[name])
+                self._loaded[name] = module
+                elapsed = (time.perf_counter() - started) * 1000
+                logger.info(f"📦 Pipeline loaded: {name} ({elapsed:.0f} ms)")
+        return module
+
+    async def aresolve(self, name: str) -> ModuleType:
+        """
+        이벤트 루프용 resolve: 로딩된 모듈은 바로 반환하고,
+        import(또는 prewarm의 import 대기)는 스레드에서 처리해 루프를 막지 않음
+        """
+        module = self._loaded.get(name)
+        if module is not None:
+            return module
+        return await asyncio.to_thread(self.resolve, name)
+
+    def entrypoint(self, name: str, attr: str) -> Any:
+        """파이프라인 모듈의 진입점 함수 반환 (Blocking)"""
+        return getattr(self.resolve(name), attr)
+
+    async def aentrypoint(self, name: str, attr: str) -> Any:
+        """파이프라인 모듈의 진입점 함수 반환 (이벤트 루프용)"""
+        return getattr(await self.aresolve(name), attr)
+
+    async def prewarm(self, names: Optional[Iterable[str]] = None) -> None:
+        """
+        파이프라인 모듈을 백그라운드 스레드에서 미리 import 하고,
+        startup 훅이 있으면 실행 (장수명 클라이언트 초기화, 코루틴 훅은 이벤트 루프에서 실행)
+        """
+        for name in list(names) if names is not None else self.names:
+            try:
+                module = await asyncio.to_thread(self.resolve, name)
+                startup = getattr(module, "startup", None)
+                if inspect.iscoroutinefunction(startup):
+                    # 이벤트 루프에 붙는 초기화 (백그라운드 워커 기동 등)
+                    await startup()
+                elif startup is not None:
+                    await asyncio.to_thread(startup)
+            except Exception as e:
+                # 실패해도 최초 요청 시 다시 시도되므로 서버 기동은 계속
+                logger.error(f"❌ Pipeline prewarm failed: {name} ({e})", exc_info=True)
+
+    async def shutdown(self) -> None:
+        """로딩된 파이프라인에 한해 shutdown 훅 실행"""
+        for name in self.names:
+            module = self._loaded.get(name)
+            shutdown = getattr(module, "shutdown", None) if module else None
+            if shutdown is not None:
+                await shutdown()
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -24,6 +24,52 @@ class EvaluateResponse(BaseModel):
     feedback_detail: str = Field(..., description="상세 피드백 (강점 및 보완점 통합)")
 
 
+class EvaluateJobSubmitResponse(BaseModel):
+    eval_job_id: int = Field(..., description="비동기 평가 작업 ID")
+    status: str = Field(..., description="작업 상태 (PENDING/RUNNING/COMPLETED/FAILED)")
+
+
+class EvaluateJobStatusResponse(BaseModel):
+    eval_job_id: int = Field(..., description="비동기 평가 작업 ID")
+    status: str = Field(..., description="작업 상태 (PENDING/RUNNING/COMPLETED/FAILED)")
+    result: Optional[EvaluateResponse] = Field(
+        default=None, description="평가 결과 (COMPLETED 상태에서만 존재)"
+    )
+    error_message: Optional[str] = Field(
+        default=None, description="실패 사유 (FAILED 상태에서만 존재)"
+    )
+
+
+class EvaluateStreamEvent(BaseModel):
+    event: str = Field(
+        ...,
+        description="이벤트 종류 (competency / feedback / result / applicant / summary / error)",
+    )
+    data: Dict[str, Any] = Field(
+        ...,
+        description="이벤트 데이터 (competency: CompetencyScore, feedback: 종합 평가, result: EvaluateResponse, applicant: BatchEvaluateItem, summary: BatchEvaluateSummary)",
+    )
+
+
+class BatchEvaluateRequest(BaseModel):
+    job_posting_id: str = Field(..., description="일괄 평가할 채용 공고 ID")
+
+
+class BatchEvaluateItem(BaseModel):
+    user_id: str = Field(..., description="지원자(사용자) ID")
+    job_application_id: int = Field(..., description="지원 내역 ID")
+    result: Optional[EvaluateResponse] = Field(
+        default=None, description="평가 결과 (성공 시)"
+    )
+    error_message: Optional[str] = Field(default=None, description="실패 사유")
+
+
+class BatchEvaluateSummary(BaseModel):
+    total: int = Field(..., description="평가 대상 지원자 수")
+    succeeded: int = Field(..., description="평가 및 저장 성공 수")
+    failed: int = Field(..., description="실패 수")
+
+
 # 3.3 지원자 비교
 class CompareRequest(BaseModel):
     job_posting_id: str = Field(..., description="비교 기준이 되는 채용 공고 ID")
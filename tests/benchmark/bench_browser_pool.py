@@ -0,0 +1,114 @@
+"""
+브라우저 풀 벤치마크: fetch마다 Chromium 실행(cold) vs 장수명 브라우저 재사용(pooled)
+
+- cold  : 기존 방식 재현 - fetch마다 새 BrowserPool(=새 Playwright 드라이버 + Chromium)을 띄우고 닫음
+- pooled: 하나의 BrowserPool로 모든 fetch 처리 (새 페이지 열기/닫기만)
+
+네트워크 영향을 없애기 위해 로컬 HTML 파일(file://)을 DefaultCrawler로 읽습니다.
+Chromium이 설치되어 있어야 합니다 (playwright install chromium).
+
+실행:
+    PYTHONPATH=.:pipelines python tests/benchmark/bench_browser_pool.py [--runs 20] [--pool-size 2]
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from job_analysis.infrastructure.adapters.crawling.browser_pool import BrowserPool
+from job_analysis.infrastructure.adapters.crawling.strategies.default import (
+    DefaultCrawler,
+)
+
+FIXTURE_HTML = """<!doctype html>
+<html lang="ko"><head><title>백엔드 개발자 채용</title></head>
+<body>
+  <h1>백엔드 개발자 (Python)</h1>
+  <section><h2>주요 업무</h2><ul>{items}</ul></section>
+</body></html>
+"""
+
+
+def _write_fixtures(directory: Path, count: int) -> List[str]:
+    urls = []
+    for i in range(count):
+        items = "".join(f"<li>업무 {i}-{j}</li>" for j in range(50))
+        path = directory / f"job_{i}.html"
+        path.write_text(FIXTURE_HTML.format(items=items), encoding="utf-8")
+        urls.append(path.as_uri())
+    return urls
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    samples = sorted(samples)
+    return {
+        "p50_ms": statistics.median(samples) * 1000,
+        "p95_ms": samples[max(0, int(len(samples) * 0.95) - 1)] * 1000,
+        "total_s": sum(samples),
+    }
+
+
+def bench_cold(urls: List[str], headless: bool) -> Dict[str, float]:
+    samples = []
+    for url in urls:
+        started = time.perf_counter()
+        pool = BrowserPool(size=1, headless=headless)
+        try:
+            DefaultCrawler(pool).fetch(url)
+        finally:
+            pool.close()
+        samples.append(time.perf_counter() - started)
+    return _summary(samples)
+
+
+def bench_pooled(urls: List[str], headless: bool, size: int) -> Dict[str, float]:
+    pool = BrowserPool(size=size, headless=headless)
+    crawler = DefaultCrawler(pool)
+    try:
+        # 첫 실행(브라우저 기동)은 서버 기동 시 1회 비용이므로 워밍업으로 분리
+        warmup_started = time.perf_counter()
+        crawler.fetch(urls[0])
+        warmup = time.perf_counter() - warmup_started
+
+        samples = []
+        for url in urls:
+            started = time.perf_counter()
+            crawler.fetch(url)
+            samples.append(time.perf_counter() - started)
+    finally:
+        pool.close()
+
+    result = _summary(samples)
+    result["warmup_ms"] = warmup * 1000
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--pool-size", type=int, default=2)
+    parser.add_argument("--headful", action="store_true")
+    args = parser.parse_args()
+    headless = not args.headful
+
+    with tempfile.TemporaryDirectory() as tmp:
+        urls = _write_fixtures(Path(tmp), args.runs)
+        results = {
+            "cold": bench_cold(urls, headless),
+            "pooled": bench_pooled(urls, headless, args.pool_size),
+        }
+
+    print(f"{args.runs} fetches (file://), headless={headless}")
+    for label, r in results.items():
+        warmup = f" | warmup {r['warmup_ms']:7.1f} ms" if "warmup_ms" in r else ""
+        print(
+            f"{label:<7} p50 {r['p50_ms']:7.1f} ms | p95 {r['p95_ms']:7.1f} ms"
+            f" | total {r['total_s']:6.2f} s{warmup}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+사이트별 DOM 추출 벤치마크: 섹션마다 locator 호출(legacy) vs 추출 스크립트 page.evaluate 1번(script)
+
+- legacy: 섹션마다 count() + inner_html(), 사람인 본문은 iframe handle/frame/locator 호출 추가,
+          원티드 "더보기"는 click() + wait_for(hidden) - 이전 SaraminCrawler/WantedCrawler 구현 재현
+- script: 현재 SaraminCrawler/WantedCrawler._parse_page (추출 스크립트 1회)
+
+각 방식의 브라우저 왕복 수(await 되는 Playwright 호출 수)와 파싱 지연을 비교합니다.
+네트워크 영향을 없애기 위해 사이트 URL을 route로 가로채 픽스처 HTML을 응답합니다.
+Chromium이 설치되어 있어야 합니다 (playwright install chromium).
+
+실행:
+    PYTHONPATH=.:pipelines python tests/benchmark/bench_dom_extraction.py [--runs 30]
+"""
+
+import argparse
+import asyncio
+import inspect
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+from playwright.async_api import Page, Route, async_playwright
+
+from job_analysis.infrastructure.adapters.crawling.base import clean_html
+from job_analysis.infrastructure.adapters.crawling.strategies.saramin import (
+    SaraminCrawler,
+)
+from job_analysis.infrastructure.adapters.crawling.strategies.wanted import (
+    WantedCrawler,
+)
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "data" / "job_posting"
+
+SARAMIN_URL = "https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=52069064"
+WANTED_URL = "https://www.wanted.co.kr/wd/330563"
+
+# 렌더링된 원티드 공고 DOM ("더보기" 클릭 시 버튼이 사라지고 전체 본문 표시)
+WANTED_HTML = """<!doctype html>
+<html lang="ko"><head><meta charset="utf-8"><title>Product Designer | 원티드</title></head>
+<body>
+<div class="JobContent_JobContent__Qb6DR">
+  <header class="JobHeader_JobHeader__TZkW3"><h1>Product Designer (그로스)</h1><a>컬리</a></header>
+  <div class="JobContent_descriptionWrapper__RMlfm">
+    <section class="JobDescription_JobDescription__s2Keo">
+      <div class="JobDescription_JobDescription__paragraph__wrapper__WPrKC">
+        <p>주요업무</p>{items}
+        <div id="more" hidden>{more}</div>
+        <button onclick="document.getElementById('more').hidden = false; this.remove();">상세정보 더보기</button>
+      </div>
+    </section>
+    <article class="JobDueTime_JobDueTime__yvhtg"><h2>마감일</h2><span>상시채용</span></article>
+    <section class="JobWorkPlace_JobWorkPlace__xPlGe">
+      <div class="JobWorkPlace_JobWorkPlace__map__24PDM">
+        <span class="JobWorkPlace_JobWorkPlace__map__location__6pp2d">서울 강남구 도산대로 16길 20</span>
+      </div>
+    </section>
+  </div>
+</div>
+</body></html>
+"""
+
+
+class CountingProxy:
+    """Playwright 객체 래퍼 - await 되는 메서드 호출(브라우저 왕복) 수를 셈"""
+
+    def __init__(self, target: Any, counter: List[int]):
+        self._target = target
+        self._counter = counter
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._target, name)
+        if inspect.iscoroutinefunction(value):
+
+            async def call(*args: Any, **kwargs: Any) -> Any:
+                self._counter[0] += 1
+                return self._wrap(await value(*args, **kwargs))
+
+            return call
+        if callable(value):
+            return lambda *args, **kwargs: self._wrap(value(*args, **kwargs))
+        return self._wrap(value)
+
+    def _wrap(self, value: Any) -> Any:
+        if type(value).__name__ in {"Locator", "Frame", "ElementHandle"}:
+            return CountingProxy(value, self._counter)
+        return value
+
+
+# ── legacy: 섹션별 locator 호출 ───────────────────────────
+
+
+async def _legacy_section(page: Any, selector: str) -> str:
+    if await page.locator(selector).count() > 0:
+        return clean_html(await page.locator(selector).inner_html())
+    return ""
+
+
+async def legacy_saramin(page: Any) -> str:
+    root = SaraminCrawler._ROOT
+    await page.wait_for_selector(root, timeout=5000)
+    sections = [await _legacy_section(page, f"{root} .wrap_jv_header")]
+    sections.append(await _legacy_section(page, f"{root} .jv_cont.jv_summary"))
+
+    cont = f"{root} .jv_cont.jv_detail .cont"
+    detail = ""
+    if await page.locator(cont).count() > 0:
+        iframe = page.locator(f"{cont} iframe").first
+        if await iframe.count() > 0:
+            frame = await (await iframe.element_handle()).content_frame()
+            await frame.wait_for_load_state("domcontentloaded", timeout=5000)
+            if await frame.locator(".user_content").count() > 0:
+                detail = clean_html(await frame.locator(".user_content").inner_html())
+            else:
+                detail = clean_html(await frame.locator("body").inner_html())
+        else:
+            detail = clean_html(await page.locator(cont).inner_html())
+    sections.append(detail)
+    sections.append(await _legacy_section(page, f"{root} .jv_cont.jv_howto"))
+    return "\n\n".join(s for s in sections if s)
+
+
+async def legacy_wanted(page: Any) -> str:
+    root, wrapper = WantedCrawler._ROOT, WantedCrawler._WRAPPER
+    await page.wait_for_selector(root, timeout=10000)
+    description = f"{wrapper} .JobDescription_JobDescription__s2Keo"
+    button = page.locator(
+        f"{description} .JobDescription_JobDescription__paragraph__wrapper__WPrKC button"
+    )
+    if await button.count() > 0:
+        await button.first.click()
+        await button.first.wait_for(state="hidden", timeout=3000)
+
+    sections = [
+        await _legacy_section(page, f"{root} .JobHeader_JobHeader__TZkW3"),
+        await _legacy_section(page, description),
+        await _legacy_section(page, f"{wrapper} .JobDueTime_JobDueTime__yvhtg"),
+        await _legacy_section(
+            page,
+            f"{wrapper} .JobWorkPlace_JobWorkPlace__xPlGe"
+            " .JobWorkPlace_JobWorkPlace__map__24PDM"
+            " .JobWorkPlace_JobWorkPlace__map__location__6pp2d",
+        ),
+    ]
+    return "\n\n".join(s for s in sections if s)
+
+
+# ── 실행 ─────────────────────────────────────────────────
+
+
+async def _serve_fixtures(route: Route) -> None:
+    url = route.request.url
+    if "view-detail" in url:
+        body = (FIXTURES / "saramin_view_detail.html").read_text(encoding="utf-8")
+    elif "saramin.co.kr" in url:
+        body = (FIXTURES / "saramin_view.html").read_text(encoding="utf-8")
+    else:
+        items = "".join(f"<p>• 그로스 실험 설계 {i}</p>" for i in range(30))
+        more = "".join(f"<p>• 우대사항 {i}</p>" for i in range(30))
+        body = WANTED_HTML.format(items=items, more=more)
+    await route.fulfill(status=200, content_type="text/html; charset=utf-8", body=body)
+
+
+async def _measure(
+    context: Any, url: str, parse: Callable[[Any], Awaitable[str]], runs: int
+) -> Dict[str, float]:
+    samples, round_trips, text = [], [], ""
+    for _ in range(runs):
+        page: Page = await context.new_page()
+        try:
+            await page.goto(url, wait_until="load")
+            counter = [0]
+            started = time.perf_counter()
+            text = await parse(CountingProxy(page, counter))
+            samples.append(time.perf_counter() - started)
+            round_trips.append(counter[0])
+        finally:
+            await page.close()
+    samples.sort()
+    return {
+        "round_trips": statistics.median(round_trips),
+        "p50_ms": statistics.median(samples) * 1000,
+        "p95_ms": samples[max(0, int(len(samples) * 0.95) - 1)] * 1000,
+        "chars": len(text),
+    }
+
+
+async def run(runs: int) -> None:
+    playwright = await async_playwright().start()
+    browser = await playwright.chromium.launch(headless=True)
+    context = await browser.new_context()
+    await context.route("https://www.saramin.co.kr/**", _serve_fixtures)
+    await context.route("https://www.wanted.co.kr/**", _serve_fixtures)
+
+    cases = [
+        ("saramin", SARAMIN_URL, legacy_saramin, SaraminCrawler()._parse_page),
+        ("wanted", WANTED_URL, legacy_wanted, WantedCrawler()._parse_page),
+    ]
+    try:
+        print(f"{runs} runs per case (route-served fixtures, headless)")
+        for site, url, legacy, script in cases:
+            for label, parse in (("legacy", legacy), ("script", script)):
+                r = await _measure(context, url, parse, runs)
+                print(
+                    f"{site:<8} {label:<7} round trips {r['round_trips']:4.0f}"
+                    f" | p50 {r['p50_ms']:6.1f} ms | p95 {r['p95_ms']:6.1f} ms"
+                    f" | {r['chars']} chars"
+                )
+    finally:
+        await browser.close()
+        await playwright.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=30)
+    args = parser.parse_args()
+    asyncio.run(run(args.runs))
+
+
+if __name__ == "__main__":
+    main()
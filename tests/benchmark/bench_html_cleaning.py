@@ -0,0 +1,165 @@
+"""
+HTML 정제 엔진 벤치마크: BeautifulSoup html.parser(soup) vs lxml(lxml)
+
+녹화된 사람인/원티드 공고 페이지(tests/fixtures)와, 같은 페이지를 실제 공고 크기로 키운 문서
+(본문 반복 + 인라인 스크립트/네비게이션 추가)를 코퍼스로 사용합니다.
+- 처리량: 코퍼스 전체를 반복 정제한 문서/초, MB/초
+- 최대 메모리: 엔진마다 별도 프로세스에서 코퍼스 1회 정제
+  (Python 힙 최대치는 tracemalloc, libxml2의 C 힙까지 포함한 값은 최대 RSS(VmHWM) 증가량 - Linux 전용)
+두 엔진의 출력이 코퍼스 전체에서 같은지도 확인합니다.
+
+실행:
+    PYTHONPATH=.:pipelines python tests/benchmark/bench_html_cleaning.py [--seconds 3] [--scale 150]
+"""
+
+import argparse
+import multiprocessing
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from job_analysis.infrastructure.adapters.crawling.html_cleaner import (
+    clean_html_lxml,
+    clean_html_soup,
+)
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "data" / "job_posting"
+
+ENGINES: Dict[str, Callable[[str], str]] = {
+    "soup": clean_html_soup,
+    "lxml": clean_html_lxml,
+}
+
+# 실제 공고 페이지에 붙어 있는 비본문 요소 (정제 시 제거 대상)
+_CHROME = """
+<nav class="gnb"><ul>{links}</ul></nav>
+<script>window.__APP_STATE__ = {state};</script>
+<style>.jv_cont {{ margin: 0 }} .wrap_jv_header {{ padding: 0 }}</style>
+<footer><p>(주)사람인 | 원티드랩</p><a href="/terms">이용약관</a></footer>
+"""
+
+
+def _scaled(html: str, body: str, scale: int) -> str:
+    """공고 본문을 scale번 반복하고 비본문 요소를 붙여 실제 페이지 크기로 확대"""
+    chrome = _CHROME.format(
+        links="".join(f'<li><a href="/menu/{i}">메뉴 {i}</a></li>' for i in range(40)),
+        state='{"items": [' + ",".join(f'"{i}"' for i in range(2000)) + "]}",
+    )
+    return html.replace("</body>", f"{body * scale}{chrome}</body>")
+
+
+def load_corpus(scale: int) -> List[Tuple[str, str]]:
+    recorded = {
+        name: (FIXTURES / f"{name}.html").read_text(encoding="utf-8")
+        for name in ("saramin_view", "saramin_view_detail", "wanted_job_page")
+    }
+    corpus = list(recorded.items())
+    corpus.append(
+        (
+            "saramin_view_large",
+            _scaled(recorded["saramin_view"], recorded["saramin_view_detail"], scale),
+        )
+    )
+    wanted_body = "".join(
+        f"<section><h3>주요업무 {i}</h3><p>• 그로스 실험 설계와 지표 분석 {i}</p></section>"
+        for i in range(10)
+    )
+    corpus.append(
+        (
+            "wanted_job_page_large",
+            _scaled(recorded["wanted_job_page"], wanted_body, scale),
+        )
+    )
+    return corpus
+
+
+def throughput(
+    engine: str, corpus: List[Tuple[str, str]], seconds: float
+) -> Dict[str, float]:
+    clean = ENGINES[engine]
+    total_bytes = sum(len(html.encode("utf-8")) for _, html in corpus)
+    docs = rounds = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        for _, html in corpus:
+            clean(html)
+        docs += len(corpus)
+        rounds += 1
+    elapsed = time.perf_counter() - started
+    return {
+        "docs_per_s": docs / elapsed,
+        "mb_per_s": total_bytes * rounds / elapsed / 1e6,
+    }
+
+
+def _proc_status_kb(field: str) -> int:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(f"{field}:"):
+                return int(line.split()[1])
+    raise RuntimeError(f"{field} not found in /proc/self/status")
+
+
+def _peak_memory_child(
+    engine: str, scale: int, traced: bool, queue: "multiprocessing.Queue"
+) -> None:
+    corpus = load_corpus(scale)
+    clean = ENGINES[engine]
+    clean("<p>warm up</p>")
+    if traced:
+        tracemalloc.start()
+        for _, html in corpus:
+            clean(html)
+        queue.put(tracemalloc.get_traced_memory()[1] / 1024)
+        return
+    # 최대 RSS(VmHWM)를 현재 RSS로 초기화한 뒤 정제 중 최대치와 비교
+    with open("/proc/self/clear_refs", "w") as f:
+        f.write("5")
+    baseline = _proc_status_kb("VmRSS")
+    for _, html in corpus:
+        clean(html)
+    queue.put(_proc_status_kb("VmHWM") - baseline)
+
+
+def peak_memory_kb(engine: str, scale: int, traced: bool) -> float:
+    """새 프로세스에서 측정 (tracemalloc은 실행 속도를 바꾸므로 RSS와 따로 측정)"""
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    process = ctx.Process(
+        target=_peak_memory_child, args=(engine, scale, traced, queue)
+    )
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--scale", type=int, default=150)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.scale)
+    print("corpus:")
+    for name, html in corpus:
+        print(f"  {name:<24} {len(html.encode('utf-8')) / 1024:8.1f} KB")
+
+    mismatches = [
+        name for name, html in corpus if clean_html_soup(html) != clean_html_lxml(html)
+    ]
+    print(f"output mismatches: {mismatches or 'none'}")
+
+    for engine in ENGINES:
+        r = throughput(engine, corpus, args.seconds)
+        heap = peak_memory_kb(engine, args.scale, traced=True)
+        rss = peak_memory_kb(engine, args.scale, traced=False)
+        print(
+            f"{engine:<5} {r['docs_per_s']:8.1f} docs/s | {r['mb_per_s']:6.2f} MB/s"
+            f" | peak Python heap {heap / 1024:6.1f} MB | peak RSS +{rss / 1024:6.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
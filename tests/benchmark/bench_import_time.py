@@ -0,0 +1,94 @@
+"""
+API cold start(import 시간) 벤치마크 - `python -X importtime` 기반
+
+- api.main          : 서버 프로세스가 요청을 받을 수 있을 때까지의 import 비용 (파이프라인 지연 로딩)
+- api.main + prewarm: 모든 파이프라인 스택(Playwright, LangChain, boto3 등)까지 import 한 비용
+                      (= 파이프라인을 eager import 하던 기존 구조의 cold start)
+
+실행:
+    PYTHONPATH=.:pipelines python tests/benchmark/bench_import_time.py [--runs 5] [--top 10] [--max-ms 1500]
+
+--max-ms 를 주면 api.main cold start 중앙값이 예산을 넘을 때 exit code 1 (CI 회귀 감지용)
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+SCENARIOS = {
+    "api.main": "import api.main",
+    "api.main + prewarm": (
+        "import api.main\n"
+        "from shared.pipeline_bridge.interface import registry\n"
+        "for name in registry.names: registry.resolve(name)"
+    ),
+}
+
+# "import time: self [us] | cumulative | imported package"
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def _importtime(code: str) -> Tuple[float, Dict[str, int]]:
+    """새 인터프리터에서 code를 실행하고 (총 import ms, 최상위 패키지별 누적 us) 반환"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=os.environ.copy(),
+        check=True,
+    )
+
+    top_level: Dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        _, cumulative, indent, package = match.groups()
+        # 들여쓰기 1칸 = 최상위 import (하위 import는 누적값에 포함됨)
+        if len(indent) == 1:
+            top_level[package] = top_level.get(package, 0) + int(cumulative)
+
+    return sum(top_level.values()) / 1000, top_level
+
+
+def _run(code: str, runs: int) -> Tuple[List[float], Dict[str, int]]:
+    samples, last = [], {}
+    for _ in range(runs):
+        total_ms, last = _importtime(code)
+        samples.append(total_ms)
+    return samples, last
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    medians: Dict[str, float] = {}
+    for label, code in SCENARIOS.items():
+        samples, top_level = _run(code, args.runs)
+        medians[label] = statistics.median(samples)
+        print(
+            f"{label:<20} median {medians[label]:8.1f} ms"
+            f" | min {min(samples):8.1f} ms | max {max(samples):8.1f} ms"
+        )
+        heaviest = sorted(top_level.items(), key=lambda kv: kv[1], reverse=True)
+        for package, cumulative in heaviest[: args.top]:
+            print(f"    {cumulative / 1000:8.1f} ms  {package}")
+
+    if args.max_ms is not None and medians["api.main"] > args.max_ms:
+        print(
+            f"❌ api.main cold start {medians['api.main']:.1f} ms > budget {args.max_ms} ms"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""
+로그 출력이 이벤트 루프 지연(loop lag)에 주는 영향 벤치마크
+
+- direct: 기존 logging.basicConfig 방식 (이벤트 루프에서 바로 포맷팅 + stdout 쓰기)
+- queue : start_logging() 방식 (루프에서는 큐에 넣기만, 포맷팅/쓰기는 리스너 스레드)
+
+느린 stdout(파이프가 가득 찬 상황)을 write마다 sleep 하는 스트림으로 흉내내고,
+여러 코루틴이 로그를 쏟아내는 동안 1ms 주기 타이머가 얼마나 늦게 깨어나는지 측정합니다.
+
+실행:
+    PYTHONPATH=.:pipelines python tests/benchmark/bench_logging_loop_latency.py [--writers 20] [--lines 200] [--write-delay-ms 0.2]
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from typing import Dict, List
+
+from api.core.logging_config import (
+    DATE_FORMAT,
+    LOG_FORMAT,
+    StructuredFormatter,
+    start_logging,
+    stop_logging,
+)
+from shared.log_context import RequestContextFilter, request_id_scope
+
+
+class SlowStream:
+    """write 마다 지연되는 출력 (느린 파이프/터미널)"""
+
+    def __init__(self, delay_seconds: float):
+        self.delay_seconds = delay_seconds
+        self.lines = 0
+
+    def write(self, text: str) -> int:
+        time.sleep(self.delay_seconds)
+        self.lines += 1
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+def _configure_direct(stream: SlowStream) -> None:
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(StructuredFormatter(LOG_FORMAT, datefmt=DATE_FORMAT))
+    handler.addFilter(RequestContextFilter())
+    root = logging.getLogger()
+    root.handlers = [handler]
+    root.setLevel(logging.INFO)
+
+
+async def _workload(writers: int, lines: int) -> Dict[str, float]:
+    logger = logging.getLogger("bench")
+    lags: List[float] = []
+    done = asyncio.Event()
+
+    async def probe() -> None:
+        # 1ms 타이머가 예정보다 늦게 깨어난 시간 = 이벤트 루프가 막혀 있던 시간
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append((time.perf_counter() - start - 0.001) * 1000)
+
+    async def writer(index: int) -> None:
+        with request_id_scope(f"req-{index}"):
+            for i in range(lines):
+                logger.info(
+                    f"🤖 Evaluated criteria: criterion-{i}",
+                    extra={"stage": "evaluate_competency", "elapsed_ms": 12.3},
+                )
+                await asyncio.sleep(0)
+
+    probe_task = asyncio.ensure_future(probe())
+    started = time.perf_counter()
+    await asyncio.gather(*(writer(i) for i in range(writers)))
+    elapsed = (time.perf_counter() - started) * 1000
+    done.set()
+    await probe_task
+
+    lags.sort()
+    return {
+        "workload_ms": elapsed,
+        "lag_p50_ms": statistics.median(lags),
+        "lag_p99_ms": lags[int(len(lags) * 0.99) - 1] if len(lags) > 1 else lags[0],
+        "lag_max_ms": lags[-1],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--writers", type=int, default=20)
+    parser.add_argument("--lines", type=int, default=200)
+    parser.add_argument("--write-delay-ms", type=float, default=0.2)
+    args = parser.parse_args()
+    delay = args.write_delay_ms / 1000
+
+    results = {}
+
+    stream = SlowStream(delay)
+    _configure_direct(stream)
+    results["direct"] = asyncio.run(_workload(args.writers, args.lines))
+    logging.getLogger().handlers = []
+
+    stream = SlowStream(delay)
+    start_logging(logging.INFO, stream=stream)
+    results["queue"] = asyncio.run(_workload(args.writers, args.lines))
+    drain_started = time.perf_counter()
+    stop_logging()
+    results["queue"]["drain_ms"] = (time.perf_counter() - drain_started) * 1000
+
+    total = args.writers * args.lines
+    print(
+        f"{total} log lines, {args.writers} writers, write delay {args.write_delay_ms} ms"
+    )
+    for label, r in results.items():
+        drain = f" | drain {r['drain_ms']:8.1f} ms" if "drain_ms" in r else ""
+        print(
+            f"{label:<7} workload {r['workload_ms']:8.1f} ms"
+            f" | loop lag p50 {r['lag_p50_ms']:6.2f} ms"
+            f" p99 {r['lag_p99_ms']:7.2f} ms max {r['lag_max_ms']:7.2f} ms{drain}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+파이프라인 요청당 의존성 조립(Wiring) 오버헤드 벤치마크
+
+- before: 요청마다 LLM/S3 클라이언트, PDF 추출기, 크롤러, 프롬프트/파서를 새로 생성 (기존 run_pipeline 방식)
+- after : lifespan에서 만든 컨테이너를 재사용하고 DB 세션에 묶인 Repository만 생성
+
+실행 (네트워크 호출 없음, 객체 생성 비용만 측정):
+    PYTHONPATH=.:pipelines python tests/benchmark/bench_pipeline_wiring.py [반복 횟수]
+"""
+
+import statistics
+import sys
+import time
+from typing import Callable, List
+
+from applicant_evaluation.container import ApplicantEvaluationContainer
+from applicant_evaluation.container import get_container as get_eval_container
+from applicant_evaluation.container import reset_container as reset_eval_container
+from job_analysis.container import JobAnalysisContainer
+from job_analysis.container import get_container as get_job_container
+from job_analysis.container import reset_container as reset_job_container
+from shared.config import settings
+
+
+def _measure(fn: Callable[[], object], iterations: int) -> List[float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _report(label: str, samples: List[float]) -> None:
+    p95 = statistics.quantiles(samples, n=20)[18]
+    print(
+        f"{label:<34} mean {statistics.mean(samples):8.3f} ms"
+        f" | p50 {statistics.median(samples):8.3f} ms | p95 {p95:8.3f} ms"
+    )
+
+
+def run(iterations: int) -> None:
+    session = object()  # Repository 생성자는 세션을 보관만 함
+
+    def before() -> None:
+        ApplicantEvaluationContainer.build().analyzer(session)  # type: ignore[arg-type]
+        JobAnalysisContainer.build()
+
+    def after() -> None:
+        get_eval_container().analyzer(session)  # type: ignore[arg-type]
+        get_job_container().service
+
+    # 최초 import/초기화 비용은 양쪽 모두 제외
+    before()
+    after()
+
+    _report("before (per-request wiring)", _measure(before, iterations))
+    _report("after  (lifespan container)", _measure(after, iterations))
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    print(f"# mock mode (USE_MOCK=true), {iterations} iterations")
+    settings.PROFILE, settings.USE_MOCK = "dev", True
+    run(iterations)
+
+    print(f"\n# LLM mode (OpenAI client, dummy key), {iterations} iterations")
+    settings.PROFILE, settings.LLM_PROVIDER = "prod", "openai"
+    settings.OPENAI_API_KEY = settings.OPENAI_API_KEY or "sk-benchmark"
+    reset_eval_container()
+    reset_job_container()
+    run(iterations)
@@ -0,0 +1,151 @@
+"""
+요청 차단 벤치마크: Python route 핸들러(route) vs CDP URL 차단 목록(cdp) vs 차단 없음(none)
+
+- route: 이전 방식 재현 - 컨텍스트에 "**/*" route를 등록하고 resource_type으로 abort/continue
+         (모든 하위 요청이 브라우저 -> Playwright 드라이버 -> Python 왕복 후 진행)
+- cdp  : 현재 방식 - 페이지 이동 전 Network.setBlockedURLs 1회 (요청은 브라우저 안에서 차단)
+- none : 차단 없음 (참고용)
+
+녹화된 공고 페이지(tests/fixtures) HTML에 이미지/스타일시트/폰트 하위 리소스를 붙여
+로컬 HTTP 서버(리소스마다 지연)로 응답하고, 페이지 이동 시작부터 파싱 완료까지 시간을 비교합니다.
+Chromium이 설치되어 있어야 합니다 (playwright install chromium).
+
+실행:
+    PYTHONPATH=.:pipelines python tests/benchmark/bench_request_blocking.py [--runs 20] [--assets 40]
+"""
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List
+
+from playwright.async_api import Route, async_playwright
+
+from job_analysis.infrastructure.adapters.crawling.request_blocking import (
+    BLOCKED_URL_PATTERNS,
+)
+from job_analysis.infrastructure.adapters.crawling.strategies.default import (
+    DefaultCrawler,
+)
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "data" / "job_posting"
+
+# 이전 방식의 차단 대상 resource_type
+LEGACY_BLOCKED_TYPES = {"image", "media", "font", "stylesheet", "other"}
+
+
+class NoBlockingCrawler(DefaultCrawler):
+    """CDP 차단 목록을 비워서 route 핸들러/차단 없음과 비교"""
+
+    _ALLOWED_REQUESTS = frozenset(BLOCKED_URL_PATTERNS)
+
+
+def _recorded_page(assets: int) -> bytes:
+    html = (FIXTURES / "saramin_view.html").read_text(encoding="utf-8")
+    extra = "".join(
+        f'<link rel="stylesheet" href="/static/style{i}.css">'
+        f'<img src="/static/banner{i}.png">'
+        for i in range(assets)
+    )
+    return html.replace("</body>", f"{extra}</body>").encode("utf-8")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def __init__(self, page: bytes, delay: float, *args, **kwargs):
+        self.page = page
+        self.delay = delay
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self) -> None:
+        if self.path.startswith("/static/"):
+            time.sleep(self.delay)
+            body, content_type = b"", "text/css"
+        elif "view-detail" in self.path:
+            body = (FIXTURES / "saramin_view_detail.html").read_bytes()
+            content_type = "text/html; charset=utf-8"
+        else:
+            body, content_type = self.page, "text/html; charset=utf-8"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+async def _legacy_block(route: Route) -> None:
+    if route.request.resource_type in LEGACY_BLOCKED_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _measure(browser, url: str, mode: str, runs: int) -> Dict[str, float]:
+    crawler = DefaultCrawler() if mode == "cdp" else NoBlockingCrawler()
+    context = await browser.new_context()
+    if mode == "route":
+        await context.route("**/*", _legacy_block)
+
+    samples: List[float] = []
+    try:
+        for _ in range(runs):
+            page = await context.new_page()
+            try:
+                started = time.perf_counter()
+                await crawler._visit(page, url)
+                samples.append(time.perf_counter() - started)
+            finally:
+                await page.close()
+    finally:
+        await context.close()
+
+    samples.sort()
+    return {
+        "p50_ms": statistics.median(samples) * 1000,
+        "p95_ms": samples[max(0, int(len(samples) * 0.95) - 1)] * 1000,
+    }
+
+
+async def run(runs: int, assets: int, delay: float) -> None:
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), partial(_Handler, _recorded_page(assets), delay)
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/zf_user/jobs/relay/view?rec_idx=52069064"
+
+    playwright = await async_playwright().start()
+    browser = await playwright.chromium.launch(headless=True)
+    try:
+        print(
+            f"{runs} runs, {assets * 2} subresources/page ({delay * 1000:.0f} ms each), headless"
+        )
+        for mode in ("route", "cdp", "none"):
+            r = await _measure(browser, url, mode, runs)
+            print(
+                f"{mode:<6} navigation->parse p50 {r['p50_ms']:7.1f} ms"
+                f" | p95 {r['p95_ms']:7.1f} ms"
+            )
+    finally:
+        await browser.close()
+        await playwright.stop()
+        server.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--assets", type=int, default=40)
+    parser.add_argument("--delay-ms", type=float, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.runs, args.assets, args.delay_ms / 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -25,14 +25,14 @@ def test_crawlers():
     print("🚀 Starting Development Crawler Test")
     print("=" * 60 + "\n")
 
+    # 1. 라우팅 크롤러 초기화 (브라우저 풀은 모든 URL이 공유)
+    crawler = DynamicRoutingCrawler()
+
     for url in test_urls:
 
         print(f"🎯 Testing [{url}]")
 
         try:
-            # 1. 라우팅 크롤러 초기화
-            crawler = DynamicRoutingCrawler()
-
             # (옵션) 내부 전략 확인을 위한 로깅은 router 내부 구현에 따름
             # 여기서는 fetch 호출만 하면 됨
 
@@ -64,6 +64,8 @@ def test_crawlers():
 
         print("\n" + "=" * 60 + "\n")
 
+    crawler.close()
+
 
 if __name__ == "__main__":
     test_crawlers()
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.core.deadline import DeadlineMiddleware
+from shared.concurrency import DeadlineExceeded, current_deadline, with_deadline
+
+
+def _build_app(timeout, overrides=None) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(DeadlineMiddleware, timeout=timeout, overrides=overrides)
+
+    @app.post("/budget")
+    async def budget(payload: dict):
+        deadline = current_deadline()
+        return {"remaining": deadline.remaining() if deadline else None}
+
+    @app.post("/slow")
+    async def slow(payload: dict):
+        try:
+            await with_deadline(asyncio.sleep(10), stage="slow")
+        except DeadlineExceeded as e:
+            return {"stage": e.stage}
+
+    return app
+
+
+def test_deadline_is_visible_to_handlers():
+    client = TestClient(_build_app(timeout=5, overrides={"/slow": None}))
+
+    remaining = client.post("/budget", json={}).json()["remaining"]
+    assert 0 < remaining <= 5
+
+
+def test_stage_is_cut_at_request_deadline():
+    client = TestClient(_build_app(timeout=0.05))
+
+    assert client.post("/slow", json={}).json() == {"stage": "slow"}
+
+
+@pytest.mark.asyncio
+async def test_client_disconnect_cancels_handler():
+    handler_cancelled = asyncio.Event()
+    seen = {}
+
+    async def app(scope, receive, send):
+        await receive()
+        seen["deadline"] = current_deadline()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            handler_cancelled.set()
+            raise
+
+    messages = [
+        {"type": "http.request", "body": b"{}", "more_body": False},
+        {"type": "http.disconnect"},
+    ]
+
+    async def receive():
+        if len(messages) == 1:
+            await asyncio.sleep(0.02)
+        return messages.pop(0)
+
+    async def send(message):
+        raise AssertionError("no response should be sent")
+
+    middleware = DeadlineMiddleware(app, timeout=5)
+    scope = {"type": "http", "path": "/ai/api/v1/job-posting/analyze"}
+    await asyncio.wait_for(middleware(scope, receive, send), timeout=1)
+
+    assert handler_cancelled.is_set()
+    assert seen["deadline"].cancelled
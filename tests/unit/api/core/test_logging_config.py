@@ -0,0 +1,60 @@
+import asyncio
+import io
+import logging
+
+import pytest
+
+from api.core.logging_config import start_logging, stop_logging
+from shared.log_context import request_id_scope
+
+
+@pytest.mark.asyncio
+async def test_records_carry_request_id_and_structured_fields():
+    stream = io.StringIO()
+    root = logging.getLogger()
+    previous_handlers = list(root.handlers)
+    previous_level = root.level
+
+    start_logging(logging.INFO, stream=stream)
+    try:
+        logger = logging.getLogger("test.logging")
+        with request_id_scope("req-1"):
+            logger.info("on loop %s", "ok", extra={"stage": "s3_download"})
+            # 워커 스레드(asyncio.to_thread)에도 request_id가 전파됨
+            await asyncio.to_thread(
+                logger.warning, "in thread", extra={"elapsed_ms": 1.5}
+            )
+        logger.info("outside request")
+    finally:
+        stop_logging()
+        root.setLevel(previous_level)
+
+    lines = stream.getvalue().splitlines()
+    assert "| req-1 | on loop ok | stage=s3_download" in lines[0]
+    assert "| req-1 | in thread | elapsed_ms=1.5" in lines[1]
+    assert "| - | outside request" in lines[2]
+    assert root.handlers == previous_handlers
+
+
+def test_exception_traceback_is_formatted_by_listener():
+    stream = io.StringIO()
+    root = logging.getLogger()
+    previous_level = root.level
+
+    start_logging(logging.INFO, stream=stream)
+    try:
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logging.getLogger("test.logging").exception(
+                "failed", extra={"stage": "pdf_extraction"}
+            )
+    finally:
+        stop_logging()
+        root.setLevel(previous_level)
+
+    output = stream.getvalue()
+    first_line = output.splitlines()[0]
+    assert first_line.endswith("failed | stage=pdf_extraction")
+    assert "Traceback" in output
+    assert "ValueError: boom" in output
@@ -0,0 +1,26 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.core.metrics import HTTP_REQUEST_SECONDS, MetricsMiddleware
+
+
+def test_requests_are_labelled_by_route_template():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"item_id": item_id}
+
+    client = TestClient(app)
+    labels = {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+    before = HTTP_REQUEST_SECONDS.count(**labels)
+
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/missing")
+
+    assert HTTP_REQUEST_SECONDS.count(**labels) == before + 2
+    assert (
+        HTTP_REQUEST_SECONDS.count(method="GET", route="<unmatched>", status="404") >= 1
+    )
@@ -0,0 +1,34 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.core.request_context import RequestIdMiddleware
+from shared.log_context import current_request_id
+
+
+def _build_client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(RequestIdMiddleware)
+
+    @app.get("/whoami")
+    async def whoami():
+        return {"request_id": current_request_id()}
+
+    return TestClient(app)
+
+
+def test_uses_incoming_request_id():
+    response = _build_client().get("/whoami", headers={"X-Request-ID": "gw-42"})
+
+    assert response.json() == {"request_id": "gw-42"}
+    assert response.headers["x-request-id"] == "gw-42"
+
+
+def test_generates_request_id_when_missing_or_invalid():
+    client = _build_client()
+
+    generated = client.get("/whoami")
+    invalid = client.get("/whoami", headers={"X-Request-ID": "bad id\twith spaces"})
+
+    assert generated.json()["request_id"] == generated.headers["x-request-id"]
+    assert len(generated.headers["x-request-id"]) == 16
+    assert invalid.headers["x-request-id"] != "bad id\twith spaces"
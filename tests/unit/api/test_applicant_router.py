@@ -1,13 +1,18 @@
+import json
 from unittest.mock import patch
 
 from fastapi.testclient import TestClient
 
 from api.main import app
+from shared.concurrency import AdmissionRejected, DeadlineExceeded
 from shared.schema.applicant import (
     CompareResponse,
     ComparisonMetric,
     CompetencyScore,
+    EvaluateJobStatusResponse,
+    EvaluateJobSubmitResponse,
     EvaluateResponse,
+    EvaluateStreamEvent,
 )
 
 client = TestClient(app)
@@ -71,3 +76,208 @@ def test_compare_applicants_success():
         assert json_data["data"]["strengths_report"] == "Better skills"
         assert json_data["data"]["comparison_metrics"][0]["name"] == "Skill"
         mock_call.assert_called_once()
+
+
+def test_submit_evaluation_returns_202():
+    # 1. Mock Data
+    mock_response = EvaluateJobSubmitResponse(eval_job_id=7, status="PENDING")
+
+    # 2. Patch
+    with patch("api.service.applicant.call_applicant_evaluation_submit") as mock_call:
+        mock_call.return_value = mock_response
+
+        # 3. Request
+        payload = {"user_id": "1", "job_posting_id": "2"}
+        response = client.post("/ai/api/v1/applicant/evaluate/async", json=payload)
+
+        # 4. Verify
+        assert response.status_code == 202
+        json_data = response.json()
+        assert json_data["success"] is True
+        assert json_data["data"]["eval_job_id"] == 7
+        assert json_data["data"]["status"] == "PENDING"
+        mock_call.assert_called_once()
+
+
+def test_submit_evaluation_without_application_is_not_found():
+    with patch("api.service.applicant.call_applicant_evaluation_submit") as mock_call:
+        mock_call.return_value = None
+
+        payload = {"user_id": "1", "job_posting_id": "2"}
+        response = client.post("/ai/api/v1/applicant/evaluate/async", json=payload)
+
+        assert response.status_code == 400
+        json_data = response.json()
+        assert json_data["success"] is False
+        assert json_data["error"]["code"] == "ITEM_NOT_FOUND"
+
+
+def test_get_evaluation_job_completed():
+    # 1. Mock Data
+    mock_response = EvaluateJobStatusResponse(
+        eval_job_id=7,
+        status="COMPLETED",
+        result=EvaluateResponse(
+            overall_score=80.0,
+            competency_scores=[
+                CompetencyScore(name="Skill", score=80, description="Good")
+            ],
+            one_line_review="Good candidate",
+            feedback_detail="Detail",
+        ),
+    )
+
+    # 2. Patch
+    with patch("api.service.applicant.call_applicant_evaluation_status") as mock_call:
+        mock_call.return_value = mock_response
+
+        # 3. Request
+        response = client.get("/ai/api/v1/applicant/evaluate/7")
+
+        # 4. Verify
+        assert response.status_code == 200
+        json_data = response.json()
+        assert json_data["data"]["status"] == "COMPLETED"
+        assert json_data["data"]["result"]["overall_score"] == 80.0
+        mock_call.assert_called_once_with(7)
+
+
+def test_get_evaluation_job_not_found():
+    with patch("api.service.applicant.call_applicant_evaluation_status") as mock_call:
+        mock_call.return_value = None
+
+        response = client.get("/ai/api/v1/applicant/evaluate/999")
+
+        assert response.status_code == 400
+        json_data = response.json()
+        assert json_data["success"] is False
+        assert json_data["error"]["code"] == "ITEM_NOT_FOUND"
+
+
+def _parse_sse(body: str):
+    events = []
+    for frame in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in frame.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def _as_stream(gen_fn):
+    # bridge 스트림 함수는 실행 슬롯 확보 후 async iterator를 반환함
+    async def call(request):
+        return gen_fn(request)
+
+    return call
+
+
+def test_stream_evaluation_emits_events_in_order():
+    async def fake_stream(request):
+        yield EvaluateStreamEvent(
+            event="competency",
+            data={"name": "Skill", "score": 90, "description": "Great"},
+        )
+        yield EvaluateStreamEvent(
+            event="feedback",
+            data={"one_line_review": "Good", "feedback_detail": "Detail"},
+        )
+        yield EvaluateStreamEvent(event="result", data={"overall_score": 90.0})
+
+    with patch(
+        "api.service.applicant.call_applicant_evaluation_stream",
+        new=_as_stream(fake_stream),
+    ):
+        payload = {"user_id": "1", "job_posting_id": "2"}
+        response = client.post("/ai/api/v1/applicant/evaluate/stream", json=payload)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _parse_sse(response.text)
+        assert [name for name, _ in events] == ["competency", "feedback", "result"]
+        assert events[0][1]["name"] == "Skill"
+        assert events[2][1]["overall_score"] == 90.0
+
+
+def test_stream_evaluation_error_event():
+    async def failing_stream(request):
+        yield EvaluateStreamEvent(
+            event="competency",
+            data={"name": "Skill", "score": 90, "description": "Great"},
+        )
+        raise ValueError("LLM failure")
+
+    with patch(
+        "api.service.applicant.call_applicant_evaluation_stream",
+        new=_as_stream(failing_stream),
+    ):
+        payload = {"user_id": "1", "job_posting_id": "2"}
+        response = client.post("/ai/api/v1/applicant/evaluate/stream", json=payload)
+
+        events = _parse_sse(response.text)
+        assert [name for name, _ in events] == ["competency", "error"]
+        assert events[1][1]["code"] == "INTERNAL_SERVER_ERROR"
+        assert events[1][1]["details"] == "LLM failure"
+
+
+def test_batch_evaluation_streams_applicants_then_summary():
+    async def fake_batch_stream(request):
+        assert request.job_posting_id == "2"
+        yield EvaluateStreamEvent(
+            event="applicant",
+            data={"user_id": "1", "job_application_id": 11, "result": None},
+        )
+        yield EvaluateStreamEvent(
+            event="summary", data={"total": 1, "succeeded": 0, "failed": 1}
+        )
+
+    with patch(
+        "api.service.applicant.call_applicant_evaluation_batch_stream",
+        new=_as_stream(fake_batch_stream),
+    ):
+        response = client.post(
+            "/ai/api/v1/applicant/evaluate/batch", json={"job_posting_id": "2"}
+        )
+
+        assert response.status_code == 200
+        events = _parse_sse(response.text)
+        assert [name for name, _ in events] == ["applicant", "summary"]
+        assert events[1][1]["total"] == 1
+
+
+def test_evaluate_returns_429_with_retry_after_when_queue_full():
+    with patch("api.service.applicant.call_applicant_evaluation") as mock_call:
+        mock_call.side_effect = AdmissionRejected("applicant_evaluation", 7)
+
+        payload = {"user_id": "1", "job_posting_id": "2"}
+        response = client.post("/ai/api/v1/applicant/evaluate", json=payload)
+
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "7"
+        json_data = response.json()
+        assert json_data["success"] is False
+        assert json_data["error"]["code"] == "TOO_MANY_REQUESTS"
+
+
+def test_stream_evaluation_rejected_before_stream_starts():
+    async def rejected(request):
+        raise AdmissionRejected("applicant_evaluation", 3)
+
+    with patch("api.service.applicant.call_applicant_evaluation_stream", new=rejected):
+        payload = {"user_id": "1", "job_posting_id": "2"}
+        response = client.post("/ai/api/v1/applicant/evaluate/stream", json=payload)
+
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "3"
+        assert response.headers["content-type"].startswith("application/json")
+
+
+def test_evaluate_returns_504_when_deadline_exceeded():
+    with patch("api.service.applicant.call_applicant_evaluation") as mock_call:
+        mock_call.side_effect = DeadlineExceeded("evaluate_competency")
+
+        payload = {"user_id": "1", "job_posting_id": "2"}
+        response = client.post("/ai/api/v1/applicant/evaluate", json=payload)
+
+        assert response.status_code == 504
+        json_data = response.json()
+        assert json_data["error"]["code"] == "DEADLINE_EXCEEDED"
+        assert "evaluate_competency" in json_data["error"]["details"]
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import AsyncMock
 from pipelines.applicant_evaluation.application.services.analyzer import (
@@ -5,10 +6,14 @@ from pipelines.applicant_evaluation.application.services.analyzer import (
 )
 from pipelines.applicant_evaluation.domain.models.evaluation import CompetencyResult
 from shared.schema.applicant import EvaluateResponse
-from pipelines.applicant_evaluation.domain.models.report import OverallFeedback
+from pipelines.applicant_evaluation.domain.models.report import (
+    AnalysisReport,
+    OverallFeedback,
+)
 from pipelines.applicant_evaluation.domain.models.job import JobInfo, EvaluationCriteria
 from pipelines.applicant_evaluation.domain.models.document import (
     ApplicantDocuments,
+    JobApplicant,
     ParsedDoc,
     FileInfo,
 )
@@ -160,3 +165,154 @@ async def test_run_job_not_found(analyzer, mock_dependencies):
 
     with pytest.raises(ValueError, match="Job not found"):
         await analyzer.run(user_id=1, job_id=999)
+
+
+@pytest.mark.asyncio
+async def test_evaluate_stream_yields_competencies_then_report(
+    analyzer, mock_dependencies
+):
+    """
+    역량별 결과가 먼저 스트리밍되고, 종합 평가 -> 최종 리포트 순으로 이어지는지 테스트
+    """
+    # 1. Setup
+    mock_dependencies["job_repo"].get_job_info.return_value = JobInfo(
+        company_name="Test Company",
+        main_tasks=["Python"],
+        tech_stacks=["AWS"],
+        summary="A great job",
+        evaluation_criteria=[
+            EvaluationCriteria(name="직무적합성", description="Desc1"),
+            EvaluationCriteria(name="성장가능성", description="Desc2"),
+        ],
+    )
+    mock_dependencies["doc_repo"].get_documents.return_value = ApplicantDocuments(
+        resume_file=FileInfo(file_path="s3://resume", file_type="RESUME"),
+        parsed_resume=ParsedDoc(doc_type="RESUME", text="A" * 60),
+    )
+
+    async def evaluate_competency(criteria, **kwargs):
+        # 첫 번째 기준이 더 늦게 끝나도록 지연 (완료 순서 != 기준 순서)
+        if criteria.name == "직무적합성":
+            await asyncio.sleep(0.01)
+            return CompetencyResult(name=criteria.name, score=80.0, description="ok")
+        return CompetencyResult(name=criteria.name, score=90.0, description="ok")
+
+    mock_dependencies["agent"].evaluate_competency.side_effect = evaluate_competency
+    mock_dependencies["agent"].synthesize_report.return_value = OverallFeedback(
+        one_line_review="Excellent candidate", feedback_detail="Detailed feedback..."
+    )
+
+    # 2. Execute
+    events = [item async for item in analyzer.evaluate_stream(100, 1)]
+
+    # 3. Verify
+    assert len(events) == 4
+    # 먼저 끝난 역량부터 스트리밍
+    assert [e.name for e in events[:2]] == ["성장가능성", "직무적합성"]
+    assert isinstance(events[2], OverallFeedback)
+    assert isinstance(events[3], AnalysisReport)
+    assert events[3].overall_score == 85.0
+    # 최종 리포트는 평가 기준 순서를 유지
+    assert [r.name for r in events[3].competency_scores] == ["직무적합성", "성장가능성"]
+
+
+@pytest.mark.asyncio
+async def test_evaluate_batch_loads_job_once_and_isolates_failures(
+    analyzer, mock_dependencies
+):
+    """
+    공고 정보/지원자 서류는 한 번만 조회하고, 실패한 지원자는 error로 기록된 채 나머지는 계속 평가
+    """
+    # 1. Setup
+    mock_dependencies["job_repo"].get_job_info.return_value = JobInfo(
+        company_name="Test Company",
+        main_tasks=[],
+        tech_stacks=[],
+        summary="",
+        evaluation_criteria=[EvaluationCriteria(name="기본", description="")],
+    )
+    ready = ApplicantDocuments(
+        resume_file=FileInfo(file_path="s3://ready.pdf", file_type="RESUME"),
+        parsed_resume=ParsedDoc(doc_type="RESUME", text="A" * 60),
+    )
+    needs_parsing = ApplicantDocuments(
+        resume_file=FileInfo(file_path="s3://raw.pdf", file_type="RESUME"),
+    )
+    broken = ApplicantDocuments(
+        resume_file=FileInfo(file_path="s3://broken.pdf", file_type="RESUME"),
+    )
+    mock_dependencies["doc_repo"].get_applicants.return_value = [
+        JobApplicant(job_application_id=1, user_id=10, documents=ready),
+        JobApplicant(job_application_id=2, user_id=20, documents=needs_parsing),
+        JobApplicant(job_application_id=3, user_id=30, documents=broken),
+    ]
+
+    async def download_file(path):
+        if path == "s3://broken.pdf":
+            raise FileNotFoundError(path)
+        return b"PDF_BYTES"
+
+    mock_dependencies["file_storage"].download_file.side_effect = download_file
+    mock_dependencies["extractor"].extract_text.return_value = "B" * 60
+    mock_dependencies["agent"].evaluate_competency.return_value = CompetencyResult(
+        name="기본", score=70.0, description="ok"
+    )
+    mock_dependencies["agent"].synthesize_report.return_value = OverallFeedback(
+        one_line_review="Good", feedback_detail="Detail"
+    )
+
+    # 2. Execute
+    results = [item async for item in analyzer.evaluate_batch(1, asyncio.Lock(), 2)]
+
+    # 3. Verify
+    by_user = {r.user_id: r for r in results}
+    assert len(results) == 3
+    assert by_user[10].report.overall_score == 70.0
+    assert by_user[20].report is not None
+    assert by_user[30].report is None and "broken" in by_user[30].error
+
+    mock_dependencies["job_repo"].get_job_info.assert_awaited_once_with(1)
+    mock_dependencies["doc_repo"].get_applicants.assert_awaited_once_with(1)
+    mock_dependencies["doc_repo"].get_documents.assert_not_awaited()
+    mock_dependencies["doc_repo"].save_parsed_doc.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_evaluate_stream_close_waits_for_cancelled_evaluations(
+    analyzer, mock_dependencies
+):
+    """
+    소비자가 중간에 끊으면 남은 평가를 취소하고, 취소가 끝난 뒤에 스트림이 닫히는지 테스트
+    """
+    mock_dependencies["job_repo"].get_job_info.return_value = JobInfo(
+        company_name="Test Company",
+        main_tasks=[],
+        tech_stacks=[],
+        summary="",
+        evaluation_criteria=[
+            EvaluationCriteria(name="빠름", description=""),
+            EvaluationCriteria(name="느림", description=""),
+        ],
+    )
+    mock_dependencies["doc_repo"].get_documents.return_value = ApplicantDocuments(
+        resume_file=FileInfo(file_path="s3://resume", file_type="RESUME"),
+        parsed_resume=ParsedDoc(doc_type="RESUME", text="A" * 60),
+    )
+    cleaned_up = []
+
+    async def evaluate_competency(criteria, **kwargs):
+        if criteria.name == "느림":
+            try:
+                await asyncio.sleep(10)
+            finally:
+                cleaned_up.append(criteria.name)
+        return CompetencyResult(name=criteria.name, score=90.0, description="ok")
+
+    mock_dependencies["agent"].evaluate_competency.side_effect = evaluate_competency
+
+    stream = analyzer.evaluate_stream(100, 1)
+    first = await stream.__anext__()
+    await stream.aclose()
+
+    assert first.name == "빠름"
+    assert cleaned_up == ["느림"]
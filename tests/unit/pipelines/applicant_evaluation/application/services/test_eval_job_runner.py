@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from pipelines.applicant_evaluation.application.services.eval_job_runner import (
+    EvalJobRunner,
+)
+
+
+@pytest.mark.asyncio
+async def test_submit_runs_handler_in_background():
+    """submit은 즉시 반환되고, 등록된 작업은 워커가 처리"""
+    processed = []
+
+    async def handler(eval_job_id: int):
+        processed.append(eval_job_id)
+
+    runner = EvalJobRunner(handler=handler, workers=2)
+
+    await runner.submit(1)
+    await runner.submit(2)
+    await runner.join()
+
+    assert sorted(processed) == [1, 2]
+    await runner.stop()
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_limited_by_workers():
+    """동시에 실행되는 작업 수는 워커 수를 넘지 않음"""
+    running = 0
+    max_running = 0
+
+    async def handler(eval_job_id: int):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    runner = EvalJobRunner(handler=handler, workers=2)
+    for i in range(6):
+        await runner.submit(i)
+    await runner.join()
+
+    assert max_running == 2
+    await runner.stop()
+
+
+@pytest.mark.asyncio
+async def test_handler_error_does_not_kill_worker():
+    """handler 예외가 발생해도 다음 작업은 계속 처리"""
+    processed = []
+
+    async def handler(eval_job_id: int):
+        if eval_job_id == 1:
+            raise RuntimeError("boom")
+        processed.append(eval_job_id)
+
+    runner = EvalJobRunner(handler=handler, workers=1)
+    await runner.submit(1)
+    await runner.submit(2)
+    await runner.join()
+
+    assert processed == [2]
+    await runner.stop()
+
+
+@pytest.mark.asyncio
+async def test_start_requeues_unfinished_jobs_once():
+    """재기동 시 DB에 남은 미완료 작업을 먼저 다시 처리"""
+    processed = []
+    recovered = []
+
+    async def handler(eval_job_id: int):
+        processed.append(eval_job_id)
+
+    async def recover():
+        recovered.append(True)
+        return [3, 5]
+
+    runner = EvalJobRunner(handler=handler, workers=1, recover=recover)
+    await runner.start()
+    await runner.submit(7)
+    await runner.join()
+
+    assert processed == [3, 5, 7]
+    assert recovered == [True]
+    await runner.stop()
+
+
+@pytest.mark.asyncio
+async def test_recovery_failure_does_not_block_new_jobs():
+    processed = []
+
+    async def handler(eval_job_id: int):
+        processed.append(eval_job_id)
+
+    async def recover():
+        raise ConnectionError("db down")
+
+    runner = EvalJobRunner(handler=handler, workers=1, recover=recover)
+    await runner.submit(1)
+    await runner.join()
+
+    assert processed == [1]
+    await runner.stop()
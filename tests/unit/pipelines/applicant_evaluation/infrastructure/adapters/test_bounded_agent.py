@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from pipelines.applicant_evaluation.infrastructure.adapters.llm.bounded_agent import (
+    ConcurrencyLimitedAnalyst,
+)
+from pipelines.applicant_evaluation.domain.models.job import JobInfo, EvaluationCriteria
+from pipelines.applicant_evaluation.domain.models.evaluation import CompetencyResult
+
+
+class SlowAgent:
+    """동시에 실행 중인 호출 수를 기록하는 가짜 Agent"""
+
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+
+    async def evaluate_competency(
+        self, job_info, criteria, resume_text, portfolio_text
+    ):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return CompetencyResult(name=criteria.name, score=50.0, description="ok")
+
+    async def synthesize_report(self, job_info, competency_results):
+        raise NotImplementedError
+
+
+@pytest.mark.asyncio
+async def test_limits_concurrent_llm_calls():
+    inner = SlowAgent()
+    agent = ConcurrencyLimitedAnalyst(inner, max_concurrency=3)
+    job_info = JobInfo(
+        company_name="TestCo",
+        main_tasks=[],
+        tech_stacks=[],
+        summary="",
+        evaluation_criteria=[EvaluationCriteria(name="c0", description="")],
+    )
+
+    results = await asyncio.gather(
+        *(
+            agent.evaluate_competency(
+                job_info, EvaluationCriteria(name=f"c{i}", description=""), "r", "p"
+            )
+            for i in range(10)
+        )
+    )
+
+    assert len(results) == 10
+    assert inner.peak == 3
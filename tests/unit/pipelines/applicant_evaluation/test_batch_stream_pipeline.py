@@ -0,0 +1,106 @@
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from pipelines.applicant_evaluation import main as main_module
+from pipelines.applicant_evaluation.domain.models.evaluation import CompetencyResult
+from pipelines.applicant_evaluation.domain.models.report import (
+    AnalysisReport,
+    ApplicantReport,
+)
+from shared.schema.applicant import BatchEvaluateRequest
+
+REPORT = AnalysisReport(
+    competency_scores=[CompetencyResult(name="기본", score=70.0, description="ok")],
+    one_line_review="Good",
+    feedback_detail="Detail",
+)
+
+
+@pytest.fixture
+async def db_engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+
+    # pysqlite의 암묵적 트랜잭션 처리를 끄고 BEGIN을 직접 보내야 SAVEPOINT가 동작
+    @event.listens_for(engine.sync_engine, "connect")
+    def _connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE parsed_docs (application_id INTEGER)"))
+        await conn.execute(text("CREATE TABLE evaluations (application_id INTEGER)"))
+    yield engine
+    await engine.dispose()
+
+
+class FakeAnalyzer:
+    """지원자마다 서류 전처리 결과를 세션에 flush한 뒤 평가 결과를 내보냄"""
+
+    def __init__(self, session):
+        self.session = session
+
+    async def evaluate_batch(self, job_id, db_lock, max_in_flight):
+        for application_id in (1, 2, 3):
+            async with db_lock:
+                await self.session.execute(
+                    text("INSERT INTO parsed_docs VALUES (:id)"), {"id": application_id}
+                )
+                await self.session.flush()
+            yield ApplicantReport(
+                job_application_id=application_id, user_id=application_id, report=REPORT
+            )
+
+
+class FlakyEvaluationRepository:
+    """2번 지원자의 결과 저장은 일부 기록 후 실패"""
+
+    def __init__(self, session):
+        self.session = session
+
+    async def save_report(self, job_application_id, report):
+        await self.session.execute(
+            text("INSERT INTO evaluations VALUES (:id)"), {"id": job_application_id}
+        )
+        if job_application_id == 2:
+            raise RuntimeError("constraint violation")
+
+
+@pytest.mark.asyncio
+async def test_failed_save_does_not_discard_other_applicants_work(
+    db_engine, monkeypatch
+):
+    async def get_db():
+        async with AsyncSession(db_engine) as session:
+            yield session
+
+    monkeypatch.setattr(main_module, "get_db", get_db)
+    monkeypatch.setattr(main_module, "_build_analyzer", FakeAnalyzer)
+    monkeypatch.setattr(
+        main_module, "SqlAlchemyEvaluationRepository", FlakyEvaluationRepository
+    )
+
+    events = [
+        event
+        async for event in main_module.batch_stream_pipeline(
+            BatchEvaluateRequest(job_posting_id="1")
+        )
+    ]
+
+    applicants = {e.data["job_application_id"]: e.data for e in events[:-1]}
+    assert applicants[2]["error_message"] == "constraint violation"
+    assert (
+        applicants[1]["error_message"] is None
+        and applicants[3]["error_message"] is None
+    )
+    assert events[-1].data == {"total": 3, "succeeded": 2, "failed": 1}
+
+    async with db_engine.connect() as conn:
+        parsed = (await conn.execute(text("SELECT * FROM parsed_docs"))).scalars()
+        saved = (await conn.execute(text("SELECT * FROM evaluations"))).scalars()
+        # 실패한 지원자의 부분 저장만 되돌리고, 서류 전처리 결과는 모두 유지
+        assert sorted(parsed.all()) == [1, 2, 3]
+        assert sorted(saved.all()) == [1, 3]
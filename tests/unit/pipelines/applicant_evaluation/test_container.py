@@ -0,0 +1,49 @@
+from unittest.mock import Mock
+
+import pytest
+
+from pipelines.applicant_evaluation import container as container_module
+from pipelines.applicant_evaluation.container import (
+    ApplicantEvaluationContainer,
+    get_container,
+    reset_container,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_container():
+    reset_container()
+    yield
+    reset_container()
+
+
+def test_get_container_is_built_once(monkeypatch):
+    build = Mock(wraps=ApplicantEvaluationContainer.build)
+    monkeypatch.setattr(container_module.ApplicantEvaluationContainer, "build", build)
+
+    first = get_container()
+    second = get_container()
+
+    assert first is second
+    build.assert_called_once()
+
+
+def test_analyzer_reuses_long_lived_dependencies():
+    container = ApplicantEvaluationContainer(
+        agent=Mock(), file_storage=Mock(), extractor=Mock()
+    )
+
+    analyzer_a = container.analyzer(Mock())
+    analyzer_b = container.analyzer(Mock())
+
+    # 요청마다 Repository(DB 세션)는 새로 만들고, 클라이언트는 공유
+    assert analyzer_a.agent is analyzer_b.agent is container.agent
+    assert analyzer_a.file_storage is analyzer_b.file_storage
+    assert analyzer_a.job_repo is not analyzer_b.job_repo
+
+
+def test_reset_container_rebuilds():
+    first = get_container()
+    reset_container()
+
+    assert get_container() is not first
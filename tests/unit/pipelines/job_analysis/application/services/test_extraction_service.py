@@ -3,14 +3,25 @@ from unittest.mock import AsyncMock, Mock
 from datetime import date
 
 from pipelines.job_analysis.application.services.extraction_service import (
+    JOB_POST_LOOKUPS,
     JobExtractionService,
 )
-from pipelines.job_analysis.domain.interface.crawler import WebCrawler
+from pipelines.job_analysis.domain.interface.crawler import (
+    AsyncWebCrawler,
+    PostingCrawler,
+    WebCrawler,
+)
 from pipelines.job_analysis.domain.interface.extractor import JobDataExtractor
+from pipelines.job_analysis.domain.interface.repository import JobPostRepository
 from pipelines.job_analysis.domain.models.job_data import (
+    CrawledPosting,
     ExtractedJobData,
     EvaluationCriteriaItem,
+    PostingFields,
+    StoredJobPost,
 )
+from pipelines.job_analysis.domain.services.section_pruner import SectionPruner
+from pipelines.job_analysis.domain.services.url_canonicalizer import hash_job_url
 from shared.schema.job_posting import JobPostingAnalyzeResponse
 
 
@@ -102,3 +113,155 @@ async def test_extract_job_data_extraction_failure(
     # When & Then
     with pytest.raises(RuntimeError, match="LLM Extraction returned empty result"):
         await service.extract_job_data(url)
+
+
+@pytest.mark.asyncio
+async def test_extract_job_data_awaits_async_crawler(mock_extractor):
+    # Given: async 엔진 크롤러는 스레드 없이 이벤트 루프에서 바로 await
+    crawler = Mock(spec=AsyncWebCrawler)
+    crawler.fetch.return_value = "Content " * 10
+    mock_extractor.extract = AsyncMock(return_value=None)
+    service = JobExtractionService(crawler=crawler, extractor=mock_extractor)
+
+    # When
+    with pytest.raises(RuntimeError):
+        await service.extract_job_data("https://www.wanted.co.kr/wd/1")
+
+    # Then
+    crawler.fetch.assert_awaited_once_with("https://www.wanted.co.kr/wd/1")
+    mock_extractor.extract.assert_awaited_once_with("Content " * 10)
+
+
+@pytest.mark.asyncio
+async def test_extract_job_data_passes_rule_based_fields_to_extractor(mock_extractor):
+    # Given: 마크업에서 회사명/공고명/마감일을 읽는 크롤러
+    fields = PostingFields(
+        company_name="컬리", job_title="백엔드 개발자", end_date=None
+    )
+    crawler = Mock(spec=PostingCrawler)
+    crawler.fetch_posting = AsyncMock(
+        return_value=CrawledPosting(text="Content " * 10, fields=fields)
+    )
+    mock_extractor.extract = AsyncMock(
+        return_value=ExtractedJobData(
+            company_name="컬리",
+            job_title="백엔드 개발자",
+            main_tasks=["주문 API 개발"],
+            tech_stacks=["Python"],
+        )
+    )
+    service = JobExtractionService(crawler=crawler, extractor=mock_extractor)
+
+    # When
+    response = await service.extract_job_data("https://www.wanted.co.kr/wd/1")
+
+    # Then
+    assert response.company_name == "컬리"
+    mock_extractor.extract.assert_awaited_once_with("Content " * 10, known=fields)
+
+
+@pytest.mark.asyncio
+async def test_extract_job_data_sends_pruned_text_and_remembers_company(
+    mock_crawler, mock_extractor
+):
+    # Given: 지원 방법/복지 섹션이 있는 공고
+    url = "https://www.wanted.co.kr/wd/1"
+    raw_text = (
+        "컬리\n백엔드 개발자\n\n주요업무\n• 주문 API 설계 및 개발\n• 결제 시스템 운영 및 장애 대응"
+        "\n\n자격요건\n• Python 백엔드 개발 경력 3년 이상"
+        "\n\n혜택 및 복지\n• 임직원 할인"
+    )
+    mock_crawler.fetch.return_value = raw_text
+    mock_extractor.extract = AsyncMock(
+        return_value=ExtractedJobData(
+            company_name="컬리",
+            job_title="백엔드 개발자",
+            main_tasks=["주문 API 설계 및 개발"],
+            tech_stacks=[],
+        )
+    )
+    pruner = Mock(wraps=SectionPruner())
+    service = JobExtractionService(
+        crawler=mock_crawler, extractor=mock_extractor, pruner=pruner
+    )
+
+    # When
+    await service.extract_job_data(url)
+
+    # Then: LLM에는 정리된 텍스트, 회사별 기록에는 원문
+    [sent] = mock_extractor.extract.await_args.args
+    assert "주문 API 설계 및 개발" in sent
+    assert "임직원 할인" not in sent
+    pruner.remember.assert_called_once_with(url, raw_text, "컬리")
+
+
+@pytest.mark.asyncio
+async def test_find_existing_returns_stored_analysis(service, mock_crawler):
+    # Given: 추적 파라미터가 붙은 URL도 표준화 URL 해시로 조회
+    url = "https://www.wanted.co.kr/wd/330563?utm_source=share"
+    job_posts = Mock(spec=JobPostRepository)
+    job_posts.find_by_url_hash.return_value = StoredJobPost(
+        job_post_id=42,
+        recruitment_status="CLOSED",
+        data=ExtractedJobData(
+            company_name="컬리",
+            job_title="Product Designer",
+            main_tasks=["프로덕트 디자인"],
+            tech_stacks=["Figma"],
+            end_date="2026-03-31",
+            ai_summary="그로스 프로덕트 디자이너",
+        ),
+    )
+
+    # When
+    response = await service.find_existing(url, job_posts)
+
+    # Then
+    job_posts.find_by_url_hash.assert_awaited_once_with(
+        hash_job_url("https://www.wanted.co.kr/wd/330563")
+    )
+    assert response.is_existing is True
+    assert response.job_posting_id == 42
+    assert response.recruitment_status == "CLOSED"
+    assert response.recruitment_period.end_date == date(2026, 3, 31)
+    mock_crawler.fetch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_find_existing_returns_none_for_new_posting(service):
+    job_posts = Mock(spec=JobPostRepository)
+    job_posts.find_by_url_hash.return_value = None
+    job_posts.find_by_source_url.return_value = None
+
+    assert (
+        await service.find_existing("https://www.wanted.co.kr/wd/1", job_posts) is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_find_existing_falls_back_to_source_url_on_hash_mismatch(service):
+    # Given: 저장 쪽이 다른 규칙(원본 URL 해시 등)으로 source_url_hash를 채운 공고
+    url = "https://www.wanted.co.kr/wd/330563?utm_source=share"
+    job_posts = Mock(spec=JobPostRepository)
+    job_posts.find_by_url_hash.return_value = None
+    job_posts.find_by_source_url.return_value = StoredJobPost(
+        job_post_id=42,
+        recruitment_status="OPEN",
+        data=ExtractedJobData(
+            company_name="컬리",
+            job_title="Product Designer",
+            main_tasks=[],
+            tech_stacks=[],
+        ),
+    )
+    mismatches = JOB_POST_LOOKUPS.value(result="source_url")
+
+    # When
+    response = await service.find_existing(url, job_posts)
+
+    # Then: 원본/표준화 URL로 찾고, 계약 불일치를 지표로 남김
+    job_posts.find_by_source_url.assert_awaited_once_with(
+        [url, "https://www.wanted.co.kr/wd/330563"]
+    )
+    assert response.job_posting_id == 42
+    assert JOB_POST_LOOKUPS.value(result="source_url") == mismatches + 1
@@ -0,0 +1,92 @@
+from pipelines.job_analysis.domain.services.section_pruner import (
+    SectionPruner,
+    estimate_tokens,
+    split_sections,
+)
+
+URL = "https://www.wanted.co.kr/wd/330563"
+OTHER_URL = "https://www.wanted.co.kr/wd/330999"
+
+INTRO = (
+    "컬리는 좋은 식재료를 새벽에 배송하는 서비스로, 고객의 식탁을 바꾸고 있습니다.\n"
+    "우리는 데이터와 실험으로 일하는 문화를 지향합니다."
+)
+
+
+def _posting(title, tasks):
+    return "\n\n".join(
+        [
+            f"컬리\n{title}",
+            f"회사 소개\n{INTRO}",
+            f"주요업무\n{tasks}",
+            "자격요건\n• Python 백엔드 개발 경력 3년 이상",
+            "혜택 및 복지\n• 컬리 적립금 및 임직원 할인\n• 자율 출퇴근제",
+            "접수기간 및 방법\n시작일\n2026.01.02 10:00\n마감일\n2026.02.01 23:59\n"
+            "지원방법\n사람인 입사지원\n제출서류: 자유 양식 이력서",
+            "근무지역\n서울 강남구 도산대로 16길 20",
+        ]
+    )
+
+
+def test_sections_split_on_blank_lines_and_known_headings():
+    text = "회사\n공고명\n\n소개 문단\n주요업무\n• API 개발\n우대사항\n• AWS"
+
+    sections = split_sections(text)
+
+    assert [(s.category, s.heading) for s in sections] == [
+        ("header", None),
+        ("body", None),
+        ("core", "주요업무"),
+        ("core", "우대사항"),
+    ]
+
+
+def test_unused_sections_are_dropped_and_schedule_keeps_dates():
+    result = SectionPruner().prune(_posting("백엔드 개발자", "• 주문 API 개발"), URL)
+
+    assert "혜택 및 복지" in result.dropped
+    assert "근무지역" in result.dropped
+    assert "지원방법" in result.dropped
+    assert "적립금" not in result.text
+    assert "도산대로" not in result.text
+    assert "사람인 입사지원" not in result.text
+    # 프롬프트가 쓰는 필드는 유지
+    for kept in ("컬리", "백엔드 개발자", "주문 API 개발", "Python 백엔드", INTRO):
+        assert kept in result.text
+    assert "시작일\n2026.01.02 10:00" in result.text
+    assert "마감일\n2026.02.01 23:59" in result.text
+    assert result.tokens_after < result.tokens_before
+
+
+def test_company_boilerplate_is_removed_from_later_postings_only():
+    pruner = SectionPruner()
+    first = _posting("백엔드 개발자", "• 주문 API 개발")
+    second = _posting("데이터 엔지니어", "• 주문 데이터 파이프라인 구축")
+
+    assert INTRO in pruner.prune(first, URL).text
+    pruner.remember(URL, first, "(주)컬리")
+
+    result = pruner.prune(second, OTHER_URL)
+    assert "새벽에 배송" not in result.text
+    assert "회사 소개" in result.dropped
+    assert result.boilerplate_lines == 2
+    assert "주문 데이터 파이프라인 구축" in result.text
+    # 같은 공고를 다시 분석할 때는 자기 자신과 비교하지 않음
+    assert INTRO in pruner.prune(first, URL).text
+
+
+def test_unknown_layout_is_left_intact():
+    pruner = SectionPruner()
+    text = "회사\n공고명\n\n" + "자유 형식 본문 " * 10
+    pruner.remember(URL, text, "회사")
+
+    result = pruner.prune(text, OTHER_URL)
+
+    assert result.text == text.strip()
+    assert result.dropped == []
+
+
+def test_token_estimate_counts_hangul_syllables_and_ascii_chunks():
+    assert estimate_tokens("백엔드") == 3
+    assert estimate_tokens("Python") == 2
+    assert estimate_tokens("") == 0
@@ -0,0 +1,123 @@
+import pytest
+
+from pipelines.job_analysis.domain.services.url_canonicalizer import (
+    canonicalize_job_url,
+    hash_job_url,
+    job_site_of,
+)
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=123&view_type=list",
+        "https://www.saramin.co.kr/zf_user/jobs/view?rec_idx=123&utm_source=kakao",
+        "http://m.saramin.co.kr/zf_user/jobs/relay/view?view_type=etc&rec_idx=123#top",
+    ],
+)
+def test_saramin_urls_share_key(url):
+    assert (
+        canonicalize_job_url(url)
+        == "https://www.saramin.co.kr/zf_user/jobs/view?rec_idx=123"
+    )
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.wanted.co.kr/wd/98765",
+        "https://www.wanted.co.kr/wd/98765?utm_source=share&referer_id=1",
+        "https://WWW.WANTED.CO.KR/wd/98765/",
+    ],
+)
+def test_wanted_urls_share_key(url):
+    assert canonicalize_job_url(url) == "https://www.wanted.co.kr/wd/98765"
+
+
+def test_other_urls_drop_tracking_params_and_sort_query():
+    url = "HTTPS://Example.com/jobs/?b=2&utm_medium=x&a=1#section"
+    assert canonicalize_job_url(url) == "https://example.com/jobs?a=1&b=2"
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        (
+            "https://evilsaramin.co.kr/zf_user/jobs/relay/view?rec_idx=1&utm_source=x",
+            "https://evilsaramin.co.kr/zf_user/jobs/relay/view?rec_idx=1",
+        ),
+        (
+            "https://saramin.co.kr.evil.com/zf_user/jobs/view?rec_idx=1",
+            "https://saramin.co.kr.evil.com/zf_user/jobs/view?rec_idx=1",
+        ),
+        ("https://notwanted.co.kr/wd/98765/", "https://notwanted.co.kr/wd/98765"),
+    ],
+)
+def test_lookalike_hosts_are_not_treated_as_job_sites(url, expected):
+    # 유사 도메인은 추적 파라미터 제거만 하고 실제 공고 URL/해시로 합쳐지지 않음
+    assert canonicalize_job_url(url) == expected
+    assert hash_job_url(url) != hash_job_url(
+        "https://www.saramin.co.kr/zf_user/jobs/view?rec_idx=1"
+    )
+    assert job_site_of(url) is None
+
+
+@pytest.mark.parametrize(
+    "url, site",
+    [
+        ("https://saramin.co.kr/zf_user/jobs/view?rec_idx=1", "saramin"),
+        ("https://m.saramin.co.kr/zf_user/jobs/view?rec_idx=1", "saramin"),
+        ("https://www.wanted.co.kr/wd/1", "wanted"),
+        ("https://example.com/jobs?from=saramin.co.kr", None),
+        ("https://example.com/wanted.co.kr/wd/1", None),
+    ],
+)
+def test_job_site_is_decided_by_host(url, site):
+    assert job_site_of(url) == site
+
+
+def test_different_postings_have_different_keys():
+    assert canonicalize_job_url(
+        "https://www.saramin.co.kr/zf_user/jobs/view?rec_idx=1"
+    ) != canonicalize_job_url("https://www.saramin.co.kr/zf_user/jobs/view?rec_idx=2")
+
+
+def test_url_hash_is_sha256_of_canonical_url():
+    url_hash = hash_job_url(
+        "https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=123&utm_source=x"
+    )
+
+    assert len(url_hash) == 64
+    assert url_hash == hash_job_url(
+        "https://www.saramin.co.kr/zf_user/jobs/view?rec_idx=123"
+    )
+    assert url_hash != hash_job_url(
+        "https://www.saramin.co.kr/zf_user/jobs/view?rec_idx=124"
+    )
+
+
+# job_posts.source_url_hash 계약 고정 값 (저장하는 쪽과 같은 값을 만들어야 기존 공고 조회가 일치)
+@pytest.mark.parametrize(
+    "url, canonical, url_hash",
+    [
+        (
+            "https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=52069064&view_type=list",
+            "https://www.saramin.co.kr/zf_user/jobs/view?rec_idx=52069064",
+            "1d9e6d93bfb845785b599f825834b9ad3c27fab3c2b121c08a14609c390b1945",
+        ),
+        (
+            "https://www.wanted.co.kr/wd/330563?utm_source=share",
+            "https://www.wanted.co.kr/wd/330563",
+            "a403bc2de9c4f7008b77229b27a301eb8607675793ff6ad92488c4925ac50cf7",
+        ),
+        (
+            "https://Careers.Example.com/jobs/?team=data&utm_medium=x&id=7#apply",
+            "https://careers.example.com/jobs?id=7&team=data",
+            "f8937b126aac894651423258b2d5f51ecdf3599d9cdfa1faecffbdb5805953e1",
+        ),
+    ],
+)
+def test_source_url_hash_contract(url, canonical, url_hash):
+    assert canonicalize_job_url(url) == canonical
+    assert hash_job_url(url) == url_hash
+    assert hash_job_url(canonical) == url_hash
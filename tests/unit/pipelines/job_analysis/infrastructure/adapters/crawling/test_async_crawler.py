@@ -0,0 +1,217 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from pipelines.job_analysis.infrastructure.adapters.crawling.async_crawler import (
+    AsyncPlaywrightCrawler,
+)
+from pipelines.job_analysis.infrastructure.adapters.crawling.page_adapter import (
+    awaitable_page,
+    run_hook,
+)
+from pipelines.job_analysis.infrastructure.adapters.crawling.strategies.default import (
+    DefaultCrawler,
+)
+
+HTML = "<html><body><h1>백엔드 개발자</h1><script>track()</script><p>Python</p></body></html>"
+URL = "https://example.com/jobs/1"
+
+
+class JSHandle:
+    def __init__(self, value):
+        self.value = value
+
+    def json_value(self):
+        return self.value
+
+
+class Page:
+    """sync 엔진용 Page 대역 (AwaitableProxy로 감싸서 훅에 전달)"""
+
+    def goto(self, url, timeout, wait_until):
+        self.url = url
+
+    def wait_for_function(self, expression, arg, timeout, polling):
+        return JSHandle("stable")
+
+    def content(self):
+        return HTML
+
+
+class FakeAsyncPage:
+    def __init__(self, browser, html):
+        self.browser = browser
+        self.html = html
+        self.closed = False
+
+    async def goto(self, url, timeout, wait_until):
+        if self.browser.gate is not None:
+            await self.browser.gate.wait()
+        self.browser.active += 1
+        self.browser.peak = max(self.browser.peak, self.browser.active)
+        await asyncio.sleep(0.01)
+        self.browser.active -= 1
+
+    async def wait_for_function(self, expression, arg, timeout, polling):
+        return FakeJSHandle()
+
+    async def content(self):
+        if isinstance(self.html, Exception):
+            raise self.html
+        return self.html
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeJSHandle:
+    async def json_value(self):
+        return "stable"
+
+
+class FakeAsyncContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.pages = []
+        self.closed = False
+
+    async def add_init_script(self, script):
+        pass
+
+    async def route(self, pattern, handler):
+        pass
+
+    async def new_page(self):
+        page = FakeAsyncPage(self.browser, self.browser.html)
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeAsyncBrowser:
+    def __init__(self, html):
+        self.html = html
+        self.contexts = []
+        self.active = 0
+        self.peak = 0
+        self.gate = None
+        self.connected = True
+        self.closed = False
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **kwargs):
+        context = FakeAsyncContext(self)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeAsyncPlaywright:
+    def __init__(self, html=HTML):
+        self.html = html
+        self.launched = []
+        self.chromium = self
+
+    async def launch(self, headless, args):
+        browser = FakeAsyncBrowser(self.html)
+        self.launched.append(browser)
+        return browser
+
+    async def stop(self):
+        pass
+
+
+def _crawler(playwright, **kwargs):
+    async def factory():
+        return playwright
+
+    return AsyncPlaywrightCrawler(
+        playwright_factory=factory, use_virtual_display=False, **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_same_strategy_hook_runs_in_both_engines():
+    # sync 엔진: 브라우저 풀 스레드에서 이벤트 루프 없이 훅 실행
+    sync_text = run_hook(DefaultCrawler()._visit(awaitable_page(Page()), URL))
+
+    crawler = _crawler(FakeAsyncPlaywright())
+    async_text = await crawler.fetch(URL)
+    await crawler.aclose()
+
+    assert sync_text == async_text == "백엔드 개발자\nPython"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_fetches_share_one_browser():
+    playwright = FakeAsyncPlaywright()
+    crawler = _crawler(playwright, max_concurrent_pages=4)
+
+    results = await asyncio.gather(*(crawler.fetch(URL) for _ in range(10)))
+    await crawler.aclose()
+
+    assert len(results) == 10
+    assert len(playwright.launched) == 1
+    browser = playwright.launched[0]
+    # 한 이벤트 루프에서 여러 페이지가 동시에 진행되지만 상한을 넘지 않음
+    assert 1 < browser.peak <= 4
+    assert all(page.closed for c in browser.contexts for page in c.pages)
+
+
+@pytest.mark.asyncio
+async def test_context_is_rotated_after_max_pages():
+    playwright = FakeAsyncPlaywright()
+    crawler = _crawler(playwright, max_pages_per_context=3)
+
+    for _ in range(7):
+        await crawler.fetch(URL)
+    await crawler.aclose()
+
+    contexts = playwright.launched[0].contexts
+    assert [len(c.pages) for c in contexts] == [3, 3, 1]
+    assert all(c.closed for c in contexts)
+
+
+@pytest.mark.asyncio
+async def test_page_error_is_translated_and_context_discarded():
+    playwright = FakeAsyncPlaywright(html=RuntimeError("renderer crashed"))
+    crawler = _crawler(playwright)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await crawler.fetch(URL)
+
+    assert exc_info.value.status_code == 500
+    assert playwright.launched[0].contexts[0].closed
+
+
+@pytest.mark.asyncio
+async def test_disconnected_browser_is_closed_before_relaunch():
+    playwright = FakeAsyncPlaywright()
+    crawler = _crawler(playwright)
+    await crawler.fetch(URL)
+    old_browser = playwright.launched[0]
+    old_browser.gate = asyncio.Event()
+
+    # 이전 브라우저에서 페이지가 진행 중일 때 연결이 끊기고 다음 요청이 들어옴
+    in_flight = asyncio.create_task(crawler.fetch(URL))
+    await asyncio.sleep(0)
+    old_browser.connected = False
+
+    assert await crawler.fetch(URL) == "백엔드 개발자\nPython"
+    assert len(playwright.launched) == 2
+    assert old_browser.closed
+    old_context = old_browser.contexts[0]
+    assert not old_context.closed
+
+    # 진행 중이던 페이지가 끝나면 버려진 컨텍스트도 닫힘
+    old_browser.gate.set()
+    await in_flight
+    assert old_context.closed
+    await crawler.aclose()
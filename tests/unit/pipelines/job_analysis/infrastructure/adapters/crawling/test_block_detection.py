@@ -0,0 +1,79 @@
+from pathlib import Path
+
+import pytest
+
+from pipelines.job_analysis.infrastructure.adapters.crawling.base import clean_html
+from pipelines.job_analysis.infrastructure.adapters.crawling.block_detection import (
+    CrawlBlocked,
+    detect_block_page,
+)
+from pipelines.job_analysis.infrastructure.adapters.crawling.strategies.saramin import (
+    SaraminCrawler,
+)
+
+FIXTURES = Path(__file__).resolve().parents[6] / "fixtures" / "data" / "job_posting"
+
+SARAMIN_URL = "https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=52069064"
+
+
+def _text(name):
+    return clean_html((FIXTURES / name).read_text(encoding="utf-8"))
+
+
+def test_recorded_block_page_is_detected_but_posting_is_not():
+    assert detect_block_page(_text("saramin_blocked.html")) == (
+        "marker",
+        "비정상적인 접근",
+    )
+    assert detect_block_page(_text("saramin_view_detail.html")) is None
+    assert detect_block_page("", title="Just a moment...") == (
+        "marker",
+        "just a moment",
+    )
+
+
+def test_short_content_and_long_postings_mentioning_markers():
+    assert detect_block_page("회사명\n공고명") == ("short_content", "7 chars")
+    # 기본 크롤러(min_chars=0)는 길이만으로 차단 판정하지 않음
+    assert detect_block_page("회사명\n공고명", min_chars=0) is None
+    # 긴 공고 본문의 "보안 확인"(보안 직무 등)은 차단 문구로 보지 않음
+    posting = "정보보호 담당자 채용\n" + "주요업무: 보안 확인 절차 운영\n" * 100
+    assert detect_block_page(posting) is None
+
+
+class BlockedPage:
+    """준비 판정 스크립트가 차단 문구를 찾은 페이지"""
+
+    url = SARAMIN_URL
+
+    def __init__(self):
+        self.calls = []
+
+    async def goto(self, url, timeout, wait_until):
+        self.calls.append("goto")
+
+    async def wait_for_function(self, expression, arg, timeout, polling):
+        self.calls.append("wait_for_function")
+        return self
+
+    async def json_value(self):
+        return "blocked"
+
+    async def title(self):
+        return "사람인 - 보안 확인"
+
+    async def evaluate(self, script, arg=None):
+        self.calls.append("evaluate")
+        raise AssertionError("blocked page must not be parsed")
+
+
+@pytest.mark.asyncio
+async def test_blocked_page_fails_before_parsing():
+    page = BlockedPage()
+
+    with pytest.raises(CrawlBlocked) as exc_info:
+        await SaraminCrawler()._visit(page, SARAMIN_URL)
+
+    assert exc_info.value.reason == "marker"
+    assert "보안 확인" in str(exc_info.value)
+    assert page.calls == ["goto", "wait_for_function"]
@@ -0,0 +1,166 @@
+import threading
+
+import pytest
+
+from pipelines.job_analysis.infrastructure.adapters.crawling.browser_pool import (
+    BrowserPool,
+)
+from shared.concurrency import Deadline, DeadlineExceeded, deadline_scope
+from shared.log_context import current_request_id, request_id_scope
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+        self.closed = False
+
+    def add_init_script(self, script):
+        pass
+
+    def route(self, pattern, handler):
+        pass
+
+    def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+        self.closed = False
+
+    def new_context(self, **kwargs):
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+    def is_connected(self):
+        return not self.closed
+
+    def close(self):
+        self.closed = True
+
+
+class FakePlaywright:
+    """sync_playwright().start() 대역 - 실행된 브라우저를 기록"""
+
+    def __init__(self, launched):
+        self.launched = launched
+        self.chromium = self
+
+    def launch(self, headless, args):
+        browser = FakeBrowser()
+        self.launched.append(browser)
+        return browser
+
+    def stop(self):
+        pass
+
+
+def _pool(launched, **kwargs):
+    kwargs.setdefault("size", 1)
+    return BrowserPool(
+        playwright_factory=lambda: FakePlaywright(launched),
+        use_virtual_display=False,
+        **kwargs,
+    )
+
+
+def test_browser_is_launched_once_for_many_pages():
+    launched = []
+    pool = _pool(launched)
+    try:
+        pages = [pool.run(lambda page: page) for _ in range(5)]
+    finally:
+        pool.close()
+
+    assert len(launched) == 1
+    assert len({id(page) for page in pages}) == 5
+    assert all(page.closed for page in pages)
+    assert launched[0].closed
+
+
+def test_context_and_browser_are_recycled_by_page_count():
+    launched = []
+    pool = _pool(launched, max_pages_per_context=2, max_pages_per_browser=5)
+    try:
+        for _ in range(7):
+            pool.run(lambda page: None)
+    finally:
+        pool.close()
+
+    # 브라우저: 5 페이지 후 교체, 컨텍스트: 2 페이지마다 교체
+    assert len(launched) == 2
+    assert [len(c.pages) for c in launched[0].contexts] == [2, 2, 1]
+    assert [len(c.pages) for c in launched[1].contexts] == [2]
+    assert all(c.closed for c in launched[0].contexts)
+
+
+def test_job_runs_on_worker_thread_with_caller_context():
+    pool = _pool([])
+    deadline = Deadline(10)
+    try:
+        with deadline_scope(deadline), request_id_scope("req-1"):
+            thread_name, request_id = pool.run(
+                lambda page: (threading.current_thread().name, current_request_id())
+            )
+    finally:
+        pool.close()
+
+    assert thread_name.startswith("browser-pool-")
+    assert request_id == "req-1"
+
+
+def test_expired_deadline_is_not_served():
+    launched = []
+    pool = _pool(launched)
+    try:
+        with deadline_scope(Deadline(0)):
+            with pytest.raises(DeadlineExceeded):
+                pool.run(lambda page: pytest.fail("should not run"))
+    finally:
+        pool.close()
+
+    assert launched == []
+
+
+def test_job_error_propagates_and_discards_context():
+    launched = []
+    pool = _pool(launched)
+
+    def boom(page):
+        raise ValueError("parse failed")
+
+    try:
+        with pytest.raises(ValueError, match="parse failed"):
+            pool.run(boom)
+        pool.run(lambda page: None)
+    finally:
+        pool.close()
+
+    # 브라우저는 유지하고 컨텍스트만 새로 생성
+    assert len(launched) == 1
+    assert [c.closed for c in launched[0].contexts] == [True, True]
+    assert len(launched[0].contexts) == 2
+
+
+def test_closed_pool_rejects_new_jobs():
+    pool = _pool([])
+    pool.close()
+
+    with pytest.raises(RuntimeError):
+        pool.run(lambda page: None)
@@ -0,0 +1,162 @@
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from pipelines.job_analysis.domain.models.snapshot import CrawlSnapshot
+from pipelines.job_analysis.infrastructure.adapters.crawling.block_detection import (
+    CrawlBlocked,
+)
+from pipelines.job_analysis.infrastructure.adapters.crawling.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakerCrawler,
+)
+from pipelines.job_analysis.infrastructure.persistence.snapshot_store import (
+    BlobSnapshotStore,
+    LocalBlobBackend,
+)
+from shared.metrics import REGISTRY
+
+URL = "https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=52069064"
+DOMAIN = "saramin.co.kr"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class ScriptedCrawler:
+    """호출마다 준비된 결과(텍스트 또는 예외)를 순서대로 반환"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    async def fetch(self, url):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+def _blocked():
+    return CrawlBlocked(URL, "marker", "보안 확인")
+
+
+def test_opens_after_consecutive_blocks_and_probes_once_after_cooldown():
+    clock = Clock()
+    breaker = CircuitBreaker(failure_threshold=2, cooldown_seconds=60, clock=clock)
+
+    breaker.record_failure(DOMAIN)
+    assert breaker.state(DOMAIN) == CLOSED
+    breaker.record_failure(DOMAIN)
+    assert breaker.state(DOMAIN) == OPEN
+    assert not breaker.acquire(DOMAIN)
+    assert breaker.retry_after(DOMAIN) == 60
+    # 다른 도메인은 영향 없음
+    assert breaker.acquire("wanted.co.kr")
+
+    clock.now += 60
+    assert breaker.acquire(DOMAIN)  # probe
+    assert breaker.state(DOMAIN) == HALF_OPEN
+    assert not breaker.acquire(DOMAIN)  # probe가 끝날 때까지 다른 요청은 차단
+
+    breaker.record_failure(DOMAIN)  # probe도 차단 -> 다시 open
+    assert breaker.state(DOMAIN) == OPEN
+    clock.now += 60
+    assert breaker.acquire(DOMAIN)
+    breaker.record_success(DOMAIN)
+    assert breaker.state(DOMAIN) == CLOSED
+    assert breaker.acquire(DOMAIN)
+
+
+def test_success_resets_consecutive_failures_and_release_frees_probe():
+    clock = Clock()
+    breaker = CircuitBreaker(failure_threshold=2, cooldown_seconds=60, clock=clock)
+
+    breaker.record_failure(DOMAIN)
+    breaker.record_success(DOMAIN)
+    breaker.record_failure(DOMAIN)
+    assert breaker.state(DOMAIN) == CLOSED
+
+    breaker.record_failure(DOMAIN)
+    clock.now += 60
+    assert breaker.acquire(DOMAIN)
+    # probe가 타임아웃 등 차단과 무관하게 실패하면 다음 요청이 다시 probe
+    breaker.release(DOMAIN)
+    assert breaker.state(DOMAIN) == HALF_OPEN
+    assert breaker.acquire(DOMAIN)
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast_with_retry_after():
+    clock = Clock()
+    inner = ScriptedCrawler(_blocked(), "unused")
+    crawler = CircuitBreakerCrawler(
+        inner, CircuitBreaker(failure_threshold=1, cooldown_seconds=30, clock=clock)
+    )
+
+    with pytest.raises(HTTPException) as first:
+        await crawler.fetch(URL)
+    clock.now += 10
+    with pytest.raises(HTTPException) as second:
+        await crawler.fetch(URL)
+
+    assert first.value.status_code == second.value.status_code == 503
+    assert second.value.headers == {"Retry-After": "20"}
+    # circuit이 열린 뒤에는 크롤러를 호출하지 않음
+    assert inner.calls == 1
+    text = REGISTRY.render()
+    assert 'crawler_blocked_pages_total{site="saramin",reason="marker"}' in text
+    assert 'crawler_circuit_state{site="saramin"} 2' in text
+
+
+@pytest.mark.asyncio
+async def test_blocked_and_open_requests_are_answered_from_snapshots(tmp_path):
+    store = BlobSnapshotStore(
+        blobs=LocalBlobBackend(str(tmp_path)),
+        index_path=str(tmp_path / "index.sqlite3"),
+    )
+    await store.save(
+        CrawlSnapshot(
+            url=URL,
+            captured_at=datetime(2026, 10, 1, tzinfo=timezone.utc),
+            source="http",
+            text="지난 크롤링 결과",
+        )
+    )
+    clock = Clock()
+    inner = ScriptedCrawler(_blocked(), "새 크롤링 결과")
+    crawler = CircuitBreakerCrawler(
+        inner,
+        CircuitBreaker(failure_threshold=1, cooldown_seconds=30, clock=clock),
+        store=store,
+    )
+
+    assert await crawler.fetch(URL) == "지난 크롤링 결과"  # 차단 -> 스냅샷
+    assert await crawler.fetch(URL) == "지난 크롤링 결과"  # open -> 크롤링 없이 스냅샷
+    clock.now += 30
+    assert await crawler.fetch(URL) == "새 크롤링 결과"  # probe 성공 -> closed
+    assert inner.calls == 2
+    assert crawler.breaker.state(DOMAIN) == CLOSED
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_other_errors_propagate_without_opening():
+    inner = ScriptedCrawler(HTTPException(status_code=400, detail="nav failed"))
+    crawler = CircuitBreakerCrawler(inner, CircuitBreaker(failure_threshold=1))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await crawler.fetch(URL)
+
+    assert exc_info.value.status_code == 400
+    assert crawler.breaker.state(DOMAIN) == CLOSED
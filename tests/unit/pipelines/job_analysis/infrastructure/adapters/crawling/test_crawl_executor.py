@@ -0,0 +1,118 @@
+import asyncio
+import contextvars
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from pipelines.job_analysis.domain.interface.crawler import WebCrawler
+from pipelines.job_analysis.infrastructure.adapters.crawling.executor import (
+    CRAWL_QUEUE_SECONDS,
+    CrawlExecutor,
+    ExecutorCrawler,
+)
+
+
+class Tracker:
+    """도메인별 동시 실행 수 기록"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = {}
+        self.peak = {}
+        self.order = []
+
+    def job(self, domain, name, hold=0.05):
+        def run():
+            with self.lock:
+                self.active[domain] = self.active.get(domain, 0) + 1
+                self.peak[domain] = max(self.peak.get(domain, 0), self.active[domain])
+                self.order.append(name)
+            time.sleep(hold)
+            with self.lock:
+                self.active[domain] -= 1
+            return name
+
+        return run
+
+
+def test_per_domain_cap_lets_other_domains_through():
+    executor = CrawlExecutor(max_workers=4, per_domain_limit=2)
+    tracker = Tracker()
+
+    futures = [
+        executor.submit("saramin.co.kr", tracker.job("saramin.co.kr", f"s{i}"))
+        for i in range(5)
+    ]
+    futures.append(executor.submit("wanted.co.kr", tracker.job("wanted.co.kr", "w0")))
+    results = [f.result(5) for f in futures]
+    executor.shutdown()
+
+    assert results == ["s0", "s1", "s2", "s3", "s4", "w0"]
+    assert tracker.peak["saramin.co.kr"] == 2
+    # 사람인 작업이 상한에 걸려 있는 동안 뒤에 들어온 원티드 작업이 먼저 실행됨
+    assert tracker.order.index("w0") < tracker.order.index("s2")
+
+
+def test_fifo_order_and_cancelled_jobs_are_skipped():
+    executor = CrawlExecutor(max_workers=1, per_domain_limit=1)
+    tracker = Tracker()
+    gate = threading.Event()
+
+    blocker = executor.submit("a.com", gate.wait)
+    queued = [
+        executor.submit("a.com", tracker.job("a.com", f"a{i}", 0)) for i in range(3)
+    ]
+    queued[1].cancel()
+    gate.set()
+
+    assert blocker.result(5) is True
+    assert [queued[0].result(5), queued[2].result(5)] == ["a0", "a2"]
+    assert tracker.order == ["a0", "a2"]
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_crawler_runs_on_dedicated_threads_with_caller_context():
+    request_id = contextvars.ContextVar("request_id", default=None)
+    seen = {}
+
+    def fetch(url):
+        seen["thread"] = threading.current_thread().name
+        seen["request_id"] = request_id.get()
+        return "crawled text"
+
+    inner = Mock(spec=WebCrawler)
+    inner.fetch.side_effect = fetch
+    inner.close = Mock()
+    crawler = ExecutorCrawler(inner, CrawlExecutor(max_workers=2))
+    before = CRAWL_QUEUE_SECONDS.count(site="saramin")
+
+    request_id.set("req-1")
+    text = await crawler.fetch("https://www.saramin.co.kr/zf_user/jobs/view?rec_idx=1")
+    await crawler.aclose()
+
+    assert text == "crawled text"
+    assert seen["request_id"] == "req-1"
+    assert seen["thread"].startswith("crawl-executor-")
+    assert CRAWL_QUEUE_SECONDS.count(site="saramin") == before + 1
+    inner.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_cancels_queued_crawls():
+    executor = CrawlExecutor(max_workers=1)
+    gate = threading.Event()
+    running = executor.submit("a.com", gate.wait)
+    waiting = asyncio.ensure_future(executor.run("a.com", lambda: "late"))
+    await asyncio.sleep(0.01)
+
+    threading.Timer(0.05, gate.set).start()
+    await asyncio.to_thread(executor.shutdown)
+
+    assert running.result(1) is True
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    with pytest.raises(RuntimeError):
+        executor.submit("a.com", lambda: None)
@@ -0,0 +1,56 @@
+import warnings
+from pathlib import Path
+
+import pytest
+
+from pipelines.job_analysis.infrastructure.adapters.crawling.html_cleaner import (
+    clean_html,
+    clean_html_lxml,
+    clean_html_soup,
+)
+
+FIXTURES = Path(__file__).resolve().parents[6] / "fixtures" / "data" / "job_posting"
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "saramin_view.html",
+        "saramin_view_detail.html",
+        "saramin_blocked.html",
+        "wanted_job_page.html",
+    ],
+)
+def test_lxml_engine_matches_soup_engine_on_recorded_pages(name):
+    html = (FIXTURES / name).read_text(encoding="utf-8")
+
+    assert clean_html_lxml(html) == clean_html_soup(html)
+
+
+@pytest.mark.parametrize(
+    "html, expected",
+    [
+        # 제외 태그 뒤 텍스트는 앞 텍스트와 합쳐지지 않고 별도 줄
+        ("<p>Hello<script>track()</script> world</p>", "Hello\nworld"),
+        (
+            "<div><header><nav>menu</nav>title</header>본문<footer>f</footer>끝</div>",
+            "본문\n끝",
+        ),
+        ("<p>a<!-- comment -->b&nbsp;c</p><br><p>d</p>", "a\nb\xa0c\nd"),
+        ("<div>첫 줄\n\n\n   \n 둘째 줄</div>", "첫 줄\n\n 둘째 줄"),
+        ("", ""),
+        ("   \n ", ""),
+    ],
+)
+def test_output_contract(html, expected):
+    assert clean_html(html) == expected
+    assert clean_html_soup(html) == expected
+
+
+def test_str_input_with_encoding_declaration_is_parsed_as_bytes():
+    # lxml은 인코딩 선언이 있는 str을 받지 않음 -> UTF-8 bytes로 다시 파싱 (경고 없음)
+    html = '<?xml version="1.0" encoding="utf-8"?><p>공고</p>'
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert clean_html_lxml(html) == "공고"
@@ -0,0 +1,145 @@
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from pipelines.job_analysis.domain.interface.crawler import AsyncWebCrawler, WebCrawler
+from pipelines.job_analysis.infrastructure.adapters.crawling.http_fast_path import (
+    HttpFastPath,
+    HttpFirstCrawler,
+)
+
+FIXTURES = Path(__file__).resolve().parents[6] / "fixtures" / "data" / "job_posting"
+
+SARAMIN_URL = "https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=52069064"
+WANTED_URL = "https://www.wanted.co.kr/wd/330563"
+
+
+def _fixture(name):
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+def _transport(routes, requested):
+    """경로 -> (상태 코드, 픽스처 파일) 로 응답하는 녹화 응답 transport"""
+
+    def handler(request):
+        requested.append(request.url.path)
+        status, name = routes.get(request.url.path, (404, None))
+        body = _fixture(name) if name else ""
+        return httpx.Response(status, text=body)
+
+    return httpx.MockTransport(handler)
+
+
+def _crawler(routes, fallback=None):
+    requested = []
+    fallback = fallback or Mock(spec=WebCrawler)
+    fast_path = HttpFastPath(transport=_transport(routes, requested))
+    return HttpFirstCrawler(fast_path=fast_path, fallback=fallback), requested
+
+
+SARAMIN_ROUTES = {
+    "/zf_user/jobs/relay/view": (200, "saramin_view.html"),
+    "/zf_user/jobs/relay/view-detail": (200, "saramin_view_detail.html"),
+}
+
+
+@pytest.mark.asyncio
+async def test_saramin_page_and_iframe_document_are_parsed_without_browser():
+    crawler, requested = _crawler(SARAMIN_ROUTES)
+
+    text = await crawler.fetch(SARAMIN_URL)
+    await crawler.aclose()
+
+    # 헤더 -> 요약 -> 본문(iframe) -> 접수 방법 순서, 스크립트 제거
+    assert text.index("AI Platform 백엔드 개발자") < text.index("경력 5~10년")
+    assert text.index("경력 5~10년") < text.index("주요업무")
+    assert text.index("주요업무") < text.index("2026.02.01 23:59")
+    assert "document.domain" not in text
+    assert sorted(requested) == sorted(p for p in SARAMIN_ROUTES)
+    crawler.fallback.fetch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_wanted_posting_is_read_from_api_payload():
+    crawler, requested = _crawler({"/api/v4/jobs/330563": (200, "wanted_job_api.json")})
+
+    text = await crawler.fetch(WANTED_URL)
+
+    assert text.startswith("컬리\nProduct Designer (그로스)")
+    assert "주요업무\n• 그로스 프로덕트" in text
+    assert "마감일\n상시채용" in text
+    assert "근무지역\n서울 강남구 도산대로 16길 20" in text
+    assert requested == ["/api/v4/jobs/330563"]
+    crawler.fallback.fetch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_wanted_falls_back_to_next_data_when_api_fails():
+    crawler, requested = _crawler({"/wd/330563": (200, "wanted_job_page.html")})
+
+    text = await crawler.fetch(WANTED_URL)
+
+    assert "자격요건\n• UI/UX 디자인 실무 경력" in text
+    assert requested == ["/api/v4/jobs/330563", "/wd/330563"]
+    crawler.fallback.fetch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_blocked_page_fails_validation_and_uses_browser():
+    fallback = Mock(spec=WebCrawler)
+    fallback.fetch.return_value = "browser text"
+    crawler, _ = _crawler(
+        {
+            "/zf_user/jobs/relay/view": (200, "saramin_blocked.html"),
+            "/zf_user/jobs/relay/view-detail": (200, "saramin_blocked.html"),
+        },
+        fallback=fallback,
+    )
+
+    assert await crawler.fetch(SARAMIN_URL) == "browser text"
+    fallback.fetch.assert_called_once_with(SARAMIN_URL)
+
+
+@pytest.mark.asyncio
+async def test_http_error_falls_back_to_async_browser_engine():
+    fallback = Mock(spec=AsyncWebCrawler)
+    fallback.fetch.return_value = "browser text"
+    fallback.aclose = AsyncMock()
+    crawler, _ = _crawler({}, fallback=fallback)
+
+    assert await crawler.fetch(WANTED_URL) == "browser text"
+    fallback.fetch.assert_awaited_once_with(WANTED_URL)
+
+    await crawler.aclose()
+    fallback.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_unsupported_site_goes_straight_to_browser():
+    fallback = Mock(spec=WebCrawler)
+    fallback.fetch.return_value = "browser text"
+    crawler, requested = _crawler(SARAMIN_ROUTES, fallback=fallback)
+
+    assert await crawler.fetch("https://careers.example.com/jobs/1") == "browser text"
+    assert requested == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://careers.example.com/jobs/1?from=saramin.co.kr",
+        "https://careers.example.com/wanted.co.kr/wd/1",
+        "https://evilsaramin.co.kr/zf_user/jobs/relay/view?rec_idx=52069064",
+    ],
+)
+async def test_site_is_routed_by_host_not_substring(url):
+    fallback = Mock(spec=WebCrawler)
+    fallback.fetch.return_value = "browser text"
+    crawler, requested = _crawler(SARAMIN_ROUTES, fallback=fallback)
+
+    assert HttpFastPath.site_of(url) is None
+    assert await crawler.fetch(url) == "browser text"
+    assert requested == []
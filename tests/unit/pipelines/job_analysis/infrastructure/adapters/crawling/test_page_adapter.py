@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from pipelines.job_analysis.infrastructure.adapters.crawling.page_adapter import (
+    awaitable_page,
+    run_hook,
+)
+
+
+# sync Playwright 대역 - 어댑터가 async API의 같은 이름 클래스로 메서드 종류를 판별하므로 이름을 맞춤
+class Locator:
+    def __init__(self, selector, html):
+        self.selector = selector
+        self.html = html
+
+    @property
+    def first(self):
+        return self
+
+    def count(self):
+        return 1 if self.html else 0
+
+    def inner_html(self):
+        return self.html
+
+
+class Page:
+    url = "https://example.com/jobs/1"
+
+    def __init__(self, dom):
+        self.dom = dom
+
+    def locator(self, selector):
+        return Locator(selector, self.dom.get(selector, ""))
+
+    def title(self):
+        return "채용 공고"
+
+
+def test_async_methods_are_awaitable_and_sync_ones_are_not():
+    async def hook(page):
+        locator = page.locator(".header").first  # async API에서도 동기
+        return (
+            page.url,
+            await page.title(),
+            await locator.count(),
+            await locator.inner_html(),
+        )
+
+    page = awaitable_page(Page({".header": "<h1>Backend</h1>"}))
+
+    assert run_hook(hook(page)) == (
+        "https://example.com/jobs/1",
+        "채용 공고",
+        1,
+        "<h1>Backend</h1>",
+    )
+
+
+def test_hook_exceptions_propagate():
+    async def hook(page):
+        if await page.locator(".missing").count() == 0:
+            raise LookupError("section not found")
+
+    with pytest.raises(LookupError):
+        run_hook(hook(awaitable_page(Page({}))))
+
+
+def test_hook_awaiting_event_loop_is_rejected():
+    async def hook(page):
+        await asyncio.sleep(0)
+
+    with pytest.raises(RuntimeError, match="non-Playwright awaitable"):
+        run_hook(hook(awaitable_page(Page({}))))
@@ -0,0 +1,104 @@
+from pathlib import Path
+
+import pytest
+
+from pipelines.job_analysis.infrastructure.adapters.crawling.capture import (
+    capture_scope,
+    record_raw_html,
+)
+from pipelines.job_analysis.infrastructure.adapters.crawling.posting_fields import (
+    PostingFieldsCrawler,
+    parse_posting_date,
+    parse_posting_fields,
+)
+
+FIXTURES = Path(__file__).resolve().parents[6] / "fixtures" / "data" / "job_posting"
+
+SARAMIN_URL = "https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=52069064"
+WANTED_URL = "https://www.wanted.co.kr/wd/330563"
+
+WANTED_FIELDS = {
+    "company_name": "컬리",
+    "job_title": "Product Designer (그로스)",
+    "end_date": None,  # due_time 없음 = 상시채용
+    "tech_stacks": ["Figma", "UX Design"],
+}
+
+
+def _fixture(name):
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+def test_saramin_header_and_period_markup():
+    fields = parse_posting_fields(SARAMIN_URL, _fixture("saramin_view.html"))
+
+    assert fields.known() == {
+        "company_name": "(주)셀키",
+        "job_title": "AI Platform 백엔드 개발자",
+        "start_date": "2026-01-02",
+        "end_date": "2026-02-01",
+    }
+
+
+@pytest.mark.parametrize("name", ["wanted_job_api.json", "wanted_job_page.html"])
+def test_wanted_job_payload(name):
+    assert parse_posting_fields(WANTED_URL, _fixture(name)).known() == WANTED_FIELDS
+
+
+def test_wanted_rendered_markup_without_next_data():
+    html = """
+    <div class="JobHeader_JobHeader__TZkW3">
+      <h1>데이터 엔지니어</h1>
+      <a href="/company/1234" data-company-name="컬리">컬리 · 서울</a>
+    </div>
+    <section class="JobDueTime_JobDueTime__yvhtg"><h2>마감일</h2><span>2026.03.31</span></section>
+    """
+
+    assert parse_posting_fields(WANTED_URL, html).known() == {
+        "company_name": "컬리",
+        "job_title": "데이터 엔지니어",
+        "end_date": "2026-03-31",
+    }
+
+
+def test_blocked_or_unsupported_pages_have_no_fields():
+    assert parse_posting_fields(SARAMIN_URL, _fixture("saramin_blocked.html")) is None
+    assert parse_posting_fields("https://example.com/jobs/1", "<h1>공고</h1>") is None
+    assert parse_posting_fields(SARAMIN_URL, None) is None
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("2026.02.01 23:59", {"value": "2026-02-01"}),
+        ("2026년 3월 5일", {"value": "2026-03-05"}),
+        ("2026-02-01T23:59:59", {"value": "2026-02-01"}),
+        ("상시채용", {"value": None}),
+        ("채용시 마감", {"value": None}),
+        ("D-25", {}),
+    ],
+)
+def test_posting_date(text, expected):
+    assert parse_posting_date(text) == expected
+
+
+class RecordingCrawler:
+    def __init__(self, raw_html):
+        self.raw_html = raw_html
+
+    async def fetch(self, url):
+        # 안쪽 데코레이터(스냅샷 저장)가 연 범위도 같은 캡처를 공유
+        with capture_scope():
+            record_raw_html(self.raw_html, source="http")
+        return "정제된 공고 텍스트"
+
+
+@pytest.mark.asyncio
+async def test_crawler_returns_text_with_fields_from_captured_raw_html():
+    crawler = PostingFieldsCrawler(RecordingCrawler(_fixture("wanted_job_api.json")))
+
+    posting = await crawler.fetch_posting(WANTED_URL)
+
+    assert posting.text == "정제된 공고 텍스트"
+    assert posting.fields.known() == WANTED_FIELDS
+    assert await crawler.fetch(WANTED_URL) == "정제된 공고 텍스트"
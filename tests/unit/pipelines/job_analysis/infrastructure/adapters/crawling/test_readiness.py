@@ -0,0 +1,89 @@
+import pytest
+
+from pipelines.job_analysis.infrastructure.adapters.crawling.readiness import (
+    ReadinessTracker,
+    domain_of,
+    wait_until_ready,
+)
+from shared.concurrency import Deadline, DeadlineExceeded, deadline_scope
+from shared.metrics import REGISTRY
+
+
+def test_default_timeout_until_enough_samples():
+    tracker = ReadinessTracker(min_samples=5)
+    for _ in range(4):
+        tracker.record("saramin.co.kr", "content", 1.0)
+
+    assert tracker.timeout_ms("saramin.co.kr", "content") == 15000
+
+
+def test_timeout_follows_recorded_percentile_within_bounds():
+    tracker = ReadinessTracker(min_samples=10, percentile=0.9, multiplier=1.5)
+    for i in range(1, 11):
+        tracker.record("wanted.co.kr", "content", i * 0.4)  # 0.4 ~ 4.0초
+
+    # p90 = 3.6초 x 1.5
+    assert tracker.timeout_ms("wanted.co.kr", "content") == pytest.approx(5400)
+    # 다른 도메인/단계는 영향 없음
+    assert tracker.timeout_ms("saramin.co.kr", "content") == 15000
+
+    fast = ReadinessTracker(min_samples=3)
+    for _ in range(3):
+        fast.record("example.com", "navigation", 0.05)
+    assert fast.timeout_ms("example.com", "navigation") == 3000  # 하한
+
+
+def test_distribution_is_exported_as_metrics():
+    tracker = ReadinessTracker(min_samples=2)
+    tracker.record("saramin.co.kr", "navigation", 0.3)
+    tracker.record("saramin.co.kr", "navigation", 0.6)
+    tracker.record_miss("careers.example.com", "content")
+
+    text = REGISTRY.render()
+    assert 'crawler_readiness_seconds_count{site="saramin",stage="navigation"}' in text
+    assert (
+        'crawler_readiness_quantile_seconds{site="saramin",stage="navigation",quantile="0.5"} 0.3'
+        in text
+    )
+    assert (
+        'crawler_readiness_timeout_seconds{site="saramin",stage="navigation"} 3' in text
+    )
+    assert 'crawler_readiness_misses_total{site="other",stage="content"}' in text
+
+
+def test_least_recent_domains_are_evicted():
+    tracker = ReadinessTracker(min_samples=1, max_domains=2)
+    for domain in ("a.com", "b.com", "c.com"):
+        tracker.record(domain, "navigation", 0.1)
+        tracker.record(domain, "content", 0.1)
+
+    assert tracker.timeout_ms("a.com", "navigation") == 15000
+    assert tracker.timeout_ms("c.com", "navigation") == 3000
+    assert domain_of("https://www.Saramin.co.kr/zf_user") == "saramin.co.kr"
+
+
+@pytest.mark.asyncio
+async def test_wait_until_ready_reports_signal_and_timeout():
+    class Handle:
+        async def json_value(self):
+            return "selector"
+
+    class Page:
+        def __init__(self, error=None):
+            self.error = error
+
+        async def wait_for_function(self, expression, arg, timeout, polling):
+            self.timeout = timeout
+            if self.error:
+                raise self.error
+            return Handle()
+
+    page = Page()
+    assert await wait_until_ready(page, ["#root"], 4000, 500) == "selector"
+    assert page.timeout == 4000
+    assert await wait_until_ready(Page(TimeoutError()), ["#root"], 4000, 500) is None
+
+    # 예산이 소진되면 타임아웃으로 삼키지 않음
+    with deadline_scope(Deadline(0)):
+        with pytest.raises(DeadlineExceeded):
+            await wait_until_ready(Page(), ["#root"], 4000, 500)
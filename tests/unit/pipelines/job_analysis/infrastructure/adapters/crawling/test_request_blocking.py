@@ -0,0 +1,70 @@
+import pytest
+
+from pipelines.job_analysis.infrastructure.adapters.crawling.page_adapter import (
+    awaitable_page,
+    run_hook,
+)
+from pipelines.job_analysis.infrastructure.adapters.crawling.request_blocking import (
+    BLOCKED_URL_PATTERNS,
+    blocked_url_patterns,
+    install_request_blocking,
+)
+
+
+# sync Playwright 대역 - 어댑터가 async API의 같은 이름 클래스로 메서드 종류를 판별하므로 이름을 맞춤
+class CDPSession:
+    def __init__(self, sent):
+        self.sent = sent
+
+    def send(self, method, params=None):
+        self.sent.append((method, params))
+
+
+class BrowserContext:
+    def __init__(self):
+        self.sent = []
+        self.session_pages = []
+
+    def new_cdp_session(self, page):
+        self.session_pages.append(page)
+        return CDPSession(self.sent)
+
+
+class Page:
+    def __init__(self):
+        self.context = BrowserContext()
+
+
+def test_allowed_categories_are_left_out():
+    patterns = blocked_url_patterns({"tracker"})
+
+    assert "*.woff2" in patterns and "*.css?*" in patterns
+    assert not set(BLOCKED_URL_PATTERNS["tracker"]) & set(patterns)
+    with pytest.raises(ValueError):
+        blocked_url_patterns({"script"})
+
+
+def test_sync_engine_page_gets_blocklist_through_cdp():
+    page = Page()
+
+    installed = run_hook(install_request_blocking(awaitable_page(page), {"tracker"}))
+
+    assert installed
+    # 어댑터로 감싼 페이지가 아니라 원래 sync Page로 세션을 염
+    assert page.context.session_pages == [page]
+    assert page.context.sent == [
+        ("Network.enable", None),
+        ("Network.setBlockedURLs", {"urls": blocked_url_patterns({"tracker"})}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_missing_cdp_falls_back_to_loading_everything():
+    class NoCdpContext:
+        async def new_cdp_session(self, page):
+            raise RuntimeError("CDP session is only available in Chromium")
+
+    class AsyncPage:
+        context = NoCdpContext()
+
+    assert await install_request_blocking(AsyncPage()) is False
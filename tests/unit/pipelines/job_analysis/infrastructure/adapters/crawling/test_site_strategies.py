@@ -0,0 +1,117 @@
+import pytest
+
+from pipelines.job_analysis.infrastructure.adapters.crawling.strategies.saramin import (
+    SaraminCrawler,
+)
+from pipelines.job_analysis.infrastructure.adapters.crawling.strategies.wanted import (
+    WantedCrawler,
+)
+
+
+class FakeFrame:
+    def __init__(self, html):
+        self.html = html
+
+    async def wait_for_load_state(self, state, timeout):
+        pass
+
+    def locator(self, selector):
+        return FakeLocator(self.html if selector == ".user_content" else None)
+
+
+class FakeLocator:
+    def __init__(self, html, frame=None):
+        self.html = html
+        self.frame = frame
+
+    @property
+    def first(self):
+        return self
+
+    async def count(self):
+        return 0 if self.html is None else 1
+
+    async def inner_html(self):
+        return self.html
+
+    async def element_handle(self):
+        return self
+
+    async def content_frame(self):
+        return self.frame
+
+
+class FakePage:
+    """브라우저 왕복(await 되는 호출)을 기록하는 Page 대역"""
+
+    url = "https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=1"
+
+    def __init__(self, payload, frame=None):
+        self.payload = payload
+        self.frame = frame
+        self.calls = []
+
+    async def evaluate(self, script, arg):
+        self.calls.append("evaluate")
+        self.arg = arg
+        return self.payload
+
+    def locator(self, selector):
+        return FakeLocator("", frame=self.frame)
+
+
+@pytest.mark.asyncio
+async def test_saramin_sections_come_from_one_evaluate():
+    page = FakePage(
+        {
+            "sections": {
+                "header": "<h1>AI Platform 백엔드 개발자</h1>",
+                "summary": "<dl><dt>경력</dt><dd>5~10년</dd></dl>",
+                "detail": "<p>주요업무</p><script>track()</script>",
+                "howto": None,
+            },
+            "detailSource": "iframe",
+        }
+    )
+
+    text = await SaraminCrawler()._parse_page(page)
+
+    assert text == "AI Platform 백엔드 개발자\n\n경력\n5~10년\n\n주요업무"
+    assert page.calls == ["evaluate"]
+    assert page.arg["root"] == SaraminCrawler._ROOT
+
+
+@pytest.mark.asyncio
+async def test_saramin_unreadable_iframe_falls_back_to_frame_locator():
+    page = FakePage(
+        {
+            "sections": {"header": "<h1>헤더</h1>", "summary": None, "detail": None},
+            "detailSource": "iframe_unreadable",
+        },
+        frame=FakeFrame("<p>iframe 본문</p>"),
+    )
+
+    text = await SaraminCrawler()._parse_page(page)
+
+    assert text == "헤더\n\niframe 본문"
+
+
+@pytest.mark.asyncio
+async def test_wanted_expands_description_inside_the_script():
+    page = FakePage(
+        {
+            "sections": {
+                "header": "<h1>Product Designer</h1>",
+                "description": "<p>주요업무</p><p>우대사항</p>",
+                "dueTime": "<span>상시채용</span>",
+                "workplace": None,
+            },
+            "expand": "expanded",
+        }
+    )
+
+    text = await WantedCrawler()._parse_page(page)
+
+    assert text == "Product Designer\n\n주요업무\n우대사항\n\n상시채용"
+    assert page.calls == ["evaluate"]
+    assert page.arg["expandButton"].endswith("button")
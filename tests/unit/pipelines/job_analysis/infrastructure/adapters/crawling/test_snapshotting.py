@@ -0,0 +1,79 @@
+from unittest.mock import Mock
+
+import pytest
+
+from pipelines.job_analysis.domain.interface.crawler import WebCrawler
+from pipelines.job_analysis.infrastructure.adapters.crawling.capture import (
+    record_raw_html,
+)
+from pipelines.job_analysis.infrastructure.adapters.crawling.snapshotting import (
+    SnapshottingCrawler,
+)
+from pipelines.job_analysis.infrastructure.persistence.snapshot_store import (
+    BlobSnapshotStore,
+    LocalBlobBackend,
+)
+
+URL = "https://www.wanted.co.kr/wd/330563"
+
+
+class RecordingAsyncCrawler:
+    async def fetch(self, url):
+        record_raw_html("<html>posting</html>", source="http")
+        return "정제된 공고 텍스트"
+
+    async def aclose(self):
+        pass
+
+
+def _store(tmp_path):
+    return BlobSnapshotStore(
+        blobs=LocalBlobBackend(str(tmp_path)),
+        index_path=str(tmp_path / "index.sqlite3"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_raw_html_recorded_by_crawler_is_stored_with_text(tmp_path):
+    store = _store(tmp_path)
+    crawler = SnapshottingCrawler(RecordingAsyncCrawler(), store)
+
+    assert await crawler.fetch(URL) == "정제된 공고 텍스트"
+    await crawler.flush()
+
+    [record] = await store.find(url=URL)
+    snapshot = await store.load(record.content_hash)
+    assert (snapshot.source, snapshot.raw_html) == ("http", "<html>posting</html>")
+    assert snapshot.text == "정제된 공고 텍스트"
+    await crawler.aclose()
+
+
+@pytest.mark.asyncio
+async def test_capture_reaches_sync_crawler_thread(tmp_path):
+    # sync 크롤러(브라우저 풀)는 to_thread에서 실행되어도 같은 캡처에 기록
+    def fetch(url):
+        record_raw_html("<html>browser</html>", source="browser")
+        return "text"
+
+    inner = Mock(spec=WebCrawler)
+    inner.fetch.side_effect = fetch
+    store = _store(tmp_path)
+    crawler = SnapshottingCrawler(inner, store)
+
+    await crawler.fetch(URL)
+    await crawler.flush()
+
+    [record] = await store.find()
+    assert record.source == "browser"
+    assert (await store.load(record.content_hash)).raw_html == "<html>browser</html>"
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_store_failure_does_not_fail_crawl():
+    store = Mock()
+    store.save.side_effect = OSError("disk full")
+    crawler = SnapshottingCrawler(RecordingAsyncCrawler(), store)
+
+    assert await crawler.fetch(URL) == "정제된 공고 텍스트"
+    await crawler.flush()
@@ -0,0 +1,222 @@
+import asyncio
+import json
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from pipelines.job_analysis.domain.models.job_data import PostingFields
+from pipelines.job_analysis.infrastructure.adapters.llm.chunked_extraction import (
+    ChunkExtraction,
+    merge_chunk_results,
+)
+from pipelines.job_analysis.infrastructure.adapters.llm.job_extractor import (
+    LLMJobExtractor,
+)
+
+SUMMARY = {
+    "ai_summary": "주문/결제 백엔드 개발자 공고",
+    "evaluation_criteria": [{"name": "직무 적합성", "description": "API 설계 경험"}],
+}
+
+
+class FakeChatModel:
+    """프롬프트 종류(전체/조각/요약)에 따라 고정 JSON을 돌려주는 LLM 대역"""
+
+    def __init__(self, chunk_replies=None, fail_chunks=()):
+        self.chunk_replies = chunk_replies or {}
+        self.fail_chunks = set(fail_chunks)
+        self.calls = []
+        self.systems = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _ainvoke(self, prompt):
+        system, user = (m.content for m in prompt.to_messages())
+        self.calls.append(user)
+        self.systems.append(system)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+
+        if "여러 조각으로 나눈" in system:
+            index = int(user[len("[조각 ") : user.index("/")])
+            if index in self.fail_chunks:
+                return AIMessage(content="not json")
+            reply = self.chunk_replies.get(index, {})
+        elif "하나의 채용 공고에서 추출한 정보" in system:
+            reply = SUMMARY
+        elif "이미 확인되었으므로" in system:
+            # 요청하지 않은 필드를 같이 돌려줘도 확인된 값이 우선
+            reply = {
+                "company_name": "잘못 읽은 회사명",
+                "main_tasks": ["주문 API 개발"],
+                "start_date": None,
+                **SUMMARY,
+            }
+        else:
+            reply = {
+                "company_name": "컬리",
+                "job_title": "백엔드 개발자",
+                "main_tasks": ["주문 API 개발"],
+                "tech_stacks": ["Python"],
+                **SUMMARY,
+            }
+        return AIMessage(content=json.dumps(reply, ensure_ascii=False))
+
+    def runnable(self):
+        return RunnableLambda(lambda _: None, afunc=self._ainvoke)
+
+
+def _long_posting(sections):
+    return "\n\n".join(f"섹션 {i}\n" + "가" * 300 for i in range(sections))
+
+
+@pytest.mark.asyncio
+async def test_short_posting_is_sent_whole_in_one_call():
+    llm = FakeChatModel()
+    extractor = LLMJobExtractor(llm.runnable(), count_tokens=lambda t: 1)
+    text = "공고 본문 " * 5000  # 예전 15000자 절삭 한도보다 긴 텍스트
+
+    result = await extractor.extract(text)
+
+    assert result.company_name == "컬리"
+    assert llm.calls == [text]
+
+
+@pytest.mark.asyncio
+async def test_long_posting_is_extracted_per_chunk_in_parallel_and_merged():
+    llm = FakeChatModel(
+        chunk_replies={
+            1: {
+                "company_name": "(주)컬리",
+                "job_title": "백엔드 개발자",
+                "main_tasks": ["주문 API 개발"],
+                "tech_stacks": ["Python", "AWS"],
+                "key_points": ["Python 3년 이상"],
+            },
+            2: {
+                "company_name": "Unknown",
+                "main_tasks": ["주문 API 개발.", "결제 시스템 운영"],
+                "tech_stacks": ["python", "Kafka"],
+                "end_date": "2026-02-01",
+            },
+            3: {"main_tasks": ["정산 배치 개선"], "key_points": ["Kafka 우대"]},
+        }
+    )
+    extractor = LLMJobExtractor(
+        llm.runnable(), count_tokens=len, chunk_tokens=700, chunk_overlap_tokens=0
+    )
+
+    result = await extractor.extract(_long_posting(6))
+
+    chunk_calls = [c for c in llm.calls if c.startswith("[조각 ")]
+    assert len(chunk_calls) == 3
+    assert all(len(c.split("\n", 1)[1]) <= 700 for c in chunk_calls)
+    # 조각 호출이 모두 동시에 진행되고 마지막에 요약 호출 1번
+    assert llm.max_in_flight == 3
+    assert len(llm.calls) == 4
+    merged = json.loads(llm.calls[-1])
+    assert merged["main_tasks"] == [
+        "주문 API 개발",
+        "결제 시스템 운영",
+        "정산 배치 개선",
+    ]
+    assert merged["key_points"] == ["Python 3년 이상", "Kafka 우대"]
+
+    assert result.company_name == "(주)컬리"
+    assert result.job_title == "백엔드 개발자"
+    assert result.main_tasks == merged["main_tasks"]
+    assert result.tech_stacks == ["Python", "AWS", "Kafka"]
+    assert result.end_date == "2026-02-01"
+    assert result.ai_summary == SUMMARY["ai_summary"]
+    assert result.evaluation_criteria[0].name == "직무 적합성"
+
+
+@pytest.mark.asyncio
+async def test_known_fields_are_not_requested_from_the_llm():
+    llm = FakeChatModel()
+    extractor = LLMJobExtractor(llm.runnable())
+    known = PostingFields(
+        company_name="컬리",
+        job_title="Product Designer (그로스)",
+        end_date=None,
+        tech_stacks=["Figma", "UX Design"],
+    )
+
+    result = await extractor.extract("공고 본문", known=known)
+
+    requested = llm.systems[0].split("추출해야 할 정보:")[1]
+    for field in ("company_name", "job_title", "end_date", "tech_stacks"):
+        assert f". {field}:" not in requested
+    for field in ("main_tasks", "start_date", "ai_summary", "evaluation_criteria"):
+        assert f". {field}:" in requested
+    assert result.company_name == "컬리"
+    assert result.job_title == "Product Designer (그로스)"
+    assert result.tech_stacks == ["Figma", "UX Design"]
+    assert result.end_date is None
+    assert result.main_tasks == ["주문 API 개발"]
+    assert result.ai_summary == SUMMARY["ai_summary"]
+
+
+@pytest.mark.asyncio
+async def test_known_fields_override_chunk_results():
+    llm = FakeChatModel(
+        chunk_replies={1: {"company_name": "컬리 채용팀", "main_tasks": ["API 개발"]}}
+    )
+    extractor = LLMJobExtractor(llm.runnable(), count_tokens=len, chunk_tokens=700)
+
+    result = await extractor.extract(
+        _long_posting(4), known=PostingFields(company_name="컬리")
+    )
+
+    assert json.loads(llm.calls[-1])["company_name"] == "컬리"
+    assert result.company_name == "컬리"
+    assert result.main_tasks == ["API 개발"]
+
+
+@pytest.mark.asyncio
+async def test_failed_chunks_are_skipped():
+    llm = FakeChatModel(
+        chunk_replies={1: {"company_name": "컬리", "main_tasks": ["주문 API 개발"]}},
+        fail_chunks={2},
+    )
+    extractor = LLMJobExtractor(llm.runnable(), count_tokens=len, chunk_tokens=700)
+
+    result = await extractor.extract(_long_posting(4))
+
+    assert result.company_name == "컬리"
+    assert result.main_tasks == ["주문 API 개발"]
+
+
+@pytest.mark.asyncio
+async def test_all_chunks_failing_returns_none():
+    llm = FakeChatModel(fail_chunks={1, 2})
+    extractor = LLMJobExtractor(llm.runnable(), count_tokens=len, chunk_tokens=700)
+
+    assert await extractor.extract(_long_posting(4)) is None
+
+
+def test_merge_is_order_stable_and_ignores_case_and_punctuation():
+    parts = [
+        ChunkExtraction(job_title="데이터 엔지니어", tech_stacks=["Spark "]),
+        ChunkExtraction(
+            company_name="컬리",
+            job_title="다른 제목",
+            main_tasks=["파이프라인 구축", "파이프라인  구축!"],
+            tech_stacks=["spark", "Airflow"],
+            start_date="2026-01-02",
+        ),
+    ]
+
+    merged = merge_chunk_results(parts)
+
+    assert merged == merge_chunk_results(parts)
+    assert merged.company_name == "컬리"
+    assert merged.job_title == "데이터 엔지니어"
+    assert merged.main_tasks == ["파이프라인 구축"]
+    assert merged.tech_stacks == ["Spark", "Airflow"]
+    assert merged.start_date == "2026-01-02"
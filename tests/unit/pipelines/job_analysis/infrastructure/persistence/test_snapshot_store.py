@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from pipelines.job_analysis.domain.models.snapshot import CrawlSnapshot
+from pipelines.job_analysis.infrastructure.persistence.snapshot_store import (
+    BlobSnapshotStore,
+    LocalBlobBackend,
+    S3BlobBackend,
+)
+
+SARAMIN_URL = "https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=52069064"
+T0 = datetime(2026, 3, 1, 9, 0, tzinfo=timezone.utc)
+
+
+def _snapshot(url=SARAMIN_URL, at=T0, text="백엔드 개발자\nPython", html="<p>raw</p>"):
+    return CrawlSnapshot(
+        url=url, captured_at=at, source="browser", raw_html=html, text=text
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = BlobSnapshotStore(
+        blobs=LocalBlobBackend(str(tmp_path)),
+        index_path=str(tmp_path / "index.sqlite3"),
+    )
+    yield store
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_round_trips_through_compressed_blob(store, tmp_path):
+    record = await store.save(_snapshot())
+
+    blob = tmp_path / BlobSnapshotStore.blob_key(record.content_hash)
+    assert blob.exists()
+    assert b"Python" not in blob.read_bytes()  # gzip 압축
+    assert record.canonical_url == (
+        "https://www.saramin.co.kr/zf_user/jobs/view?rec_idx=52069064"
+    )
+
+    loaded = await store.load(record.content_hash)
+    assert loaded.raw_html == "<p>raw</p>"
+    assert loaded.text == "백엔드 개발자\nPython"
+    assert loaded.captured_at == T0
+
+
+@pytest.mark.asyncio
+async def test_same_content_is_stored_once_but_indexed_per_capture(store, tmp_path):
+    first = await store.save(_snapshot())
+    # 추적 파라미터만 다른 URL로 다시 수집
+    second = await store.save(
+        _snapshot(url=SARAMIN_URL + "&utm_source=x", at=T0 + timedelta(hours=1))
+    )
+
+    assert first.content_hash == second.content_hash
+    assert len(list((tmp_path / "objects").rglob("*.json.gz"))) == 1
+    records = await store.find(url=SARAMIN_URL)
+    assert [r.captured_at for r in records] == [T0 + timedelta(hours=1), T0]
+
+
+@pytest.mark.asyncio
+async def test_find_filters_by_time_and_keeps_latest_per_url(store):
+    other = "https://www.wanted.co.kr/wd/330563"
+    await store.save(_snapshot(at=T0, text="v1"))
+    await store.save(_snapshot(at=T0 + timedelta(days=1), text="v2"))
+    await store.save(_snapshot(url=other, at=T0 + timedelta(days=2), text="w1"))
+
+    in_range = await store.find(
+        since=T0 + timedelta(hours=1), until=T0 + timedelta(days=2)
+    )
+    assert [r.text_chars for r in in_range] == [2]
+
+    latest = await store.find(latest_only=True)
+    assert [(r.url, r.captured_at) for r in latest] == [
+        (other, T0 + timedelta(days=2)),
+        (SARAMIN_URL, T0 + timedelta(days=1)),
+    ]
+    assert len(await store.find(limit=1)) == 1
+
+
+@pytest.mark.asyncio
+async def test_s3_backend_uses_file_storage_with_prefix(tmp_path):
+    class FakeFileStorage:
+        def __init__(self):
+            self.objects = {}
+
+        async def upload_file(self, file_content, destination_path, content_type):
+            self.objects[destination_path] = (file_content, content_type)
+            return destination_path
+
+        async def download_file(self, file_path):
+            return self.objects[file_path][0]
+
+    storage = FakeFileStorage()
+    store = BlobSnapshotStore(
+        blobs=S3BlobBackend(storage, prefix="crawl-snapshots/"),
+        index_path=str(tmp_path / "index.sqlite3"),
+    )
+    record = await store.save(_snapshot())
+
+    key = f"crawl-snapshots/{BlobSnapshotStore.blob_key(record.content_hash)}"
+    assert storage.objects[key][1] == "application/gzip"
+    assert (await store.load(record.content_hash)).text == "백엔드 개발자\nPython"
+    store.close()
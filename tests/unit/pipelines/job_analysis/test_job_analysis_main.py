@@ -0,0 +1,50 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from pipelines.job_analysis import main as main_module
+from shared.concurrency import SingleFlight
+from shared.schema.job_posting import JobPostingAnalyzeRequest
+
+
+class SlowExtractionService:
+    def __init__(self):
+        self.crawled = []
+
+    async def extract_job_data(self, url):
+        self.crawled.append(url)
+        await asyncio.sleep(0.01)
+        return f"analysis of {url}"
+
+
+@pytest.mark.asyncio
+async def test_coalesced_requests_crawl_the_canonical_url(monkeypatch):
+    service = SlowExtractionService()
+    monkeypatch.setattr(
+        main_module, "get_container", lambda: SimpleNamespace(service=service)
+    )
+    monkeypatch.setattr(main_module, "job_analysis_flight", SingleFlight())
+
+    async def no_existing(service, url):
+        return None
+
+    monkeypatch.setattr(main_module, "_find_existing", no_existing)
+
+    # 같은 표준화 URL을 가진 서로 다른 원본 URL이 동시에 요청됨
+    results = await asyncio.gather(
+        main_module.run_pipeline(
+            JobPostingAnalyzeRequest(
+                url="https://m.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=7&utm_source=x"
+            )
+        ),
+        main_module.run_pipeline(
+            JobPostingAnalyzeRequest(
+                url="https://www.saramin.co.kr/zf_user/jobs/view?view_type=list&rec_idx=7"
+            )
+        ),
+    )
+
+    canonical = "https://www.saramin.co.kr/zf_user/jobs/view?rec_idx=7"
+    assert service.crawled == [canonical]
+    assert results == [f"analysis of {canonical}"] * 2
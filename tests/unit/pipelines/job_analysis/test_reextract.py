@@ -0,0 +1,53 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from pipelines.job_analysis.domain.models.job_data import ExtractedJobData
+from pipelines.job_analysis.domain.models.snapshot import CrawlSnapshot
+from pipelines.job_analysis.infrastructure.persistence.snapshot_store import (
+    BlobSnapshotStore,
+    LocalBlobBackend,
+)
+from pipelines.job_analysis.reextract import reextract_snapshots
+
+
+@pytest.mark.asyncio
+async def test_stored_snapshots_are_reextracted_without_crawling(tmp_path):
+    store = BlobSnapshotStore(
+        blobs=LocalBlobBackend(str(tmp_path)),
+        index_path=str(tmp_path / "index.sqlite3"),
+    )
+    for i in range(5):
+        await store.save(
+            CrawlSnapshot(
+                url=f"https://www.wanted.co.kr/wd/{i}",
+                captured_at=datetime(2026, 3, 1, i, tzinfo=timezone.utc),
+                source="http",
+                text=f"posting {i}",
+            )
+        )
+
+    extracted = ExtractedJobData.model_construct(company_name="컬리", job_title="PD")
+
+    async def extract(text):
+        if text == "posting 3":
+            return None
+        return extracted
+
+    extractor = AsyncMock()
+    extractor.extract.side_effect = extract
+
+    records = await store.find()
+    results = [
+        r async for r in reextract_snapshots(store, extractor, records, concurrency=2)
+    ]
+
+    assert sorted(r.record.url for r in results) == sorted(r.url for r in records)
+    failed = [r for r in results if r.error]
+    assert [r.record.url for r in failed] == ["https://www.wanted.co.kr/wd/3"]
+    assert sum(r.data is extracted for r in results) == 4
+    assert sorted(c.args[0] for c in extractor.extract.call_args_list) == [
+        f"posting {i}" for i in range(5)
+    ]
+    store.close()
@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+from shared.concurrency import AdmissionController, AdmissionRejected, AdmittedStream
+
+
+@pytest.mark.asyncio
+async def test_limits_concurrency_and_queues_the_rest():
+    controller = AdmissionController("test", max_concurrency=2, max_queue=10)
+    running = 0
+    peak = 0
+
+    async def work():
+        nonlocal running, peak
+        async with controller.admit():
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(work() for _ in range(6)))
+
+    assert peak == 2
+    assert controller.in_flight == 0
+    assert controller.waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_queue_is_full():
+    controller = AdmissionController("test", max_concurrency=1, max_queue=1)
+    release = asyncio.Event()
+
+    async def hold():
+        async with controller.admit():
+            await release.wait()
+
+    holder = asyncio.ensure_future(hold())
+    queued = asyncio.ensure_future(hold())
+    await asyncio.sleep(0)
+
+    assert controller.in_flight == 1
+    assert controller.waiting == 1
+    with pytest.raises(AdmissionRejected) as exc_info:
+        await controller.acquire()
+    assert exc_info.value.retry_after >= 1
+
+    release.set()
+    await asyncio.gather(holder, queued)
+    assert controller.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_retry_after_follows_recent_service_time():
+    controller = AdmissionController("test", max_concurrency=1, max_queue=0)
+    assert controller.retry_after() == 1
+
+    # 처리 시간 2.5초로 기록되도록 시작 시각을 당김
+    ticket = await controller.acquire()
+    ticket._started -= 2.5
+    ticket.release()
+
+    assert controller.retry_after() == 3
+
+
+@pytest.mark.asyncio
+async def test_stream_releases_slot_on_completion_and_error():
+    controller = AdmissionController("test", max_concurrency=1, max_queue=0)
+
+    async def events(fail: bool):
+        yield 1
+        if fail:
+            raise ValueError("boom")
+        yield 2
+
+    stream = AdmittedStream(events(fail=False), await controller.acquire())
+    assert [e async for e in stream] == [1, 2]
+    assert controller.in_flight == 0
+
+    stream = AdmittedStream(events(fail=True), await controller.acquire())
+    with pytest.raises(ValueError):
+        async for _ in stream:
+            pass
+    assert controller.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_releases_slot_when_closed_or_abandoned():
+    controller = AdmissionController("test", max_concurrency=1, max_queue=0)
+
+    async def events():
+        yield 1
+        yield 2
+
+    stream = AdmittedStream(events(), await controller.acquire())
+    assert await stream.__anext__() == 1
+    await stream.aclose()
+    assert controller.in_flight == 0
+
+    # 소비되지 않고 버려진 스트림도 슬롯을 반환
+    stream = AdmittedStream(events(), await controller.acquire())
+    del stream
+    assert controller.in_flight == 0
+    await asyncio.wait_for(controller.acquire(), timeout=1)
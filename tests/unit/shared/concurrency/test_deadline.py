@@ -0,0 +1,105 @@
+import asyncio
+import time
+
+import pytest
+
+from shared.concurrency import (
+    Deadline,
+    DeadlineExceeded,
+    check_deadline,
+    current_deadline,
+    deadline_scope,
+    stage_timeout,
+    stage_timeout_ms,
+    with_deadline,
+)
+
+
+def test_stage_timeout_is_capped_by_remaining_budget():
+    with deadline_scope(Deadline(0.5)):
+        assert stage_timeout("llm", cap=10) <= 0.5
+        assert stage_timeout("llm", cap=0.1) == pytest.approx(0.1)
+        assert stage_timeout_ms("navigation", 15000) <= 500
+
+    # Deadline이 없으면 기존 고정 타임아웃 그대로
+    assert current_deadline() is None
+    assert stage_timeout("llm", cap=10) == 10
+    assert stage_timeout("llm") is None
+
+
+def test_expired_or_cancelled_deadline_raises():
+    with deadline_scope(Deadline(0)):
+        with pytest.raises(DeadlineExceeded) as exc_info:
+            check_deadline("crawl")
+        assert exc_info.value.stage == "crawl"
+        assert not exc_info.value.cancelled
+
+    deadline = Deadline(None)
+    assert deadline.timeout("crawl") is None
+    deadline.cancel()
+    with pytest.raises(DeadlineExceeded) as exc_info:
+        deadline.check("crawl")
+    assert exc_info.value.cancelled
+
+
+@pytest.mark.asyncio
+async def test_with_deadline_cancels_slow_work():
+    cancelled = False
+
+    async def slow():
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    with deadline_scope(Deadline(0.05)):
+        with pytest.raises(DeadlineExceeded) as exc_info:
+            await with_deadline(slow(), stage="evaluate_competency")
+
+    assert exc_info.value.stage == "evaluate_competency"
+    assert cancelled
+
+
+@pytest.mark.asyncio
+async def test_with_deadline_does_not_start_work_after_expiry():
+    started = False
+
+    async def work():
+        nonlocal started
+        started = True
+
+    with deadline_scope(Deadline(0)):
+        with pytest.raises(DeadlineExceeded):
+            await with_deadline(work(), stage="s3_download")
+    assert not started
+
+
+@pytest.mark.asyncio
+async def test_deadline_propagates_to_worker_thread():
+    deadline = Deadline(5)
+
+    def blocking_stage():
+        # 스레드 안에서 같은 Deadline을 보고, 취소 신호가 오면 다음 확인 지점에서 멈춤
+        assert current_deadline() is deadline
+        for _ in range(100):
+            check_deadline("parse_page")
+            time.sleep(0.01)
+
+    with deadline_scope(deadline):
+        future = asyncio.ensure_future(asyncio.to_thread(blocking_stage))
+        await asyncio.sleep(0.03)
+        deadline.cancel()
+        with pytest.raises(DeadlineExceeded) as exc_info:
+            await future
+    assert exc_info.value.cancelled
+
+
+def test_detached_deadline_keeps_expiry_but_not_cancellation():
+    deadline = Deadline(5)
+    shared = deadline.detached()
+    deadline.cancel()
+
+    assert shared.expires_at == deadline.expires_at
+    assert not shared.expired
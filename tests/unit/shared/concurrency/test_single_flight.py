@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+
+from shared.concurrency import FileLockSingleFlight, SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    flight: SingleFlight[str] = SingleFlight()
+    calls = 0
+
+    async def work() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "result"
+
+    results = await asyncio.gather(*(flight.do("key", work) for _ in range(10)))
+
+    assert results == ["result"] * 10
+    assert calls == 1
+    assert flight.inflight == 0
+
+
+@pytest.mark.asyncio
+async def test_different_keys_run_separately():
+    flight: SingleFlight[str] = SingleFlight()
+    calls = []
+
+    async def work(key: str) -> str:
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return key
+
+    results = await asyncio.gather(
+        flight.do("a", lambda: work("a")), flight.do("b", lambda: work("b"))
+    )
+
+    assert results == ["a", "b"]
+    assert sorted(calls) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_exception_is_shared_and_key_released():
+    flight: SingleFlight[str] = SingleFlight()
+
+    async def fail() -> str:
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        flight.do("key", fail), flight.do("key", fail), return_exceptions=True
+    )
+    assert all(isinstance(r, ValueError) for r in results)
+
+    # 실패 후에는 새 호출이 다시 실행됨 (결과 캐시 없음)
+    async def ok() -> str:
+        return "ok"
+
+    assert await flight.do("key", ok) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_work():
+    flight: SingleFlight[str] = SingleFlight()
+
+    async def work() -> str:
+        await asyncio.sleep(0.02)
+        return "done"
+
+    first = asyncio.ensure_future(flight.do("key", work))
+    second = asyncio.ensure_future(flight.do("key", work))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "done"
+
+
+@pytest.mark.asyncio
+async def test_file_lock_reuses_result_written_while_waiting(tmp_path):
+    # 서로 다른 프로세스를 흉내내기 위해 레지스트리 인스턴스를 분리
+    def make() -> FileLockSingleFlight[str]:
+        return FileLockSingleFlight(
+            lock_dir=str(tmp_path),
+            serialize=lambda v: v,
+            deserialize=lambda s: s,
+            poll_interval=0.005,
+        )
+
+    worker_a, worker_b = make(), make()
+    calls = 0
+
+    async def work() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "shared"
+
+    results = await asyncio.gather(worker_a.do("key", work), worker_b.do("key", work))
+
+    assert results == ["shared", "shared"]
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_file_lock_does_not_reuse_stale_result(tmp_path):
+    flight: FileLockSingleFlight[str] = FileLockSingleFlight(
+        lock_dir=str(tmp_path), serialize=lambda v: v, deserialize=lambda s: s
+    )
+    values = iter(["first", "second"])
+
+    async def work() -> str:
+        return next(values)
+
+    assert await flight.do("key", work) == "first"
+    assert await flight.do("key", work) == "second"
@@ -0,0 +1,161 @@
+import pytest
+from langchain_core.language_models import FakeListChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.outputs import ChatGeneration
+from pydantic import BaseModel
+
+from shared.llm.cache import (
+    CACHE_EVICTIONS,
+    CACHE_LOOKUPS,
+    TieredLLMCache,
+    bypass_llm_cache,
+    cache_after_parse,
+    encode_generations,
+)
+
+PROMPT = '[{"type": "human", "content": "공고 분석"}]'
+LLM = "ChatOpenAI gpt-4o-mini temperature=0"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _generation(text):
+    return [ChatGeneration(message=AIMessage(content=text))]
+
+
+def _texts(value):
+    return [g.text for g in value] if value is not None else None
+
+
+@pytest.mark.asyncio
+async def test_identical_prompt_is_served_from_cache():
+    cache = TieredLLMCache()
+    llm = FakeListChatModel(responses=["첫 응답", "둘째 응답"], cache=cache)
+    hits = CACHE_LOOKUPS.value(result="memory")
+
+    assert (await llm.ainvoke("공고 분석")).content == "첫 응답"
+    assert (await llm.ainvoke("공고 분석")).content == "첫 응답"
+    assert (await llm.ainvoke("다른 공고")).content == "둘째 응답"
+    assert CACHE_LOOKUPS.value(result="memory") == hits + 1
+
+
+@pytest.mark.asyncio
+async def test_bypass_calls_the_model_and_refreshes_the_entry():
+    cache = TieredLLMCache()
+    llm = FakeListChatModel(responses=["첫 응답", "새 응답"], cache=cache)
+    await llm.ainvoke("공고 분석")
+
+    with bypass_llm_cache():
+        assert (await llm.ainvoke("공고 분석")).content == "새 응답"
+    assert (await llm.ainvoke("공고 분석")).content == "새 응답"
+
+
+class Verdict(BaseModel):
+    score: int
+
+
+@pytest.mark.asyncio
+async def test_only_parsed_responses_are_cached(tmp_path):
+    cache = TieredLLMCache(path=str(tmp_path / "llm_cache.sqlite3"))
+    llm = FakeListChatModel(
+        responses=["점수: 80점", '{"score": 80}', '{"score": 10}'], cache=cache
+    )
+    chain = cache_after_parse(llm | PydanticOutputParser(pydantic_object=Verdict))
+
+    # 파싱에 실패한 응답은 캐시되지 않으므로 재시도 시 LLM을 다시 호출
+    with pytest.raises(Exception):
+        await chain.ainvoke("평가")
+    assert (await chain.ainvoke("평가")).score == 80
+    assert (await chain.ainvoke("평가")).score == 80
+    assert llm.i == 2
+
+
+def test_key_includes_model_parameters():
+    cache = TieredLLMCache()
+    cache.update(PROMPT, LLM, _generation("응답"))
+
+    assert _texts(cache.lookup(PROMPT, LLM)) == ["응답"]
+    assert cache.lookup(PROMPT, LLM.replace("gpt-4o-mini", "gpt-4o")) is None
+
+
+def test_disk_tier_survives_a_new_process(tmp_path):
+    path = str(tmp_path / "llm_cache.sqlite3")
+    first = TieredLLMCache(path=path)
+    first.update(PROMPT, LLM, _generation('{"company_name": "컬리"}'))
+    first.close()
+
+    second = TieredLLMCache(path=path)
+    hits = CACHE_LOOKUPS.value(result="disk")
+
+    value = second.lookup(PROMPT, LLM)
+
+    assert _texts(value) == ['{"company_name": "컬리"}']
+    assert isinstance(value[0], ChatGeneration)
+    assert CACHE_LOOKUPS.value(result="disk") == hits + 1
+    # 이후 조회는 메모리 계층
+    assert second.lookup(PROMPT, LLM) is not None
+    assert CACHE_LOOKUPS.value(result="disk") == hits + 1
+    second.close()
+
+
+def test_entries_expire_after_ttl(tmp_path):
+    clock = Clock()
+    cache = TieredLLMCache(
+        path=str(tmp_path / "llm_cache.sqlite3"), ttl_seconds=60, clock=clock
+    )
+    cache.update(PROMPT, LLM, _generation("응답"))
+
+    clock.now += 59
+    assert cache.lookup(PROMPT, LLM) is not None
+    clock.now += 2
+    assert cache.lookup(PROMPT, LLM) is None
+    # 디스크 항목도 만료
+    assert (
+        TieredLLMCache(path=cache.path, ttl_seconds=60, clock=clock).lookup(PROMPT, LLM)
+        is None
+    )
+
+
+def test_memory_tier_keeps_most_recently_used_entries():
+    cache = TieredLLMCache(max_memory_entries=2)
+    for prompt in ("a", "b"):
+        cache.update(prompt, LLM, _generation(prompt))
+    cache.lookup("a", LLM)
+    cache.update("c", LLM, _generation("c"))
+
+    assert cache.lookup("b", LLM) is None
+    assert _texts(cache.lookup("a", LLM)) == ["a"]
+    assert _texts(cache.lookup("c", LLM)) == ["c"]
+
+
+def test_disk_tier_evicts_least_recently_used_entries_over_size(tmp_path):
+    clock = Clock()
+    path = str(tmp_path / "llm_cache.sqlite3")
+    entry = len(encode_generations(_generation("x" * 100)).encode("utf-8"))
+    cache = TieredLLMCache(
+        path=path,
+        max_memory_entries=1,
+        max_disk_bytes=entry * 3,  # 3개까지 보관
+        prune_every=1,
+        clock=clock,
+    )
+    evicted = CACHE_EVICTIONS.value(reason="size")
+
+    for prompt in ("a", "b", "c"):
+        clock.now += 1
+        cache.update(prompt, LLM, _generation(prompt * 100))
+    clock.now += 1
+    cache.lookup("a", LLM)  # 디스크에서 읽으면서 마지막 사용 시각 갱신
+    clock.now += 1
+    cache.update("d", LLM, _generation("d" * 100))
+
+    fresh = TieredLLMCache(path=path, clock=clock)
+    assert [p for p in "abcd" if fresh.lookup(p, LLM) is not None] == ["a", "c", "d"]
+    assert CACHE_EVICTIONS.value(reason="size") == evicted + 1
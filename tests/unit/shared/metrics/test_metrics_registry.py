@@ -0,0 +1,42 @@
+import pytest
+
+from shared.metrics import MetricsRegistry
+
+
+def test_render_prometheus_text_format():
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "요청 수", ["route"])
+    depth = registry.gauge("queue_depth", "대기열 길이")
+    latency = registry.histogram("latency_seconds", "지연", ["route"], buckets=(0.1, 1))
+
+    requests.inc(route="/a")
+    requests.inc(2, route="/a")
+    depth.set(3)
+    latency.observe(0.05, route="/a")
+    latency.observe(0.5, route="/a")
+    latency.observe(5, route="/a")
+
+    lines = registry.render().splitlines()
+
+    assert "# TYPE requests_total counter" in lines
+    assert 'requests_total{route="/a"} 3' in lines
+    assert "queue_depth 3" in lines
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{route="/a",le="1"} 2' in lines
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 'latency_seconds_count{route="/a"} 3' in lines
+    assert 'latency_seconds_sum{route="/a"} 5.55' in lines
+
+
+def test_same_name_returns_existing_metric():
+    registry = MetricsRegistry()
+    assert registry.counter("c", "x") is registry.counter("c", "x")
+    with pytest.raises(ValueError):
+        registry.gauge("c", "x")
+
+
+def test_label_names_must_match():
+    registry = MetricsRegistry()
+    counter = registry.counter("c", "x", ["pipeline"])
+    with pytest.raises(ValueError):
+        counter.inc(route="/a")
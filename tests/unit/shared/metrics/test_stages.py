@@ -0,0 +1,36 @@
+import asyncio
+
+import pytest
+
+from shared.metrics import (
+    DB_QUERY_SECONDS,
+    STAGE_SECONDS,
+    time_stage,
+    timed_query,
+)
+
+
+def test_time_stage_records_even_on_error():
+    before = STAGE_SECONDS.count(pipeline="test", stage="boom")
+
+    with pytest.raises(ValueError):
+        with time_stage("test", "boom"):
+            raise ValueError("boom")
+
+    assert STAGE_SECONDS.count(pipeline="test", stage="boom") == before + 1
+
+
+@pytest.mark.asyncio
+async def test_timed_query_labels_by_repository_and_method():
+    class FakeRepository:
+        @timed_query
+        async def get_thing(self, thing_id: int) -> int:
+            await asyncio.sleep(0.01)
+            return thing_id
+
+    labels = {"repository": "FakeRepository", "method": "get_thing"}
+    before = DB_QUERY_SECONDS.count(**labels)
+
+    assert await FakeRepository().get_thing(3) == 3
+    assert DB_QUERY_SECONDS.count(**labels) == before + 1
+    assert DB_QUERY_SECONDS.sum(**labels) >= 0.01
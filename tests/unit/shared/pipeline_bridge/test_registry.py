@@ -0,0 +1,121 @@
+import asyncio
+import sys
+import types
+
+import pytest
+
+from shared.pipeline_bridge.registry import PipelineRegistry
+
+
+@pytest.fixture
+def fake_pipeline(monkeypatch):
+    """sys.modules에 등록된 가짜 파이프라인 모듈 (startup/shutdown 호출 기록)"""
+    module = types.ModuleType("fake_pipeline_main")
+    module.calls = []
+
+    async def run_pipeline(request):
+        return f"ran {request}"
+
+    def startup():
+        module.calls.append("startup")
+
+    async def shutdown():
+        module.calls.append("shutdown")
+
+    module.run_pipeline = run_pipeline
+    module.startup = startup
+    module.shutdown = shutdown
+    monkeypatch.setitem(sys.modules, "fake_pipeline_main", module)
+    return module
+
+
+def test_resolve_is_lazy_and_cached(fake_pipeline):
+    registry = PipelineRegistry({"fake": "fake_pipeline_main"})
+
+    assert not registry.is_loaded("fake")
+    assert registry.resolve("fake") is fake_pipeline
+    assert registry.is_loaded("fake")
+    assert registry.resolve("fake") is fake_pipeline
+
+
+@pytest.mark.asyncio
+async def test_entrypoint_returns_pipeline_function(fake_pipeline):
+    registry = PipelineRegistry({"fake": "fake_pipeline_main"})
+
+    run_pipeline = registry.entrypoint("fake", "run_pipeline")
+
+    assert await run_pipeline("req") == "ran req"
+
+
+def test_unknown_pipeline_raises():
+    registry = PipelineRegistry({})
+
+    with pytest.raises(KeyError):
+        registry.resolve("missing")
+
+
+@pytest.mark.asyncio
+async def test_prewarm_loads_and_starts_pipelines(fake_pipeline):
+    registry = PipelineRegistry(
+        {"fake": "fake_pipeline_main", "broken": "no_such_pipeline_module"}
+    )
+
+    # 하나가 실패해도 나머지 prewarm은 계속 진행
+    await registry.prewarm()
+
+    assert registry.is_loaded("fake")
+    assert not registry.is_loaded("broken")
+    assert fake_pipeline.calls == ["startup"]
+
+
+@pytest.mark.asyncio
+async def test_shutdown_only_touches_loaded_pipelines(fake_pipeline):
+    registry = PipelineRegistry({"fake": "fake_pipeline_main"})
+
+    await registry.shutdown()
+    assert fake_pipeline.calls == []
+
+    registry.resolve("fake")
+    await registry.shutdown()
+    assert fake_pipeline.calls == ["shutdown"]
+
+
+@pytest.mark.asyncio
+async def test_aresolve_waits_for_prewarm_import_off_the_event_loop(fake_pipeline):
+    registry = PipelineRegistry({"fake": "fake_pipeline_main"})
+    import_lock = registry._locks["fake"]
+    import_lock.acquire()  # prewarm 스레드가 import 중인 상태
+
+    try:
+        task = asyncio.ensure_future(registry.aentrypoint("fake", "run_pipeline"))
+        # 대기 중에도 이벤트 루프(헬스 체크, SSE 등)는 계속 동작
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+        assert not task.done()
+    finally:
+        import_lock.release()
+
+    run_pipeline = await asyncio.wait_for(task, timeout=1)
+    assert await run_pipeline("req") == "ran req"
+
+
+@pytest.mark.asyncio
+async def test_prewarm_awaits_coroutine_startup_on_the_event_loop(fake_pipeline):
+    async def startup():
+        asyncio.get_running_loop()  # 이벤트 루프 스레드에서 실행
+        fake_pipeline.calls.append("async startup")
+
+    fake_pipeline.startup = startup
+    registry = PipelineRegistry({"fake": "fake_pipeline_main"})
+
+    await registry.prewarm()
+
+    assert fake_pipeline.calls == ["async startup"]
+
+
+def test_import_locks_are_per_pipeline(fake_pipeline):
+    registry = PipelineRegistry({"fake": "fake_pipeline_main", "other": "json"})
+
+    # 다른 파이프라인이 import 중이어도 대기하지 않음
+    with registry._locks["other"]:
+        assert registry.resolve("fake") is fake_pipeline